@@ -2,7 +2,7 @@
 
 엔드포인트:
 - POST /runs/generate        : 새 run_id 로 초안 생성
-- GET  /runs                 : 모든 run 조회
+- GET  /runs                 : run 목록 (2026-10 — app.api_runs_list, 페이지 단위)
 - GET  /runs/{run_id}        : 단일 run 조회 + DELIVERING 인 경우
                                OCI outbox 1회 reconciliation 시도
 - POST /runs/{run_id}/reject : PENDING_APPROVAL -> REJECTED
@@ -31,20 +31,22 @@ from typing import Any, AsyncIterator, Optional
 
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 
 # `app.config` import 자체가 .env 자동 로드를 트리거한다.
 # 환경변수에 의존하는 어떤 모듈보다 먼저 import 되어야 한다.
 from app import config  # noqa: F401  # side-effect import (load_dotenv)
 from app import (
+    compute_lanes,
     delivery,
     draft,
     holdings as holdings_module,
     holdings_enrich,
     market_cache,
     market_data_store,
-    market_naver,
     oci_startup_status,
+    sqlite_schemas,
     store,
 )
 from app.api_decision_draft_preview import router as decision_draft_preview_router
@@ -54,6 +56,7 @@ from app.api_holdings_market_evidence import router as holdings_market_evidence_
 from app.api_holdings_oci_apply import router as holdings_oci_apply_router
 from app.api_market_topn import router as market_topn_router
 from app.api_ml_baseline import router as ml_baseline_router
+from app.api_ml_export import router as ml_export_router
 from app.api_ml_jobs import router as ml_jobs_router
 from app.api_ml_relative_upside import router as ml_relative_upside_router
 from app.api_ml_readiness import router as ml_readiness_router
@@ -61,6 +64,8 @@ from app.api_ml_sanity import router as ml_sanity_router
 from app.api_nav_discount import router as nav_discount_router
 from app.api_oci_startup_status import router as oci_startup_status_router
 from app.api_price_series import router as price_series_router
+from app.api_runs_list import RunResponse
+from app.api_runs_list import router as runs_list_router
 from app.api_three_push_param import router as three_push_param_router
 from app.api_universe import router as universe_router
 from app.holdings import HoldingsValidationError
@@ -77,6 +82,15 @@ async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
     실패해도 예외를 올리지 않아 기동을 막지 않는다(oci_startup_status 내부에서
     UNKNOWN 스냅샷을 남긴다). 이후 요청·새로고침으로 재조회하지 않는다.
     """
+    # 2026-10 — 기존 SQLite 파일의 스키마 마이그레이션 (PRAGMA user_version 기준).
+    # 요청 경로의 store init 은 이후 process 캐시만 확인한다. 실패는 로그만.
+    try:
+        applied = sqlite_schemas.migrate_existing_databases()
+        for name, steps in applied.items():
+            if steps:
+                logger.info("SQLite 마이그레이션 적용 (%s): %s", name, ", ".join(steps))
+    except Exception as e:  # noqa: BLE001 - 기동을 절대 막지 않는다
+        logger.warning("SQLite 마이그레이션 중 예외(무시): %s", e)
     try:
         snap = oci_startup_status.refresh_snapshot()
         logger.info(
@@ -87,10 +101,14 @@ async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:  # noqa: BLE001 - 기동을 절대 막지 않는다
         logger.warning("OCI 기동 상태 읽기 중 예외(무시): %s", e)
     yield
+    # 2026-10 — 무거운 read endpoint 전용 executor (app.compute_lanes) 정리.
+    compute_lanes.shutdown()
 
 
 app = FastAPI(title="POC 1단계 승인 루프", lifespan=_lifespan)
 
+GZIP_MINIMUM_BYTES = 2048
+
 # Next.js dev(3000) 프론트에서 직접 호출 허용.
 # Next.js API Routes/Proxy 를 거치지 않고 프론트 ↔ FastAPI 분리 연결이
 # 이번 단계의 확정 설계. 운영 배포 시 origin 화이트리스트 재정의 대상.
@@ -101,8 +119,16 @@ app.add_middleware(
     # POC2 Step 1: PUT /holdings 추가됨. preflight OPTIONS 통과 위해 PUT 허용.
     allow_methods=["GET", "POST", "PUT"],
     allow_headers=["*"],
+    # 2026-10 — GET /runs 다음 페이지 cursor 헤더를 브라우저에서 읽을 수 있게.
+    expose_headers=["X-Next-Cursor"],
 )
+# 2026-10 — 큰 응답 (TOP N 후보 / 다년 가격 시계열) 만 gzip. 작은 상태 응답은
+# 압축 비용이 이득보다 커서 minimum_size 아래는 그대로 보낸다. compresslevel 은
+# 기본 9 대신 5 — 크기 차이는 작고 CPU 는 절반 이하.
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_BYTES, compresslevel=5)
 
+# 2026-10 — GET /runs 는 SQLite run 저장소 페이지 조회 (limit / status / before).
+app.include_router(runs_list_router)
 # POC2 Step 6 — universe momentum 엔드포인트는 별도 라우터로 분리 (app.api_universe).
 # KS-10 근접 해소 + 1개 책임 1개 파일.
 app.include_router(universe_router)
@@ -128,6 +154,9 @@ app.include_router(ml_sanity_router)
 # POC2 ML Baseline v0 룩백 검증 (2026-06-11) — read-only
 # GET /ml/baseline-v0/latest. state/ml/ml_baseline_v0_report_latest.json 만 read.
 app.include_router(ml_baseline_router)
+# 2026-10 — read-only GET /ml/export/{dataset}: feature 테이블 / walk-forward 예측을
+# NDJSON · CSV 로 조각 단위 streaming (app.ml_export). CLI 는 scripts/export_ml_data.py.
+app.include_router(ml_export_router)
 # POC2 UI 안전실행 (2026-06-11) — POST /ml/jobs/evidence-refresh + GET /ml/jobs/latest.
 # 3단계 (feature → sanity → baseline) background job runner + read-only status.
 app.include_router(ml_jobs_router)
@@ -169,31 +198,6 @@ class GenerateDraftRequest(BaseModel):
     )
 
 
-class RunResponse(BaseModel):
-    run_id: str
-    asof: str
-    status: str
-    draft_payload: Optional[dict[str, Any]] = None
-    # POC2 Step 2D: 신규 run 은 generate 시점에 백엔드가 빌드한 message_text 를
-    # 응답에 그대로 포함한다. 과거 run 은 None.
-    # 프론트엔드는 이 값을 opaque string 으로 받아 그대로 렌더링한다 (조립 금지).
-    message_text: Optional[str] = None
-    # POC2 3-PUSH Message Contract 정렬 (2026-06-11) — 3종 PUSH 구분 식별자.
-    # 과거 run 은 None. delivery / OCI consumer 는 본 필드를 읽지 않는다.
-    push_kind: Optional[str] = None
-
-    @classmethod
-    def from_run(cls, run: Run) -> "RunResponse":
-        return cls(
-            run_id=run.run_id,
-            asof=run.asof,
-            status=run.status,
-            draft_payload=run.draft_payload,
-            message_text=run.message_text,
-            push_kind=run.push_kind,
-        )
-
-
 @app.post("/runs/generate", response_model=RunResponse)
 def post_generate(req: GenerateDraftRequest) -> RunResponse:
     # 원 지시(POC1): GenerateDraft 실패 → FAILED 단일 규칙.
@@ -408,6 +412,10 @@ def post_market_refresh() -> MarketRefreshResponse:
             detail="holdings 가 비어 있습니다. 먼저 보유 종목을 입력 후 저장해 주세요.",
         )
 
+    # 2026-10 — httpx 를 끌어오는 Naver adapter 는 이 명시 갱신에서만 import
+    # (API 기동 시 미로드 — tests/test_import_time.py).
+    from app import market_naver
+
     tickers = [h.ticker for h in loaded]
     results = market_naver.fetch_many(tickers)
 
@@ -479,11 +487,6 @@ def get_holdings_enriched() -> EnrichedHoldingsResponse:
     )
 
 
-@app.get("/runs", response_model=list[RunResponse])
-def get_runs() -> list[RunResponse]:
-    return [RunResponse.from_run(r) for r in store.list_runs()]
-
-
 def _try_reconcile_with_oci_outbox(run: Run) -> Run:
     """DELIVERING 상태인 run 에 한해 OCI outbox 결과를 1회 조회하여 갱신.
 
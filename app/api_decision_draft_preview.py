@@ -18,12 +18,14 @@ from typing import Any, Optional
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from app import compute_lanes
 from app.decision_draft_preview_service import (
     ALLOWED_TARGET_KINDS,
     TARGET_KIND_CANDIDATE,
     TARGET_KIND_HOLDING,
     build_preview_text,
 )
+from app.evidence_context import EvidenceContext
 from app.market_data_store import DEFAULT_DB_PATH
 
 router = APIRouter()
@@ -51,7 +53,9 @@ class PreviewResponse(BaseModel):
     message: Optional[str] = None
 
 
-def _load_holdings_evidence(ticker: str) -> Optional[dict[str, Any]]:
+def _load_holdings_evidence(
+    ticker: str, context: Optional[EvidenceContext] = None
+) -> Optional[dict[str, Any]]:
     """canonical 보유 evidence 조립 — 화면과 동일 원천·동일 계산 (FIX r5).
 
     화면 (HoldingsCompareView) 이 사용하는 두 데이터 원천을 그대로 결합한다:
@@ -66,32 +70,35 @@ def _load_holdings_evidence(ticker: str) -> Optional[dict[str, Any]]:
     FIX r3 예외 정책 그대로:
     - 데이터 오류 (파일 부재 / JSON 파싱 / holdings 검증 / SQLite) 만 catch.
     - 프로그래머 오류 (ImportError / AttributeError / TypeError) 는 propagate.
+
+    2026-10 — holdings / quotes / TOP N 은 context (요청 단위 memo) 로 읽는다.
     """
     import json
     import logging
     import sqlite3
     import traceback
 
-    from app import market_cache
-    from app.holdings import HoldingsValidationError, load as load_holdings
+    from app import holdings_market_evidence
+    from app.holdings import HoldingsValidationError
     from app.holdings_enrich import enrich_holdings
-    from app.holdings_market_evidence import build_holdings_market_evidence
-    from app.market_topn import compute_topn
 
     logger = logging.getLogger(__name__)
+    ctx = context or EvidenceContext(db_path=DEFAULT_DB_PATH)
     try:
-        holdings = load_holdings()
+        holdings = ctx.holdings()
         # 화면과 동일하게 market_cache.get_all() 사용 (외부 fetch 0건, cache read).
-        all_quotes = market_cache.get_all()
+        all_quotes = ctx.quotes()
         relevant_quotes = {
             h.ticker: all_quotes[h.ticker] for h in holdings if h.ticker in all_quotes
         }
         enriched = enrich_holdings(holdings, relevant_quotes)
-        topn_payload = compute_topn()
-        evidence_payload = build_holdings_market_evidence(
+        topn_payload = ctx.topn()
+        evidence_payload = holdings_market_evidence.build_holdings_market_evidence(
             holdings=holdings,
             topn_payload=topn_payload,
             market_quotes=relevant_quotes,
+            db_path=ctx.db_path,
+            context=ctx,
         )
     except (
         FileNotFoundError,
@@ -203,17 +210,18 @@ def _aggregate_enriched_by_ticker(enriched: list) -> list[dict[str, Any]]:
     return result
 
 
-def _load_candidate_evidence(ticker: str) -> Optional[dict[str, Any]]:
+def _load_candidate_evidence(
+    ticker: str, context: Optional[EvidenceContext] = None
+) -> Optional[dict[str, Any]]:
     """FIX r3 (2026-07-03): 프로그래머 오류 propagate, 데이터 오류만 catch."""
     import logging
     import sqlite3
     import traceback
 
-    from app.market_topn import compute_topn
-
     logger = logging.getLogger(__name__)
+    ctx = context or EvidenceContext(db_path=DEFAULT_DB_PATH)
     try:
-        payload = compute_topn()
+        payload = ctx.topn()
     except sqlite3.Error as exc:
         logger.warning(
             "decision-draft/preview: candidate evidence load data error "
@@ -231,11 +239,16 @@ def _load_candidate_evidence(ticker: str) -> Optional[dict[str, Any]]:
 
 
 @router.post("/decision-draft/preview", response_model=PreviewResponse)
-def post_decision_draft_preview(req: PreviewRequest) -> PreviewResponse:
+async def post_decision_draft_preview(req: PreviewRequest) -> PreviewResponse:
     """저장 없는 판단 근거 미리보기 생성.
 
     부작용 0건 — DB write / 외부 호출 / 자동 조회 / ML 실행 없음.
+    2026-10 — evidence 조립은 `evidence` lane (app.compute_lanes) 에서 실행.
     """
+    return await compute_lanes.run(compute_lanes.LANE_EVIDENCE, _build_preview, req)
+
+
+def _build_preview(req: PreviewRequest) -> PreviewResponse:
     if req.target_kind not in ALLOWED_TARGET_KINDS:
         return PreviewResponse(status="error", message=_FAILURE_MESSAGE)
     ticker = (req.ticker or "").strip()
@@ -250,11 +263,13 @@ def post_decision_draft_preview(req: PreviewRequest) -> PreviewResponse:
     import traceback
 
     _preview_logger = logging.getLogger(__name__)
+    # 2026-10 — 요청 1건의 evidence 로드 공유 (loader + 시장 참고).
+    context = EvidenceContext(db_path=DEFAULT_DB_PATH)
     try:
         if req.target_kind == TARGET_KIND_HOLDING:
-            target_evidence = _load_holdings_evidence(ticker)
+            target_evidence = _load_holdings_evidence(ticker, context)
         else:
-            target_evidence = _load_candidate_evidence(ticker)
+            target_evidence = _load_candidate_evidence(ticker, context)
     except Exception as exc:  # noqa: BLE001 — endpoint 경계 응답 계약 유지
         _preview_logger.error(
             "decision-draft/preview: unexpected loader error "
@@ -274,6 +289,7 @@ def post_decision_draft_preview(req: PreviewRequest) -> PreviewResponse:
         ticker=ticker,
         target_evidence=target_evidence,
         db_path=DEFAULT_DB_PATH,
+        context=context,
     )
     if result.status != "ok" or result.preview_text is None:
         return PreviewResponse(status="error", message=_FAILURE_MESSAGE)
@@ -4,6 +4,7 @@
 - POST /decision/sessions       : AI 질문 / GPT·Gemini·Claude 3개 답변 / 메모 /
   1차 판정 / 스냅샷 저장.
 - GET  /decision/sessions       : 최근 기록 목록 (요약 + has_* 플래그).
+  2026-10 — `cursor` / `next_cursor` keyset pagination ((created_at, id) 기준).
 - GET  /decision/sessions/{id}  : 특정 기록 상세 (3 답변 분리).
 
 2026-05-21 변경: 단일 answer_text → gpt_answer_text / gemini_answer_text /
@@ -18,6 +19,7 @@ from typing import Literal, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from app.decision_evidence_list import decode_cursor, encode_cursor
 from app.decision_evidence_store import (
     ALLOWED_USER_VERDICTS,
     DEFAULT_DB_PATH,
@@ -106,6 +108,8 @@ class DecisionSessionSummary(BaseModel):
 class ListDecisionSessionsResponse(BaseModel):
     status: str  # "ok"
     records: list[DecisionSessionSummary]
+    # 2026-10 — 다음 페이지 cursor. 더 없으면 None.
+    next_cursor: Optional[str] = None
 
 
 class DecisionSessionDetail(BaseModel):
@@ -178,11 +182,23 @@ def post_decision_session(
 @router.get("/decision/sessions", response_model=ListDecisionSessionsResponse)
 def get_decision_sessions(
     limit: int = Query(default=10, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None),
 ) -> ListDecisionSessionsResponse:
-    rows = list_recent_records(limit=limit, db_path=DEFAULT_DB_PATH)
+    before = None
+    if cursor:
+        before = decode_cursor(cursor)
+        if before is None:
+            raise HTTPException(status_code=422, detail="invalid cursor.")
+    # limit + 1 건을 읽어 다음 페이지 존재 여부를 판정한다.
+    rows = list_recent_records(limit=limit + 1, before=before, db_path=DEFAULT_DB_PATH)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
     return ListDecisionSessionsResponse(
         status="ok",
         records=[DecisionSessionSummary(**r) for r in rows],
+        next_cursor=next_cursor,
     )
 
 
@@ -18,18 +18,27 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
+from app import compute_lanes, single_flight
 from app import holdings as holdings_module
 from app import market_cache
+from app.evidence_context import EvidenceContext
 from app.holdings import HoldingsValidationError, HOLDINGS_FILE
 from app.holdings_market_evidence import (
     build_holdings_market_evidence,
     get_holdings_file_mtime_iso,
 )
+from app.http_cache import (
+    PRIVATE_NO_CACHE,
+    conditional_get,
+    file_version,
+    request_version,
+    sqlite_version,
+)
 from app.market_data_store import DEFAULT_DB_PATH as MARKET_DB_PATH
-from app.market_topn import DEFAULT_BASIS, DEFAULT_N, DEFAULT_ORDER, compute_topn
+from app.market_topn import DEFAULT_BASIS, DEFAULT_N, DEFAULT_ORDER
 
 router = APIRouter()
 
@@ -164,11 +173,26 @@ def _to_market_context_response(
     )
 
 
+def _data_version() -> str:
+    """holdings 파일 + 시세 cache (snapshot + journal) + market_data.sqlite."""
+    return "|".join(
+        [
+            file_version(holdings_module.HOLDINGS_FILE),
+            file_version(market_cache.CACHE_FILE),
+            file_version(market_cache.journal_path()),
+            sqlite_version(MARKET_DB_PATH),
+        ]
+    )
+
+
 @router.get(
     "/holdings/market-evidence/latest",
     response_model=HoldingsMarketEvidenceResponse,
+    dependencies=[Depends(conditional_get(_data_version, PRIVATE_NO_CACHE))],
 )
-def get_holdings_market_evidence_latest() -> HoldingsMarketEvidenceResponse:
+async def get_holdings_market_evidence_latest(
+    request: Request,
+) -> HoldingsMarketEvidenceResponse:
     """보유 ETF × Market Discovery evidence 비교 (지시문 §5.1 / AC-1~2).
 
     응답 status:
@@ -178,27 +202,39 @@ def get_holdings_market_evidence_latest() -> HoldingsMarketEvidenceResponse:
 
     holdings 가 비어있어도 200 + 빈 응답 — 기존 GET /holdings 와 동일 정책
     (지시문 §4.1 "기존 빈 상태 처리를 깨뜨리면 안 된다").
+
+    2026-10 — holdings / quotes / TOP N / 시계열 / 구성종목 / NAV 는 요청 단위
+    EvidenceContext 로 1번씩만 읽는다.
+    2026-10 — 위 입력 파일이 모두 그대로면 (If-None-Match 일치) 조립 없이 304.
+    보유 정보라 Cache-Control 은 private.
+    2026-10 — 조립은 `evidence` lane (app.compute_lanes) 에서 실행. 같은 데이터
+    버전의 동시 요청은 진행 중인 조립 1건을 함께 기다린다 (app.single_flight).
     """
+    flight_key = single_flight.key(
+        request.url.path, {}, request_version(request, _data_version)
+    )
+    return await single_flight.run(
+        flight_key, compute_lanes.LANE_EVIDENCE, _build_response
+    )
+
+
+def _build_response() -> HoldingsMarketEvidenceResponse:
+    context = EvidenceContext(db_path=MARKET_DB_PATH)
     try:
-        loaded = holdings_module.load()
+        loaded = context.holdings()
     except HoldingsValidationError as e:
         raise HTTPException(status_code=500, detail=f"holdings 저장 파일 손상: {e}")
 
     holdings_asof = get_holdings_file_mtime_iso(HOLDINGS_FILE)
 
     # 시세 enrichment 는 캐시에서만 추출 (외부 fetch X — 지시문 §5.1 금지 목록).
-    all_quotes = market_cache.get_all()
+    all_quotes = context.quotes()
     relevant_quotes = {
         h.ticker: all_quotes[h.ticker] for h in loaded if h.ticker in all_quotes
     }
 
     # Market Discovery TOP N 결과 — SQLite read-only (외부 fetch X).
-    topn_payload = compute_topn(
-        n=DEFAULT_N,
-        db_path=MARKET_DB_PATH,
-        basis=DEFAULT_BASIS,
-        order=DEFAULT_ORDER,
-    )
+    topn_payload = context.topn(n=DEFAULT_N, basis=DEFAULT_BASIS, order=DEFAULT_ORDER)
 
     evidence = build_holdings_market_evidence(
         holdings=loaded,
@@ -206,6 +242,7 @@ def get_holdings_market_evidence_latest() -> HoldingsMarketEvidenceResponse:
         market_quotes=relevant_quotes,
         db_path=MARKET_DB_PATH,
         holdings_asof=holdings_asof,
+        context=context,
     )
 
     return HoldingsMarketEvidenceResponse(
@@ -17,15 +17,24 @@ SQLite 만이 시장 데이터의 단일 SSOT.
 
 from __future__ import annotations
 
-from typing import Literal
+from pathlib import Path
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from app import (
+    compute_lanes,
+    dashboard_snapshot,
+    ml_relative_upside_score,
+    single_flight,
+)
 
 from app.api_market_topn_models import (  # noqa: F401 — MarketCandidate re-exported for tests
     MarketCandidate,
     MarketLatestRefresh,
     MarketRefreshResponse,
     MarketRefreshStatusResponse,
+    MarketRiskReference,
     MarketTopNFilters,
     MarketTopNResponse,
 )
@@ -37,6 +46,14 @@ from app.api_market_topn_service import (
     market_context_to_model,
     merge_relative_upside_score,
 )
+from app.http_cache import (
+    conditional_get,
+    file_version,
+    json_bytes_response,
+    request_version,
+    sqlite_version,
+)
+from app.market_data_snapshot import read_db_path
 from app.market_data_store import DEFAULT_DB_PATH
 from app.market_refresh_service import (
     DEFAULT_COOLDOWN_HOURS,
@@ -58,8 +75,24 @@ router = APIRouter()
 # ─── /market/topn/latest ──────────────────────────────────────────────
 
 
-@router.get("/market/topn/latest", response_model=MarketTopNResponse)
-def get_market_topn_latest(
+def _topn_data_version() -> str:
+    """TOP N 응답의 입력 — market_data (snapshot) + 상대상승 점수 snapshot."""
+    return "|".join(
+        [
+            sqlite_version(read_db_path(DEFAULT_DB_PATH)),
+            file_version(ml_relative_upside_score.SCORE_SNAPSHOT_PATH),
+        ]
+    )
+
+
+@router.get(
+    "/market/topn/latest",
+    response_model=MarketTopNResponse,
+    dependencies=[Depends(conditional_get(_topn_data_version))],
+)
+async def get_market_topn_latest(
+    request: Request,
+    response: Response,
     n: int = Query(default=DEFAULT_N, ge=1, le=200),
     basis: BasisLiteral = Query(default=DEFAULT_BASIS),
     order: OrderLiteral = Query(default=DEFAULT_ORDER),
@@ -67,7 +100,7 @@ def get_market_topn_latest(
     exclude_leveraged: bool = Query(default=True),
     exclude_synthetic: bool = Query(default=True),
     exclude_futures: bool = Query(default=True),
-) -> MarketTopNResponse:
+) -> MarketTopNResponse | Response:
     """SQLite 에서 직접 일간 / 1개월 / 3개월 TOP N 산출.
 
     artifact 파일을 읽지 않는다. FDR 호출 / refresh 트리거 없음 (read-only).
@@ -79,10 +112,63 @@ def get_market_topn_latest(
       · 프론트 로컬 reverse 가 아니다.
     invalid basis / order 는 FastAPI Literal 가 422 응답으로 차단.
     필터링은 TOP N limit 이전에 적용된다 (지시문 §3.1).
+    2026-10 — snapshot 모드면 발행된 읽기 전용 snapshot 에서 계산한다.
+    2026-10 — If-None-Match 가 현재 데이터 버전과 같으면 계산 없이 304
+    (app.http_cache).
+    2026-10 — 계산은 전용 `topn` lane (app.compute_lanes) 에서 — 공용 threadpool 을
+    잡지 않는다. 같은 query · 데이터 버전의 동시 요청은 계산 1건을 공유한다
+    (app.single_flight).
+    2026-10 — 자주 쓰는 조합은 refresh 직후 계산해 둔 payload (app.dashboard_snapshot)
+    를 그대로 보낸다. 입력이 그 뒤로 바뀌었거나 드문 조합이면 live 계산.
     """
+    params = dict(
+        n=n,
+        basis=basis,
+        order=order,
+        exclude_inverse=exclude_inverse,
+        exclude_leveraged=exclude_leveraged,
+        exclude_synthetic=exclude_synthetic,
+        exclude_futures=exclude_futures,
+    )
+    cached = await compute_lanes.run(
+        compute_lanes.LANE_STATUS,
+        dashboard_snapshot.load,
+        DEFAULT_DB_PATH,
+        dashboard_snapshot.topn_key(params),
+        (ml_relative_upside_score.SCORE_SNAPSHOT_PATH,),
+    )
+    if cached is not None:
+        return json_bytes_response(cached, response)
+    flight_key = single_flight.key(
+        request.url.path, params, request_version(request, _topn_data_version)
+    )
+    return await single_flight.run(
+        flight_key, compute_lanes.LANE_TOPN, _build_topn_response, **params
+    )
+
+
+def _build_topn_response(
+    *,
+    n: int,
+    basis: str,
+    order: str,
+    exclude_inverse: bool,
+    exclude_leveraged: bool,
+    exclude_synthetic: bool,
+    exclude_futures: bool,
+    db_path: Optional[Path] = None,
+    market_risk_reference: Optional[MarketRiskReference] = None,
+) -> MarketTopNResponse:
+    """TOP N 응답 조립. materialize (app.dashboard_snapshot) 는 운영 DB 경로와
+    한 번 계산한 시장 위험 참고 카드를 넘긴다 — 조합마다 다시 읽지 않는다."""
+    if db_path is None:
+        db_path = read_db_path(DEFAULT_DB_PATH)
+    if market_risk_reference is None:
+        # 2026-07-03 Market Risk Reference v1 — SQLite 만 read (외부 호출 X).
+        market_risk_reference = build_market_risk_reference_payload(db_path)
     payload = compute_topn(
         n=n,
-        db_path=DEFAULT_DB_PATH,
+        db_path=db_path,
         basis=basis,
         order=order,
         exclude_inverse=exclude_inverse,
@@ -94,7 +180,7 @@ def get_market_topn_latest(
     filters_raw = payload.get("filters") or {}
     enriched_candidates = enrich_candidates_with_evidence(
         [candidate_to_model(c) for c in payload.get("candidates", [])],
-        db_path=DEFAULT_DB_PATH,
+        db_path=db_path,
     )
     # 2026-06-20 ML 축1 — 상대상승 참고점수 v0 머지 (지시문 §10). snapshot 부재
     # 시에도 후보 응답 자체는 유지 (지시문 §10 끝 — 실패·미생성 격리).
@@ -136,8 +222,7 @@ def get_market_topn_latest(
         relative_upside_score_user_notice=score_meta.get(
             "relative_upside_score_user_notice"
         ),
-        # 2026-07-03 Market Risk Reference v1 — SQLite 만 read (외부 호출 X).
-        market_risk_reference=build_market_risk_reference_payload(DEFAULT_DB_PATH),
+        market_risk_reference=market_risk_reference,
     )
 
 
@@ -163,8 +248,11 @@ def post_market_refresh() -> MarketRefreshResponse:
 
 
 @router.get("/market/refresh/status", response_model=MarketRefreshStatusResponse)
-def get_market_refresh_status() -> MarketRefreshStatusResponse:
-    snap = get_state_snapshot(
+async def get_market_refresh_status() -> MarketRefreshStatusResponse:
+    # 2026-10 — 상태 polling 은 `status` lane (무거운 계산과 thread 를 나누지 않음).
+    snap = await compute_lanes.run(
+        compute_lanes.LANE_STATUS,
+        get_state_snapshot,
         cooldown_hours=DEFAULT_COOLDOWN_HOURS,
         db_path=DEFAULT_DB_PATH,
     )
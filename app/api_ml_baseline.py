@@ -23,9 +23,10 @@ import json
 from pathlib import Path
 from typing import Any, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
+from app.http_cache import conditional_get, file_version
 from app.ml_baseline_evidence import build_ml_baseline_evidence_snapshot
 
 BASELINE_REPORT_PATH = Path("state/ml/ml_baseline_v0_report_latest.json")
@@ -62,9 +63,20 @@ class MlBaselineEvidenceSnapshotResponse(BaseModel):
     message: Optional[str] = None
 
 
-@router.get("/ml/baseline-v0/latest", response_model=MlBaselineV0Response)
+def _report_version() -> str:
+    return file_version(BASELINE_REPORT_PATH)
+
+
+@router.get(
+    "/ml/baseline-v0/latest",
+    response_model=MlBaselineV0Response,
+    dependencies=[Depends(conditional_get(_report_version))],
+)
 def get_ml_baseline_v0_latest() -> MlBaselineV0Response:
-    """저장된 baseline 룩백 report 만 반환 (재계산 X / 외부 호출 X)."""
+    """저장된 baseline 룩백 report 만 반환 (재계산 X / 외부 호출 X).
+
+    2026-10 — report 파일이 그대로면 (If-None-Match 일치) 읽지 않고 304.
+    """
     if not BASELINE_REPORT_PATH.exists():
         return MlBaselineV0Response(
             status="empty",
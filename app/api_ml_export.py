@@ -0,0 +1,60 @@
+"""GET /ml/export/{dataset} — ML feature / 예측 streaming export (2026-10).
+
+read-only. 저장된 `etf_ml_feature_daily` / `market_risk_feature_daily` 와
+walk-forward 예측 CSV artifact 를 조각 단위로 NDJSON 또는 CSV 로 흘려보낸다
+(app.ml_export). 응답 전체를 메모리에 만들지 않는다 — 다년치 표도 process 메모리가
+조각 1개 크기로 일정.
+
+- format: ndjson (기본, 행마다 JSON 1줄) / csv (header 포함).
+- start / end: asof 구간 (양끝 포함, YYYY-MM-DD).
+- ticker: 반복 지정 (ETF feature 만). 다른 데이터셋에 주면 422.
+- 외부 source 호출 X / 계산 X. 첫 조각 전에 입력을 검증하므로 오류는 본문 전에 422.
+"""
+
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app import ml_export
+from app.market_data_store import DEFAULT_DB_PATH
+
+router = APIRouter()
+
+DatasetLiteral = Literal[
+    "etf_features", "market_risk_features", "walk_forward_predictions"
+]
+FormatLiteral = Literal["ndjson", "csv"]
+_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+
+@router.get("/ml/export/{dataset}")
+def get_ml_export(
+    dataset: DatasetLiteral,
+    format: FormatLiteral = Query(default="ndjson"),
+    start: Optional[str] = Query(default=None, pattern=_DATE_PATTERN),
+    end: Optional[str] = Query(default=None, pattern=_DATE_PATTERN),
+    ticker: list[str] = Query(default=[]),
+) -> StreamingResponse:
+    """데이터셋을 조각 단위로 streaming. 결과가 없으면 빈 본문 (csv 는 header 만)."""
+    try:
+        source = ml_export.open_export(
+            dataset,
+            start=start,
+            end=end,
+            tickers=ticker,
+            db_path=DEFAULT_DB_PATH,
+        )
+    except ml_export.ExportError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    filename = f"{dataset}.{format}"
+    return StreamingResponse(
+        ml_export.encode(source, format),
+        media_type=ml_export.MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        },
+    )
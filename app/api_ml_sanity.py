@@ -13,9 +13,11 @@ import json
 from pathlib import Path
 from typing import Any, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
+from app.http_cache import conditional_get, file_version
+
 SANITY_SNAPSHOT_PATH = Path("state/ml/ml_feature_sanity_latest.json")
 
 router = APIRouter()
@@ -28,7 +30,15 @@ class MlFeatureSanityResponse(BaseModel):
     message: Optional[str] = None
 
 
-@router.get("/ml/feature-sanity/latest", response_model=MlFeatureSanityResponse)
+def _snapshot_version() -> str:
+    return file_version(SANITY_SNAPSHOT_PATH)
+
+
+@router.get(
+    "/ml/feature-sanity/latest",
+    response_model=MlFeatureSanityResponse,
+    dependencies=[Depends(conditional_get(_snapshot_version))],
+)
 def get_ml_feature_sanity_latest() -> MlFeatureSanityResponse:
     """저장된 sanity snapshot 만 반환 (재계산 X / 외부 호출 X).
 
@@ -36,6 +46,8 @@ def get_ml_feature_sanity_latest() -> MlFeatureSanityResponse:
       - empty: snapshot 파일이 아직 생성되지 않은 정상 초기 상태.
       - error: snapshot 파일이 존재하지만 손상되어 읽을 수 없음 (fail-loud).
       - ok: snapshot 정상 반환.
+
+    2026-10 — snapshot 파일이 그대로면 (If-None-Match 일치) 읽지 않고 304.
     """
     if not SANITY_SNAPSHOT_PATH.exists():
         return MlFeatureSanityResponse(
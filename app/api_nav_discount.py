@@ -14,17 +14,21 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response
 from pydantic import BaseModel
 
+from app import dashboard_snapshot
 from app.etf_nav_fetcher import classify_discount_flag
 from app.etf_nav_store import (
     DEFAULT_DB_PATH as NAV_DB_PATH,
     NavDailyRow,
     fetch_all_latest_nav,
 )
+from app.http_cache import conditional_get, json_bytes_response, sqlite_version
+from app.market_data_snapshot import read_db_path
 from app.market_data_store import DEFAULT_DB_PATH as MARKET_DB_PATH
 
 router = APIRouter()
@@ -110,15 +114,45 @@ def _row_to_item(row: NavDailyRow, name: Optional[str]) -> NavDiscountItem:
 # ─── route ─────────────────────────────────────────────────────────────
 
 
-@router.get("/market/nav-discount/latest", response_model=NavDiscountResponse)
-def get_nav_discount_latest() -> NavDiscountResponse:
+def _data_version() -> str:
+    # NAV 와 ETF 이름은 보통 같은 market_data.sqlite — 경로가 갈라진 경우도 각각.
+    return "|".join(
+        sqlite_version(read_db_path(p)) for p in (NAV_DB_PATH, MARKET_DB_PATH)
+    )
+
+
+@router.get(
+    "/market/nav-discount/latest",
+    response_model=NavDiscountResponse,
+    dependencies=[Depends(conditional_get(_data_version))],
+)
+def get_nav_discount_latest(response: Response) -> NavDiscountResponse | Response:
     """저장된 etf_nav_daily 최신 NAV/괴리율을 read-only 로 반환.
 
     - 외부 source 호출 X / refresh X.
     - 모든 ETF (asof DESC, created_at DESC) 기준 최신 row 1건씩.
     - 매수/매도 판단 X.
+    - 2026-10 — snapshot 모드면 발행된 읽기 전용 snapshot 을 읽는다.
+    - 2026-10 — If-None-Match 가 현재 DB 버전과 같으면 조회 없이 304.
+    - 2026-10 — refresh 직후 계산해 둔 응답 (app.dashboard_snapshot) 이 현재
+      데이터 기준이면 그대로 보낸다. NAV 와 ETF 이름 DB 가 같은 파일일 때만.
     """
-    rows = fetch_all_latest_nav(db_path=NAV_DB_PATH)
+    if NAV_DB_PATH == MARKET_DB_PATH:
+        cached = dashboard_snapshot.load(
+            NAV_DB_PATH, dashboard_snapshot.KEY_NAV_DISCOUNT
+        )
+        if cached is not None:
+            return json_bytes_response(cached, response)
+    return build_nav_discount_response(
+        read_db_path(NAV_DB_PATH), read_db_path(MARKET_DB_PATH)
+    )
+
+
+def build_nav_discount_response(
+    nav_db_path: Path, market_db_path: Path
+) -> NavDiscountResponse:
+    """NAV 괴리율 응답 조립 — endpoint live 경로와 app.dashboard_snapshot 공용."""
+    rows = fetch_all_latest_nav(db_path=nav_db_path)
     if not rows:
         return NavDiscountResponse(
             status="empty",
@@ -131,7 +165,7 @@ def get_nav_discount_latest() -> NavDiscountResponse:
             items=[],
         )
 
-    name_map = _build_name_map(MARKET_DB_PATH)
+    name_map = _build_name_map(market_db_path)
     items = [_row_to_item(r, name_map.get(r.etf_ticker)) for r in rows]
 
     ok_count = sum(1 for it in items if it.status == "ok")
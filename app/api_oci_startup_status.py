@@ -7,15 +7,37 @@ POC3-07 (PLAN V2 §4.2 · 설계자 Q2):
   - 첫 화면(오늘의 투자 점검)은 summary_line·checked_at 만 사용해 한 줄 표시.
   - 상세(jobs·note)는 진단·상태 화면에서만 사용.
 
+2026-10 — source_circuits: 외부 데이터 소스(fdr / pykrx / naver / yahoo) circuit
+breaker 의 현재 상태. sqlite_connections: 공유 SQLite connection 수 / acquire 지연.
+둘 다 프로세스 메모리 값이라 요청마다 그대로 읽는다 (외부 조회 없음).
+market_data_tables: market_data.sqlite 테이블별 행 수 / 최신 날짜 / 마지막 writer
+run — writer 가 유지하는 통계 테이블 (app.market_data_stats) 1번 조회. 데이터
+크기와 무관하게 일정 비용.
+compute_lanes: 무거운 read endpoint 전용 executor (app.compute_lanes) lane 별
+실행 / 대기 수와 대기 시간 — 503 거절이 늘면 worker 수 조정 신호. 통계 조회는
+`status` lane 에서 돌려 event loop 를 막지 않는다.
+
 민감정보는 스냅샷 자체에 없다(app.oci_startup_status 가 담지 않음).
 """
 
 from __future__ import annotations
 
+import logging
+import sqlite3
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
-from app import oci_startup_status
+from app import (
+    compute_lanes,
+    market_data_stats,
+    market_data_store,
+    oci_startup_status,
+    source_circuit_breaker,
+    sqlite_pool,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/oci", tags=["oci-status"])
 
@@ -26,6 +48,49 @@ class OciJobStatusModel(BaseModel):
     detail: str = ""
 
 
+class SourceCircuitModel(BaseModel):
+    source: str
+    state: str  # closed | open | half_open
+    consecutive_failures: int
+    open_seconds: float
+    retry_after_seconds: float | None = None
+    total_failures: int
+    total_short_circuits: int
+    last_error: str | None = None
+
+
+class SqlitePoolModel(BaseModel):
+    open_read_connections: int
+    open_write_connections: int
+    opened_total: int
+    reopened_total: int
+    reused_total: int
+    acquire_count: int
+    acquire_ms_avg: float
+    acquire_ms_max: float
+
+
+class MarketTableStatsModel(BaseModel):
+    table: str
+    row_count: int
+    min_date: str | None = None
+    max_date: str | None = None
+    last_run_id: str | None = None
+    updated_at: str | None = None
+
+
+class ComputeLaneModel(BaseModel):
+    lane: str
+    max_workers: int
+    max_queue: int
+    running: int
+    queued: int
+    completed_total: int
+    rejected_total: int
+    wait_ms_avg: float
+    wait_ms_max: float
+
+
 class OciStartupStatusResponse(BaseModel):
     checked_at: str | None
     reachable: bool
@@ -34,12 +99,28 @@ class OciStartupStatusResponse(BaseModel):
     crontab_active: bool | None
     jobs: list[OciJobStatusModel]
     note: str
+    source_circuits: list[SourceCircuitModel] = []
+    sqlite_connections: SqlitePoolModel | None = None
+    market_data_tables: list[MarketTableStatsModel] = []
+    compute_lanes: list[ComputeLaneModel] = []
+
+
+def _market_table_stats() -> list[MarketTableStatsModel]:
+    try:
+        stats = market_data_stats.load_stats(market_data_store.DEFAULT_DB_PATH)
+    except sqlite3.Error as e:
+        logger.warning("market_data 통계 조회 실패: %s", e)
+        return []
+    return [MarketTableStatsModel(**vars(s)) for s in (stats or {}).values()]
 
 
 @router.get("/startup-status", response_model=OciStartupStatusResponse)
-def get_oci_startup_status() -> OciStartupStatusResponse:
+async def get_oci_startup_status() -> OciStartupStatusResponse:
     """기동 시 1회 읽은 OCI 상태 스냅샷 반환(재조회 없음)."""
     snap = oci_startup_status.get_snapshot()
+    market_tables = await compute_lanes.run(
+        compute_lanes.LANE_STATUS, _market_table_stats
+    )
     return OciStartupStatusResponse(
         checked_at=snap.checked_at,
         reachable=snap.reachable,
@@ -51,4 +132,10 @@ def get_oci_startup_status() -> OciStartupStatusResponse:
             for j in snap.jobs
         ],
         note=snap.note,
+        source_circuits=[
+            SourceCircuitModel(**vars(c)) for c in source_circuit_breaker.snapshot_all()
+        ],
+        sqlite_connections=SqlitePoolModel(**vars(sqlite_pool.pool_stats())),
+        market_data_tables=market_tables,
+        compute_lanes=[ComputeLaneModel(**vars(s)) for s in compute_lanes.lane_stats()],
     )
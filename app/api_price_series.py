@@ -14,19 +14,31 @@
   (UNAVAILABLE) 구분.
 - 내부 파일 경로·SQL·stack trace 미노출.
 - 신규 DB·테이블·schema·source·cache 없음. 기존 ETF ticker 호출 계약 불변.
+
+2026-10 — `?format=columnar` 는 같은 값을 `dates[]` / `closes[]` 두 배열로 반환
+(PriceSeriesColumnarResponse). 다년 시계열에서 점마다 반복되는 key 와 점 단위
+model 생성을 없앤다 — 차트 client 가 opt-in. 기본값 (rows) 계약은 그대로.
+
+2026-10 — 선택 parameter `start` / `end` (YYYY-MM-DD, 양끝 포함) 는 SQL 에서 구간을
+거르고, `max_points` 는 LTTB (app.series_downsample) 로 점 수를 줄인다 — 첫 / 마지막
+점은 유지, 값은 저장값 그대로. 셋 다 없으면 기존처럼 전체 시계열.
 """
 
 from __future__ import annotations
 
 import re
-from typing import Optional
+from datetime import date
+from typing import Literal, Optional, Union
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
+from app.http_cache import conditional_get, sqlite_version
 from app.market_benchmark_store import fetch_benchmark_history
+from app.market_data_snapshot import read_db_path
 from app.market_data_store import DEFAULT_DB_PATH as MARKET_DB_PATH
 from app.market_data_store import fetch_price_history
+from app.series_downsample import lttb
 
 router = APIRouter()
 
@@ -39,6 +51,9 @@ _TICKER_RE = re.compile(r"^[0-9A-Za-z]{6}$")
 # 저장된 지수만 노출 — 임의 benchmark_id 조회를 막는다 (KOSPI 코스피 대표 차트).
 _ALLOWED_BENCHMARKS = {"KOSPI"}
 
+# max_points 상한 — 이보다 큰 값은 사실상 전체 시계열이라 downsample 의미가 없다.
+MAX_POINTS_LIMIT = 5000
+
 
 class PricePoint(BaseModel):
     date: str  # SQLite 저장 거래 기준일 (YYYY-MM-DD)
@@ -56,14 +71,49 @@ class PriceSeriesResponse(BaseModel):
     series: list[PricePoint] = []
 
 
-def _series_response(label: str, rows) -> PriceSeriesResponse:
-    """(date, close) rows → PriceSeriesResponse. rows 는 date ASC 저장값 그대로."""
+class PriceSeriesColumnarResponse(BaseModel):
+    """format=columnar — series 대신 dates[i] / closes[i] 가 같은 거래일."""
+
+    ticker: str
+    availability: str
+    reason: Optional[str] = None
+    available_from: Optional[str] = None
+    available_to: Optional[str] = None
+    dates: list[str] = []
+    closes: list[float] = []
+
+
+SeriesFormat = Literal["rows", "columnar"]
+AnySeriesResponse = Union[PriceSeriesResponse, PriceSeriesColumnarResponse]
+
+
+def _model_for(fmt: SeriesFormat) -> type[AnySeriesResponse]:
+    return PriceSeriesColumnarResponse if fmt == "columnar" else PriceSeriesResponse
+
+
+def _unavailable(
+    label: str, reason: str, fmt: SeriesFormat = "rows"
+) -> AnySeriesResponse:
+    return _model_for(fmt)(ticker=label, availability="UNAVAILABLE", reason=reason)
+
+
+def _series_response(label: str, rows, fmt: SeriesFormat = "rows") -> AnySeriesResponse:
+    """(date, close) rows → 응답 model. rows 는 date ASC 저장값 그대로."""
     if not rows:
-        return PriceSeriesResponse(
+        return _model_for(fmt)(
             ticker=label,
             availability="NO_DATA",
             reason="no_stored_data",
         )
+    if fmt == "columnar":
+        return PriceSeriesColumnarResponse(
+            ticker=label,
+            availability="AVAILABLE",
+            available_from=rows[0][0],
+            available_to=rows[-1][0],
+            dates=[d for (d, _c) in rows],
+            closes=[c for (_d, c) in rows],
+        )
     series = [PricePoint(date=d, price=c) for (d, c) in rows]
     return PriceSeriesResponse(
         ticker=label,
@@ -74,51 +124,83 @@ def _series_response(label: str, rows) -> PriceSeriesResponse:
     )
 
 
-@router.get("/market/price-series", response_model=PriceSeriesResponse)
-def get_price_series(ticker: str = "", benchmark: str = "") -> PriceSeriesResponse:
+def _parse_window(
+    start: Optional[str], end: Optional[str]
+) -> Optional[tuple[Optional[str], Optional[str]]]:
+    """start / end 를 ISO 날짜로 정규화. 형식 오류 또는 start > end 면 None."""
+    try:
+        lo = date.fromisoformat(start).isoformat() if start else None
+        hi = date.fromisoformat(end).isoformat() if end else None
+    except ValueError:
+        return None
+    if lo is not None and hi is not None and lo > hi:
+        return None
+    return lo, hi
+
+
+def _thin(rows, max_points: Optional[int]):
+    return rows if max_points is None else lttb(rows, max_points)
+
+
+def _data_version() -> str:
+    return sqlite_version(read_db_path(MARKET_DB_PATH))
+
+
+@router.get(
+    "/market/price-series",
+    response_model=AnySeriesResponse,
+    dependencies=[Depends(conditional_get(_data_version))],
+)
+def get_price_series(
+    ticker: str = "",
+    benchmark: str = "",
+    format: SeriesFormat = Query(default="rows"),
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    max_points: Optional[int] = Query(default=None, ge=2, le=MAX_POINTS_LIMIT),
+) -> AnySeriesResponse:
     """선택 ticker / 시장지수 benchmark 의 저장된 일별 가격 시계열 (read-only).
 
     - benchmark 파라미터가 있으면 시장지수 시계열 (KOSPI 등) 을 반환한다
       (POC3-01 코스피 대표 차트). 허용 benchmark 만 조회.
     - 없으면 기존대로 선택 ticker 시계열 (frontend lazy · 기존 계약 불변).
+    - 2026-10 — snapshot 모드면 발행된 읽기 전용 snapshot 을 읽는다.
+    - 2026-10 — ETag (ticker / benchmark query 포함) 가 같으면 조회 없이 304.
+    - 2026-10 — format=columnar 면 dates[] / closes[] 배열 (값·순서 동일).
+    - 2026-10 — start / end 구간 (형식 오류 → invalid_range) + max_points LTTB.
     """
+    window = _parse_window(start, end)
     bm = (benchmark or "").strip().upper()
     if bm:
         # 시장지수 benchmark 분기 (POC3-01). 허용 목록 밖은 형식 오류로 구분.
         if bm not in _ALLOWED_BENCHMARKS:
-            return PriceSeriesResponse(
-                ticker=bm,
-                availability="UNAVAILABLE",
-                reason="invalid_benchmark",
-            )
+            return _unavailable(bm, "invalid_benchmark", format)
+        if window is None:
+            return _unavailable(bm, "invalid_range", format)
+        lo, hi = window
         try:
-            rows = fetch_benchmark_history(bm, db_path=MARKET_DB_PATH)
-        except Exception:  # noqa: BLE001 — 내부 오류를 raw 로 노출하지 않는다.
-            return PriceSeriesResponse(
-                ticker=bm,
-                availability="UNAVAILABLE",
-                reason="read_failure",
+            rows = fetch_benchmark_history(
+                bm, start=lo, end=hi, db_path=read_db_path(MARKET_DB_PATH)
             )
-        return _series_response(bm, rows)
+        except Exception:  # noqa: BLE001 — 내부 오류를 raw 로 노출하지 않는다.
+            return _unavailable(bm, "read_failure", format)
+        return _series_response(bm, _thin(rows, max_points), format)
 
     tk = (ticker or "").strip()
 
     # ticker 형식 오류 → UNAVAILABLE (데이터 없음과 구분).
     if not tk or not _TICKER_RE.match(tk):
-        return PriceSeriesResponse(
-            ticker=tk,
-            availability="UNAVAILABLE",
-            reason="invalid_ticker",
-        )
+        return _unavailable(tk, "invalid_ticker", format)
+    if window is None:
+        return _unavailable(tk, "invalid_range", format)
+    lo, hi = window
 
     # 내부 조회 실패(DB 손상 등) → UNAVAILABLE (raw 예외 미노출).
     try:
-        rows = fetch_price_history(tk, db_path=MARKET_DB_PATH)
-    except Exception:  # noqa: BLE001 — 내부 오류를 raw 로 노출하지 않는다.
-        return PriceSeriesResponse(
-            ticker=tk,
-            availability="UNAVAILABLE",
-            reason="read_failure",
+        rows = fetch_price_history(
+            tk, start=lo, end=hi, db_path=read_db_path(MARKET_DB_PATH)
         )
+    except Exception:  # noqa: BLE001 — 내부 오류를 raw 로 노출하지 않는다.
+        return _unavailable(tk, "read_failure", format)
 
-    return _series_response(tk, rows)
+    return _series_response(tk, _thin(rows, max_points), format)
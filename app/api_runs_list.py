@@ -0,0 +1,70 @@
+"""Run 목록 API — GET /runs (2026-10 app.api 에서 분리).
+
+- 응답 본문은 기존과 같은 `RunResponse` 배열 (run_id 내림차순).
+- 2026-10 — run 저장소 SQLite 이전과 함께 페이지 단위로 읽는다.
+  `limit` (기본 50) / `status` 필터 / `before` (직전 페이지 마지막 run_id).
+  다음 페이지가 있으면 `X-Next-Cursor` 헤더에 다음 `before` 값을 싣는다
+  (본문 배열 형태를 바꾸지 않기 위해 헤더 사용).
+
+`RunResponse` 는 app.api 의 run 엔드포인트들이 함께 쓴다 (app.api 가 re-export).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from fastapi import APIRouter, Query, Response
+from pydantic import BaseModel
+
+from app import compute_lanes, store
+from app.models import Run, Status
+
+router = APIRouter()
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class RunResponse(BaseModel):
+    run_id: str
+    asof: str
+    status: str
+    draft_payload: Optional[dict[str, Any]] = None
+    # POC2 Step 2D: 신규 run 은 generate 시점에 백엔드가 빌드한 message_text 를
+    # 응답에 그대로 포함한다. 과거 run 은 None.
+    # 프론트엔드는 이 값을 opaque string 으로 받아 그대로 렌더링한다 (조립 금지).
+    message_text: Optional[str] = None
+    # POC2 3-PUSH Message Contract 정렬 (2026-06-11) — 3종 PUSH 구분 식별자.
+    # 과거 run 은 None. delivery / OCI consumer 는 본 필드를 읽지 않는다.
+    push_kind: Optional[str] = None
+
+    @classmethod
+    def from_run(cls, run: Run) -> "RunResponse":
+        return cls(
+            run_id=run.run_id,
+            asof=run.asof,
+            status=run.status,
+            draft_payload=run.draft_payload,
+            message_text=run.message_text,
+            push_kind=run.push_kind,
+        )
+
+
+@router.get("/runs", response_model=list[RunResponse])
+async def get_runs(
+    response: Response,
+    limit: int = Query(default=store.DEFAULT_PAGE_LIMIT, ge=1, le=store.MAX_PAGE_LIMIT),
+    status: Optional[Status] = Query(default=None),
+    before: Optional[str] = Query(default=None),
+) -> list[RunResponse]:
+    # 2026-10 — polling 조회라 `status` lane (무거운 계산 lane 과 thread 분리).
+    runs = await compute_lanes.run(
+        compute_lanes.LANE_STATUS,
+        store.list_runs_page,
+        limit=limit + 1,
+        before=before,
+        status=status,
+    )
+    if len(runs) > limit:
+        runs = runs[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = runs[-1].run_id
+    return [RunResponse.from_run(r) for r in runs]
@@ -4,7 +4,7 @@
 
 설계자 결정 (Step 6 §6 / §7 / §12 + Step6 Fix 라운드 2026-05-11):
 - POST /universe/momentum/refresh : 수동 sync refresh (pykrx 1개월 수익률).
-  GenerateDraft / Approve / Telegram 자동 호출 금지. seed >20 hard fail.
+  GenerateDraft / Approve / Telegram 자동 호출 금지. seed cap 초과 hard fail.
   candidate 단위 실패는 partial / failed 결과로 저장 (HTTP 200).
 - **신규 endpoint 추가 금지** (Fix 라운드 결정) — GET /universe/momentum/latest 제거.
   UI 의 마지막 갱신 결과 표시는 POST refresh 응답을 frontend state 로 보관해서 처리하며,
@@ -86,7 +86,8 @@ def post_universe_momentum_refresh() -> UniverseMomentumRefreshResponse:
 
     실패 처리:
     - seed 파일 부재 / asof 누락·형식 오류·미래 날짜 / items 비정상: 422 (universe seed 검증 실패)
-    - items 20개 초과: 422 (UniverseRefreshError) — 조용히 자르지 않는다.
+    - items cap (MAX_UNIVERSE_ITEMS_PER_REFRESH) 초과: 422 (UniverseRefreshError)
+      — 조용히 자르지 않는다.
     - candidate 단위 pykrx 실패는 partial / failed 결과로 저장 (HTTP 200 OK).
     """
     # Step 7A: seed 파일 부재 시 starter seed 생성 (기존 사용자 seed 보호).
@@ -0,0 +1,178 @@
+"""무거운 read 계산 전용 bounded executor — lane 별 동시 실행 상한 (2026-10).
+
+배경: 모든 router 가 sync `def` 라 Starlette 공용 threadpool (기본 40) 을 같이 썼다.
+대시보드 로드 몇 건이 `compute_topn` / holdings evidence 조립으로 thread 를 오래
+잡으면, `/runs` · `/market/refresh/status` 같은 가벼운 polling 도 thread 를 기다렸다.
+
+lane = 이름 붙은 전용 ThreadPoolExecutor (worker 수 = 그 lane 의 동시 실행 상한).
+async endpoint 가 `await run(lane, fn, ...)` 로 넘기면:
+- 대기 중인 요청은 thread 를 잡지 않고 event loop 에서 기다린다.
+- lane 대기열이 `max_queue` 를 넘으면 503 + Retry-After (무한 적체 방지).
+- lane 끼리 / 공용 threadpool 과 thread 를 나누지 않는다 — 한 lane 이 밀려도
+  다른 lane 과 나머지 endpoint 는 영향 없다.
+
+`status` lane 은 상태 polling endpoint 전용 (작은 SQLite 조회도 event loop 밖).
+`lane_stats()` 는 대기열 길이 / 대기 시간 — `/oci/startup-status` 가 노출한다.
+worker 수는 `COMPUTE_LANE_<NAME>_WORKERS` 환경변수로 바꿀 수 있다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi import HTTPException
+
+from app.config import optional_env
+
+T = TypeVar("T")
+
+LANE_TOPN = "topn"
+LANE_EVIDENCE = "evidence"
+LANE_STATUS = "status"
+
+# lane → (기본 worker 수, 대기열 상한).
+_LANE_DEFAULTS: dict[str, tuple[int, int]] = {
+    LANE_TOPN: (2, 16),
+    LANE_EVIDENCE: (2, 16),
+    LANE_STATUS: (4, 64),
+}
+RETRY_AFTER_SECONDS = 1
+
+
+@dataclass(frozen=True)
+class LaneStats:
+    lane: str
+    max_workers: int
+    max_queue: int
+    running: int
+    queued: int
+    completed_total: int
+    rejected_total: int
+    wait_ms_avg: float
+    wait_ms_max: float
+
+
+class _Lane:
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.running = 0
+        self.queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # 호출자가 _lock 보유. shutdown 뒤 다시 쓰면 새로 만든다 (테스트 lifespan 반복).
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"lane-{self.name}",
+            )
+        return self._executor
+
+    def submit(self, call: Callable[[], T]) -> "Future[T]":
+        submitted = time.monotonic()
+
+        def task() -> T:
+            waited = time.monotonic() - submitted
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            try:
+                return call()
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"요청이 밀려 있습니다 ({self.name}). 잠시 후 다시 시도해 주세요.",
+                    headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+                )
+            self.queued += 1
+            future = self._pool().submit(task)
+        # 시작 전에 취소 (client 연결 끊김) 되면 task 가 돌지 않는다 — 대기열에서 뺀다.
+        future.add_done_callback(self._forget_if_cancelled)
+        return future
+
+    def _forget_if_cancelled(self, future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+    def stats(self) -> LaneStats:
+        with self._lock:
+            started = self.completed + self.running
+            avg = self.wait_seconds_total / started if started else 0.0
+            return LaneStats(
+                lane=self.name,
+                max_workers=self.max_workers,
+                max_queue=self.max_queue,
+                running=self.running,
+                queued=self.queued,
+                completed_total=self.completed,
+                rejected_total=self.rejected,
+                wait_ms_avg=round(avg * 1000, 3),
+                wait_ms_max=round(self.wait_seconds_max * 1000, 3),
+            )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def _workers(name: str, default: int) -> int:
+    raw = optional_env(f"COMPUTE_LANE_{name.upper()}_WORKERS", default=str(default))
+    return max(1, int(raw))
+
+
+_LANES: dict[str, _Lane] = {
+    name: _Lane(name, _workers(name, workers), max_queue)
+    for name, (workers, max_queue) in _LANE_DEFAULTS.items()
+}
+
+
+def submit(lane: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+    """fn(*args, **kwargs) 를 lane 에 넣고 concurrent Future 를 돌려준다.
+
+    contextvars 는 복사해서 넘긴다 (Starlette run_in_threadpool 과 같은 동작).
+    대기열이 가득 차면 HTTPException(503). 여러 요청이 한 결과를 기다리는 경우
+    (app.single_flight) 가 아니면 `run()` 을 쓴다.
+    """
+    ctx = contextvars.copy_context()
+    return _LANES[lane].submit(partial(ctx.run, fn, *args, **kwargs))
+
+
+async def run(lane: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """fn(*args, **kwargs) 를 lane 전용 thread 에서 실행하고 결과를 기다린다."""
+    return await asyncio.wrap_future(submit(lane, fn, *args, **kwargs))
+
+
+def lane_stats() -> list[LaneStats]:
+    return [_LANES[name].stats() for name in sorted(_LANES)]
+
+
+def shutdown() -> None:
+    """lifespan 종료 시 — 실행 중인 작업을 기다린 뒤 thread 정리."""
+    for lane in _LANES.values():
+        lane.shutdown()
@@ -0,0 +1,197 @@
+"""refresh 직후 대시보드 응답을 미리 계산해 두는 materialized snapshot (2026-10).
+
+배경: `/market/topn/latest` (시장 위험 참고 카드 포함) · `/market/nav-discount/latest`
+는 요청마다 universe 전체를 다시 계산했다. 입력 데이터는 `_execute_refresh_job` /
+scripts/refresh_market_timeseries.py / scripts/refresh_nav_universe.py 가 끝날
+때만 바뀌므로, 그 직후 1번 계산해 두면 API 지연이 universe 크기와 무관해진다.
+
+- `materialize(db_path)` — 자주 쓰는 parameter 조합 (frontend 대시보드 / workbench
+  의 n · 모든 basis × order · 기본 필터) 의 TOP N 응답과 NAV 괴리율 응답을 계산해
+  `dashboard_snapshot` 테이블 (market_data.sqlite) 에 key 별 1행으로 바꿔 쓴다.
+  payload 는 응답 JSON 의 zlib 압축본.
+- 각 행은 계산 직전의 입력 버전 (추적 테이블 change_seq, TOP N 은 상대상승 점수
+  snapshot 파일 버전까지) 을 함께 저장한다. `load` 는 현재 버전과 같을 때만
+  payload 를 돌려준다 — 이후 어느 writer 든 데이터를 바꾸면 live 계산으로 간다.
+- snapshot 모드 (app.market_data_snapshot) 면 발행 전에 계산하므로 발행본에 함께
+  들어간다. API 는 `read_db_path` 로 같은 파일에서 payload 와 버전을 읽는다.
+- 드문 조합 (다른 n / 필터 해제) 은 지금처럼 요청 시 계산한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from app import market_data_stats
+from app.http_cache import file_version
+from app.market_data_snapshot import read_db_path
+from app.market_topn_helpers import ALLOWED_BASIS, ALLOWED_ORDER, DEFAULT_N
+from app.sqlite_pool import pooled_connection
+
+logger = logging.getLogger(__name__)
+
+TABLE = "dashboard_snapshot"
+
+DASHBOARD_SNAPSHOT_DDL = f"""
+CREATE TABLE IF NOT EXISTS {TABLE} (
+    key            TEXT PRIMARY KEY,
+    source_version TEXT NOT NULL,
+    payload        BLOB NOT NULL,
+    raw_bytes      INTEGER NOT NULL,
+    built_at       TEXT NOT NULL
+)
+""".strip()
+
+KEY_NAV_DISCOUNT = "nav_discount"
+# frontend/lib/api/dashboardKeys.ts — 대시보드 카드 n=10, workbench n=30.
+TOPN_N_VALUES = (DEFAULT_N, 30)
+TOPN_DEFAULT_FILTERS = {
+    "exclude_inverse": True,
+    "exclude_leveraged": True,
+    "exclude_synthetic": True,
+    "exclude_futures": True,
+}
+_COMPRESS_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class MaterializeSummary:
+    entries: int
+    raw_bytes: int
+    stored_bytes: int
+    runtime_seconds: float
+
+
+def topn_key(params: Mapping[str, Any]) -> str:
+    """TOP N query 값 → key. bool 은 소문자, 이름 순 (query 순서 무관)."""
+    parts = []
+    for name, value in sorted(params.items()):
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        parts.append(f"{name}={value}")
+    return "topn?" + "&".join(parts)
+
+
+def topn_variants() -> list[dict[str, Any]]:
+    return [
+        {"n": n, "basis": basis, "order": order, **TOPN_DEFAULT_FILTERS}
+        for n in sorted(set(TOPN_N_VALUES))
+        for basis in ALLOWED_BASIS
+        for order in ALLOWED_ORDER
+    ]
+
+
+def _source_version(
+    con: sqlite3.Connection, extra_files: Iterable[Path] = ()
+) -> Optional[str]:
+    version = market_data_stats.data_version(con)
+    if version is None:
+        return None
+    return "|".join([version, *(file_version(p) for p in extra_files)])
+
+
+def load(db_path: Path, key: str, extra_files: Iterable[Path] = ()) -> Optional[bytes]:
+    """key 의 응답 JSON. 없거나 입력이 그 뒤로 바뀌었으면 None (→ live 계산)."""
+    path = read_db_path(db_path)
+    if not Path(path).exists():
+        return None
+    try:
+        with pooled_connection(path) as con:
+            row = con.execute(
+                f"SELECT source_version, payload FROM {TABLE} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            current = _source_version(con, extra_files)
+    except sqlite3.OperationalError:
+        # 테이블 이전 DB / snapshot — live 계산.
+        return None
+    if current is None or row[0] != current:
+        return None
+    return zlib.decompress(row[1])
+
+
+def _builders(
+    db_path: Path,
+) -> list[tuple[str, Callable[[], Any], tuple[Path, ...]]]:
+    # API 모듈의 응답 조립 함수를 그대로 쓴다 — live 응답과 같은 모양 보장.
+    from app import api_market_topn, api_nav_discount, ml_relative_upside_score
+
+    risk = api_market_topn.build_market_risk_reference_payload(db_path)
+    score_files = (ml_relative_upside_score.SCORE_SNAPSHOT_PATH,)
+    out: list[tuple[str, Callable[[], Any], tuple[Path, ...]]] = [
+        (
+            KEY_NAV_DISCOUNT,
+            lambda: api_nav_discount.build_nav_discount_response(db_path, db_path),
+            (),
+        )
+    ]
+    for params in topn_variants():
+        out.append(
+            (
+                topn_key(params),
+                lambda p=params: api_market_topn._build_topn_response(
+                    **p, db_path=db_path, market_risk_reference=risk
+                ),
+                score_files,
+            )
+        )
+    return out
+
+
+def materialize(db_path: Path) -> MaterializeSummary:
+    """db_path (운영 DB) 기준으로 전체 payload 를 다시 계산해 테이블을 교체한다."""
+    from app import sqlite_schemas
+
+    t0 = time.perf_counter()
+    sqlite_schemas.ensure_market_data(db_path)
+    # 계산 전에 버전을 잡는다 — 계산 중 다른 writer 가 쓰면 버전이 어긋나 live 로 간다.
+    with pooled_connection(db_path) as con:
+        base_version = market_data_stats.data_version(con)
+    if base_version is None:
+        raise sqlite3.OperationalError("market_data_table_stats 없음")
+
+    built_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    rows = []
+    for key, build, extra_files in _builders(db_path):
+        raw = build().model_dump_json().encode("utf-8")
+        version = "|".join([base_version, *(file_version(p) for p in extra_files)])
+        rows.append(
+            (key, version, zlib.compress(raw, _COMPRESS_LEVEL), len(raw), built_at)
+        )
+    with pooled_connection(db_path, write=True) as con:
+        con.execute(f"DELETE FROM {TABLE}")
+        con.executemany(
+            f"INSERT INTO {TABLE} (key, source_version, payload, raw_bytes, built_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+    return MaterializeSummary(
+        entries=len(rows),
+        raw_bytes=sum(r[3] for r in rows),
+        stored_bytes=sum(len(r[2]) for r in rows),
+        runtime_seconds=round(time.perf_counter() - t0, 3),
+    )
+
+
+def materialize_quietly(db_path: Path) -> Optional[MaterializeSummary]:
+    """refresh 후처리용 — 실패는 로그만 (endpoint 는 live 계산으로 응답한다)."""
+    try:
+        summary = materialize(db_path)
+    except Exception as e:  # noqa: BLE001 — refresh 결과 자체는 이미 DB 에 있다
+        logger.warning("dashboard snapshot 계산 실패 (%s): %s", db_path, e)
+        return None
+    logger.info(
+        "dashboard snapshot %d건 (%d → %d bytes, %.2fs)",
+        summary.entries,
+        summary.raw_bytes,
+        summary.stored_bytes,
+        summary.runtime_seconds,
+    )
+    return summary
@@ -21,11 +21,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from app.market_data_store import DEFAULT_DB_PATH
 from app.market_risk_reference_service import build_market_risk_reference
 
+if TYPE_CHECKING:
+    from app.evidence_context import EvidenceContext
+
 TARGET_KIND_HOLDING = "holding"
 TARGET_KIND_CANDIDATE = "candidate"
 ALLOWED_TARGET_KINDS = (TARGET_KIND_HOLDING, TARGET_KIND_CANDIDATE)
@@ -169,9 +172,13 @@ def _build_candidate_evidence_lines(
 
 def _build_market_reference_lines(
     db_path: Path,
+    context: Optional[EvidenceContext] = None,
 ) -> tuple[list[str], list[str], Optional[str], Optional[str]]:
     """(시장 참고 lines, 주의사항 lines, kodex_asof, vix_asof)."""
-    evidence = build_market_risk_reference(db_path=db_path)
+    if context is not None and context.db_path == db_path:
+        evidence = context.market_risk_reference()
+    else:
+        evidence = build_market_risk_reference(db_path=db_path)
     lines: list[str] = []
     warnings: list[str] = []
 
@@ -229,11 +236,13 @@ def build_preview_text(
     ticker: str,
     target_evidence: dict[str, Any],
     db_path: Path = DEFAULT_DB_PATH,
+    context: Optional[EvidenceContext] = None,
 ) -> PreviewResult:
     """선택 ETF 하나에 대한 preview_text 를 결정적으로 조립.
 
     target_evidence 는 호출자가 미리 구성한 dict (보유 또는 후보 evidence 한 건).
-    본 함수는 부작용 없이 텍스트만 생성.
+    본 함수는 부작용 없이 텍스트만 생성. context 가 있으면 시장 참고 evidence 를
+    그 요청의 memo 에서 읽는다.
     """
     if target_kind not in ALLOWED_TARGET_KINDS:
         return PreviewResult(
@@ -258,7 +267,7 @@ def build_preview_text(
         context_line = "후보 ETF 하나에 대해 매수 검토 근거를 정리합니다."
 
     market_lines, market_warnings, k_asof, v_asof = _build_market_reference_lines(
-        db_path=db_path
+        db_path=db_path, context=context
     )
     warning_lines.extend(market_warnings)
     questions = _build_ai_followup_questions(target_kind)
@@ -0,0 +1,139 @@
+"""Decision Evidence 목록 projection — 파생 컬럼 계산 / backfill / cursor (2026-10).
+
+배경: `GET /decision/sessions` 목록이 row 마다 전체 컬럼 (후보 / 시장 문맥 /
+구성종목 / ML evidence JSON blob + 3개 답변 본문) 을 읽고 json.loads 한 뒤
+candidate_count / 요약 / has_* 만 계산했다. 목록 비용이 blob 크기와 이력
+길이에 비례했다.
+
+본 모듈:
+- `list_projection` — insert 시점 1번 계산하는 파생 컬럼 값.
+- `backfill_list_projection` — 기존 row 채우기 (decision_evidence_store 의
+  `_migrate_add_list_projection` 마이그레이션 step 에서 1번).
+- `encode_cursor` / `decode_cursor` — (created_at, id) keyset cursor 문자열.
+
+조회 자체는 decision_evidence_store.list_recent_records (파생 컬럼만 SELECT).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Optional
+
+LIST_PROJECTION_COLUMNS = (
+    ("summary_text", "TEXT NOT NULL DEFAULT ''"),
+    ("candidate_count", "INTEGER NOT NULL DEFAULT 0"),
+    ("has_gpt_answer", "INTEGER NOT NULL DEFAULT 0"),
+    ("has_gemini_answer", "INTEGER NOT NULL DEFAULT 0"),
+    ("has_claude_answer", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+# 목록 keyset pagination 용 — ORDER BY created_at DESC, id DESC 를 역방향 scan.
+LIST_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS idx_ai_session_records_created_id
+ON ai_session_records (created_at, id)
+""".strip()
+
+SUMMARY_MAX_CHARS = 50
+_CURSOR_SEP = "|"
+
+
+def summary_text(
+    *,
+    user_memo: str,
+    gpt_answer_text: str,
+    gemini_answer_text: str,
+    claude_answer_text: str,
+    question_text: str,
+) -> str:
+    """목록 표시용 요약 (앞 50자).
+
+    우선순위: user_memo → gpt_answer_text → gemini_answer_text →
+    claude_answer_text → question_text. 첫 번째 비어있지 않은 텍스트를 사용.
+    """
+    for value in (
+        user_memo,
+        gpt_answer_text,
+        gemini_answer_text,
+        claude_answer_text,
+        question_text,
+    ):
+        text = (value or "").strip()
+        if text:
+            return text[:SUMMARY_MAX_CHARS]
+    return ""
+
+
+def list_projection(
+    *,
+    user_memo: str,
+    gpt_answer_text: str,
+    gemini_answer_text: str,
+    claude_answer_text: str,
+    question_text: str,
+    candidate_count: int,
+) -> tuple[str, int, int, int, int]:
+    """(summary_text, candidate_count, has_gpt, has_gemini, has_claude)."""
+    return (
+        summary_text(
+            user_memo=user_memo,
+            gpt_answer_text=gpt_answer_text,
+            gemini_answer_text=gemini_answer_text,
+            claude_answer_text=claude_answer_text,
+            question_text=question_text,
+        ),
+        int(candidate_count),
+        int(bool((gpt_answer_text or "").strip())),
+        int(bool((gemini_answer_text or "").strip())),
+        int(bool((claude_answer_text or "").strip())),
+    )
+
+
+def _candidate_count(snapshot_json: Optional[str]) -> int:
+    try:
+        snapshot = json.loads(snapshot_json or "")
+    except (TypeError, ValueError):
+        return 0
+    return len(snapshot) if isinstance(snapshot, list) else 0
+
+
+def backfill_list_projection(con: sqlite3.Connection) -> int:
+    """모든 기존 row 의 파생 컬럼을 다시 계산. 갱신 row 수 반환."""
+    cur = con.execute(
+        "SELECT id, user_memo, gpt_answer_text, gemini_answer_text, "
+        "claude_answer_text, question_text, candidate_snapshot_json "
+        "FROM ai_session_records"
+    )
+    updates = [
+        (
+            *list_projection(
+                user_memo=memo,
+                gpt_answer_text=gpt,
+                gemini_answer_text=gemini,
+                claude_answer_text=claude,
+                question_text=question,
+                candidate_count=_candidate_count(snapshot_json),
+            ),
+            id_,
+        )
+        for id_, memo, gpt, gemini, claude, question, snapshot_json in cur.fetchall()
+    ]
+    con.executemany(
+        "UPDATE ai_session_records SET summary_text = ?, candidate_count = ?, "
+        "has_gpt_answer = ?, has_gemini_answer = ?, has_claude_answer = ? "
+        "WHERE id = ?",
+        updates,
+    )
+    return len(updates)
+
+
+def encode_cursor(created_at: str, record_id: str) -> str:
+    return f"{created_at}{_CURSOR_SEP}{record_id}"
+
+
+def decode_cursor(cursor: str) -> Optional[tuple[str, str]]:
+    """cursor → (created_at, id). 형식이 맞지 않으면 None."""
+    created_at, sep, record_id = (cursor or "").rpartition(_CURSOR_SEP)
+    if not sep or not created_at or not record_id:
+        return None
+    return created_at, record_id
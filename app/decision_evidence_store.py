@@ -28,6 +28,14 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
+from app.decision_evidence_list import (
+    LIST_INDEX_DDL,
+    LIST_PROJECTION_COLUMNS,
+    backfill_list_projection,
+    list_projection,
+)
+from app.sqlite_pool import pooled_connection
+
 DEFAULT_DB_PATH = Path("state/decision/decision_evidence.sqlite")
 
 # 사용자 1차 판정 enum (지시문 §9).
@@ -56,7 +64,12 @@ CREATE TABLE IF NOT EXISTS ai_session_records (
     overlap_snapshot_json         TEXT NOT NULL DEFAULT '{}',
     short_term_momentum_snapshot_json TEXT NOT NULL DEFAULT '{}',
     data_quality_snapshot_json    TEXT NOT NULL DEFAULT '{}',
-    ml_baseline_evidence_snapshot_json TEXT NOT NULL DEFAULT '{}'
+    ml_baseline_evidence_snapshot_json TEXT NOT NULL DEFAULT '{}',
+    summary_text                  TEXT NOT NULL DEFAULT '',
+    candidate_count               INTEGER NOT NULL DEFAULT 0,
+    has_gpt_answer                INTEGER NOT NULL DEFAULT 0,
+    has_gemini_answer             INTEGER NOT NULL DEFAULT 0,
+    has_claude_answer             INTEGER NOT NULL DEFAULT 0
 );
 """.strip()
 
@@ -246,36 +259,47 @@ def _migrate_add_ml_baseline_evidence_snapshot(con: sqlite3.Connection) -> None:
         )
 
 
+def _migrate_add_list_projection(con: sqlite3.Connection) -> None:
+    """목록용 파생 컬럼 5개 + (created_at, id) 인덱스 추가 후 기존 row backfill
+    (2026-10, app.decision_evidence_list). 누락 컬럼만 ADD COLUMN.
+    """
+    cur = con.execute("PRAGMA table_info(ai_session_records)")
+    cols = {row[1] for row in cur.fetchall()}
+    if not cols:
+        return
+    for name, decl in LIST_PROJECTION_COLUMNS:
+        if name not in cols:
+            _safe_add_column(
+                con, f"ALTER TABLE ai_session_records ADD COLUMN {name} {decl}"
+            )
+    con.execute(LIST_INDEX_DDL)
+    backfill_list_projection(con)
+
+
 def init_db(db_path: Path = DEFAULT_DB_PATH) -> None:
     """DB 파일 + 테이블 보장. 기존 스키마는 자동 마이그레이션.
 
-    마이그레이션 순서:
-    1. 신규 스키마로 CREATE TABLE IF NOT EXISTS — 신규 DB 일 때만 효력.
-    2. _migrate_legacy_answer_text — 단일 answer_text → 3 분리 (POC2 2026-05-21).
-    3. _migrate_add_market_context_snapshot — market_context 컬럼 (2026-05-22).
-    4. _migrate_add_constituent_overlap_snapshots — constituent/overlap 2 컬럼
+    마이그레이션 순서 (2026-10 — app.sqlite_schemas DECISION_EVIDENCE_SCHEMA,
+    PRAGMA user_version 기준 step 당 1번만 적용):
+    1. 신규 스키마로 CREATE TABLE IF NOT EXISTS + _migrate_legacy_answer_text
+       — 단일 answer_text → 3 분리 (POC2 2026-05-21).
+    2. _migrate_add_market_context_snapshot — market_context 컬럼 (2026-05-22).
+    3. _migrate_add_constituent_overlap_snapshots — constituent/overlap 2 컬럼
        (POC2 2026-05-27).
+    4. _migrate_add_evidence_closeout_snapshots (2026-06-01).
+    5. _migrate_add_ml_baseline_evidence_snapshot (2026-06-11).
+    6. _migrate_add_list_projection — 목록용 파생 컬럼 + backfill (2026-10).
     """
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(db_path)) as con:
-        con.execute(AI_SESSION_RECORDS_DDL)
-        _migrate_legacy_answer_text(con)
-        _migrate_add_market_context_snapshot(con)
-        _migrate_add_constituent_overlap_snapshots(con)
-        _migrate_add_evidence_closeout_snapshots(con)
-        _migrate_add_ml_baseline_evidence_snapshot(con)
-        con.commit()
+    from app.sqlite_schemas import ensure_decision_evidence
+
+    ensure_decision_evidence(db_path)
 
 
 @contextmanager
-def _connection(db_path: Path):
+def _connection(db_path: Path, *, write: bool = False):
     init_db(db_path)
-    con = sqlite3.connect(str(db_path))
-    try:
+    with pooled_connection(db_path, write=write) as con:
         yield con
-        con.commit()
-    finally:
-        con.close()
 
 
 class DecisionValidationError(ValueError):
@@ -358,8 +382,16 @@ def insert_record(
     ml_baseline_evidence_json = json.dumps(
         ml_baseline_evidence_snapshot or {}, ensure_ascii=False
     )
+    projection = list_projection(
+        user_memo=user_memo,
+        gpt_answer_text=gpt_answer_text,
+        gemini_answer_text=gemini_answer_text,
+        claude_answer_text=claude_answer_text,
+        question_text=question_text,
+        candidate_count=len(candidate_snapshot),
+    )
 
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.execute(
             "INSERT INTO ai_session_records ("
             "id, created_at, updated_at, asof, source_screen, "
@@ -369,8 +401,10 @@ def insert_record(
             "linked_market_refresh_id, market_context_snapshot_json, "
             "constituent_snapshot_json, overlap_snapshot_json, "
             "short_term_momentum_snapshot_json, data_quality_snapshot_json, "
-            "ml_baseline_evidence_snapshot_json"
-            ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "ml_baseline_evidence_snapshot_json, summary_text, candidate_count, "
+            "has_gpt_answer, has_gemini_answer, has_claude_answer"
+            ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, "
+            "?, ?, ?, ?, ?)",
             (
                 new_id,
                 now_iso,
@@ -393,6 +427,7 @@ def insert_record(
                 short_term_momentum_json,
                 data_quality_json,
                 ml_baseline_evidence_json,
+                *projection,
             ),
         )
 
@@ -471,63 +506,51 @@ def _row_to_full_dict(row: tuple) -> dict:
     }
 
 
-def _summary_text(record: dict) -> str:
-    """목록 표시용 요약 (앞 50자).
-
-    우선순위: user_memo → gpt_answer_text → gemini_answer_text →
-    claude_answer_text → question_text. 첫 번째 비어있지 않은 텍스트를 사용.
-    """
-    for key in (
-        "user_memo",
-        "gpt_answer_text",
-        "gemini_answer_text",
-        "claude_answer_text",
-        "question_text",
-    ):
-        text = (record.get(key) or "").strip()
-        if text:
-            return text[:50]
-    return ""
-
-
 def list_recent_records(
     *,
     limit: int = 10,
+    before: Optional[tuple[str, str]] = None,
     db_path: Path = DEFAULT_DB_PATH,
 ) -> list[dict]:
     """최근 created_at DESC 순 N건 — 목록용 축약 dict 리스트.
 
     each item 에 `has_gpt_answer / has_gemini_answer / has_claude_answer` boolean
     포함 (지시문 §10.2).
+
+    2026-10 — insert 시점 파생 컬럼만 읽는다 (blob / 답변 본문 미조회).
+    before=(created_at, id) 면 그보다 앞선 row 부터 (keyset pagination,
+    (created_at, id) 인덱스 역방향 scan — 이력 길이와 무관).
     """
     if limit <= 0:
         return []
+    where, params = "", []
+    if before is not None:
+        where = "WHERE (created_at, id) < (?, ?) "
+        params = [before[0], before[1]]
     with _connection(db_path) as con:
         cur = con.execute(
-            f"SELECT {_SELECT_COLS} FROM ai_session_records "
+            "SELECT id, created_at, asof, source_screen, user_verdict, summary_text, "
+            "candidate_count, has_gpt_answer, has_gemini_answer, has_claude_answer "
+            f"FROM ai_session_records {where}"
             "ORDER BY created_at DESC, id DESC LIMIT ?",
-            (int(limit),),
+            (*params, int(limit)),
         )
         rows = cur.fetchall()
-
-    out: list[dict] = []
-    for row in rows:
-        full = _row_to_full_dict(row)
-        out.append(
-            {
-                "id": full["id"],
-                "created_at": full["created_at"],
-                "asof": full["asof"],
-                "source_screen": full["source_screen"],
-                "user_verdict": full["user_verdict"],
-                "summary": _summary_text(full),
-                "candidate_count": len(full["candidate_snapshot"]),
-                "has_gpt_answer": bool(full["gpt_answer_text"].strip()),
-                "has_gemini_answer": bool(full["gemini_answer_text"].strip()),
-                "has_claude_answer": bool(full["claude_answer_text"].strip()),
-            }
-        )
-    return out
+    return [
+        {
+            "id": r[0],
+            "created_at": r[1],
+            "asof": r[2],
+            "source_screen": r[3],
+            "user_verdict": r[4],
+            "summary": r[5],
+            "candidate_count": int(r[6]),
+            "has_gpt_answer": bool(r[7]),
+            "has_gemini_answer": bool(r[8]),
+            "has_claude_answer": bool(r[9]),
+        }
+        for r in rows
+    ]
 
 
 def get_record(record_id: str, *, db_path: Path = DEFAULT_DB_PATH) -> Optional[dict]:
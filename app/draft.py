@@ -20,6 +20,7 @@ from typing import Any, Optional
 from uuid import uuid4
 
 from app import draft_message, sample_draft, store
+from app.evidence_context import EvidenceContext
 from app.factors import build_factor_signals
 from app.holdings import HOLDINGS_FILE, Holding
 from app.holdings_enrich import enrich_holdings, to_recommendation_dict
@@ -180,11 +181,16 @@ def _build_holdings_payload(
     # runtime_package 의 market_discovery_snapshot evidence (AC-4) 양쪽에서
     # 사용된다. SQLite read-only 이지만 1137 ETF × 60거래일 계산이라 호출 비용이
     # 있으므로 한 함수 호출당 1회만 수행한다.
+    # 2026-10 — EvidenceContext 로 TOP N 과 evidence builder 가 보유 ETF / KODEX200
+    # 시계열 로드를 공유한다.
+    evidence_context = EvidenceContext(db_path=MARKET_DB_PATH)
+    evidence_context.focus(h.ticker for h in holdings)
     topn_payload_for_holdings = compute_topn(
         n=DEFAULT_N,
         db_path=MARKET_DB_PATH,
         basis=DEFAULT_BASIS,
         order=DEFAULT_ORDER,
+        context=evidence_context,
     )
     market_evidence_snapshot = build_holdings_market_evidence(
         holdings=holdings,
@@ -192,6 +198,7 @@ def _build_holdings_payload(
         market_quotes=quotes,
         db_path=MARKET_DB_PATH,
         holdings_asof=get_holdings_file_mtime_iso(HOLDINGS_FILE),
+        context=evidence_context,
     )
     holdings_market_evidence_signal = build_holdings_market_evidence_factor_signal(
         market_evidence_snapshot, asof_iso=asof_iso
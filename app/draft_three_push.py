@@ -27,7 +27,7 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from uuid import uuid4
 
 from app import store
@@ -37,6 +37,9 @@ from app.push_context import build_push_context
 from app.runtime_package import build_runtime_package
 from app.runtime_probe_cache import get_runtime_probe_snapshot
 
+if TYPE_CHECKING:
+    from app.evidence_context import EvidenceContext
+
 logger = logging.getLogger(__name__)
 
 # PUSH-1/3 PC test probe 대상 ticker (Q2 — holdings/benchmark/spike 후보).
@@ -283,54 +286,45 @@ def generate_spike_alert_draft(
     return run
 
 
-def generate_market_briefing_via_generic(input_data: dict[str, Any]) -> Run:
+def _default_topn(context: Optional[EvidenceContext]) -> dict[str, Any]:
+    """기본 인자 TOP N — context 가 있으면 그 요청의 memo 를 공유 (2026-10)."""
+    from app.evidence_context import EvidenceContext
+    from app.market_data_store import DEFAULT_DB_PATH as _MARKET_DB
+    from app.market_topn import DEFAULT_BASIS, DEFAULT_N, DEFAULT_ORDER
+
+    ctx = context or EvidenceContext(db_path=_MARKET_DB)
+    return ctx.topn(n=DEFAULT_N, basis=DEFAULT_BASIS, order=DEFAULT_ORDER)
+
+
+def generate_market_briefing_via_generic(
+    input_data: dict[str, Any],
+    context: Optional[EvidenceContext] = None,
+) -> Run:
     """POST /runs/generate (push_kind="market_briefing") → PUSH-1 흐름.
 
     내부에서 read-only evidence loader 를 호출 후 generate_market_briefing_draft
     로 위임. 외부 source 호출 0건 — 저장된 evidence / SQLite read-only.
     """
-    from app.market_data_store import DEFAULT_DB_PATH as _MARKET_DB
-    from app.market_topn import (
-        DEFAULT_BASIS,
-        DEFAULT_N,
-        DEFAULT_ORDER,
-        compute_topn,
-    )
     from app.ml_baseline_evidence import build_ml_baseline_evidence_snapshot
 
     ml_snapshot = build_ml_baseline_evidence_snapshot()
-    topn_payload = compute_topn(
-        n=DEFAULT_N,
-        db_path=_MARKET_DB,
-        basis=DEFAULT_BASIS,
-        order=DEFAULT_ORDER,
-    )
+    topn_payload = _default_topn(context)
     return generate_market_briefing_draft(
         ml_baseline_snapshot=ml_snapshot,
         topn_payload=topn_payload,
     )
 
 
-def generate_spike_alert_via_generic(input_data: dict[str, Any]) -> Run:
+def generate_spike_alert_via_generic(
+    input_data: dict[str, Any],
+    context: Optional[EvidenceContext] = None,
+) -> Run:
     """POST /runs/generate (push_kind="spike_or_falling_alert") → PUSH-3 흐름.
 
     universe_momentum_latest.json read-only 로딩. 손상 / 부재는 logger 로 구분
     (B-1 의심 해소: 손상은 명시 WARNING, 부재는 DEBUG — 정상 흐름).
     """
-    from app.market_data_store import DEFAULT_DB_PATH as _MARKET_DB
-    from app.market_topn import (
-        DEFAULT_BASIS,
-        DEFAULT_N,
-        DEFAULT_ORDER,
-        compute_topn,
-    )
-
-    topn_payload = compute_topn(
-        n=DEFAULT_N,
-        db_path=_MARKET_DB,
-        basis=DEFAULT_BASIS,
-        order=DEFAULT_ORDER,
-    )
+    topn_payload = _default_topn(context)
     universe_artifact = _load_universe_artifact_for_spike()
     return generate_spike_alert_draft(
         topn_payload=topn_payload,
@@ -23,6 +23,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Optional
 
+from app.source_circuit_breaker import (
+    SOURCE_NAVER_STOCK,
+    SOURCE_PYKRX,
+    CircuitOpenError,
+    guarded_call,
+    is_server_error_status,
+)
+
 PYKRX_SOURCE = "pykrx/get_etf_portfolio_deposit_file"
 NAVER_STOCK_SOURCE = "naver_stock_etf_component"
 
@@ -89,7 +97,16 @@ def _pykrx_pdf_fetcher(etf_ticker: str, asof: str, top_k: int) -> FetchResult:
         )
     yyyymmdd = _asof_to_yyyymmdd(asof)
     try:
-        df = stock.get_etf_portfolio_deposit_file(yyyymmdd, etf_ticker)
+        df = guarded_call(
+            SOURCE_PYKRX, stock.get_etf_portfolio_deposit_file, yyyymmdd, etf_ticker
+        )
+    except CircuitOpenError as e:
+        return FetchResult(
+            status="unavailable",
+            source=PYKRX_SOURCE,
+            constituents=[],
+            message=str(e),
+        )
     except Exception as e:  # noqa: BLE001
         return FetchResult(
             status="unavailable",
@@ -200,11 +217,18 @@ def _naver_http_get(url: str, timeout: float = NAVER_TIMEOUT_SEC) -> tuple[int,
     import urllib.request
 
     req = urllib.request.Request(url, headers=NAVER_HEADERS, method="GET")
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return int(resp.status), resp.read().decode("utf-8", errors="replace")
-    except urllib.error.HTTPError as e:
-        return int(e.code), ""
+
+    def _get() -> tuple[int, str]:
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                return int(resp.status), resp.read().decode("utf-8", errors="replace")
+        except urllib.error.HTTPError as e:
+            return int(e.code), ""
+
+    # 2026-10 — stock.naver.com circuit breaker. 5xx / 429 도 실패로 센다.
+    return guarded_call(
+        SOURCE_NAVER_STOCK, _get, failure_if=lambda r: is_server_error_status(r[0])
+    )
 
 
 def _coerce_weight_string(raw) -> Optional[float]:
@@ -274,6 +298,13 @@ def naver_stock_etf_component_fetcher(
     )
     try:
         http_status, body = _naver_http_get(url)
+    except CircuitOpenError as e:
+        return FetchResult(
+            status="unavailable",
+            source=NAVER_STOCK_SOURCE,
+            constituents=[],
+            message=str(e),
+        )
     except Exception as e:  # noqa: BLE001 — 네트워크 실패 격리.
         return FetchResult(
             status="unavailable",
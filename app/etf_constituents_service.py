@@ -8,6 +8,9 @@ POST /market/constituents/refresh 의 백엔드 service. 외부 fetch 의존성
 - `force=true` 인 경우에만 캐시를 무시하고 재수집.
 - 외부 fetch 사이 ticker 당 0.5초 delay.
 - 전체 refresh time budget 30초. 초과 시 남은 ETF 는 skipped_timeout.
+- 소스 circuit breaker 가 열려 있으면 (fetch 결과가 circuit_open, 2026-10) 남은
+  ETF 는 delay / 호출 없이 skipped_circuit_open — 열린 소스를 기다리며 time budget
+  을 쓰지 않는다.
 - 부분 실패 격리: ETF 단위 실패가 전체 실패로 번지지 않는다.
 - source 불명 데이터는 ok 처리하지 않는다 (fetcher 가 source 명시).
 """
@@ -31,6 +34,11 @@ from app.etf_constituents_store import (
     log_constituent_refresh,
     upsert_constituents,
 )
+from app.source_circuit_breaker import (
+    CIRCUIT_OPEN_REASON,
+    CircuitOpenError,
+    is_circuit_open_message,
+)
 
 MAX_TICKERS_PER_REQUEST = 10
 # 2026-08-19 설계 확정 — 외부 호출을 가두는 상한(ETF 10개)과 ETF 안에서 담는
@@ -49,7 +57,8 @@ TIME_BUDGET_SECONDS = 30.0
 @dataclass
 class RefreshItemResult:
     ticker: str
-    status: str  # "ok" / "unavailable" / "skipped_timeout" / "cached"
+    # "ok" / "unavailable" / "skipped_timeout" / "skipped_circuit_open" / "cached"
+    status: str
     source: Optional[str]
     constituent_count: int
     from_cache: bool
@@ -140,6 +149,7 @@ def refresh_constituents(
     skipped_count = 0
     source_seen: Optional[str] = None
     is_first_external = True
+    circuit_message: Optional[str] = None  # breaker 가 열린 것을 본 뒤의 사유
 
     # 2026-05-31 — Naver Stock ETFComponent 1차 채택 (직전 PYKRX_SOURCE 교체).
     # cache key 일치성 (지시문 §4.3 ticker+asof+source) — 본 service 는 단일
@@ -202,6 +212,29 @@ def refresh_constituents(
             skipped_count += 1
             continue
 
+        # breaker 가 열려 있으면 delay / 호출 없이 건너뛴다.
+        if circuit_message is not None:
+            items.append(
+                RefreshItemResult(
+                    ticker=tk,
+                    status="skipped_circuit_open",
+                    source=None,
+                    constituent_count=0,
+                    from_cache=False,
+                    message=circuit_message,
+                )
+            )
+            log_constituent_refresh(
+                etf_ticker=tk,
+                asof=asof,
+                status="skipped_circuit_open",
+                source=None,
+                message=CIRCUIT_OPEN_REASON,
+                db_path=db_path,
+            )
+            skipped_count += 1
+            continue
+
         # ticker 간 delay (첫 외부 호출 제외).
         if not is_first_external:
             sleep_fn(PER_TICKER_DELAY_SECONDS)
@@ -210,6 +243,13 @@ def refresh_constituents(
         # fetch.
         try:
             result: FetchResult = fetch(tk, asof, capped_top_k)
+        except CircuitOpenError as e:
+            result = FetchResult(
+                status="unavailable",
+                source="unknown",
+                constituents=[],
+                message=str(e),
+            )
         except Exception as e:  # noqa: BLE001 — service 안에서 흡수.
             result = FetchResult(
                 status="unavailable",
@@ -218,6 +258,8 @@ def refresh_constituents(
                 message=f"fetch_unexpected: {type(e).__name__}: {e}",
             )
 
+        if result.status != "ok" and is_circuit_open_message(result.message):
+            circuit_message = result.message
         if result.status != "ok" or not result.constituents:
             items.append(
                 RefreshItemResult(
@@ -22,6 +22,7 @@ from pathlib import Path
 from typing import Iterable, Optional
 
 from app.market_data_store import DEFAULT_DB_PATH
+from app.sqlite_pool import pooled_connection
 
 ETF_CONSTITUENTS_DDL = """
 CREATE TABLE IF NOT EXISTS etf_constituents (
@@ -114,27 +115,20 @@ def _migrate_add_naver_columns(con: sqlite3.Connection) -> None:
 def init_constituents_db(db_path: Path = DEFAULT_DB_PATH) -> None:
     """2개 신규 테이블 보장 + Naver source 통합 마이그레이션.
 
-    마이그레이션 순서:
-    1. CREATE TABLE IF NOT EXISTS (신규 4 컬럼 포함) — 신규 DB.
-    2. _migrate_add_naver_columns — 기존 DB 자동 컬럼 추가 (POC2 2026-05-31).
+    2026-10 — app.sqlite_schemas market_data step 3 (CREATE TABLE IF NOT EXISTS +
+    _migrate_add_naver_columns) 으로 이동. user_version 기준 1번만 적용되고
+    이후 connection 마다 PRAGMA table_info 를 다시 읽지 않는다.
     """
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(db_path)) as con:
-        con.execute(ETF_CONSTITUENTS_DDL)
-        con.execute(ETF_CONSTITUENT_REFRESH_LOG_DDL)
-        _migrate_add_naver_columns(con)
-        con.commit()
+    from app.sqlite_schemas import ensure_market_data
+
+    ensure_market_data(db_path)
 
 
 @contextmanager
-def _connection(db_path: Path):
+def _connection(db_path: Path, *, write: bool = False):
     init_constituents_db(db_path)
-    con = sqlite3.connect(str(db_path))
-    try:
+    with pooled_connection(db_path, write=write) as con:
         yield con
-        con.commit()
-    finally:
-        con.close()
 
 
 def has_constituents(
@@ -202,7 +196,7 @@ def upsert_constituents(
         market_type = excluded.market_type,
         created_at = excluded.created_at
     """
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.executemany(sql, payload)
     return len(payload)
 
@@ -214,6 +208,24 @@ _FETCH_COLUMNS = (
 )
 
 
+def _constituent_row(r: tuple) -> ConstituentRow:
+    """_FETCH_COLUMNS 순서의 SELECT row → ConstituentRow."""
+    return ConstituentRow(
+        etf_ticker=r[0],
+        asof=r[1],
+        source=r[2],
+        rank=r[3],
+        constituent_ticker=r[4],
+        constituent_name=r[5],
+        weight_pct=r[6],
+        etf_name=r[7],
+        constituent_key=r[8],
+        constituent_isin=r[9],
+        constituent_reuters_code=r[10],
+        market_type=r[11],
+    )
+
+
 def fetch_constituents(
     *,
     etf_ticker: str,
@@ -237,23 +249,52 @@ def fetch_constituents(
                 "AND source = ? ORDER BY rank ASC",
                 (etf_ticker, asof, source),
             )
-        return [
-            ConstituentRow(
-                etf_ticker=r[0],
-                asof=r[1],
-                source=r[2],
-                rank=r[3],
-                constituent_ticker=r[4],
-                constituent_name=r[5],
-                weight_pct=r[6],
-                etf_name=r[7],
-                constituent_key=r[8],
-                constituent_isin=r[9],
-                constituent_reuters_code=r[10],
-                market_type=r[11],
-            )
-            for r in cur.fetchall()
-        ]
+        return [_constituent_row(r) for r in cur.fetchall()]
+
+
+# 2026-10 — fetch_constituents_many 의 IN (...) 한 번에 넣는 ticker 수.
+_TICKERS_PER_QUERY = 900
+
+
+def fetch_constituents_many(
+    tickers: Iterable[str],
+    asof: Optional[str] = None,
+    *,
+    db_path: Path = DEFAULT_DB_PATH,
+) -> dict[str, list[ConstituentRow]]:
+    """여러 ETF 의 구성종목 (rank ASC) 을 1 쿼리로 (2026-10).
+
+    asof 를 주면 모든 ticker 에 그 asof. None 이면 ticker 마다 가장 최근 asof —
+    latest_constituent_asof + fetch_constituents 를 ticker 마다 부르던 것과 같은
+    결과. 모든 source 포함. 구성종목이 없는 ticker 는 결과 dict 에 없다.
+    """
+    wanted = list(dict.fromkeys(t for t in tickers if t))
+    out: dict[str, list[ConstituentRow]] = {}
+    if not wanted:
+        return out
+    with _connection(db_path) as con:
+        for start in range(0, len(wanted), _TICKERS_PER_QUERY):
+            chunk = wanted[start : start + _TICKERS_PER_QUERY]  # noqa: E203
+            marks = ", ".join("?" * len(chunk))
+            if asof is not None:
+                cur = con.execute(
+                    f"SELECT {_FETCH_COLUMNS} FROM etf_constituents "
+                    f"WHERE etf_ticker IN ({marks}) AND asof = ? "
+                    "ORDER BY etf_ticker, rank ASC",
+                    [*chunk, asof],
+                )
+            else:
+                cur = con.execute(
+                    f"SELECT {_FETCH_COLUMNS} FROM etf_constituents "
+                    "WHERE (etf_ticker, asof) IN ("
+                    "  SELECT etf_ticker, MAX(asof) FROM etf_constituents "
+                    f"  WHERE etf_ticker IN ({marks}) GROUP BY etf_ticker"
+                    ") ORDER BY etf_ticker, rank ASC",
+                    chunk,
+                )
+            for r in cur.fetchall():
+                out.setdefault(r[0], []).append(_constituent_row(r))
+    return out
 
 
 def log_constituent_refresh(
@@ -265,9 +306,12 @@ def log_constituent_refresh(
     message: Optional[str],
     db_path: Path = DEFAULT_DB_PATH,
 ) -> None:
-    """수집 결과 1건 기록 (status: ok / unavailable / skipped_timeout / cached)."""
+    """수집 결과 1건 기록.
+
+    status: ok / unavailable / skipped_timeout / skipped_circuit_open / cached.
+    """
     now = _utcnow_iso()
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.execute(
             "INSERT INTO etf_constituent_refresh_log "
             "(etf_ticker, asof, status, source, message, created_at) "
@@ -8,6 +8,8 @@ K6 방어 정책 (per-ticker):
 - ticker 당 0.5초 delay.
 - 전체 time budget 30초.
 - 실패 격리: ETF 단위 실패가 Market Discovery refresh 전체 실패로 전파 X.
+- 2026-10 — fetch 결과가 circuit_open (소스 breaker 열림) 이면 남은 ticker 는
+  delay / 호출 없이 skipped_circuit_open. time budget 을 대기로 쓰지 않는다.
 
 2026-06-08 Naver Universe Integration (지시문 §5):
 - refresh_nav_universe() 신규 — Naver `etfItemList.nhn` 1회 호출로 전체 ETF
@@ -41,6 +43,7 @@ from app.naver_etf_universe_fetcher import (
     SOURCE_LABEL as NAVER_UNIVERSE_SOURCE,
     fetch_universe_snapshot,
 )
+from app.source_circuit_breaker import CircuitOpenError, is_circuit_open_message
 
 MAX_TICKERS_PER_REQUEST = 10
 PER_TICKER_DELAY_SECONDS = 0.5
@@ -50,7 +53,7 @@ TIME_BUDGET_SECONDS = 30.0
 @dataclass
 class NavItemResult:
     ticker: str
-    status: str  # ok / unavailable / cached / skipped_timeout
+    status: str  # ok / unavailable / cached / skipped_timeout / skipped_circuit_open
     source: str
     asof: Optional[str]
     nav: Optional[float]
@@ -176,6 +179,7 @@ def refresh_nav(
     skipped_count = 0
     rows_to_upsert: list[NavDailyRow] = []
     deadline = now_fn() + TIME_BUDGET_SECONDS
+    circuit_message: Optional[str] = None  # breaker 가 열린 것을 본 뒤의 사유
 
     for index, ticker in enumerate(tickers):
         # cache check — 같은 asof 의 (어떤 source 라도) 이미 있으면 재사용.
@@ -206,11 +210,33 @@ def refresh_nav(
             skipped_count += 1
             continue
 
+        if circuit_message is not None:
+            items.append(
+                NavItemResult(
+                    ticker=ticker,
+                    status="skipped_circuit_open",
+                    source="unavailable",
+                    asof=asof,
+                    nav=None,
+                    market_price=None,
+                    discount_rate_pct=None,
+                    flag=None,
+                    from_cache=False,
+                    message=circuit_message,
+                )
+            )
+            skipped_count += 1
+            continue
+
         if index > 0:
             sleep_fn(PER_TICKER_DELAY_SECONDS)
 
         try:
             result = fetcher_fn(ticker)
+        except CircuitOpenError as e:
+            result = NavFetchResult(
+                status="unavailable", source="unavailable", message=str(e)
+            )
         except Exception as e:  # noqa: BLE001
             result = NavFetchResult(
                 status="unavailable",
@@ -218,6 +244,8 @@ def refresh_nav(
                 message=f"fetcher exception: {type(e).__name__}: {e}",
             )
 
+        if result.status != "ok" and is_circuit_open_message(result.message):
+            circuit_message = result.message
         row = _result_to_row(ticker=ticker, asof=asof, result=result)
         rows_to_upsert.append(row)
         items.append(_row_to_item(row, from_cache=False))
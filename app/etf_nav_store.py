@@ -10,12 +10,13 @@ PK: (etf_ticker, asof, source).
 
 from __future__ import annotations
 
-import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+from app.sqlite_pool import pooled_connection
 
 DEFAULT_DB_PATH = Path("state/market/market_data.sqlite")
 
@@ -53,11 +54,10 @@ def _utcnow_iso() -> str:
 
 
 def init_nav_db(db_path: Path = DEFAULT_DB_PATH) -> None:
-    """테이블 보장. 신규 컬럼이 생길 경우 _safe_add_column 패턴 활용 (현재 없음)."""
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(db_path)) as con:
-        con.execute(ETF_NAV_DAILY_DDL)
-        con.commit()
+    """테이블 보장. 스키마 변경은 app.sqlite_schemas 에 step 추가 (2026-10)."""
+    from app.sqlite_schemas import ensure_market_data
+
+    ensure_market_data(db_path)
 
 
 # 2026-06-08 perf — db_path 별 1회만 init (process-level 캐시).
@@ -73,14 +73,10 @@ def _ensure_nav_initialized(db_path: Path) -> None:
 
 
 @contextmanager
-def _connection(db_path: Path):
+def _connection(db_path: Path, *, write: bool = False):
     _ensure_nav_initialized(db_path)
-    con = sqlite3.connect(str(db_path))
-    try:
+    with pooled_connection(db_path, write=write) as con:
         yield con
-        con.commit()
-    finally:
-        con.close()
 
 
 def upsert_nav_rows(
@@ -118,7 +114,7 @@ def upsert_nav_rows(
         message = excluded.message,
         created_at = excluded.created_at
     """
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.executemany(sql, payload)
     return len(payload)
 
@@ -152,6 +148,52 @@ def fetch_latest_nav(
         )
 
 
+# 2026-10 — *_many 조회의 IN (...) 한 번에 넣는 ticker 수 (SQLite 변수 한도 여유).
+_TICKERS_PER_QUERY = 900
+
+
+def fetch_latest_nav_many(
+    tickers: Iterable[str],
+    *,
+    db_path: Path = DEFAULT_DB_PATH,
+) -> dict[str, NavDailyRow]:
+    """여러 ticker 의 최신 NAV row — fetch_latest_nav 와 같은 선택 규칙, 1 쿼리 (2026-10).
+
+    ticker 마다 (asof DESC, created_at DESC) 첫 row. PK (etf_ticker, ...) 로
+    IN 조회. row 가 없는 ticker 는 결과 dict 에 없다.
+    """
+    wanted = list(dict.fromkeys(t for t in tickers if t))
+    out: dict[str, NavDailyRow] = {}
+    if not wanted:
+        return out
+    with _connection(db_path) as con:
+        for start in range(0, len(wanted), _TICKERS_PER_QUERY):
+            chunk = wanted[start : start + _TICKERS_PER_QUERY]  # noqa: E203
+            marks = ", ".join("?" * len(chunk))
+            cur = con.execute(
+                "SELECT etf_ticker, asof, nav, market_price, discount_rate_pct, "
+                "source, status, message FROM ("
+                "  SELECT *, ROW_NUMBER() OVER ("
+                "    PARTITION BY etf_ticker ORDER BY asof DESC, created_at DESC"
+                "  ) AS rn FROM etf_nav_daily "
+                f"  WHERE etf_ticker IN ({marks})"
+                ") WHERE rn = 1",
+                chunk,
+            )
+            for row in cur.fetchall():
+                out[row[0]] = NavDailyRow(
+                    etf_ticker=row[0],
+                    asof=row[1],
+                    nav=row[2],
+                    market_price=row[3],
+                    discount_rate_pct=row[4],
+                    source=row[5],
+                    status=row[6],
+                    message=row[7],
+                )
+    return out
+
+
 def fetch_all_latest_nav(
     *,
     db_path: Path = DEFAULT_DB_PATH,
@@ -0,0 +1,156 @@
+"""요청 단위 evidence 로드 공유 — EvidenceContext (2026-10).
+
+배경: `GET /holdings/market-evidence/latest` · `POST /decision-draft/preview` ·
+GenerateDraft 가 같은 요청 안에서 holdings / market_cache / compute_topn /
+KODEX200 시계열 / 구성종목 / NAV 를 각자 다시 읽었다. KODEX200 시계열만 해도
+compute_topn (universe loop + market_context) · 단기 흐름 batch · 판단 요약에서
+4번 읽혔고, 보유 ETF 가 후보이기도 하면 구성종목도 2번 읽혔다.
+
+EvidenceContext 는 요청 1건 동안 이 로드들을 memo 한다. 요청마다 새로 만들고
+요청이 끝나면 버린다 (프로세스 전역 캐시가 아니다 — 갱신 직후 요청이 옛 값을
+보지 않는다). 각 builder 는 `context=None` 이면 예전처럼 직접 읽는다.
+
+가격 시계열은 "focus" ticker (보유 ETF + KODEX200) 만 보관한다. compute_topn 의
+universe loop 는 context 를 거치되 나머지 ~1100 ticker 시계열은 보관하지 않는다
+(요청 동안 메모리 상한 유지).
+
+`loads` 는 실제로 store 를 읽은 횟수 (dataset 별) — 테스트 / 진단용.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from app import holdings as holdings_module
+from app import market_cache
+from app.etf_constituents_store import (
+    ConstituentRow,
+    fetch_constituents,
+    fetch_constituents_many,
+    latest_constituent_asof,
+)
+from app.etf_nav_store import NavDailyRow, fetch_latest_nav, fetch_latest_nav_many
+from app.holdings import Holding
+from app.market_benchmark_store import fetch_benchmark_history
+from app.market_cache import MarketQuote
+from app.market_data_store import (
+    DEFAULT_DB_PATH,
+    fetch_price_history,
+    get_etf_name_map,
+)
+from app.market_regime import KODEX200_TICKER
+
+
+@dataclass
+class EvidenceContext:
+    db_path: Path = DEFAULT_DB_PATH
+    loads: Counter = field(default_factory=Counter, init=False, repr=False)
+    _focus: set[str] = field(default_factory=set, init=False, repr=False)
+    _memo: dict[tuple, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._focus.add(KODEX200_TICKER)
+
+    def _once(self, key: tuple, load) -> Any:
+        if key not in self._memo:
+            self.loads[key[0]] += 1
+            self._memo[key] = load()
+        return self._memo[key]
+
+    def focus(self, tickers: Iterable[str]) -> None:
+        """시계열을 요청 동안 보관할 ticker 추가 (holdings() 가 보유 ETF 를 자동 추가)."""
+        self._focus.update(t for t in tickers if t)
+
+    def holdings(self) -> list[Holding]:
+        """holdings.load() 1회. HoldingsValidationError 는 호출자에게 그대로."""
+        loaded = self._once(("holdings",), lambda: holdings_module.load())
+        self.focus(h.ticker for h in loaded)
+        return loaded
+
+    def quotes(self) -> dict[str, MarketQuote]:
+        return self._once(("quotes",), lambda: market_cache.get_all())
+
+    def topn(self, **kwargs: Any) -> dict:
+        """compute_topn(**kwargs) — 같은 인자 조합은 1회. 시계열 로드를 공유한다."""
+        from app import market_topn
+
+        key = ("topn", tuple(sorted(kwargs.items())))
+        return self._once(
+            key,
+            lambda: market_topn.compute_topn(
+                db_path=self.db_path, context=self, **kwargs
+            ),
+        )
+
+    def name_map(self) -> dict[str, Optional[str]]:
+        return self._once(("name_map",), lambda: get_etf_name_map(db_path=self.db_path))
+
+    def price_history(self, ticker: str) -> list[tuple[str, float]]:
+        key = ("price_history", ticker)
+        if key in self._memo:
+            return self._memo[key]
+        self.loads["price_history"] += 1
+        series = fetch_price_history(ticker, db_path=self.db_path)
+        if ticker in self._focus:
+            self._memo[key] = series
+        return series
+
+    def benchmark_history(self, benchmark_id: str) -> list[tuple[str, float]]:
+        return self._once(
+            ("benchmark_history", benchmark_id),
+            lambda: fetch_benchmark_history(benchmark_id, db_path=self.db_path),
+        )
+
+    def latest_nav(self, ticker: str) -> Optional[NavDailyRow]:
+        return self._once(
+            ("latest_nav", ticker),
+            lambda: fetch_latest_nav(etf_ticker=ticker, db_path=self.db_path),
+        )
+
+    def prefetch_nav(self, tickers: Iterable[str]) -> None:
+        """아직 읽지 않은 ticker 들의 최신 NAV 를 1 쿼리로 memo (fetch_latest_nav_many)."""
+        missing = [
+            t for t in dict.fromkeys(tickers) if ("latest_nav", t) not in self._memo
+        ]
+        if not missing:
+            return
+        self.loads["latest_nav_many"] += 1
+        found = fetch_latest_nav_many(missing, db_path=self.db_path)
+        for t in missing:
+            self._memo[("latest_nav", t)] = found.get(t)
+
+    def prefetch_constituents(self, tickers: Iterable[str]) -> None:
+        """아직 읽지 않은 ticker 들의 최신 asof 구성종목을 1 쿼리로 memo."""
+        missing = [
+            t for t in dict.fromkeys(tickers) if ("constituents", t) not in self._memo
+        ]
+        if not missing:
+            return
+        self.loads["constituents_many"] += 1
+        found = fetch_constituents_many(missing, db_path=self.db_path)
+        for t in missing:
+            self._memo[("constituents", t)] = found.get(t, [])
+
+    def constituents(self, ticker: str) -> list[ConstituentRow]:
+        """ticker 의 가장 최근 asof 구성종목 (cache-only). 없으면 []."""
+
+        def load() -> list[ConstituentRow]:
+            asof = latest_constituent_asof(ticker, db_path=self.db_path)
+            if asof is None:
+                return []
+            return fetch_constituents(
+                etf_ticker=ticker, asof=asof, db_path=self.db_path
+            )
+
+        return self._once(("constituents", ticker), load)
+
+    def market_risk_reference(self) -> Any:
+        from app.market_risk_reference_service import build_market_risk_reference
+
+        return self._once(
+            ("market_risk_reference",),
+            lambda: build_market_risk_reference(db_path=self.db_path),
+        )
@@ -0,0 +1,366 @@
+"""외부 fetcher record / replay 레이어 (2026-10).
+
+배경: FDR / pykrx / Naver fetcher 는 모두 callable 주입을 받지만, 실제 응답을
+저장해 두었다가 결정적으로 재생할 방법이 없었다. 그래서 ingestion 성능은 항상
+네트워크 상태와 섞여서만 측정됐다.
+
+본 모듈:
+- FixtureStore: `<root>/<fetcher name>/<sha1(key)>.json` 파일 1개 = 응답 1건.
+  값은 JSON 으로 인코딩한다 (DataFrame / dataclass / tuple / date 포함).
+- RecordReplaySession:
+  - record — 실제 fetcher 를 호출하고 결과(또는 예외)를 저장한 뒤 그대로 돌려준다.
+  - replay — 네트워크 없이 저장된 결과를 돌려준다. SimulationProfile 로 호출당
+    지연(latency ± jitter)과 오류율(SimulatedFetchError)을 흉내낸다.
+    저장된 응답이 없으면 FixtureMissingError — 실제 네트워크로 대체하지 않는다.
+- install(): 주입 인자가 없는 경로 (예: timeseries CLI) 를 위해 FETCHER_BINDINGS 의
+  모듈 속성을 세션 동안만 교체하고, 끝나면 원래 함수로 되돌린다.
+
+key 는 fetcher 별 key_fn 으로 만든다. 가격 fetcher 는 ticker 만 key 로 쓴다 —
+기록 시점과 재생 시점의 날짜 구간이 달라도 같은 응답을 재생하기 위함.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import importlib
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+FIXTURE_DIR = Path("state/fetch_fixtures")
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+
+class FixtureMissingError(LookupError):
+    """replay 중 저장된 응답이 없음."""
+
+
+class SimulatedFetchError(ConnectionError):
+    """replay 오류율 시뮬레이션으로 주입된 실패."""
+
+
+class ReplayedFetchError(RuntimeError):
+    """record 시점에 fetcher 가 던진 예외를 replay 에서 재현."""
+
+
+# ─── 값 인코딩 ───────────────────────────────────────────────────────
+
+
+def _is_dataframe(value: Any) -> bool:
+    return all(hasattr(value, a) for a in ("to_dict", "columns", "index", "iterrows"))
+
+
+def encode_value(value: Any) -> Any:
+    """fetcher 결과 → JSON 직렬화 가능한 값."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, tuple):
+        return {"__tuple__": [encode_value(v) for v in value]}
+    if isinstance(value, list):
+        return [encode_value(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): encode_value(v) for k, v in value.items()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        return {
+            "__dataclass__": f"{cls.__module__}:{cls.__qualname__}",
+            "fields": {
+                f.name: encode_value(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+                if f.init
+            },
+        }
+    if _is_dataframe(value):
+        split = value.to_dict(orient="split")
+        index = list(value.index)
+        is_dt = bool(index) and all(hasattr(i, "isoformat") for i in index)
+        return {
+            "__dataframe__": {
+                "columns": [str(c) for c in split["columns"]],
+                "index": [i.isoformat() if is_dt else encode_value(i) for i in index],
+                "index_kind": "datetime" if is_dt else "plain",
+                "index_name": value.index.name,
+                "data": [
+                    [encode_value(_native(v)) for v in row] for row in split["data"]
+                ],
+            }
+        }
+    raise TypeError(f"fixture 인코딩 불가 타입: {type(value).__name__}")
+
+
+def _native(value: Any) -> Any:
+    """numpy scalar → python scalar."""
+    item = getattr(value, "item", None)
+    if callable(item) and not isinstance(value, (list, tuple, dict, str)):
+        try:
+            return item()
+        except (TypeError, ValueError):
+            return value
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [decode_value(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__date__" in value:
+        return date.fromisoformat(value["__date__"])
+    if "__tuple__" in value:
+        return tuple(decode_value(v) for v in value["__tuple__"])
+    if "__dataclass__" in value:
+        module_name, qualname = value["__dataclass__"].split(":", 1)
+        cls: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            cls = getattr(cls, part)
+        fields = {k: decode_value(v) for k, v in value["fields"].items()}
+        return cls(**fields)
+    if "__dataframe__" in value:
+        import pandas as pd  # lazy import
+
+        spec = value["__dataframe__"]
+        if spec["index_kind"] == "datetime":
+            index = pd.DatetimeIndex(pd.to_datetime(spec["index"]))
+        else:
+            index = pd.Index([decode_value(i) for i in spec["index"]])
+        index.name = spec.get("index_name")
+        return pd.DataFrame(spec["data"], index=index, columns=spec["columns"])
+    return {k: decode_value(v) for k, v in value.items()}
+
+
+# ─── fixture store ──────────────────────────────────────────────────
+
+
+class FixtureStore:
+    """fetcher 이름 + key 단위 JSON fixture 디렉터리."""
+
+    def __init__(self, root: Path = FIXTURE_DIR) -> None:
+        self.root = Path(root)
+
+    def _path(self, name: str, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.root / name / f"{digest}.json"
+
+    def put(
+        self,
+        name: str,
+        key: str,
+        *,
+        value: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        entry: dict[str, Any] = {"name": name, "key": key}
+        if error is not None:
+            entry["error"] = {"type": type(error).__name__, "message": str(error)}
+        else:
+            entry["value"] = encode_value(value)
+        path = self._path(name, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+
+    def get(self, name: str, key: str) -> Optional[dict]:
+        path = self._path(name, key)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def keys(self, name: str) -> list[str]:
+        folder = self.root / name
+        if not folder.is_dir():
+            return []
+        out = []
+        for path in folder.glob("*.json"):
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            out.append(str(entry["key"]))
+        return sorted(out)
+
+
+# ─── session ────────────────────────────────────────────────────────
+
+
+@dataclass
+class SimulationProfile:
+    """replay 시 호출당 지연 / 오류율. seed 고정으로 결정적 재현."""
+
+    latency_seconds: float = 0.0
+    jitter_seconds: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class FetchStats:
+    calls: int = 0
+    recorded: int = 0
+    replayed: int = 0
+    missing: int = 0
+    simulated_errors: int = 0
+    simulated_latency_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class FetcherBinding:
+    """install() 이 교체하는 모듈 속성 1개."""
+
+    name: str
+    module: str
+    attr: str
+    key_fn: Callable[..., str]
+
+
+def _first_arg_key(*args: Any, **_kwargs: Any) -> str:
+    return str(args[0])
+
+
+def _constituents_key(etf_ticker: str, _asof: str, top_k: int) -> str:
+    return f"{etf_ticker}|{top_k}"
+
+
+FETCHER_BINDINGS: tuple[FetcherBinding, ...] = (
+    FetcherBinding(
+        "fdr_universe",
+        "app.market_data_fdr",
+        "_default_universe_fetcher",
+        lambda: "ETF/KR",
+    ),
+    FetcherBinding(
+        "fdr_price", "app.market_data_fdr", "_default_price_fetcher", _first_arg_key
+    ),
+    FetcherBinding(
+        "timeseries_price",
+        "app.market_timeseries_naver_yahoo_adapter",
+        "_default_price_fetcher",
+        _first_arg_key,
+    ),
+    FetcherBinding(
+        "constituents",
+        "app.etf_constituents_fetcher",
+        "naver_stock_etf_component_fetcher",
+        _constituents_key,
+    ),
+    # default_nav_fetcher() 가 돌려주는 현재 기본 per-ticker NAV fetcher.
+    FetcherBinding(
+        "nav", "app.etf_nav_fetcher", "unavailable_nav_fetcher", _first_arg_key
+    ),
+    FetcherBinding(
+        "market_naver_quote", "app.market_naver", "fetch_one", _first_arg_key
+    ),
+)
+
+
+class RecordReplaySession:
+    """fetcher 를 감싸 record / replay 하는 세션. 여러 thread 에서 호출 가능."""
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        *,
+        mode: str,
+        profile: Optional[SimulationProfile] = None,
+        sleeper: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if mode not in (MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"unknown mode: {mode}")
+        self.store = store
+        self.mode = mode
+        self.profile = profile or SimulationProfile()
+        self._sleeper = sleeper
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self.stats: dict[str, FetchStats] = {}
+
+    def _stat(self, name: str) -> FetchStats:
+        with self._lock:
+            return self.stats.setdefault(name, FetchStats())
+
+    def _simulate(self, name: str, stat: FetchStats) -> None:
+        p = self.profile
+        with self._lock:
+            jitter = self._rng.uniform(-p.jitter_seconds, p.jitter_seconds)
+            fail = p.error_rate > 0 and self._rng.random() < p.error_rate
+        delay = max(0.0, p.latency_seconds + jitter)
+        if delay > 0:
+            self._sleeper(delay)
+        with self._lock:
+            stat.simulated_latency_seconds += delay
+            if fail:
+                stat.simulated_errors += 1
+        if fail:
+            raise SimulatedFetchError(f"simulated fetch error: {name}")
+
+    def wrap(
+        self,
+        name: str,
+        fn: Optional[Callable[..., Any]],
+        key_fn: Callable[..., str],
+    ) -> Callable[..., Any]:
+        """fn 을 감싼 callable. replay 모드에서는 fn 을 호출하지 않는다 (None 허용)."""
+        if self.mode == MODE_RECORD and fn is None:
+            raise ValueError(f"record mode needs a real fetcher: {name}")
+
+        def _wrapped(*args: Any, **kwargs: Any) -> Any:
+            stat = self._stat(name)
+            key = key_fn(*args, **kwargs)
+            with self._lock:
+                stat.calls += 1
+            if self.mode == MODE_RECORD:
+                try:
+                    value = fn(*args, **kwargs)
+                except Exception as e:
+                    self.store.put(name, key, error=e)
+                    with self._lock:
+                        stat.recorded += 1
+                    raise
+                self.store.put(name, key, value=value)
+                with self._lock:
+                    stat.recorded += 1
+                return value
+
+            self._simulate(name, stat)
+            entry = self.store.get(name, key)
+            if entry is None:
+                with self._lock:
+                    stat.missing += 1
+                raise FixtureMissingError(f"no fixture: {name} key={key}")
+            with self._lock:
+                stat.replayed += 1
+            if "error" in entry:
+                err = entry["error"]
+                raise ReplayedFetchError(f"{err['type']}: {err['message']}")
+            return decode_value(entry["value"])
+
+        return _wrapped
+
+    @contextmanager
+    def install(
+        self, bindings: tuple[FetcherBinding, ...] = FETCHER_BINDINGS
+    ) -> Iterator["RecordReplaySession"]:
+        """bindings 의 모듈 속성을 세션 wrapper 로 교체. 종료 시 원복."""
+        originals: list[tuple[Any, str, Any]] = []
+        try:
+            for b in bindings:
+                module = importlib.import_module(b.module)
+                original = getattr(module, b.attr)
+                originals.append((module, b.attr, original))
+                setattr(module, b.attr, self.wrap(b.name, original, b.key_fn))
+            yield self
+        finally:
+            for module, attr, original in reversed(originals):
+                setattr(module, attr, original)
@@ -21,13 +21,10 @@ from pathlib import Path
 from typing import Any, Optional
 
 from app.etf_constituents_analysis import compute_repeated_core_holdings
-from app.etf_constituents_store import (
-    ConstituentRow,
-    fetch_constituents,
-    latest_constituent_asof,
-)
+from app.etf_constituents_store import ConstituentRow
 from app.etf_nav_fetcher import classify_discount_flag
-from app.etf_nav_store import DEFAULT_DB_PATH as NAV_DEFAULT_DB_PATH, fetch_latest_nav
+from app.etf_nav_store import DEFAULT_DB_PATH as NAV_DEFAULT_DB_PATH
+from app.evidence_context import EvidenceContext
 from app.holdings import Holding
 from app.holdings_enrich import enrich_holdings
 from app.market_cache import MarketQuote
@@ -206,7 +203,7 @@ def _build_market_core_repeated_lookup(
     candidates: list[dict[str, Any]],
     topn_status: str,
     *,
-    db_path: Path,
+    context: EvidenceContext,
 ) -> Optional[dict[str, dict[str, Any]]]:
     """현재 Market Discovery 후보들의 반복 핵심 종목 lookup 생성 (Strict Cache-only).
 
@@ -224,10 +221,7 @@ def _build_market_core_repeated_lookup(
         tk = c.get("ticker")
         if not tk:
             continue
-        cache_asof = latest_constituent_asof(tk, db_path=db_path)
-        if cache_asof is None:
-            continue
-        rows = fetch_constituents(etf_ticker=tk, asof=cache_asof, db_path=db_path)
+        rows = context.constituents(tk)
         if rows:
             per_ticker_rows[tk] = rows
 
@@ -265,7 +259,7 @@ def _build_constituents_overlap(
     holding_ticker: str,
     market_core_lookup: Optional[dict[str, dict[str, Any]]],
     *,
-    db_path: Path,
+    context: EvidenceContext,
 ) -> dict[str, Any]:
     """보유 ETF 구성종목 ∩ Market Discovery 반복 핵심 종목 (Strict Cache-only).
 
@@ -276,15 +270,8 @@ def _build_constituents_overlap(
             "status": MARKET_CORE_UNAVAILABLE,
             "overlap_with_market_core": [],
         }
-    cache_asof = latest_constituent_asof(holding_ticker, db_path=db_path)
-    if cache_asof is None:
-        return {
-            "status": CONSTITUENTS_UNAVAILABLE,
-            "overlap_with_market_core": [],
-        }
-    rows = fetch_constituents(
-        etf_ticker=holding_ticker, asof=cache_asof, db_path=db_path
-    )
+    # 후보이기도 한 보유 ETF 는 위 lookup 에서 읽은 구성종목을 그대로 쓴다.
+    rows = context.constituents(holding_ticker)
     if not rows:
         return {
             "status": CONSTITUENTS_UNAVAILABLE,
@@ -313,12 +300,14 @@ def _build_constituents_overlap(
     }
 
 
-def _build_nav_payload(holding_ticker: str, *, db_path: Path) -> dict[str, Any]:
+def _build_nav_payload(
+    holding_ticker: str, *, context: EvidenceContext
+) -> dict[str, Any]:
     """기존 etf_nav_daily store 에서 최신 row 1건 조회 (외부 fetch X).
 
     지시문 §5.9 — source 미연동이면 unavailable. NAV source 신규 채택 X.
     """
-    row = fetch_latest_nav(etf_ticker=holding_ticker, db_path=db_path)
+    row = context.latest_nav(holding_ticker)
     if row is None:
         return {
             "status": STATUS_UNAVAILABLE,
@@ -411,15 +400,13 @@ def _build_judgment_summary(
     market_context: Optional[dict],
     holdings_asof: Optional[str],
     market_asof: Optional[str],
-    db_path: Path,
+    context: EvidenceContext,
 ) -> dict:
     """POC3-06 §6 공통 판단 요약 — PC read·PUSH 공용 단일 결과.
 
     시장 위치(KOSPI 관찰값·국면·지속일)는 저장 benchmark series read 로 산출한다
     (신규 source 0). 보유 최대 3건·자료 확인 필요는 evidence(holdings_out) 기반.
     """
-    from app.market_benchmark_store import fetch_benchmark_history
-    from app.market_data_store import fetch_price_history as _fetch_etf_history
     from app.market_regime import (
         KODEX200_TICKER,
         KOSPI_ID,
@@ -428,8 +415,8 @@ def _build_judgment_summary(
     )
     from app.market_summary_composer import compose_judgment_summary
 
-    kospi_history = fetch_benchmark_history(KOSPI_ID, db_path=db_path)
-    kodex_history = _fetch_etf_history(KODEX200_TICKER, db_path=db_path)
+    kospi_history = context.benchmark_history(KOSPI_ID)
+    kodex_history = context.price_history(KODEX200_TICKER)
     kospi_position = (
         compute_kospi_position_metrics(kospi_history) if kospi_history else None
     )
@@ -454,6 +441,7 @@ def build_holdings_market_evidence(
     market_quotes: Optional[dict[str, MarketQuote]] = None,
     db_path: Path = NAV_DEFAULT_DB_PATH,
     holdings_asof: Optional[str] = None,
+    context: Optional[EvidenceContext] = None,
 ) -> dict[str, Any]:
     """보유 ETF × Market Discovery evidence (지시문 §5.2~§5.10).
 
@@ -473,7 +461,12 @@ def build_holdings_market_evidence(
         market_data.sqlite. NAV / constituents store 가 같은 파일을 사용.
     holdings_asof : str | None
         holdings_latest.json 의 갱신 시각 (ISO). 호출자가 측정.
+    context : EvidenceContext | None
+        2026-10 — 같은 요청에서 이미 읽은 시계열 / 구성종목 / NAV 를 공유.
+        None 이면 이 호출 전용 context 를 만든다 (db_path 기준).
     """
+    if context is None or context.db_path != db_path:
+        context = EvidenceContext(db_path=db_path)
     market_quotes = market_quotes or {}
     enriched_list = enrich_holdings(holdings, market_quotes)
     enriched_by_ticker = {e.ticker: e for e in enriched_list}
@@ -487,15 +480,25 @@ def build_holdings_market_evidence(
 
     # 단기 흐름 batch 1회 호출 — 보유 ETF tickers 만. KODEX200 시계열은 helper 가 1회만 fetch.
     holding_tickers = [h.ticker for h in holdings]
+    context.focus(holding_tickers)
+    # 2026-10 — NAV / 구성종목은 ticker 마다가 아니라 bulk 1 쿼리씩 (보유 30건이면
+    # 60+ 쿼리 → 2). 구성종목은 후보 lookup 이 필요할 때만 — 후보 + 보유를 함께.
+    context.prefetch_nav(holding_tickers)
+    if topn_status == "ok" and candidates:
+        context.prefetch_constituents(
+            [c.get("ticker") for c in candidates if c.get("ticker")] + holding_tickers
+        )
     stm_map = (
-        compute_short_term_momentum_batch(holding_tickers, db_path=db_path)
+        compute_short_term_momentum_batch(
+            holding_tickers, db_path=db_path, context=context
+        )
         if holding_tickers
         else {}
     )
 
     # 반복 핵심 종목 lookup 은 후보 전체에 대해 1회 계산.
     market_core_lookup = _build_market_core_repeated_lookup(
-        candidates, topn_status, db_path=db_path
+        candidates, topn_status, context=context
     )
 
     summary = {
@@ -516,9 +519,9 @@ def build_holdings_market_evidence(
         returns_payload, excess_payload = _build_returns_and_excess(matched_candidate)
         short_term = _build_short_term_payload(stm_map.get(h.ticker))
         constituents = _build_constituents_overlap(
-            h.ticker, market_core_lookup, db_path=db_path
+            h.ticker, market_core_lookup, context=context
         )
-        nav_discount = _build_nav_payload(h.ticker, db_path=db_path)
+        nav_discount = _build_nav_payload(h.ticker, context=context)
         notes = _build_evidence_notes(
             topn_match,
             short_term,
@@ -587,7 +590,7 @@ def build_holdings_market_evidence(
         market_context=market_context,
         holdings_asof=holdings_asof,
         market_asof=market_asof,
-        db_path=db_path,
+        context=context,
     )
 
     return {
@@ -0,0 +1,136 @@
+"""read-only GET 의 조건부 요청 (ETag / If-None-Match → 304) (2026-10).
+
+배경: 대시보드가 `/market/topn/latest` · `/market/price-series` ·
+`/holdings/market-evidence/latest` 등을 polling 할 때마다 전체 payload 를 다시
+계산 · 전송했다. 이 응답들은 저장된 데이터 (market_data.sqlite / holdings 파일 /
+ML snapshot JSON) 의 함수라서, 데이터가 그대로면 결과도 그대로다.
+
+`conditional_get(version_fn)` 은 route 의 dependency 로 붙는다:
+- version_fn() — endpoint 가 읽는 데이터의 버전 문자열 (파일 stat / SQLite
+  통계 테이블 1행씩 — payload 계산 X).
+- ETag = hash(경로 + query + version + 프로세스 기동 token). 기동 token 때문에
+  코드 배포 / 재시작 후에는 한 번 전체 응답을 다시 받는다 (응답 형태 변경 대비).
+- `If-None-Match` 가 일치하면 endpoint 본문을 실행하지 않고 304 (HTTPException —
+  FastAPI 기본 handler 가 body 없이 headers 만 보낸다).
+- 아니면 응답에 ETag + Cache-Control 을 붙인다. Cache-Control 은 `no-cache`
+  (저장은 하되 매번 재검증) — 오래된 값을 검증 없이 보여주지 않는다.
+
+dependency 가 계산한 버전은 `request.state.data_version` 에 남긴다 — endpoint 가
+같은 버전으로 single-flight key 를 만든다 (app.single_flight, 버전 재조회 없음).
+
+응답 안의 runtime_seconds / 생성 시각 같은 진단 값은 ETag 에 넣지 않는다 — 304
+이면 클라이언트는 처음 받은 값을 그대로 쓴다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import secrets
+import sqlite3
+from pathlib import Path
+from typing import Callable, Optional
+
+from fastapi import HTTPException, Request, Response
+
+from app import market_data_stats
+from app.sqlite_pool import pooled_connection
+
+NO_CACHE = "no-cache"
+PRIVATE_NO_CACHE = "private, no-cache"
+
+_BOOT_TOKEN = secrets.token_hex(8)
+
+
+def file_version(path: Optional[Path]) -> str:
+    """파일 stat (inode / mtime_ns / size). 없으면 "-" — 생성되면 버전이 바뀐다."""
+    if path is None:
+        return "-"
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return "-"
+    return f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def sqlite_version(db_path: Path) -> str:
+    """market_data SQLite 버전 — 파일 identity + 추적 테이블 change_seq.
+
+    change_seq 는 writer trigger 가 올린다 (app.market_data_stats) — checkpoint /
+    WAL 전환 같은 파일 변화에는 그대로라 mtime 보다 정확하다. inode 는 파일 자체가
+    교체된 경우 (복원 등) 를 잡는다. snapshot 모드면 호출자가 read_db_path() 로 받은
+    snapshot 경로를 넘긴다 — 발행마다 파일명이 바뀐다.
+    통계 테이블이 없는 DB (마이그레이션 전 사본) 만 본 파일 + `-wal` stat 으로 대신한다.
+    """
+    path = Path(db_path)
+    identity = file_version(path)
+    if identity == "-":
+        return f"{path.name}|-"
+    try:
+        with pooled_connection(path) as con:
+            version = market_data_stats.data_version(con)
+    except sqlite3.Error:
+        version = None
+    if version is None:
+        wal = path.with_name(path.name + "-wal")
+        return f"{path.name}|{identity}|{file_version(wal)}"
+    inode = identity.split(":", 1)[0]
+    return f"{path.name}|{inode}|{version}"
+
+
+def _etag(request: Request, version: str) -> str:
+    query = sorted(request.query_params.multi_items())
+    # gzip 본문과 원본 본문은 다른 표현 — strong ETag 가 서로 달라야 한다
+    # (app.api 의 GZipMiddleware 가 Accept-Encoding 에 따라 압축).
+    gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    raw = "\n".join(
+        [_BOOT_TOKEN, request.url.path, repr(query), version, f"gzip={gzip}"]
+    )
+    return '"' + hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 비교 — `*` / 목록 / weak (W/) 표기 모두 허용 (RFC 9110 weak 비교)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def conditional_get(
+    version_fn: Callable[[], str], cache_control: str = NO_CACHE
+) -> Callable[[Request, Response], None]:
+    """route dependency — 데이터 버전이 같으면 304, 아니면 ETag / Cache-Control 설정."""
+
+    def dependency(request: Request, response: Response) -> None:
+        version = version_fn()
+        request.state.data_version = version
+        etag = _etag(request, version)
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _matches(if_none_match, etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return dependency
+
+
+def json_bytes_response(body: bytes, response: Response) -> Response:
+    """이미 직렬화된 JSON (app.dashboard_snapshot) 을 그대로 보낸다.
+
+    endpoint 가 Response 를 직접 돌려주면 FastAPI 는 주입된 `response` 의 헤더를
+    합치지 않는다 — dependency 가 붙인 ETag / Cache-Control 을 여기서 옮긴다.
+    """
+    return Response(
+        content=body, media_type="application/json", headers=dict(response.headers)
+    )
+
+
+def request_version(request: Request, version_fn: Callable[[], str]) -> str:
+    """conditional_get 이 이 요청에서 계산한 데이터 버전 (없으면 지금 계산)."""
+    version = getattr(request.state, "data_version", None)
+    return version if version is not None else version_fn()
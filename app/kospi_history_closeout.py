@@ -25,6 +25,7 @@ from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from app import sqlite_pool
 from app.market_benchmark_store import (
     fetch_existing_benchmark_close_map,
     upsert_benchmark_prices,
@@ -146,6 +147,8 @@ def _project_split_with_hypothetical_kospi(
     # ignore_cleanup_errors=True 지정.
     with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpd:
         tmp_db = Path(tmpd) / "hypothetical.sqlite"
+        # 2026-10 — 공유 connection 은 WAL 모드. 복사 전에 WAL 을 본 파일에 반영.
+        sqlite_pool.checkpoint(db_path)
         shutil.copyfile(str(db_path), str(tmp_db))
         # 기존 KOSPI 우선 — hypothetical row 중 기존에 이미 있는 date 는 skip.
         appendable: list[tuple[str, Optional[float]]] = []
@@ -173,6 +176,7 @@ def _project_split_with_hypothetical_kospi(
         }
         # 명시적으로 참조 해제 + GC — Windows sqlite 파일 언락.
         del result, train, val, test
+        sqlite_pool.close_path(tmp_db)
         gc.collect()
         return split_result
 
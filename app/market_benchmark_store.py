@@ -13,13 +13,13 @@ KOSPI 같이 ETF 가 아닌 지수만 별도 보관한다. API 응답에서는 
 
 from __future__ import annotations
 
-import sqlite3
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, Optional
 
-from app.market_data_store import DEFAULT_DB_PATH
+from app.market_data_store import DEFAULT_DB_PATH, date_range_sql
+from app.sqlite_pool import pooled_connection
 
 MARKET_BENCHMARK_DAILY_PRICE_DDL = """
 CREATE TABLE IF NOT EXISTS market_benchmark_daily_price (
@@ -39,22 +39,18 @@ def _utcnow_iso() -> str:
 
 
 def init_benchmark_db(db_path: Path = DEFAULT_DB_PATH) -> None:
-    """benchmark 테이블 보장. market_data_store.init_db 와 동일 DB 파일."""
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(db_path)) as con:
-        con.execute(MARKET_BENCHMARK_DAILY_PRICE_DDL)
-        con.commit()
+    """benchmark 테이블 보장. market_data_store.init_db 와 동일 DB 파일
+    (2026-10 — 같은 user_version 마이그레이션, app.sqlite_schemas)."""
+    from app.sqlite_schemas import ensure_market_data
+
+    ensure_market_data(db_path)
 
 
 @contextmanager
-def _connection(db_path: Path):
+def _connection(db_path: Path, *, write: bool = False):
     init_benchmark_db(db_path)
-    con = sqlite3.connect(str(db_path))
-    try:
+    with pooled_connection(db_path, write=write) as con:
         yield con
-        con.commit()
-    finally:
-        con.close()
 
 
 def upsert_benchmark_prices(
@@ -82,7 +78,7 @@ def upsert_benchmark_prices(
         source = excluded.source,
         created_at = excluded.created_at
     """
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.executemany(sql, payload)
     return len(payload)
 
@@ -90,15 +86,21 @@ def upsert_benchmark_prices(
 def fetch_benchmark_history(
     benchmark_id: str,
     *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
     db_path: Path = DEFAULT_DB_PATH,
 ) -> list[tuple[str, float]]:
-    """(date, close) 시계열 (date ASC). close 가 null/0 이하인 행 제외."""
+    """(date, close) 시계열 (date ASC). close 가 null/0 이하인 행 제외.
+
+    2026-10 — start / end (양끝 포함) 가 있으면 그 구간만 SQL 에서 거른다.
+    """
+    range_sql, range_params = date_range_sql(start, end)
     with _connection(db_path) as con:
         cur = con.execute(
             "SELECT date, close FROM market_benchmark_daily_price "
-            "WHERE benchmark_id = ? AND close IS NOT NULL AND close > 0 "
-            "ORDER BY date ASC",
-            (benchmark_id,),
+            "WHERE benchmark_id = ? AND close IS NOT NULL AND close > 0"
+            f"{range_sql} ORDER BY date ASC",
+            (benchmark_id, *range_params),
         )
         return [(r[0], float(r[1])) for r in cur.fetchall()]
 
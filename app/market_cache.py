@@ -1,4 +1,4 @@
-"""POC2 Step 2 — 시장 데이터 캐시 (메모리 + JSON 파일).
+"""POC2 Step 2 — 시장 데이터 캐시 (메모리 + JSON snapshot + journal).
 
 설계자 결정:
 - 캐시 파일: state/market_cache/market_latest.json (단일)
@@ -22,11 +22,25 @@
   "updated_at": "ISO-8601",
   "items": { "<ticker>": <항목 스키마> }
 }
+
+2026-10 — append-only journal + compaction:
+- 기존 upsert_many 는 호출마다 전체 캐시를 indent JSON 으로 다시 써서
+  원자 교체했다 (1종목 갱신도 전체 재작성).
+- 이제 값이 바뀐 종목만 journal (market_latest.journal.jsonl, 1줄 = 항목
+  스키마 1건) 에 append + fsync 한다. 쓰기 비용은 변경 종목 수에 비례.
+- 로드 = snapshot (CACHE_FILE) 위에 journal 을 순서대로 재생 (마지막 값 우선).
+  마지막 줄이 잘린 경우 (쓰는 중 종료) 그 줄만 무시한다.
+- compaction: journal 이 COMPACT_JOURNAL_LINES 줄을 넘거나 snapshot 이 아직
+  없으면 메모리 전체를 snapshot 으로 원자 교체 후 journal 을 비운다. 교체와
+  비우기 사이에 종료돼도 journal 재생은 같은 결과 (항목 전체 값 기록).
+- 쓰기 실패 롤백: journal 을 append 전 크기로 되돌리고 메모리도 원복.
+- 프로세스 내 직렬화는 기존 _LOCK 그대로.
 """
 
 from __future__ import annotations
 
 import json
+import logging
 import os
 import tempfile
 import threading
@@ -35,12 +49,17 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 CACHE_DIR = Path("state/market_cache")
 CACHE_FILE = CACHE_DIR / "market_latest.json"
+JOURNAL_SUFFIX = ".journal.jsonl"
+COMPACT_JOURNAL_LINES = 1000
 
 _LOCK = threading.Lock()
 _MEM_CACHE: dict[str, "MarketQuote"] = {}
 _MEM_LOADED = False
+_JOURNAL_LINES = 0
 
 
 @dataclass
@@ -76,7 +95,24 @@ def _atomic_write(path: Path, text: str) -> None:
         raise
 
 
-def _load_from_disk_unlocked() -> dict[str, MarketQuote]:
+def journal_path() -> Path:
+    # CACHE_FILE 를 호출 시점에 읽는다 — 테스트의 monkeypatch 와 같은 디렉터리.
+    return CACHE_FILE.with_name(CACHE_FILE.stem + JOURNAL_SUFFIX)
+
+
+def _quote_from_raw(ticker: str, raw: dict) -> MarketQuote:
+    return MarketQuote(
+        ticker=str(raw.get("ticker") or ticker),
+        name=(raw.get("name") if isinstance(raw.get("name"), str) else None),
+        current_price=_coerce_price(raw.get("current_price")),
+        price_asof=(
+            raw.get("price_asof") if isinstance(raw.get("price_asof"), str) else None
+        ),
+        price_source=str(raw.get("price_source") or "naver"),
+    )
+
+
+def _load_snapshot_unlocked() -> dict[str, MarketQuote]:
     if not CACHE_FILE.exists():
         return {}
     try:
@@ -89,17 +125,36 @@ def _load_from_disk_unlocked() -> dict[str, MarketQuote]:
     for ticker, raw in items.items():
         if not isinstance(raw, dict):
             continue
-        result[ticker] = MarketQuote(
-            ticker=str(raw.get("ticker") or ticker),
-            name=(raw.get("name") if isinstance(raw.get("name"), str) else None),
-            current_price=_coerce_price(raw.get("current_price")),
-            price_asof=(
-                raw.get("price_asof")
-                if isinstance(raw.get("price_asof"), str)
-                else None
-            ),
-            price_source=str(raw.get("price_source") or "naver"),
-        )
+        result[ticker] = _quote_from_raw(ticker, raw)
+    return result
+
+
+def _replay_journal_unlocked(cache: dict[str, MarketQuote]) -> int:
+    """journal 을 cache 위에 재생. 읽은 줄 수 반환 (손상 줄 포함)."""
+    path = journal_path()
+    if not path.exists():
+        return 0
+    lines = 0
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    raw = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(raw, dict) and raw.get("ticker"):
+                    quote = _quote_from_raw(str(raw["ticker"]), raw)
+                    cache[quote.ticker] = quote
+    except OSError as e:
+        logger.warning("market_cache journal 읽기 실패 (%s): %s", path, e)
+    return lines
+
+
+def _load_from_disk_unlocked() -> dict[str, MarketQuote]:
+    global _JOURNAL_LINES
+    result = _load_snapshot_unlocked()
+    _JOURNAL_LINES = _replay_journal_unlocked(result)
     return result
 
 
@@ -130,10 +185,11 @@ def _ensure_loaded() -> None:
 
 def reset_for_test() -> None:
     """테스트 격리용. 메모리 캐시 + loaded 플래그 초기화."""
-    global _MEM_LOADED
+    global _MEM_LOADED, _JOURNAL_LINES
     with _LOCK:
         _MEM_CACHE.clear()
         _MEM_LOADED = False
+        _JOURNAL_LINES = 0
 
 
 def get(ticker: str) -> Optional[MarketQuote]:
@@ -146,8 +202,48 @@ def get_all() -> dict[str, MarketQuote]:
     return dict(_MEM_CACHE)
 
 
+def _append_journal(path: Path, quotes: list[MarketQuote]) -> None:
+    """quotes 를 journal 끝에 append + fsync. 실패 시 append 전 크기로 되돌린다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text = "".join(
+        json.dumps(asdict(q), ensure_ascii=False, separators=(",", ":")) + "\n"
+        for q in quotes
+    )
+    with path.open("a", encoding="utf-8") as f:
+        start = f.tell()
+        try:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            try:
+                f.truncate(start)
+            except OSError:
+                pass
+            raise
+
+
+def _compact_unlocked() -> None:
+    global _JOURNAL_LINES
+    payload = {
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "items": {t: asdict(q) for t, q in _MEM_CACHE.items()},
+    }
+    _atomic_write(CACHE_FILE, json.dumps(payload, indent=2, ensure_ascii=False))
+    # snapshot 교체 후 비운다 — 사이에 종료돼도 재생 결과는 같다.
+    journal_path().unlink(missing_ok=True)
+    _JOURNAL_LINES = 0
+
+
+def compact() -> None:
+    """메모리 캐시 전체를 snapshot 으로 쓰고 journal 을 비운다."""
+    _ensure_loaded()
+    with _LOCK:
+        _compact_unlocked()
+
+
 def upsert_many(quotes: list[MarketQuote]) -> None:
-    """여러 종목을 한 번에 갱신 + 디스크 원자적 저장.
+    """여러 종목을 한 번에 갱신 + 변경분을 journal 에 append.
 
     같은 프로세스 내 동시 쓰기는 _LOCK 으로 직렬화.
 
@@ -155,9 +251,14 @@ def upsert_many(quotes: list[MarketQuote]) -> None:
     1. 쓰기 전에 반드시 디스크 캐시를 메모리에 병합한다 (_ensure_loaded). 서버
        재시작 직후 첫 호출이 upsert_many 라도, 부분 성공으로 인해 디스크에 있던
        타 종목의 기존 캐시가 사라지지 않는다.
-    2. 디스크 쓰기가 실패하면 메모리 캐시도 직전 스냅샷으로 원복한다.
-       원자적 교체라 실패 시 기존 파일은 손상되지 않으며, 메모리도 일관 유지.
+    2. 디스크 쓰기가 실패하면 메모리 캐시도 직전 값으로 원복한다 (바뀐 종목만
+       — 전체 캐시를 복사하지 않는다). journal 은 append 전 크기로 되돌리므로
+       디스크도 일관 유지.
+
+    2026-10: 값이 그대로인 종목은 기록하지 않는다. compaction (snapshot 재작성)
+    실패는 journal 에 이미 기록된 값이 있으므로 로그만 남긴다.
     """
+    global _JOURNAL_LINES
     if not quotes:
         return
     # 디스크 기존 캐시를 먼저 메모리에 로드 — 부분 fetch 결과가 기존 값을
@@ -165,19 +266,26 @@ def upsert_many(quotes: list[MarketQuote]) -> None:
     # 자체가 lock 으로 직렬화한다.
     _ensure_loaded()
     with _LOCK:
-        # 직전 스냅샷 보존 — 쓰기 실패 시 롤백용.
-        snapshot = dict(_MEM_CACHE)
-        for q in quotes:
-            _MEM_CACHE[q.ticker] = q
-        payload = {
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "items": {t: asdict(q) for t, q in _MEM_CACHE.items()},
-        }
-        text = json.dumps(payload, indent=2, ensure_ascii=False)
+        changed = {q.ticker: q for q in quotes if _MEM_CACHE.get(q.ticker) != q}
+        if not changed:
+            return
+        # 바뀌는 종목의 직전 값만 보존 (None = 원래 없던 종목) — 쓰기 실패 시 롤백용.
+        previous = {t: _MEM_CACHE.get(t) for t in changed}
+        _MEM_CACHE.update(changed)
         try:
-            _atomic_write(CACHE_FILE, text)
+            _append_journal(journal_path(), list(changed.values()))
         except Exception:
-            # 디스크 쓰기 실패 → 메모리 캐시도 직전 스냅샷으로 원복.
-            _MEM_CACHE.clear()
-            _MEM_CACHE.update(snapshot)
+            # 디스크 쓰기 실패 → 바뀐 종목만 직전 값으로 원복.
+            for ticker, old in previous.items():
+                if old is None:
+                    _MEM_CACHE.pop(ticker, None)
+                else:
+                    _MEM_CACHE[ticker] = old
             raise
+        _JOURNAL_LINES += len(changed)
+        if _JOURNAL_LINES < COMPACT_JOURNAL_LINES and CACHE_FILE.exists():
+            return
+        try:
+            _compact_unlocked()
+        except OSError as e:
+            logger.warning("market_cache compaction 실패 (journal 유지): %s", e)
@@ -27,6 +27,12 @@ from app.market_data_store import (
     upsert_daily_prices,
     upsert_etf_master,
 )
+from app.source_circuit_breaker import (
+    CIRCUIT_OPEN_REASON,
+    SOURCE_FDR,
+    CircuitOpenError,
+    guarded_call,
+)
 
 FDR_SOURCE = "FinanceDataReader"
 DEFAULT_LOOKBACK_DAYS = 120  # 3개월 수익률 + 거래일/휴장일 여유
@@ -52,18 +58,20 @@ class PriceRefreshResult:
     fail: int
     runtime_seconds: float
     failure_examples: list[dict] = field(default_factory=list)
+    circuit_open: int = 0  # breaker 가 열려 호출하지 않은 ticker 수 (fail 에 포함)
 
 
 def _default_universe_fetcher():
     import FinanceDataReader as fdr  # lazy import
 
-    return fdr.StockListing("ETF/KR")
+    return guarded_call(SOURCE_FDR, fdr.StockListing, "ETF/KR")
 
 
 def _default_price_fetcher(ticker: str, start: date, end: date):
     import FinanceDataReader as fdr  # lazy import
 
-    return fdr.DataReader(ticker, start, end)
+    # 2026-10 — FDR 소스 circuit breaker. open 이면 호출 없이 CircuitOpenError.
+    return guarded_call(SOURCE_FDR, fdr.DataReader, ticker, start, end)
 
 
 def _to_optional_float(val) -> Optional[float]:
@@ -247,9 +255,18 @@ def refresh_price_history(
     t0 = time.perf_counter()
     success = 0
     failures: list[dict] = []
+    circuit_open = 0
     for tk in normalized:
         try:
             df = fetch(tk, start_date, end_date)
+        except CircuitOpenError as e:
+            # 네트워크 실패가 아니라 호출 생략 — 사유를 따로 남긴다.
+            circuit_open += 1
+            if len(failures) < 10:
+                failures.append(
+                    {"ticker": tk, "error": str(e)[:160], "reason": CIRCUIT_OPEN_REASON}
+                )
+            continue
         except Exception as e:  # noqa: BLE001
             if len(failures) < 10:
                 failures.append(
@@ -297,4 +314,5 @@ def refresh_price_history(
         fail=fail,
         runtime_seconds=elapsed,
         failure_examples=failures[:5],
+        circuit_open=circuit_open,
     )
@@ -0,0 +1,120 @@
+"""market_data.sqlite 보조 인덱스 마이그레이션 (2026-10).
+
+배경: market_data.sqlite 의 테이블은 PK 만 있어 다음 조회가 전체 scan 이었다.
+- etf_daily_price `MAX(date)` / `WHERE date = ?` — market_topn_helpers
+  `_latest_date_in_db`, refresh 상태 / market_flow_dataset 최신일 확인.
+- etf_nav_daily ticker 별 `MAX(asof)` / `MAX(created_at)` — fetch_all_latest_nav.
+- market_refresh_log `ORDER BY created_at DESC` — latest_refresh_log.
+- etf_constituents asof 기준 조회.
+
+인덱스 (추가만 — 기존 정의는 바꾸지 않는다):
+1. etf_daily_price (date, ticker, close) — 날짜 단면 조회용 covering 인덱스.
+   같은 날짜 행이 연속 구간이라 날짜 단위 partition 처럼 읽힌다. 유효 종가
+   최신일 (`MAX(date) ... WHERE close > 0`) 도 인덱스 끝에서 역방향으로 끝난다
+   — 별도 partial 인덱스는 planner 가 고르지 않아 두지 않는다.
+2. etf_nav_daily (etf_ticker, asof, created_at)
+3-4. market_refresh_log (created_at), (source, created_at)
+5. etf_constituents (asof, etf_ticker)
+
+전/후 조회 계획과 시간: scripts/benchmark_market_data_indexes.py.
+
+적용 기록은 market_data.sqlite 의 `PRAGMA user_version` 하나뿐이다 —
+app.sqlite_schemas market_data 스키마의 `secondary_indexes` step 이
+`ensure_all_indexes` 로 실행한다. 인덱스를 추가하면 그 뒤에 같은 호출을 하는
+step 을 하나 더 둔다. 별도 per-index 기록 테이블은 두지 않는다 (예전
+`market_data_index_migration` 은 step 10 이 지운다). 대상 테이블이 없으면
+건너뛰고, `CREATE INDEX IF NOT EXISTS` 라 재실행이 안전하다.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+
+# 2026-10 이전 per-index 적용 기록 테이블 — user_version step 과 이중 기록이라 폐기.
+LEGACY_MIGRATION_TABLE = "market_data_index_migration"
+
+
+@dataclass(frozen=True)
+class SecondaryIndex:
+    table: str
+    name: str
+    ddl: str
+
+
+SECONDARY_INDEXES: tuple[SecondaryIndex, ...] = (
+    SecondaryIndex(
+        "etf_daily_price",
+        "idx_etf_daily_price_date_ticker_close",
+        "CREATE INDEX IF NOT EXISTS idx_etf_daily_price_date_ticker_close "
+        "ON etf_daily_price (date, ticker, close)",
+    ),
+    SecondaryIndex(
+        "etf_nav_daily",
+        "idx_etf_nav_daily_ticker_asof_created",
+        "CREATE INDEX IF NOT EXISTS idx_etf_nav_daily_ticker_asof_created "
+        "ON etf_nav_daily (etf_ticker, asof, created_at)",
+    ),
+    SecondaryIndex(
+        "market_refresh_log",
+        "idx_market_refresh_log_created_at",
+        "CREATE INDEX IF NOT EXISTS idx_market_refresh_log_created_at "
+        "ON market_refresh_log (created_at)",
+    ),
+    SecondaryIndex(
+        "market_refresh_log",
+        "idx_market_refresh_log_source_created_at",
+        "CREATE INDEX IF NOT EXISTS idx_market_refresh_log_source_created_at "
+        "ON market_refresh_log (source, created_at)",
+    ),
+    SecondaryIndex(
+        "etf_constituents",
+        "idx_etf_constituents_asof_ticker",
+        "CREATE INDEX IF NOT EXISTS idx_etf_constituents_asof_ticker "
+        "ON etf_constituents (asof, etf_ticker)",
+    ),
+)
+
+
+def _table_exists(con: sqlite3.Connection, table: str) -> bool:
+    cur = con.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?", (table,)
+    )
+    return cur.fetchone() is not None
+
+
+def _existing_indexes(con: sqlite3.Connection) -> set[str]:
+    return {
+        r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+
+
+def ensure_indexes(con: sqlite3.Connection, table: str) -> list[str]:
+    """table 에 없는 보조 인덱스를 만들고 새로 만든 인덱스 이름 목록 반환.
+
+    호출자가 commit 한다 (마이그레이션 step / 벤치마크의 connection 블록 안에서 호출).
+    """
+    pending = [ix for ix in SECONDARY_INDEXES if ix.table == table]
+    if not pending or not _table_exists(con, table):
+        return []
+    existing = _existing_indexes(con)
+    created: list[str] = []
+    for ix in pending:
+        if ix.name in existing:
+            continue
+        con.execute(ix.ddl)
+        created.append(ix.name)
+    return created
+
+
+def ensure_all_indexes(con: sqlite3.Connection) -> list[str]:
+    """존재하는 모든 대상 테이블에 없는 인덱스 적용 (마이그레이션 step / 벤치마크용)."""
+    created: list[str] = []
+    for table in dict.fromkeys(ix.table for ix in SECONDARY_INDEXES):
+        created.extend(ensure_indexes(con, table))
+    return created
+
+
+def drop_legacy_migration_table(con: sqlite3.Connection) -> None:
+    """예전 per-index 기록 테이블 제거 — 적용 여부는 user_version 이 관리한다."""
+    con.execute(f"DROP TABLE IF EXISTS {LEGACY_MIGRATION_TABLE}")
@@ -0,0 +1,243 @@
+"""market_data.sqlite 읽기 전용 snapshot 발행 (2026-10).
+
+배경: `_execute_refresh_job` / scripts/refresh_market_timeseries.py 가 수천 row 를
+쓰는 동안 `/market/topn/latest` · `/market/price-series` ·
+`/market/nav-discount/latest` 읽기가 같은 파일의 writer 와 경합했다.
+
+snapshot 모드 (환경변수 MARKET_DATA_SNAPSHOT_MODE=on, 기본 off):
+- refresh 작업은 지금처럼 운영 DB 에 쓴다 (= staging). 작업이 끝나면
+  `publish_if_enabled` 가 `VACUUM INTO` 로 WAL 까지 반영된 일관 사본을 만든다
+  (rollback journal 모드, 조각 모음된 파일).
+- 사본은 `snapshots/market_data.<stamp>.sqlite` 로 이름이 매번 다르고 발행 후
+  내용을 바꾸지 않는다. `snapshots/CURRENT` (파일명 1줄) 를 원자 교체해 전환한다.
+  열려 있는 파일을 덮어쓰지 않으므로 Windows 에서도 교체가 막히지 않는다.
+- API 읽기는 `read_db_path(DEFAULT_DB_PATH)` 로 현재 snapshot 경로를 받는다.
+  sqlite_pool 이 `mode=ro&immutable=1` + mmap 으로 연다 — lock 을 잡지 않으므로
+  refresh 중에도 읽기가 막히지 않는다.
+- 직전 snapshot 1개는 남긴다 (발행 순간 읽던 요청 보호). 그보다 오래된 파일은
+  다음 발행 때 지운다. 삭제 실패 (Windows 에서 열린 파일) 는 다음 발행에 재시도.
+- 지우는 snapshot 은 sqlite_pool 에서 retire 만 한다 — 다른 thread 가 조회 중인
+  connection 을 닫지 않는다. 여러 요청 / thread 에 걸쳐 한 발행본을 읽는 streaming
+  (app.ml_export) 은 `pin_read_path` 로 경로를 고정하고, 고정된 파일의 삭제는
+  마지막 pin 이 풀릴 때로 미룬다.
+
+모드가 off 이거나 snapshot 이 아직 없으면 `read_db_path` 는 운영 DB 경로를
+그대로 돌려준다. refresh 작업 외 경로 (on-demand 구성종목 수집 등) 로 쓴 값은
+다음 발행부터 snapshot 에 보인다 — 수동 발행은 scripts/publish_market_data_snapshot.py.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from app import sqlite_pool
+from app.config import optional_env
+from app.market_data_store import DEFAULT_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+MODE_ENV = "MARKET_DATA_SNAPSHOT_MODE"
+SNAPSHOT_DIR_NAME = "snapshots"
+POINTER_NAME = "CURRENT"
+KEEP_PREVIOUS = 1
+_POINTER_REPLACE_ATTEMPTS = 5
+_PIN_ATTEMPTS = 3
+
+_LOCK = threading.RLock()  # pin finalize 가 GC 로 lock 보유 중에 돌 수도 있다.
+# pointer 경로 → ((mtime_ns, size), snapshot 경로). 요청마다 stat 1회.
+_POINTER_CACHE: dict[str, tuple[tuple[int, int], Optional[Path]]] = {}
+# snapshot 경로 → 살아 있는 pin 수. 지울 차례가 됐지만 pin 이 남은 경로는 _DEFERRED.
+_PINS: dict[str, int] = {}
+_DEFERRED: set[str] = set()
+
+
+def snapshot_mode_enabled() -> bool:
+    value = optional_env(MODE_ENV, default="off") or "off"
+    return value.strip().lower() in ("1", "on", "true", "yes")
+
+
+def snapshot_dir(db_path: Path = DEFAULT_DB_PATH) -> Path:
+    return Path(db_path).parent / SNAPSHOT_DIR_NAME
+
+
+def _pointer_path(db_path: Path) -> Path:
+    return snapshot_dir(db_path) / POINTER_NAME
+
+
+def current_snapshot(db_path: Path = DEFAULT_DB_PATH) -> Optional[Path]:
+    """현재 발행된 snapshot 경로. 없으면 None."""
+    pointer = _pointer_path(db_path)
+    try:
+        st = os.stat(pointer)
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(pointer)
+    cached = _POINTER_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        name = pointer.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    path = snapshot_dir(db_path) / name if name else None
+    if path is not None and not path.exists():
+        path = None
+    if path is not None:
+        sqlite_pool.register_immutable(path)
+    with _LOCK:
+        _POINTER_CACHE[key] = (stamp, path)
+    return path
+
+
+def read_db_path(db_path: Path = DEFAULT_DB_PATH) -> Path:
+    """API 읽기용 경로 — snapshot 모드 + 발행본이 있으면 snapshot, 아니면 db_path."""
+    if not snapshot_mode_enabled():
+        return db_path
+    return current_snapshot(db_path) or db_path
+
+
+class SnapshotPin:
+    """읽기 경로 1개를 고정한다. release() 또는 객체가 버려질 때 풀린다."""
+
+    def __init__(self, path: Path, pinned: bool) -> None:
+        self.path = path
+        self._release = (
+            weakref.finalize(self, _unpin, _pin_key(path)) if pinned else None
+        )
+
+    def release(self) -> None:
+        if self._release is not None:
+            self._release()
+
+
+def pin_read_path(db_path: Path = DEFAULT_DB_PATH) -> SnapshotPin:
+    """`read_db_path` 와 같은 경로를 돌려주되, snapshot 이면 pin 이 풀릴 때까지
+    발행이 바뀌어도 파일을 지우지 않는다 (조각 단위 streaming 용)."""
+    for _ in range(_PIN_ATTEMPTS):
+        path = read_db_path(db_path)
+        if path == Path(db_path):
+            break
+        key = _pin_key(path)
+        with _LOCK:
+            # pin 직전에 지워졌으면 (발행 경쟁) pointer 를 다시 읽는다.
+            if key not in _DEFERRED and path.exists():
+                _PINS[key] = _PINS.get(key, 0) + 1
+                return SnapshotPin(path, pinned=True)
+            _POINTER_CACHE.pop(str(_pointer_path(db_path)), None)
+    return SnapshotPin(Path(db_path), pinned=False)
+
+
+def _pin_key(path: Path) -> str:
+    return os.path.abspath(str(path))
+
+
+def _unpin(key: str) -> None:
+    with _LOCK:
+        remaining = _PINS.get(key, 0) - 1
+        if remaining > 0:
+            _PINS[key] = remaining
+            return
+        _PINS.pop(key, None)
+        if key not in _DEFERRED:
+            return
+        _DEFERRED.discard(key)
+        _remove_snapshot(Path(key))
+
+
+def _remove_snapshot(path: Path) -> None:
+    """_LOCK 보유 중 호출 — pin 확인과 삭제 사이에 새 pin 이 끼지 않게."""
+    sqlite_pool.forget_immutable(path)
+    try:
+        path.unlink()
+    except OSError as e:
+        logger.info("이전 snapshot 삭제 보류 (%s): %s", path.name, e)
+
+
+def _write_pointer(pointer: Path, name: str) -> None:
+    tmp = pointer.with_name(f".{POINTER_NAME}.{os.getpid()}.tmp")
+    tmp.write_text(name + "\n", encoding="utf-8")
+    for attempt in range(_POINTER_REPLACE_ATTEMPTS):
+        try:
+            os.replace(tmp, pointer)
+            return
+        except PermissionError:
+            # Windows — 다른 요청이 pointer 를 읽는 순간이면 잠깐 뒤 재시도.
+            if attempt == _POINTER_REPLACE_ATTEMPTS - 1:
+                raise
+            time.sleep(0.05)
+
+
+def _prune(directory: Path, keep: set[str]) -> None:
+    for path in directory.glob("market_data.*.sqlite"):
+        if path.name in keep:
+            continue
+        key = _pin_key(path)
+        with _LOCK:
+            if _PINS.get(key):
+                _DEFERRED.add(key)  # 마지막 pin 이 풀릴 때 지운다.
+                continue
+            _remove_snapshot(path)
+
+
+def publish_snapshot(db_path: Path = DEFAULT_DB_PATH) -> Path:
+    """db_path 의 일관 사본을 새 snapshot 으로 발행하고 CURRENT 를 전환한다."""
+    from app import sqlite_schemas
+
+    db_path = Path(db_path)
+    sqlite_schemas.ensure_market_data(db_path)
+    directory = snapshot_dir(db_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    target = directory / f"market_data.{stamp}.sqlite"
+    tmp = directory / f".{target.name}.tmp"
+    tmp.unlink(missing_ok=True)
+    # 별도 connection — pooled writer 를 잡지 않으므로 진행 중 refresh 와 경합 X.
+    con = sqlite3.connect(str(db_path), timeout=sqlite_pool.BUSY_TIMEOUT_MS / 1000)
+    try:
+        con.execute("VACUUM INTO ?", (str(tmp),))
+    finally:
+        con.close()
+    with open(tmp, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp, target)
+
+    previous = current_snapshot(db_path)
+    _write_pointer(_pointer_path(db_path), target.name)
+    sqlite_pool.register_immutable(target)
+    with _LOCK:
+        # mtime 해상도가 낮은 파일시스템에서도 다음 조회가 새 pointer 를 읽게.
+        _POINTER_CACHE.pop(str(_pointer_path(db_path)), None)
+    keep = {target.name}
+    if previous is not None and KEEP_PREVIOUS > 0:
+        keep.add(previous.name)
+    _prune(directory, keep)
+    return target
+
+
+def publish_if_enabled(db_path: Path = DEFAULT_DB_PATH) -> Optional[Path]:
+    """snapshot 모드일 때만 발행. 실패는 로그만 — refresh 결과 자체는 운영 DB 에 있다."""
+    if not snapshot_mode_enabled():
+        return None
+    try:
+        path = publish_snapshot(db_path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("market_data snapshot 발행 실패 (%s): %s", db_path, e)
+        return None
+    logger.info("market_data snapshot 발행: %s", path.name)
+    return path
+
+
+def reset_cache_for_tests() -> None:
+    with _LOCK:
+        _POINTER_CACHE.clear()
+        _PINS.clear()
+        _DEFERRED.clear()
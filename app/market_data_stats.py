@@ -0,0 +1,232 @@
+"""market_data.sqlite 테이블 통계 — 행 수 / 날짜 범위 / 마지막 writer run (2026-10).
+
+배경: 준비 상태 확인 (preflight / `/oci/startup-status` / TopN 의 최신 날짜) 이
+매번 스키마를 훑거나 `PRAGMA integrity_check` · `COUNT(*)` 로 큰 테이블을 끝까지
+읽었다. 데이터가 쌓일수록 기동 확인이 느려진다.
+
+`market_data_table_stats` (테이블당 1행) 를 writer 쪽에서 유지한다:
+- 행 수 / 최소·최대 날짜 / change_seq 는 추적 테이블의 INSERT · UPDATE · DELETE
+  trigger 가 갱신한다. store 코드 변경 없이 모든 writer 가 반영된다.
+  삭제로 최소·최대가 빠지면 그 때만 MIN / MAX 를 다시 구한다.
+- last_run_id 는 `record_run` (log_refresh 가 호출) 이 남긴다. 직전 기록 이후
+  change_seq 가 바뀐 테이블에만 그 run_id 를 붙인다.
+- 스키마 step (`table_statistics`) 이 처음 1번 전체 scan 으로 값을 채운다.
+
+읽는 쪽은 `read_stats` — 작은 테이블 1번 조회. 실제 값과의 대조 (전체 scan) 는
+`deep_scan` 으로, preflight `--deep` 에서만 한다. 어긋나면 `rebuild` 로 다시 채운다
+(scripts/rebuild_market_data_stats.py). `data_version` 은 change_seq 묶음 —
+read-only API 의 ETag 입력.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from app.sqlite_pool import pooled_connection
+
+STATS_TABLE = "market_data_table_stats"
+
+# 추적 테이블 → 날짜 컬럼 (없으면 None — 행 수만).
+TRACKED_TABLES: dict[str, Optional[str]] = {
+    "etf_master": None,
+    "etf_daily_price": "date",
+    "market_refresh_log": "asof",
+    "etf_nav_daily": "asof",
+    "etf_constituents": "asof",
+    "market_benchmark_daily_price": "date",
+}
+
+MARKET_DATA_TABLE_STATS_DDL = f"""
+CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+    table_name   TEXT PRIMARY KEY,
+    row_count    INTEGER NOT NULL DEFAULT 0,
+    min_date     TEXT,
+    max_date     TEXT,
+    change_seq   INTEGER NOT NULL DEFAULT 0,
+    run_seq      INTEGER NOT NULL DEFAULT 0,
+    last_run_id  TEXT,
+    updated_at   TEXT,
+    rebuilt_at   TEXT
+)
+""".strip()
+
+_NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%SZ', 'now')"
+
+
+@dataclass(frozen=True)
+class TableStats:
+    table: str
+    row_count: int
+    min_date: Optional[str]
+    max_date: Optional[str]
+    last_run_id: Optional[str]
+    updated_at: Optional[str]
+
+
+def _trigger_ddl(table: str, date_col: Optional[str]) -> list[str]:
+    where = f"WHERE table_name = '{table}'"
+    touch = f"change_seq = change_seq + 1, updated_at = {_NOW_SQL}"
+    if date_col is None:
+        ins_range = del_range = ""
+    else:
+        ins_range = (
+            f", min_date = min(COALESCE(min_date, NEW.{date_col}), NEW.{date_col})"
+            f", max_date = max(COALESCE(max_date, NEW.{date_col}), NEW.{date_col})"
+        )
+        del_range = (
+            f", min_date = CASE WHEN OLD.{date_col} = min_date "
+            f"THEN (SELECT MIN({date_col}) FROM {table}) ELSE min_date END"
+            f", max_date = CASE WHEN OLD.{date_col} = max_date "
+            f"THEN (SELECT MAX({date_col}) FROM {table}) ELSE max_date END"
+        )
+    ddl = [
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_stats_ins AFTER INSERT ON {table} "
+        f"BEGIN UPDATE {STATS_TABLE} SET row_count = row_count + 1, {touch}"
+        f"{ins_range} {where}; END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_stats_del AFTER DELETE ON {table} "
+        f"BEGIN UPDATE {STATS_TABLE} SET row_count = row_count - 1, {touch}"
+        f"{del_range} {where}; END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_stats_upd AFTER UPDATE ON {table} "
+        f"BEGIN UPDATE {STATS_TABLE} SET {touch} {where}; END",
+    ]
+    if date_col is not None:
+        # 날짜 자체를 바꾸는 UPDATE (드묾) — 범위를 다시 구한다.
+        ddl.append(
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_stats_upd_date "
+            f"AFTER UPDATE OF {date_col} ON {table} "
+            f"WHEN OLD.{date_col} IS NOT NEW.{date_col} "
+            f"BEGIN UPDATE {STATS_TABLE} SET "
+            f"min_date = (SELECT MIN({date_col}) FROM {table}), "
+            f"max_date = (SELECT MAX({date_col}) FROM {table}) {where}; END"
+        )
+    return ddl
+
+
+def _existing_tables(con: sqlite3.Connection) -> set[str]:
+    return {
+        r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+
+
+def _scan(
+    con: sqlite3.Connection, table: str
+) -> tuple[int, Optional[str], Optional[str]]:
+    date_col = TRACKED_TABLES[table]
+    if date_col is None:
+        return (
+            int(con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]),
+            None,
+            None,
+        )
+    row = con.execute(
+        f"SELECT COUNT(*), MIN({date_col}), MAX({date_col}) FROM {table}"
+    ).fetchone()
+    return int(row[0]), row[1], row[2]
+
+
+def install(con: sqlite3.Connection) -> None:
+    """스키마 step — 통계 테이블 + trigger 생성 후 전체 scan 으로 1번 채운다."""
+    con.execute(MARKET_DATA_TABLE_STATS_DDL)
+    present = _existing_tables(con)
+    for table, date_col in TRACKED_TABLES.items():
+        if table not in present:
+            continue
+        for ddl in _trigger_ddl(table, date_col):
+            con.execute(ddl)
+    rebuild(con)
+
+
+def rebuild(con: sqlite3.Connection) -> list[str]:
+    """추적 테이블 전체 scan 으로 행 수 / 날짜 범위를 다시 채운다. 갱신한 테이블 목록."""
+    present = _existing_tables(con)
+    rebuilt: list[str] = []
+    for table in TRACKED_TABLES:
+        if table not in present:
+            continue
+        count, lo, hi = _scan(con, table)
+        con.execute(
+            f"INSERT INTO {STATS_TABLE} (table_name, row_count, min_date, max_date, "
+            f"updated_at, rebuilt_at) VALUES (?, ?, ?, ?, {_NOW_SQL}, {_NOW_SQL}) "
+            "ON CONFLICT(table_name) DO UPDATE SET row_count = excluded.row_count, "
+            "min_date = excluded.min_date, max_date = excluded.max_date, "
+            "rebuilt_at = excluded.rebuilt_at",
+            (table, count, lo, hi),
+        )
+        rebuilt.append(table)
+    return rebuilt
+
+
+def record_run(con: sqlite3.Connection, run_id: str) -> None:
+    """직전 기록 이후 바뀐 추적 테이블에 writer run_id 를 남긴다.
+
+    writer 와 같은 connection / 트랜잭션에서 호출한다. 통계 테이블이 없는
+    DB (마이그레이션 전 사본 등) 에서는 아무것도 하지 않는다.
+    """
+    try:
+        con.execute(
+            f"UPDATE {STATS_TABLE} SET last_run_id = ?, run_seq = change_seq "
+            "WHERE change_seq > run_seq",
+            (run_id,),
+        )
+    except sqlite3.OperationalError:
+        return
+
+
+def read_stats(con: sqlite3.Connection) -> Optional[dict[str, TableStats]]:
+    """통계 테이블 전체 (행 수 = 추적 테이블 수). 통계 테이블이 없으면 None."""
+    try:
+        rows = con.execute(
+            f"SELECT table_name, row_count, min_date, max_date, last_run_id, updated_at "
+            f"FROM {STATS_TABLE} ORDER BY table_name"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    return {r[0]: TableStats(r[0], int(r[1]), r[2], r[3], r[4], r[5]) for r in rows}
+
+
+def data_version(con: sqlite3.Connection) -> Optional[str]:
+    """추적 테이블 change_seq 묶음 — 어느 writer 든 행을 바꾸면 달라진다.
+
+    HTTP ETag (app.http_cache) 용. checkpoint / WAL 전환처럼 데이터와 무관한 파일
+    변화에는 그대로다. 통계 테이블이 없으면 None.
+    """
+    try:
+        rows = con.execute(
+            f"SELECT table_name, change_seq FROM {STATS_TABLE} ORDER BY table_name"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    return ",".join(f"{r[0]}={r[1]}" for r in rows)
+
+
+def load_stats(db_path: Path) -> Optional[dict[str, TableStats]]:
+    """db_path 의 통계. 파일이 없으면 만들지 않고 None."""
+    if not Path(db_path).exists():
+        return None
+    with pooled_connection(db_path) as con:
+        return read_stats(con)
+
+
+def deep_scan(
+    con: sqlite3.Connection, tables: Optional[Iterable[str]] = None
+) -> dict[str, tuple[int, Optional[str], Optional[str]]]:
+    """전체 scan 실측값 (row_count, min_date, max_date). preflight --deep 전용."""
+    present = _existing_tables(con)
+    names = TRACKED_TABLES if tables is None else tables
+    return {t: _scan(con, t) for t in names if t in present and t in TRACKED_TABLES}
+
+
+def drift(
+    stats: dict[str, TableStats],
+    actual: dict[str, tuple[int, Optional[str], Optional[str]]],
+) -> list[str]:
+    """통계와 실측이 다른 테이블 목록 (통계 행이 없는 테이블 포함)."""
+    out: list[str] = []
+    for table, (count, lo, hi) in actual.items():
+        s = stats.get(table)
+        if s is None or (s.row_count, s.min_date, s.max_date) != (count, lo, hi):
+            out.append(table)
+    return out
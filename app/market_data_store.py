@@ -12,14 +12,18 @@ decision_evidence 테이블 신설 금지 (BACKLOG — 별도 STEP).
 from __future__ import annotations
 
 import json
-import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, Optional, Sequence
 
+from app import market_data_stats
+from app.sqlite_pool import pooled_connection
+
 DEFAULT_DB_PATH = Path("state/market/market_data.sqlite")
+# 종가 columnar archive 디렉터리 (DB 파일 옆). 내용은 app.price_archive 가 관리.
+PRICE_ARCHIVE_DIR_NAME = "price_archive"
 
 ETF_MASTER_DDL = """
 CREATE TABLE IF NOT EXISTS etf_master (
@@ -170,16 +174,14 @@ def init_db(db_path: Path = DEFAULT_DB_PATH) -> None:
     """Create database file + tables if missing.
 
     Decision evidence 테이블은 생성하지 않는다 (BACKLOG).
+
+    2026-10 — 같은 파일을 쓰는 store (nav / constituents / benchmark / ml feature)
+    테이블과 보조 인덱스까지 app.sqlite_schemas 의 user_version 마이그레이션으로
+    함께 맞춘다. 최신 version 이면 probe 없이 끝난다.
     """
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(db_path)) as con:
-        con.execute(ETF_MASTER_DDL)
-        con.execute(ETF_DAILY_PRICE_DDL)
-        con.execute(MARKET_REFRESH_LOG_DDL)
-        con.execute(MARKET_REFRESH_STATE_DDL)
-        con.execute(MARKET_TIMESERIES_INGESTION_STATE_DDL)
-        con.execute(MARKET_TIMESERIES_REFRESH_STATE_DDL)
-        con.commit()
+    from app.sqlite_schemas import ensure_market_data
+
+    ensure_market_data(db_path)
 
 
 # 2026-06-08 perf — `_connection` 이 매 호출마다 init_db (connect + CREATE TABLE
@@ -198,14 +200,15 @@ def _ensure_initialized(db_path: Path) -> None:
 
 
 @contextmanager
-def _connection(db_path: Path):
+def _connection(db_path: Path, *, write: bool = False):
+    """2026-10 — thread 별 공유 읽기 connection / 경로별 writer (app.sqlite_pool).
+
+    `with _connection(db_path) as con` 의미는 그대로 — 정상 종료 시 commit,
+    예외 시 rollback. 쓰기 helper 는 write=True 로 writer 를 쓴다.
+    """
     _ensure_initialized(db_path)
-    con = sqlite3.connect(str(db_path))
-    try:
+    with pooled_connection(db_path, write=write) as con:
         yield con
-        con.commit()
-    finally:
-        con.close()
 
 
 def upsert_etf_master(
@@ -246,7 +249,7 @@ def upsert_etf_master(
         source = excluded.source,
         last_seen_at = excluded.last_seen_at
     """
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.executemany(sql, payload)
     return len(payload)
 
@@ -288,7 +291,7 @@ def upsert_daily_prices(
         source = excluded.source,
         fetched_at = excluded.fetched_at
     """
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.executemany(sql, payload)
     return len(payload)
 
@@ -305,14 +308,26 @@ def log_refresh(
     error_summary: Optional[str] = None,
     db_path: Path = DEFAULT_DB_PATH,
 ) -> None:
-    """market_refresh_log 1건 기록 (성공/실패/runtime/오류 요약)."""
+    """market_refresh_log 1건 기록 (성공/실패/runtime/오류 요약).
+
+    같은 run_id 재기록은 UPDATE — REPLACE 의 암묵적 DELETE 는 delete trigger 를
+    부르지 않아 통계 행 수가 어긋난다 (app.market_data_stats).
+    """
     now = _utcnow_iso()
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.execute(
-            "INSERT OR REPLACE INTO market_refresh_log "
+            "INSERT INTO market_refresh_log "
             "(run_id, source, asof, attempted_count, success_count, fail_count, "
             "runtime_seconds, error_summary, created_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(run_id) DO UPDATE SET "
+            "source = excluded.source, asof = excluded.asof, "
+            "attempted_count = excluded.attempted_count, "
+            "success_count = excluded.success_count, "
+            "fail_count = excluded.fail_count, "
+            "runtime_seconds = excluded.runtime_seconds, "
+            "error_summary = excluded.error_summary, "
+            "created_at = excluded.created_at",
             (
                 run_id,
                 source,
@@ -325,6 +340,8 @@ def log_refresh(
                 now,
             ),
         )
+        # 2026-10 — 이 run 이 바꾼 테이블의 통계 행에 writer run_id 기록.
+        market_data_stats.record_run(con, run_id)
 
 
 def list_etf_tickers(db_path: Path = DEFAULT_DB_PATH) -> list[str]:
@@ -374,22 +391,70 @@ def get_etf_name_map(
         return {str(row[0]): (row[1] if row[1] else None) for row in cur.fetchall()}
 
 
+def date_range_sql(
+    start: Optional[str], end: Optional[str], column: str = "date"
+) -> tuple[str, list[str]]:
+    """선택 구간 (양끝 포함) WHERE 조각 — `AND ...` 형태와 parameter."""
+    sql, params = "", []
+    if start is not None:
+        sql += f" AND {column} >= ?"
+        params.append(start)
+    if end is not None:
+        sql += f" AND {column} <= ?"
+        params.append(end)
+    return sql, params
+
+
 def fetch_price_history(
     ticker: str,
     *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
     db_path: Path = DEFAULT_DB_PATH,
 ) -> list[tuple[str, float]]:
-    """(date, close) 시계열 (date ASC). close 가 null/0 이하인 행은 제외."""
+    """(date, close) 시계열 (date ASC). close 가 null/0 이하인 행은 제외.
+
+    2026-10: sync 된 종가 archive 가 있으면 memmap 에서 읽는다. archive 가 없거나
+    ticker 가 sync 이후 바뀌었으면 SQLite — 결과는 같다.
+    2026-10: start / end (YYYY-MM-DD, 양끝 포함) 로 구간만 읽는다.
+    """
     with _connection(db_path) as con:
+        if (Path(db_path).parent / PRICE_ARCHIVE_DIR_NAME / "index.json").exists():
+            # numpy import 는 archive 가 있을 때만 (API 기동 비용).
+            from app import price_archive
+
+            archived = price_archive.read_history(
+                con, Path(db_path), ticker, start=start, end=end
+            )
+            if archived is not None:
+                return archived
+        range_sql, range_params = date_range_sql(start, end)
         cur = con.execute(
             "SELECT date, close FROM etf_daily_price "
-            "WHERE ticker = ? AND close IS NOT NULL AND close > 0 "
-            "ORDER BY date ASC",
-            (ticker,),
+            "WHERE ticker = ? AND close IS NOT NULL AND close > 0"
+            f"{range_sql} ORDER BY date ASC",
+            (ticker, *range_params),
         )
         return [(r[0], float(r[1])) for r in cur.fetchall()]
 
 
+def fetch_close_matrix(
+    tickers: Optional[Iterable[str]] = None,
+    *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    db_path: Path = DEFAULT_DB_PATH,
+):
+    """전 종목 (또는 tickers) 종가 행렬 — app.price_archive.PriceMatrix.
+
+    분석 / 백테스트용 bulk 조회. fetch_price_history 를 ticker 마다 부르는 대신
+    archive 를 한 번에 읽는다 (없으면 SQLite 1 query).
+    """
+    from app import price_archive
+
+    return price_archive.load_close_matrix(db_path, tickers, start=start, end=end)
+
+
 def get_last_price_date(
     ticker: str,
     *,
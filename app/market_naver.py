@@ -20,6 +20,14 @@ from typing import Optional
 import httpx
 
 from app.market_cache import MarketQuote
+from app.source_circuit_breaker import (
+    CIRCUIT_OPEN_REASON,
+    SOURCE_NAVER_MOBILE,
+    TRANSPORT_ERRORS,
+    CircuitOpenError,
+    guarded_call,
+    is_server_error_status,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,12 +81,23 @@ def fetch_one(
 ) -> FetchResult:
     """단일 ticker 조회. 실패 시 quote=None + reason. 예외 raise 안 함."""
     url = NAVER_BASIC_URL.format(ticker=ticker)
-    try:
+
+    def _get() -> httpx.Response:
         if client is not None:
-            resp = client.get(url, timeout=timeout, headers=DEFAULT_HEADERS)
-        else:
-            with httpx.Client(timeout=timeout, headers=DEFAULT_HEADERS) as c:
-                resp = c.get(url)
+            return client.get(url, timeout=timeout, headers=DEFAULT_HEADERS)
+        with httpx.Client(timeout=timeout, headers=DEFAULT_HEADERS) as c:
+            return c.get(url)
+
+    try:
+        # 2026-10 — m.stock.naver.com circuit breaker. 5xx / 429 도 실패로 센다.
+        resp = guarded_call(
+            SOURCE_NAVER_MOBILE,
+            _get,
+            failure_if=lambda r: is_server_error_status(r.status_code),
+            transport_errors=(*TRANSPORT_ERRORS, httpx.TransportError),
+        )
+    except CircuitOpenError:
+        return FetchResult(ticker=ticker, quote=None, reason=CIRCUIT_OPEN_REASON)
     except httpx.TimeoutException:
         logger.warning(f"[market_naver] timeout ticker={ticker}")
         return FetchResult(ticker=ticker, quote=None, reason="timeout")
@@ -0,0 +1,44 @@
+"""market_data.sqlite 쓰기 작업 공통 후처리 (2026-10).
+
+배경: refresh job (`_execute_refresh_job`) / scripts/refresh_market_timeseries.py /
+scripts/ingest_krx_timeseries.py / scripts/refresh_nav_universe.py 가 쓰기 뒤
+후처리를 각자 나열했다. 그 사이 일부 writer 에서 단계가 빠져 snapshot 모드의 API
+가 새 데이터를 보지 못했다.
+
+`run_post_refresh` 가 순서를 1곳에서 정한다:
+1. 종가 columnar archive sync (바뀐 ticker 만 — 없으면 no-op).
+2. 대시보드 응답 미리 계산 (app.dashboard_snapshot).
+3. snapshot 모드면 API 읽기용 사본 발행 — 2 의 결과도 발행본에 들어간다.
+
+각 단계의 실패는 해당 함수가 로그로 흡수한다 — 쓰기 결과 자체는 이미 운영 DB 에 있다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.dashboard_snapshot import MaterializeSummary, materialize_quietly
+from app.market_data_snapshot import publish_if_enabled
+from app.market_data_store import DEFAULT_DB_PATH
+from app.market_timeseries_ingestion_service import sync_price_archive
+
+
+@dataclass(frozen=True)
+class PostRefreshResult:
+    archive_synced: bool
+    materialized: Optional[MaterializeSummary]
+    published: Optional[Path]
+
+
+def run_post_refresh(db_path: Path = DEFAULT_DB_PATH) -> PostRefreshResult:
+    """archive sync → 대시보드 계산 → (snapshot 모드면) 발행."""
+    archive_synced = sync_price_archive(db_path)
+    materialized = materialize_quietly(db_path)
+    published = publish_if_enabled(db_path)
+    return PostRefreshResult(
+        archive_synced=archive_synced,
+        materialized=materialized,
+        published=published,
+    )
@@ -42,6 +42,7 @@ from app.market_data_store import (
     list_etf_tickers,
     log_refresh,
 )
+from app.market_post_refresh import run_post_refresh
 from app.market_refresh_state_store import (
     MarketRefreshStateRow,
     clear_state,
@@ -386,6 +387,10 @@ def _execute_refresh_job(
         # 건드리지 않으므로 마지막 정상 성공 기록은 그대로 유지된다.
         _persist_current_state(db_path)
 
+    # 2026-10 — 종가 archive sync, 대시보드 응답 미리 계산, snapshot 모드면 API
+    # 읽기용 사본 발행 (실패는 로그만). 모든 writer 공통 (app.market_post_refresh).
+    run_post_refresh(db_path)
+
 
 @dataclass
 class StartResult:
@@ -19,6 +19,8 @@ SQLite (`etf_daily_price` / `market_benchmark_daily_price` / 상태 테이블) 
 
 from __future__ import annotations
 
+import logging
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Optional
@@ -45,6 +47,8 @@ from app.market_timeseries_ingestion_store import (
 
 BENCHMARK_KODEX200_TICKER = "069500"
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class IngestionInput:
@@ -481,3 +485,26 @@ def ingest_benchmark_timeseries(
         series_end_date=series_end,
         error_summary=err,
     )
+
+
+def sync_price_archive(db_path: Path = DEFAULT_DB_PATH) -> bool:
+    """수집 실행 끝 — 바뀐 ticker 를 종가 columnar archive 에 반영 (2026-10).
+
+    archive 는 읽기 가속용 파생본이다. sync 실패는 로그만 남기고, 읽기는
+    SQLite 로 계속된다 (다음 sync 때 dirty ticker 가 다시 반영된다).
+    """
+    from app import price_archive
+
+    try:
+        result = price_archive.sync(db_path)
+    except (OSError, sqlite3.Error, ValueError) as e:
+        logger.warning("price archive sync 실패 (%s): %s", db_path, e)
+        return False
+    if result.synced_tickers:
+        logger.info(
+            "price archive sync: %d tickers (full=%s, rows=%d)",
+            result.synced_tickers,
+            result.full_rebuild,
+            result.archived_rows,
+        )
+    return True
@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Callable, Optional
 
+from app import source_circuit_breaker as scb
+
 SOURCE_NAVER = "NAVER_FDR"
 SOURCE_YAHOO = "YAHOO_FDR"
 PRICE_BASIS = "SOURCE_CLOSE"
@@ -51,10 +53,21 @@ class AdapterResult:
     yahoo_attempted: bool = False
 
 
+def _source_for_symbol(symbol: str) -> str:
+    """명시 식별자 prefix → circuit breaker 소스 이름."""
+    if symbol.startswith(YAHOO_PREFIX):
+        return scb.SOURCE_YAHOO_FDR
+    return scb.SOURCE_NAVER_FDR
+
+
 def _default_price_fetcher(ticker: str, start: date, end: date):
     import FinanceDataReader as fdr  # lazy import
 
-    return fdr.DataReader(ticker, start, end)
+    # 2026-10 — 소스별 circuit breaker. Naver 가 open 이어도 Yahoo 보조 경로는
+    # 그대로 시도된다 (소스별 독립).
+    return scb.guarded_call(
+        _source_for_symbol(ticker), fdr.DataReader, ticker, start, end
+    )
 
 
 def _df_to_close_rows(df) -> list[tuple[str, Optional[float]]]:
@@ -115,6 +128,8 @@ def fetch_ticker_prices(
                 error=None,
                 yahoo_attempted=False,
             )
+    except scb.CircuitOpenError as e:
+        naver_error = str(e)[:200]
     except Exception as e:  # noqa: BLE001
         naver_error = f"{type(e).__name__}: {e}"[:200]
 
@@ -133,6 +148,8 @@ def fetch_ticker_prices(
             )
         # 빈 응답도 실패로 기록
         yahoo_error = "empty_response"
+    except scb.CircuitOpenError as e:
+        yahoo_error = str(e)[:200]
     except Exception as e:  # noqa: BLE001
         yahoo_error = f"{type(e).__name__}: {e}"[:200]
 
@@ -21,7 +21,7 @@ from __future__ import annotations
 import sqlite3
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from app.market_benchmark_store import fetch_benchmark_history
 from app.market_data_store import (
@@ -69,6 +69,9 @@ from app.market_topn_helpers import (  # noqa: F401
     classify_etf_tags,
 )
 
+if TYPE_CHECKING:
+    from app.evidence_context import EvidenceContext
+
 
 def compute_topn(
     *,
@@ -81,6 +84,7 @@ def compute_topn(
     exclude_leveraged: bool = True,
     exclude_synthetic: bool = True,
     exclude_futures: bool = True,
+    context: Optional[EvidenceContext] = None,
 ) -> dict:
     """SQLite etf_daily_price 기준 일간 / 1개월 / 3개월 TOP N 산출.
 
@@ -92,8 +96,13 @@ def compute_topn(
     4. 정렬 → 5. TOP N 자르기 → 6. rank 재부여.
     SQLite 에서 먼저 TOP N 자른 뒤 필터링하는 방식은 금지 (필터 후 결과가 N 미만이
     되는 케이스가 발생).
+
+    2026-10 — context (app.evidence_context) 를 주면 시계열 / 이름 매핑 로드를 같은
+    요청의 다른 builder 와 공유한다. context.db_path 가 db_path 와 다르면 무시.
     """
     t0 = time.perf_counter()
+    if context is not None and context.db_path != db_path:
+        context = None
     if basis not in ALLOWED_BASIS:
         basis = DEFAULT_BASIS  # 호출자(API) 가 Literal 로 1차 막지만 안전 fallback.
     if order not in ALLOWED_ORDER:
@@ -191,7 +200,11 @@ def compute_topn(
 
     # 2026-06-08 perf — universe 전체 ticker→name 매핑을 1 쿼리로 prefetch
     # (이전: ticker 마다 SQLite 1 호출 = 1000+ 회). row 없는 ticker 는 None.
-    name_cache: dict[str, Optional[str]] = get_etf_name_map(db_path=db_path)
+    name_cache: dict[str, Optional[str]] = (
+        dict(context.name_map())
+        if context is not None
+        else get_etf_name_map(db_path=db_path)
+    )
 
     def _name_of(tk: str) -> Optional[str]:
         # fallback: prefetch dict 에 없는 ticker (e.g. master 미등록) 는 단건 조회.
@@ -200,8 +213,13 @@ def compute_topn(
         name_cache[tk] = get_etf_name(tk, db_path=db_path)
         return name_cache[tk]
 
+    def _history_of(tk: str) -> list[tuple[str, float]]:
+        if context is not None:
+            return context.price_history(tk)
+        return fetch_price_history(tk, db_path=db_path)
+
     for tk in tickers:
-        history = fetch_price_history(tk, db_path=db_path)
+        history = _history_of(tk)
         if not history:
             price_fail += 1
             for label, _ in period_specs:
@@ -303,8 +321,12 @@ def compute_topn(
     # ── Market Regime & Benchmark Context (지시문 §6~§9, 2026-05-22) ────
     # KODEX200 history 는 etf_daily_price 에서, KOSPI 는 market_benchmark_daily_price
     # 에서. 둘 다 SQLite read-only — 외부 fetch 없음.
-    kodex200_history = fetch_price_history(KODEX200_TICKER, db_path=db_path)
-    kospi_history = fetch_benchmark_history(KOSPI_ID, db_path=db_path)
+    kodex200_history = _history_of(KODEX200_TICKER)
+    kospi_history = (
+        context.benchmark_history(KOSPI_ID)
+        if context is not None
+        else fetch_benchmark_history(KOSPI_ID, db_path=db_path)
+    )
     market_context = compute_market_context(
         asof=asof_iso,
         kodex200_history=kodex200_history,
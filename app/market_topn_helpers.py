@@ -24,6 +24,7 @@ from datetime import date, timedelta
 from pathlib import Path
 from typing import Optional
 
+from app.market_data_stats import read_stats
 from app.market_data_store import latest_refresh_log
 
 REQUIRED_TABLES = ("etf_master", "etf_daily_price", "market_refresh_log")
@@ -183,7 +184,15 @@ def _compute_period(
 
 
 def _latest_date_in_db(db_path: Path) -> Optional[str]:
+    """etf_daily_price 최신 날짜.
+
+    2026-10 — writer 가 유지하는 통계 행 (app.market_data_stats) 을 먼저 읽는다.
+    통계 테이블이 없는 DB (마이그레이션 전 / 외부 사본) 만 MAX(date) 조회.
+    """
     with sqlite3.connect(str(db_path)) as con:
+        stats = read_stats(con)
+        if stats is not None and "etf_daily_price" in stats:
+            return stats["etf_daily_price"].max_date or None
         cur = con.execute("SELECT MAX(date) FROM etf_daily_price")
         row = cur.fetchone()
         return row[0] if row and row[0] else None
@@ -0,0 +1,264 @@
+"""ML feature / 예측 streaming export — NDJSON · CSV (2026-10).
+
+배경: `etf_ml_feature_daily` · `market_risk_feature_daily` · walk-forward 예측을
+밖으로 꺼내려면 CSV artifact 를 직접 읽거나, 전체를 dict list 로 만든 뒤 내보내야
+했다. 다년치 feature 표를 받으면 process 메모리가 데이터 크기만큼 커졌다.
+
+`open_export()` 로 컬럼 / 행 조각 iterator 를 열고 `encode()` 가 조각마다 bytes 를
+내놓는다 — `GET /ml/export/{dataset}` (app.api_ml_export) 와
+scripts/export_ml_data.py 가 같은 함수를 쓴다.
+- SQLite 테이블: PK 순서 keyset 조회로 `chunk_size` 행씩 읽는다 (`WHERE key >
+  마지막 key ORDER BY key LIMIT n`). 조각마다 짧은 조회라 긴 read transaction 이
+  checkpoint 를 막지 않고, 응답이 조각마다 다른 thread 에서 이어져도 pooled
+  connection 을 그대로 쓴다. snapshot 모드면 시작 시점의 발행본 1개에서 읽는다 —
+  `pin_read_path` 로 고정하므로 도중에 새 발행이 있어도 파일이 지워지지 않는다.
+- walk-forward 예측: CSV artifact 를 줄 단위로 읽어 같은 크기 조각으로 넘긴다.
+  값은 CSV 문자열 그대로 (빈 칸은 null).
+- 메모리는 조각 1개 크기로 일정하다 — 전체 행 수와 무관.
+
+필터: asof 구간 (양끝 포함, 예측은 as_of_date) · ticker (ETF feature 만).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+from app.market_data_snapshot import SnapshotPin, pin_read_path
+from app.market_data_store import DEFAULT_DB_PATH, date_range_sql
+from app.sqlite_pool import pooled_connection
+
+DATASET_ETF_FEATURES = "etf_features"
+DATASET_MARKET_RISK_FEATURES = "market_risk_features"
+DATASET_WALK_FORWARD_PREDICTIONS = "walk_forward_predictions"
+
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+MEDIA_TYPES = {FORMAT_NDJSON: "application/x-ndjson", FORMAT_CSV: "text/csv"}
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_TICKERS = 500
+
+
+class ExportError(ValueError):
+    """잘못된 export 요청 (데이터셋과 맞지 않는 필터 등)."""
+
+
+@dataclass(frozen=True)
+class _TableSource:
+    table: str
+    key: tuple[str, ...]  # PRIMARY KEY 순서 — keyset 조회 기준
+    ticker_column: Optional[str]
+
+
+_TABLES = {
+    DATASET_ETF_FEATURES: _TableSource(
+        "etf_ml_feature_daily", ("asof", "ticker"), "ticker"
+    ),
+    DATASET_MARKET_RISK_FEATURES: _TableSource(
+        "market_risk_feature_daily", ("asof",), None
+    ),
+}
+DATASETS = (*_TABLES, DATASET_WALK_FORWARD_PREDICTIONS)
+
+
+@dataclass(frozen=True)
+class ExportSource:
+    columns: list[str]
+    chunks: Iterator[list[Sequence]]
+
+
+def _table_chunks(
+    source: _TableSource,
+    pin: SnapshotPin,
+    columns: list[str],
+    *,
+    start: Optional[str],
+    end: Optional[str],
+    tickers: Sequence[str],
+    chunk_size: int,
+) -> Iterator[list[Sequence]]:
+    key_idx = [columns.index(k) for k in source.key]
+    range_sql, range_params = date_range_sql(start, end, column="asof")
+    where = "1 = 1" + range_sql
+    params: list = list(range_params)
+    if tickers:
+        where += f" AND {source.ticker_column} IN ({', '.join('?' * len(tickers))})"
+        params.extend(tickers)
+    key_list = ", ".join(source.key)
+    select = f"SELECT {', '.join(columns)} FROM {source.table} WHERE {where}"
+    last: Optional[tuple] = None
+    try:
+        while True:
+            if last is None:
+                sql, args = select, params
+            else:
+                marks = ", ".join("?" * len(last))
+                sql, args = f"{select} AND ({key_list}) > ({marks})", [*params, *last]
+            with pooled_connection(pin.path) as con:
+                rows = con.execute(
+                    f"{sql} ORDER BY {key_list} LIMIT ?", [*args, chunk_size]
+                ).fetchall()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < chunk_size:
+                return
+            last = tuple(rows[-1][i] for i in key_idx)
+    finally:
+        pin.release()
+
+
+def _open_table(
+    dataset: str,
+    *,
+    start: Optional[str],
+    end: Optional[str],
+    tickers: Sequence[str],
+    db_path: Path,
+    chunk_size: int,
+) -> ExportSource:
+    source = _TABLES[dataset]
+    if tickers and source.ticker_column is None:
+        raise ExportError(f"{dataset} 는 ticker 필터를 지원하지 않습니다.")
+    # 조각 iterator 가 끝나거나 버려질 때까지 발행본을 고정 (pin.release / finalize).
+    pin = pin_read_path(db_path)
+    if not Path(pin.path).exists():
+        pin.release()
+        return ExportSource(columns=[], chunks=iter(()))
+    # 테이블이 아직 없으면 (feature 미적재 DB) 컬럼 0개 — 빈 export.
+    with pooled_connection(pin.path) as con:
+        columns = [r[1] for r in con.execute(f"PRAGMA table_info({source.table})")]
+    if not columns:
+        pin.release()
+        return ExportSource(columns=[], chunks=iter(()))
+    return ExportSource(
+        columns=columns,
+        chunks=_table_chunks(
+            source,
+            pin,
+            columns,
+            start=start,
+            end=end,
+            tickers=tickers,
+            chunk_size=chunk_size,
+        ),
+    )
+
+
+def _csv_chunks(
+    reader: Iterator[list[str]],
+    handle: io.TextIOBase,
+    date_idx: int,
+    *,
+    start: Optional[str],
+    end: Optional[str],
+    chunk_size: int,
+) -> Iterator[list[Sequence]]:
+    try:
+        chunk: list[Sequence] = []
+        for row in reader:
+            asof = row[date_idx] if date_idx < len(row) else ""
+            if (start and asof < start) or (end and asof > end):
+                continue
+            chunk.append([v if v != "" else None for v in row])
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        handle.close()
+
+
+def _open_predictions(
+    *,
+    start: Optional[str],
+    end: Optional[str],
+    tickers: Sequence[str],
+    chunk_size: int,
+) -> ExportSource:
+    from app import market_flow_walk_forward
+
+    if tickers:
+        raise ExportError("walk-forward 예측은 시장 단위라 ticker 필터가 없습니다.")
+    path = Path(market_flow_walk_forward.WALK_FORWARD_PREDICTIONS_CSV_PATH)
+    try:
+        handle = path.open("r", encoding="utf-8", newline="")
+    except FileNotFoundError:
+        return ExportSource(columns=[], chunks=iter(()))
+    reader = csv.reader(handle)
+    columns = next(reader, [])
+    if "as_of_date" not in columns:
+        handle.close()
+        return ExportSource(columns=columns, chunks=iter(()))
+    return ExportSource(
+        columns=columns,
+        chunks=_csv_chunks(
+            reader,
+            handle,
+            columns.index("as_of_date"),
+            start=start,
+            end=end,
+            chunk_size=chunk_size,
+        ),
+    )
+
+
+def open_export(
+    dataset: str,
+    *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    tickers: Iterable[str] = (),
+    db_path: Path = DEFAULT_DB_PATH,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ExportSource:
+    """컬럼 목록과 행 조각 iterator. 행은 아직 읽지 않는다 (iterator 소비 시점)."""
+    tickers = sorted({t.strip() for t in tickers if t and t.strip()})
+    if len(tickers) > MAX_TICKERS:
+        raise ExportError(f"ticker 는 최대 {MAX_TICKERS}개까지 지정할 수 있습니다.")
+    if start and end and start > end:
+        raise ExportError("start 가 end 보다 늦습니다.")
+    if dataset == DATASET_WALK_FORWARD_PREDICTIONS:
+        return _open_predictions(
+            start=start, end=end, tickers=tickers, chunk_size=chunk_size
+        )
+    if dataset not in _TABLES:
+        raise ExportError(f"알 수 없는 데이터셋: {dataset}")
+    return _open_table(
+        dataset,
+        start=start,
+        end=end,
+        tickers=tickers,
+        db_path=db_path,
+        chunk_size=chunk_size,
+    )
+
+
+def encode(source: ExportSource, fmt: str) -> Iterator[bytes]:
+    """조각 단위로 NDJSON (행마다 JSON 1줄) / CSV (첫 조각 앞에 header) 인코딩."""
+    if fmt == FORMAT_NDJSON:
+        for chunk in source.chunks:
+            yield "".join(
+                json.dumps(dict(zip(source.columns, row)), ensure_ascii=False) + "\n"
+                for row in chunk
+            ).encode("utf-8")
+        return
+    if fmt != FORMAT_CSV:
+        raise ExportError(f"알 수 없는 형식: {fmt}")
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(source.columns)
+    for chunk in source.chunks:
+        writer.writerows(chunk)
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():
+        # 행이 하나도 없으면 header 만.
+        yield buf.getvalue().encode("utf-8")
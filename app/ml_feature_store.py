@@ -11,7 +11,6 @@
 
 from __future__ import annotations
 
-import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -19,6 +18,8 @@ from pathlib import Path
 from typing import Iterable, Optional
 
 from app.market_data_store import DEFAULT_DB_PATH
+from app import sqlite_migrations
+from app.sqlite_pool import pooled_connection
 
 ETF_ML_FEATURE_DAILY_DDL = """
 CREATE TABLE IF NOT EXISTS etf_ml_feature_daily (
@@ -86,11 +87,9 @@ _INITIALIZED_ML_DBS: set[str] = set()
 
 
 def init_ml_feature_db(db_path: Path = DEFAULT_DB_PATH) -> None:
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(db_path)) as con:
-        con.execute(ETF_ML_FEATURE_DAILY_DDL)
-        con.execute(MARKET_RISK_FEATURE_DAILY_DDL)
-        con.commit()
+    from app.sqlite_schemas import ensure_market_data
+
+    ensure_market_data(db_path)
 
 
 def _ensure_ml_initialized(db_path: Path) -> None:
@@ -102,14 +101,10 @@ def _ensure_ml_initialized(db_path: Path) -> None:
 
 
 @contextmanager
-def _connection(db_path: Path):
+def _connection(db_path: Path, *, write: bool = False):
     _ensure_ml_initialized(db_path)
-    con = sqlite3.connect(str(db_path))
-    try:
+    with pooled_connection(db_path, write=write) as con:
         yield con
-        con.commit()
-    finally:
-        con.close()
 
 
 def _utcnow_iso() -> str:
@@ -206,7 +201,7 @@ def upsert_etf_features(
         source_flags=excluded.source_flags,
         created_at=excluded.created_at
     """
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.executemany(sql, items)
     return len(items)
 
@@ -325,7 +320,7 @@ def upsert_market_risk_features(
         breadth_deterioration_proxy=excluded.breadth_deterioration_proxy,
         created_at=excluded.created_at
     """
-    with _connection(db_path) as con:
+    with _connection(db_path, write=True) as con:
         con.executemany(sql, items)
     return len(items)
 
@@ -374,3 +369,4 @@ def fetch_readiness(db_path: Path = DEFAULT_DB_PATH) -> MlFeatureReadiness:
 def reset_initialized_cache_for_tests() -> None:
     """테스트 전용 — process-level init 캐시 초기화."""
     _INITIALIZED_ML_DBS.clear()
+    sqlite_migrations.reset_cache_for_tests("market_data")
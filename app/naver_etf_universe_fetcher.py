@@ -21,23 +21,38 @@ Endpoint:
   message="stale cache reused").
 - raw response 전문 저장 X — 필요 필드만 정규화한 dict 반환.
 - 응답 자체에 명시적 asof 키가 없으므로 asof 결정은 호출자(service)에서 수행한다.
-- 인증 / 새 라이브러리 추가 0건. urllib + socket timeout 만 사용.
+- 인증 / 새 라이브러리 추가 0건.
+- 2026-10 — 기본 경로는 `app.naver_http_cache` 디스크 캐시 + conditional request
+  (ETag / Last-Modified) 를 거친다. 프로세스 재시작 후에도 TTL 이내면 네트워크 0회,
+  이후엔 304 재검증. body sha256 이 직전 파싱 결과와 같으면 decode / json.loads /
+  item 빌드를 건너뛰고 같은 snapshot items 를 공유한다 (universe fetcher ↔
+  refresh_nav_universe 가 한 run 안에서 한 번만 파싱).
+- 2026-10 — 디스크 캐시 경로의 body 는 `app.naver_json_stream` 으로 스트리밍
+  디코드한다 (charset 1회 판정 → chunk 단위 incremental decode → etfItemList 원소를
+  하나씩 item 으로 빌드). full text / 전체 dict 리스트 사본을 만들지 않는다.
+  HTTP 경로는 이것 하나뿐이다 (캐시 · circuit breaker · 스트리밍 파서). 파싱 실패는
+  호출 실패와 같이 다뤄 stale snapshot 이 있으면 그것을 쓴다.
 
 본 모듈은 fetcher 만 책임지고 store / service / API 와 분리된다.
 """
 
 from __future__ import annotations
 
-import json
-import socket
-import urllib.error
-import urllib.request
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 # 2026-06-08 FIX (검증자 A-1 / B-6): 괴리율 계산은 기존 helper 재사용 — 산식 중복 X.
 from app.etf_nav_fetcher import compute_discount_rate_pct
+from app.naver_http_cache import CachedHttpResponse, cached_get
+from app.naver_json_stream import (
+    SNIFF_BYTES,
+    JsonStreamError,
+    detect_charset,
+    iter_array_items,
+    iter_byte_chunks,
+)
+from app.source_circuit_breaker import SOURCE_NAVER_FINANCE
 
 NAVER_UNIVERSE_URL = "https://finance.naver.com/api/sise/etfItemList.nhn"
 NAVER_HEADERS = {
@@ -49,7 +64,6 @@ NAVER_HEADERS = {
     "Accept": "application/json, text/plain, */*",
 }
 HTTP_TIMEOUT_SECONDS = 8
-SOCKET_TIMEOUT_SECONDS = 15
 
 TTL_SECONDS = 30
 
@@ -81,6 +95,11 @@ class NaverUniverseSnapshot:
     cache_hit: bool = False
     stale_cache_used: bool = False
     message: Optional[str] = None
+    # 2026-10 — 디스크 HTTP 캐시 경로 결과 (fresh | not_modified | downloaded |
+    # stale_on_error). http_getter 주입 경로는 None.
+    http_cache_status: Optional[str] = None
+    # body hash 가 직전 파싱과 같아 재파싱을 건너뛰었는지.
+    parse_skipped: bool = False
 
 
 # ─── 모듈-전역 캐시 ──────────────────────────────────────────────
@@ -91,6 +110,12 @@ _UNIVERSE_CACHE: dict[str, Any] = {
     "expires_at": None,  # datetime (UTC)
 }
 
+# 2026-10 — 마지막으로 파싱한 body 의 sha256 → items. 같은 body 면 재파싱 생략.
+_PARSED_BODY: dict[str, Any] = {
+    "body_sha256": None,
+    "items": None,  # dict[str, NaverUniverseItem]
+}
+
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
@@ -165,57 +190,18 @@ def _build_item(raw: dict) -> Optional[NaverUniverseItem]:
     )
 
 
-def _decode_body(body: bytes, content_type: Optional[str]) -> str:
-    """Naver universe endpoint 는 EUC-KR / cp949 응답을 줄 수 있다.
-
-    Content-Type 의 charset 우선, 없거나 실패하면 utf-8 → cp949 순으로 시도.
-    """
-    charset = None
-    if content_type:
-        for part in content_type.split(";"):
-            part = part.strip().lower()
-            if part.startswith("charset="):
-                charset = part.split("=", 1)[1].strip().strip('"')
-                break
-    if charset:
-        try:
-            return body.decode(charset, errors="strict")
-        except (LookupError, UnicodeDecodeError):
-            pass
-    for enc in ("utf-8", "cp949", "euc-kr"):
-        try:
-            return body.decode(enc, errors="strict")
-        except UnicodeDecodeError:
-            continue
-    return body.decode("utf-8", errors="replace")
-
-
-def _http_get_json(url: str) -> tuple[Optional[int], Optional[dict], Optional[str]]:
-    """단순 GET → (http_status, parsed_json, error_text)."""
-    req = urllib.request.Request(url, headers=NAVER_HEADERS)
-    # socket-level timeout 도 명시 (urllib 내부 socket 에 적용).
-    prev_timeout = socket.getdefaulttimeout()
-    try:
-        socket.setdefaulttimeout(SOCKET_TIMEOUT_SECONDS)
-        with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as resp:
-            body = resp.read()
-            content_type = resp.headers.get("Content-Type")
-            text = _decode_body(body, content_type)
-            try:
-                payload = json.loads(text)
-            except Exception as e:  # noqa: BLE001
-                return (resp.status, None, f"json_decode_failed: {e}")
-            if not isinstance(payload, dict):
-                return (resp.status, None, "payload_not_dict")
-            return (resp.status, payload, None)
-    except urllib.error.HTTPError as e:
-        return (e.code, None, f"HTTPError {e.code}: {e}")
-    except urllib.error.URLError as e:
-        return (None, None, f"URLError: {e}")
-    except Exception as e:  # noqa: BLE001
-        return (None, None, f"{type(e).__name__}: {e}")
-    finally:
-        socket.setdefaulttimeout(prev_timeout)
+def _snapshot_from_items(
+    items: dict[str, NaverUniverseItem], fetched_at: datetime
+) -> NaverUniverseSnapshot:
+    if not items:
+        return NaverUniverseSnapshot(
+            status="unavailable",
+            fetched_at=_utc_iso(fetched_at),
+            message="empty etfItemList",
+        )
+    return NaverUniverseSnapshot(
+        status="ok", fetched_at=_utc_iso(fetched_at), items=items
+    )
 
 
 def _build_snapshot_from_payload(
@@ -235,15 +221,24 @@ def _build_snapshot_from_payload(
         built = _build_item(raw)
         if built is not None:
             items[built.ticker] = built
-    if not items:
-        return NaverUniverseSnapshot(
-            status="unavailable",
-            fetched_at=_utc_iso(fetched_at),
-            message="empty etfItemList",
-        )
-    return NaverUniverseSnapshot(
-        status="ok", fetched_at=_utc_iso(fetched_at), items=items
-    )
+    return _snapshot_from_items(items, fetched_at)
+
+
+def _build_items_streaming(
+    body: bytes, content_type: Optional[str]
+) -> dict[str, NaverUniverseItem]:
+    """body → ticker → item 맵 (스트리밍). 구조 / 디코드 오류는 JsonStreamError."""
+    charset = detect_charset(body[:SNIFF_BYTES], content_type)
+    items: dict[str, NaverUniverseItem] = {}
+    for raw in iter_array_items(
+        iter_byte_chunks(body), key="etfItemList", charset=charset
+    ):
+        if not isinstance(raw, dict):
+            continue
+        built = _build_item(raw)
+        if built is not None:
+            items[built.ticker] = built
+    return items
 
 
 def _clone_as_stale(
@@ -259,6 +254,46 @@ def _clone_as_stale(
     )
 
 
+def _snapshot_from_cached_response(
+    resp: CachedHttpResponse, fetched_at: datetime
+) -> tuple[Optional[NaverUniverseSnapshot], Optional[str]]:
+    """디스크 캐시 응답 → snapshot. body hash 가 직전과 같으면 재파싱 생략.
+
+    반환: (snapshot, error). body 자체가 없으면 (None, error).
+    """
+    if resp.body is None:
+        return None, f"call_failed: {resp.error or 'unknown'} (http={resp.status})"
+
+    if (
+        resp.body_sha256 is not None
+        and resp.body_sha256 == _PARSED_BODY.get("body_sha256")
+        and _PARSED_BODY.get("items")
+    ):
+        snapshot = NaverUniverseSnapshot(
+            status="ok",
+            fetched_at=_utc_iso(fetched_at),
+            items=dict(_PARSED_BODY["items"]),
+            parse_skipped=True,
+        )
+    else:
+        try:
+            snapshot = _snapshot_from_items(
+                _build_items_streaming(resp.body, resp.content_type), fetched_at
+            )
+        except JsonStreamError as e:
+            return None, f"call_failed: json_stream_failed: {e} (http={resp.status})"
+        if snapshot.status == "ok":
+            _PARSED_BODY["body_sha256"] = resp.body_sha256
+            _PARSED_BODY["items"] = dict(snapshot.items)
+
+    snapshot.http_cache_status = resp.cache_status
+    if resp.cache_status == "stale_on_error" and snapshot.status == "ok":
+        snapshot.status = "partial"
+        snapshot.stale_cache_used = True
+        snapshot.message = "stale cache reused"
+    return snapshot, None
+
+
 def fetch_universe_snapshot(
     *,
     force: bool = False,
@@ -267,8 +302,9 @@ def fetch_universe_snapshot(
     """Naver ETF universe 1회 호출 (TTL 30s + stale 재사용).
 
     Args:
-        force: True 이면 TTL 무시하고 외부 호출.
+        force: True 이면 TTL 무시하고 외부 호출 (디스크 캐시도 재검증).
         http_getter: 테스트용 주입. (url) -> (status, payload_dict, err).
+            주입 시 디스크 HTTP 캐시를 거치지 않는다.
 
     Returns:
         NaverUniverseSnapshot — status ∈ {ok, partial, unavailable}.
@@ -290,28 +326,45 @@ def fetch_universe_snapshot(
             cache_hit=True,
             stale_cache_used=cached.stale_cache_used,
             message=cached.message,
+            http_cache_status=cached.http_cache_status,
+            parse_skipped=cached.parse_skipped,
+        )
+
+    if http_getter is not None:
+        status_code, payload, err = http_getter(NAVER_UNIVERSE_URL)
+        snapshot = (
+            _build_snapshot_from_payload(payload, now) if payload is not None else None
+        )
+        failure = f"call_failed: {err or 'unknown'} (http={status_code})"
+    else:
+        resp = cached_get(
+            NAVER_UNIVERSE_URL,
+            headers=NAVER_HEADERS,
+            max_age_seconds=0 if force else TTL_SECONDS,
+            timeout=HTTP_TIMEOUT_SECONDS,
+            now=now,
+            source=SOURCE_NAVER_FINANCE,
         )
+        snapshot, failure = _snapshot_from_cached_response(resp, now)
 
-    getter = http_getter or _http_get_json
-    status_code, payload, err = getter(NAVER_UNIVERSE_URL)
-    if payload is None:
+    if snapshot is None:
         if isinstance(cached, NaverUniverseSnapshot) and cached.items:
             return _clone_as_stale(cached, now)
         return NaverUniverseSnapshot(
             status="unavailable",
             fetched_at=_utc_iso(now),
-            message=f"call_failed: {err or 'unknown'} (http={status_code})",
+            message=failure,
         )
 
-    snapshot = _build_snapshot_from_payload(payload, now)
-    if snapshot.status != "ok":
+    if snapshot.status == "unavailable":
         # 응답은 받았지만 비정상 — stale 있으면 stale 우선.
         if isinstance(cached, NaverUniverseSnapshot) and cached.items:
             return _clone_as_stale(cached, now)
         return snapshot
 
-    _UNIVERSE_CACHE["data"] = snapshot
-    _UNIVERSE_CACHE["expires_at"] = now + timedelta(seconds=TTL_SECONDS)
+    if snapshot.status == "ok":
+        _UNIVERSE_CACHE["data"] = snapshot
+        _UNIVERSE_CACHE["expires_at"] = now + timedelta(seconds=TTL_SECONDS)
     return snapshot
 
 
@@ -319,3 +372,5 @@ def reset_cache_for_tests() -> None:
     """테스트 전용 — 모듈 캐시 초기화."""
     _UNIVERSE_CACHE["data"] = None
     _UNIVERSE_CACHE["expires_at"] = None
+    _PARSED_BODY["body_sha256"] = None
+    _PARSED_BODY["items"] = None
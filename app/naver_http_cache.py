@@ -0,0 +1,250 @@
+"""Naver endpoint 용 디스크 HTTP 응답 캐시 + conditional request (2026-10).
+
+배경: `naver_etf_universe_fetcher` 의 TTL 캐시는 프로세스 메모리에만 있어 재시작
+때마다 `etfItemList.nhn` 전체 payload 를 다시 내려받았다.
+
+본 모듈 정책:
+- URL 1개당 meta JSON (`<key>.json`) + body (`<key>.body`) 2 파일. key = sha1(url).
+  meta: url / etag / last_modified / fetched_at / body_sha256 / content_type / status.
+- max_age_seconds 이내 entry 는 네트워크 없이 그대로 반환 (cache_status=fresh).
+- 그 외에는 If-None-Match / If-Modified-Since 를 실어 요청. 304 면 디스크 body 를
+  재사용 (not_modified), 200 이면 body 교체 (downloaded).
+- 요청 실패 시 디스크 entry 가 있으면 body 를 함께 돌려준다 (stale_on_error) —
+  stale 판정 / 표시는 호출자 책임.
+- body_sha256 을 함께 반환 — 호출자는 이전과 같은 hash 면 재파싱을 건너뛴다.
+- 파일 쓰기는 .tmp → replace (atomic). 캐시 I/O 실패는 요청 자체를 실패시키지 않는다.
+- 네트워크 요청은 호출자가 지정한 endpoint family 의 circuit breaker 를 거친다
+  (2026-10, 기본 finance.naver.com). open 이면 요청 없이 디스크 entry 를
+  stale_on_error 로 돌려준다 (error 에 circuit_open 표시). transport 오류와 5xx /
+  429 만 실패로 센다.
+
+본 모듈은 HTTP + 디스크 캐시만 책임진다. JSON 디코드 / 정규화는 fetcher 모듈.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from app.source_circuit_breaker import (
+    SOURCE_NAVER_FINANCE,
+    CircuitOpenError,
+    get_breaker,
+    is_server_error_status,
+    is_source_failure,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path("state/market/http_cache")
+
+
+@dataclass
+class CachedHttpResponse:
+    """cached_get 결과.
+
+    cache_status: fresh | not_modified | downloaded | stale_on_error | error
+    body 는 error 일 때만 None.
+    """
+
+    cache_status: str
+    status: Optional[int]
+    body: Optional[bytes]
+    content_type: Optional[str]
+    body_sha256: Optional[str]
+    fetched_at: Optional[str]
+    error: Optional[str] = None
+
+
+def _now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _utc_iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_iso(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        ts = datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+    except ValueError:
+        return None
+    return ts.replace(tzinfo=timezone.utc)
+
+
+def _cache_key(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def _paths(url: str) -> tuple[Path, Path]:
+    key = _cache_key(url)
+    return CACHE_DIR / f"{key}.json", CACHE_DIR / f"{key}.body"
+
+
+def _read_entry(url: str) -> Optional[tuple[dict, bytes]]:
+    """디스크 entry (meta, body). 손상 / hash 불일치 / url 불일치 시 None."""
+    meta_path, body_path = _paths(url)
+    if not meta_path.exists() or not body_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body = body_path.read_bytes()
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("naver http cache 손상 — 무시하고 재조회: %s", e)
+        return None
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return None
+    if meta.get("body_sha256") != hashlib.sha256(body).hexdigest():
+        return None
+    return meta, body
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _write_entry(url: str, meta: dict, body: Optional[bytes]) -> None:
+    """meta (+ body 가 주어지면 body) 저장. body 를 먼저 써서 meta 가 가리키게 한다."""
+    meta_path, body_path = _paths(url)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if body is not None:
+            _atomic_write(body_path, body)
+        _atomic_write(
+            meta_path,
+            json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8"),
+        )
+    except OSError as e:
+        logger.warning("naver http cache 저장 실패: %s", e)
+
+
+def _from_entry(
+    cache_status: str, meta: dict, body: bytes, error: Optional[str] = None
+) -> CachedHttpResponse:
+    return CachedHttpResponse(
+        cache_status=cache_status,
+        status=meta.get("status"),
+        body=body,
+        content_type=meta.get("content_type"),
+        body_sha256=meta.get("body_sha256"),
+        fetched_at=meta.get("fetched_at"),
+        error=error,
+    )
+
+
+def cached_get(
+    url: str,
+    *,
+    headers: dict[str, str],
+    max_age_seconds: float,
+    timeout: float,
+    urlopen: Optional[Callable[..., Any]] = None,
+    now: Optional[datetime] = None,
+    source: str = SOURCE_NAVER_FINANCE,
+) -> CachedHttpResponse:
+    """디스크 캐시 + conditional GET.
+
+    Args:
+        url / headers: 요청 대상. headers 는 원본 dict 를 수정하지 않는다.
+        max_age_seconds: 이 나이 이내 entry 는 요청 없이 반환. 0 이면 항상 재검증.
+        timeout: urlopen timeout.
+        urlopen: 테스트 주입용 (기본 urllib.request.urlopen).
+        now: 테스트 주입용 현재 시각 (UTC).
+        source: circuit breaker key (app.source_circuit_breaker endpoint family).
+    """
+    opener = urlopen or urllib.request.urlopen
+    now = now or _now_utc()
+    entry = _read_entry(url)
+
+    if entry is not None and max_age_seconds > 0:
+        meta, body = entry
+        fetched_at = _parse_iso(meta.get("fetched_at"))
+        if fetched_at is not None and (now - fetched_at).total_seconds() < float(
+            max_age_seconds
+        ):
+            return _from_entry("fresh", meta, body)
+
+    req_headers = dict(headers)
+    if entry is not None:
+        meta, _ = entry
+        if meta.get("etag"):
+            req_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            req_headers["If-Modified-Since"] = meta["last_modified"]
+
+    breaker = get_breaker(source)
+    try:
+        breaker.before_call()
+    except CircuitOpenError as e:
+        return _error_result(entry, None, str(e))
+
+    req = urllib.request.Request(url, headers=req_headers)
+    try:
+        with opener(req, timeout=timeout) as resp:
+            body = resp.read()
+            status = getattr(resp, "status", None)
+            resp_headers = resp.headers
+    except urllib.error.HTTPError as e:
+        # 4xx / 304 는 서버가 응답한 것 — breaker 실패로 세지 않는다.
+        if is_server_error_status(e.code):
+            breaker.record_failure(f"HTTPError {e.code}")
+        else:
+            breaker.record_success()
+        if e.code == 304 and entry is not None:
+            meta, body = entry
+            meta = dict(meta)
+            meta["fetched_at"] = _utc_iso(now)
+            _write_entry(url, meta, None)
+            return _from_entry("not_modified", meta, body)
+        return _error_result(entry, e.code, f"HTTPError {e.code}: {e}")
+    except urllib.error.URLError as e:
+        breaker.record_failure(f"URLError: {e}")
+        return _error_result(entry, None, f"URLError: {e}")
+    except Exception as e:  # noqa: BLE001
+        if is_source_failure(e):
+            breaker.record_failure(f"{type(e).__name__}: {e}")
+        else:
+            breaker.record_success()
+        return _error_result(entry, None, f"{type(e).__name__}: {e}")
+    breaker.record_success()
+
+    meta = {
+        "url": url,
+        "status": status,
+        "etag": resp_headers.get("ETag"),
+        "last_modified": resp_headers.get("Last-Modified"),
+        "content_type": resp_headers.get("Content-Type"),
+        "fetched_at": _utc_iso(now),
+        "body_sha256": hashlib.sha256(body).hexdigest(),
+    }
+    unchanged = entry is not None and entry[0].get("body_sha256") == meta["body_sha256"]
+    _write_entry(url, meta, None if unchanged else body)
+    return _from_entry("downloaded", meta, body)
+
+
+def _error_result(
+    entry: Optional[tuple[dict, bytes]], status: Optional[int], error: str
+) -> CachedHttpResponse:
+    if entry is not None:
+        meta, body = entry
+        return _from_entry("stale_on_error", meta, body, error=error)
+    return CachedHttpResponse(
+        cache_status="error",
+        status=status,
+        body=None,
+        content_type=None,
+        body_sha256=None,
+        fetched_at=None,
+        error=error,
+    )
@@ -0,0 +1,180 @@
+"""Naver JSON 응답 스트리밍 디코드 (2026-10).
+
+배경: `naver_etf_universe_fetcher` 는 응답 body 전체를 읽은 뒤 utf-8 / cp949 /
+euc-kr 디코드를 전체 버퍼로 차례 시도하고, 그 결과 문자열을 `json.loads` 해
+전체 dict 리스트를 만든 다음 item 을 빌드했다. universe 가 커질수록 body bytes +
+full text + 파싱된 전체 리스트가 동시에 메모리에 올라간다 (OCI 소형 인스턴스).
+
+본 모듈:
+- detect_charset: Content-Type charset → BOM sniff → 앞부분 utf-8 검증 순으로
+  charset 을 1회만 결정한다 (앞부분으로 판정 불가하면 cp949).
+- iter_array_items: bytes chunk 를 incremental decoder 로 조금씩 디코드하면서
+  지정 key 의 JSON 배열 원소를 하나씩 `raw_decode` 로 꺼낸다. 소비한 텍스트는
+  chunk 를 채울 때마다 버린다 — 메모리에는 chunk 1~2개 분량 텍스트만 남는다.
+- 디코드 / 구조 오류는 JsonStreamError. 호출자는 기존 전체 디코드 경로로 1회
+  fallback 한다 (charset 오표기 등 예외 응답 보호).
+
+외부 라이브러리 추가 0건 (codecs / json 표준 모듈만 사용).
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+CHUNK_BYTES = 64 * 1024
+SNIFF_BYTES = 64 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_WS = re.compile(r"[ \t\r\n]*")
+
+
+class JsonStreamError(ValueError):
+    """스트리밍 디코드 / 구조 오류 — 호출자가 전체 디코드 경로로 fallback."""
+
+
+def _header_charset(content_type: Optional[str]) -> Optional[str]:
+    if not content_type:
+        return None
+    for part in content_type.split(";"):
+        part = part.strip().lower()
+        if part.startswith("charset="):
+            name = part.split("=", 1)[1].strip().strip('"')
+            try:
+                return codecs.lookup(name).name
+            except LookupError:
+                return None
+    return None
+
+
+def _decodes_cleanly(head: bytes, charset: str) -> bool:
+    """head 를 charset 으로 디코드 가능한지 — 끝의 잘린 multibyte 는 허용."""
+    try:
+        codecs.getincrementaldecoder(charset)(errors="strict").decode(head)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_charset(head: bytes, content_type: Optional[str]) -> str:
+    """앞부분 bytes + Content-Type 으로 charset 1회 결정."""
+    for bom, name in _BOMS:
+        if head.startswith(bom):
+            return name
+    declared = _header_charset(content_type)
+    sample = head[:SNIFF_BYTES]
+    if declared and _decodes_cleanly(sample, declared):
+        return declared
+    if _decodes_cleanly(sample, "utf-8"):
+        return "utf-8"
+    return "cp949"
+
+
+def iter_byte_chunks(body: bytes, size: int = CHUNK_BYTES) -> Iterator[memoryview]:
+    """메모리의 bytes 를 복사 없이 chunk 단위 memoryview 로 자른다."""
+    view = memoryview(body)
+    for start in range(0, len(view), size):
+        yield view[start : start + size]  # noqa: E203
+
+
+class _TextStream:
+    """incremental decoder 위의 텍스트 버퍼. fill() 때 소비분을 버린다."""
+
+    def __init__(self, chunks: Iterable[bytes], charset: str) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(charset)(errors="strict")
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """chunk 1개를 더 디코드해 붙인다. 더 없으면 False."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        try:
+            if chunk is None:
+                text = self._decoder.decode(b"", final=True)
+                self.eof = True
+            else:
+                text = self._decoder.decode(chunk)
+        except UnicodeDecodeError as e:
+            raise JsonStreamError(f"decode_failed: {e}") from e
+        self.buf = self.buf[self.pos :] + text  # noqa: E203
+        self.pos = 0
+        return chunk is not None or bool(text)
+
+    def skip_ws(self) -> None:
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                return
+
+    def expect(self, ch: str) -> None:
+        self.skip_ws()
+        if self.pos >= len(self.buf) or self.buf[self.pos] != ch:
+            raise JsonStreamError(f"expected {ch!r} at stream offset")
+        self.pos += 1
+
+
+def iter_array_items(
+    chunks: Iterable[bytes],
+    *,
+    key: str,
+    charset: str,
+) -> Iterator[Any]:
+    """JSON 문서 안 `"<key>": [ ... ]` 배열의 원소를 하나씩 yield.
+
+    key 는 문서 전체에서 처음 등장하는 `"<key>"` 문자열로 찾는다 (Naver universe
+    응답은 result.etfItemList 하나뿐). 배열 뒤의 나머지 문서는 읽지 않는다.
+    """
+    stream = _TextStream(chunks, charset)
+    json_decoder = json.JSONDecoder()
+    needle = json.dumps(key)
+
+    # 1) key 탐색 — 못 찾으면 needle 길이만큼 꼬리를 남기고 계속 채운다.
+    while True:
+        idx = stream.buf.find(needle, stream.pos)
+        if idx >= 0:
+            stream.pos = idx + len(needle)
+            break
+        stream.pos = max(stream.pos, len(stream.buf) - len(needle))
+        if not stream.fill():
+            raise JsonStreamError(f"key {key!r} not found")
+    stream.expect(":")
+    stream.expect("[")
+
+    # 2) 배열 원소 — 미완성 원소면 chunk 를 더 채워 재시도.
+    first = True
+    while True:
+        stream.skip_ws()
+        if stream.pos >= len(stream.buf):
+            raise JsonStreamError("unterminated array")
+        ch = stream.buf[stream.pos]
+        if ch == "]":
+            return
+        if not first:
+            if ch != ",":
+                raise JsonStreamError("expected ',' between array items")
+            stream.pos += 1
+            stream.skip_ws()
+        while True:
+            try:
+                value, end = json_decoder.raw_decode(stream.buf, stream.pos)
+            except json.JSONDecodeError as e:
+                if not stream.fill():
+                    raise JsonStreamError(f"json_decode_failed: {e}") from e
+                continue
+            # 버퍼 끝에서 끝난 숫자 / 리터럴은 잘렸을 수 있다 — 더 채워 재확인.
+            if end >= len(stream.buf) and stream.fill():
+                continue
+            break
+        stream.pos = end
+        first = False
+        yield value
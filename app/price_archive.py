@@ -0,0 +1,425 @@
+"""etf_daily_price 종가 columnar archive — numpy memmap (2026-10).
+
+배경: etf_daily_price 는 OHLCV 1행 = SQLite row 1개 (TEXT 날짜 / source /
+fetched_at 문자열 + PK·보조 인덱스). `initial --all` 로 3년+ 전 universe 를
+적재하면 파일이 계속 커지고, 분석 consumer 는 매번 row 단위로 다시 읽는다.
+
+archive 구조 (DB 파일 옆 `price_archive/`):
+- `day.<gen>.npy` int32 — 1970-01-01 기준 일수. ticker 오름차순 → 날짜 오름차순.
+- `close.<gen>.npy` float64 — 같은 위치의 종가 (close > 0 인 행만 —
+  fetch_price_history 와 같은 기준).
+- `index.json` — generation + ticker → [offset, length]. 원자 교체로 전환.
+파일은 `np.load(mmap_mode="r")` 로 열어 ticker 구간만 slice 한다.
+
+SQLite 와의 동기화 (스키마 step `price_archive_tracking`):
+- etf_daily_price INSERT / UPDATE / DELETE trigger 가 ticker 를
+  `price_archive_dirty` 에 기록한다. 어떤 writer 든 별도 호출 없이 추적된다.
+- `sync` 는 DB write lock (BEGIN IMMEDIATE) 안에서 dirty ticker 만 다시 읽어
+  새 generation 을 쓰고, dirty 를 비우고 `price_archive_meta.generation` 을 갱신한다.
+  ingestion service / refresh 작업이 끝날 때 1번 호출한다.
+- 읽기는 DB 의 generation 이 index 와 같고 ticker 가 dirty 가 아닐 때만 archive
+  를 쓴다. 그 외 (archive 없음 / sync 전 쓰기 / DB 교체) 는 None → 호출자가
+  SQLite 로 읽는다. 결과는 항상 SQLite 와 같다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from app.market_data_store import PRICE_ARCHIVE_DIR_NAME
+from app.sqlite_pool import pooled_connection
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "index.json"
+FORMAT_VERSION = 1
+
+PRICE_ARCHIVE_DIRTY_DDL = """
+CREATE TABLE IF NOT EXISTS price_archive_dirty (
+    ticker TEXT PRIMARY KEY
+) WITHOUT ROWID
+""".strip()
+
+PRICE_ARCHIVE_META_DDL = """
+CREATE TABLE IF NOT EXISTS price_archive_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+)
+""".strip()
+
+# INSERT OR IGNORE 는 바깥 upsert 의 충돌 정책에 덮이므로 NOT EXISTS 로 중복 회피.
+_MARK = (
+    "INSERT INTO price_archive_dirty (ticker) SELECT {row}.ticker WHERE NOT EXISTS "
+    "(SELECT 1 FROM price_archive_dirty WHERE ticker = {row}.ticker);"
+)
+PRICE_ARCHIVE_TRIGGERS_DDL = (
+    "CREATE TRIGGER IF NOT EXISTS trg_etf_daily_price_archive_ins "
+    "AFTER INSERT ON etf_daily_price BEGIN " + _MARK.format(row="NEW") + " END",
+    "CREATE TRIGGER IF NOT EXISTS trg_etf_daily_price_archive_upd "
+    "AFTER UPDATE OF ticker, date, close ON etf_daily_price BEGIN "
+    + _MARK.format(row="NEW")
+    + " "
+    + _MARK.format(row="OLD")
+    + " END",
+    "CREATE TRIGGER IF NOT EXISTS trg_etf_daily_price_archive_del "
+    "AFTER DELETE ON etf_daily_price BEGIN " + _MARK.format(row="OLD") + " END",
+)
+
+_VALID_CLOSE = "close IS NOT NULL AND close > 0"
+_MAX_IN_PARAMS = 900
+
+
+@dataclass(frozen=True)
+class _Archive:
+    stamp: tuple[int, int]
+    generation: str
+    offsets: dict[str, tuple[int, int]]
+    day: np.ndarray
+    close: np.ndarray
+    # 고유 거래일 (오름차순) 과 그 ISO 문자열 — ticker 마다 날짜 변환을 반복하지 않게.
+    calendar: np.ndarray
+    labels: np.ndarray
+
+    def dates(self, days: np.ndarray) -> list[str]:
+        return self.labels[np.searchsorted(self.calendar, days)].tolist()
+
+    def segment(self, ticker: str) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """ticker 의 (days, close) memmap view. archive 에 없으면 None."""
+        bounds = self.offsets.get(ticker)
+        if bounds is None:
+            return None
+        span = slice(bounds[0], bounds[0] + bounds[1])
+        return self.day[span], self.close[span]
+
+
+@dataclass
+class SyncResult:
+    generation: Optional[str]
+    full_rebuild: bool
+    synced_tickers: int
+    archived_tickers: int
+    archived_rows: int
+
+
+@dataclass
+class PriceMatrix:
+    """전 종목 종가 행렬. close[i, j] = dates[i] 의 tickers[j] 종가 (없으면 NaN)."""
+
+    tickers: list[str]
+    dates: np.ndarray  # datetime64[D], 오름차순
+    close: np.ndarray  # float64, shape (len(dates), len(tickers))
+
+    def date_strings(self) -> list[str]:
+        return np.datetime_as_string(self.dates, unit="D").tolist()
+
+
+_LOCK = threading.Lock()
+_SYNC_LOCK = threading.Lock()
+_CACHE: dict[str, _Archive] = {}
+
+
+def install_dirty_tracking(con: sqlite3.Connection) -> None:
+    """스키마 step — dirty / meta 테이블 + trigger. 기존 ticker 는 모두 dirty."""
+    con.execute(PRICE_ARCHIVE_DIRTY_DDL)
+    con.execute(PRICE_ARCHIVE_META_DDL)
+    for ddl in PRICE_ARCHIVE_TRIGGERS_DDL:
+        con.execute(ddl)
+    con.execute(
+        "INSERT OR IGNORE INTO price_archive_dirty (ticker) "
+        "SELECT DISTINCT ticker FROM etf_daily_price"
+    )
+
+
+def archive_dir(db_path: Path) -> Path:
+    return Path(db_path).parent / PRICE_ARCHIVE_DIR_NAME
+
+
+def _to_days(dates: Iterable[str]) -> np.ndarray:
+    return np.array(list(dates), dtype="datetime64[D]").astype(np.int32)
+
+
+def _day_strings(days: np.ndarray) -> list[str]:
+    return np.datetime_as_string(days.astype("datetime64[D]"), unit="D").tolist()
+
+
+def _load(db_path: Path) -> Optional[_Archive]:
+    """index.json 이 바뀌었을 때만 다시 연다 (요청마다 stat 1회)."""
+    directory = archive_dir(db_path)
+    index_path = directory / INDEX_NAME
+    try:
+        st = os.stat(index_path)
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(index_path.resolve())
+    cached = _CACHE.get(key)
+    if cached is not None and cached.stamp == stamp:
+        return cached
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        if index.get("format") != FORMAT_VERSION:
+            return None
+        generation = str(index["generation"])
+        day = np.load(directory / f"day.{generation}.npy", mmap_mode="r")
+        close = np.load(directory / f"close.{generation}.npy", mmap_mode="r")
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("price archive 로드 실패 (%s): %s", directory, e)
+        return None
+    calendar = np.unique(day)
+    loaded = _Archive(
+        stamp=stamp,
+        generation=generation,
+        offsets={t: (int(o), int(n)) for t, (o, n) in index["tickers"].items()},
+        day=day,
+        close=close,
+        calendar=calendar,
+        labels=np.array(_day_strings(calendar), dtype=object),
+    )
+    with _LOCK:
+        _CACHE[key] = loaded
+    return loaded
+
+
+def _db_generation(con: sqlite3.Connection) -> Optional[str]:
+    try:
+        row = con.execute(
+            "SELECT value FROM price_archive_meta WHERE key = 'generation'"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None  # tracking step 이전 DB (snapshot 등)
+    return row[0] if row else None
+
+
+def read_history(
+    con: sqlite3.Connection,
+    db_path: Path,
+    ticker: str,
+    *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Optional[list[tuple[str, float]]]:
+    """archive 의 (date, close) 목록 (start / end 포함 구간). 못 쓰면 None."""
+    archive = _load(db_path)
+    if archive is None or _db_generation(con) != archive.generation:
+        return None
+    dirty = con.execute(
+        "SELECT 1 FROM price_archive_dirty WHERE ticker = ?", (ticker,)
+    ).fetchone()
+    if dirty is not None:
+        return None
+    segment = archive.segment(ticker)
+    if segment is None:
+        return []
+    days, closes = segment
+    if start is not None or end is not None:
+        # segment 는 날짜 오름차순 — 구간 양끝만 이분 탐색.
+        lo = 0 if start is None else int(np.searchsorted(days, _to_days([start])[0]))
+        hi = (
+            len(days)
+            if end is None
+            else int(np.searchsorted(days, _to_days([end])[0], side="right"))
+        )
+        days, closes = days[lo:hi], closes[lo:hi]
+    return list(zip(archive.dates(days), closes.tolist()))
+
+
+def _sqlite_series(
+    con: sqlite3.Connection, tickers: Optional[list[str]]
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """SQLite → ticker 별 (days, close). tickers=None 이면 전체."""
+    sql = f"SELECT ticker, date, close FROM etf_daily_price WHERE {_VALID_CLOSE}"
+    params: list[str] = []
+    if tickers is not None:
+        if not tickers:
+            return {}
+        # 변수 개수 한도 (구버전 SQLite 999) 를 넘으면 전체를 읽고 걸러낸다.
+        if len(tickers) <= _MAX_IN_PARAMS:
+            sql += f" AND ticker IN ({','.join('?' * len(tickers))})"
+            params = list(tickers)
+    rows = con.execute(sql + " ORDER BY ticker, date", params).fetchall()
+    if tickers is not None and not params:
+        wanted = set(tickers)
+        rows = [r for r in rows if r[0] in wanted]
+    if not rows:
+        return {}
+    ticker_col, date_col, close_col = zip(*rows)
+    days = _to_days(date_col)
+    closes = np.array(close_col, dtype=np.float64)
+    names, starts = np.unique(np.array(ticker_col), return_index=True)
+    ends = list(starts[1:]) + [len(rows)]
+    return {
+        str(name): (days[slice(lo, hi)], closes[slice(lo, hi)])
+        for name, lo, hi in zip(names, starts, ends)
+    }
+
+
+def _save_array(path: Path, array: np.ndarray) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _write_generation(
+    directory: Path, series: dict[str, tuple[np.ndarray, np.ndarray]]
+) -> tuple[str, int]:
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    generation = f"{stamp}-{uuid.uuid4().hex[:8]}"
+    tickers = sorted(series)
+    offsets: dict[str, list[int]] = {}
+    position = 0
+    for t in tickers:
+        n = len(series[t][0])
+        offsets[t] = [position, n]
+        position += n
+    empty_day = np.empty(0, dtype=np.int32)
+    empty_close = np.empty(0, dtype=np.float64)
+    day = np.concatenate([series[t][0] for t in tickers] or [empty_day])
+    close = np.concatenate([series[t][1] for t in tickers] or [empty_close])
+    _save_array(directory / f"day.{generation}.npy", day.astype(np.int32))
+    _save_array(directory / f"close.{generation}.npy", close.astype(np.float64))
+    index = {"format": FORMAT_VERSION, "generation": generation, "tickers": offsets}
+    tmp = directory / f".{INDEX_NAME}.tmp"
+    tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, directory / INDEX_NAME)
+    return generation, position
+
+
+def _prune(directory: Path, keep: set[str]) -> None:
+    for path in list(directory.glob("day.*.npy")) + list(directory.glob("close.*.npy")):
+        generation = path.name.split(".", 1)[1].rsplit(".", 1)[0]
+        if generation in keep:
+            continue
+        try:
+            path.unlink()
+        except OSError as e:
+            # Windows — 다른 thread 가 memmap 중이면 다음 sync 에서 재시도.
+            logger.info("이전 archive 삭제 보류 (%s): %s", path.name, e)
+
+
+def sync(db_path: Path) -> SyncResult:
+    """dirty ticker 를 archive 에 반영. archive 가 없거나 어긋나면 전체 재구성."""
+    from app import sqlite_schemas
+
+    db_path = Path(db_path)
+    sqlite_schemas.ensure_market_data(db_path)
+    directory = archive_dir(db_path)
+    with _SYNC_LOCK, pooled_connection(db_path, write=True) as con:
+        # write lock 을 sync 끝까지 잡는다 — dirty 조회 ~ 삭제 사이 쓰기 유입 차단.
+        if not con.in_transaction:
+            con.execute("BEGIN IMMEDIATE")
+        dirty = sorted(
+            r[0] for r in con.execute("SELECT ticker FROM price_archive_dirty")
+        )
+        current = _load(db_path)
+        previous = current.generation if current is not None else None
+        if current is not None and _db_generation(con) != current.generation:
+            current = None
+        if current is not None and not dirty:
+            return SyncResult(
+                current.generation, False, 0, len(current.offsets), len(current.day)
+            )
+
+        full = current is None
+        series = _sqlite_series(con, None if full else dirty)
+        if current is not None:
+            dirty_set = set(dirty)
+            for t in current.offsets:
+                if t not in dirty_set:
+                    series[t] = current.segment(t)
+        generation, rows = _write_generation(directory, series)
+        con.execute("DELETE FROM price_archive_dirty")
+        con.execute(
+            "INSERT INTO price_archive_meta (key, value) VALUES ('generation', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (generation,),
+        )
+    _prune(directory, {generation} | ({previous} if previous else set()))
+    return SyncResult(
+        generation=generation,
+        full_rebuild=full,
+        synced_tickers=len(series) if full else len(dirty),
+        archived_tickers=len(series),
+        archived_rows=rows,
+    )
+
+
+def load_close_matrix(
+    db_path: Path,
+    tickers: Optional[Iterable[str]] = None,
+    *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> PriceMatrix:
+    """종가 행렬. archive 의 clean ticker 는 memmap, 나머지는 SQLite 에서 읽는다."""
+    from app import sqlite_schemas
+
+    db_path = Path(db_path)
+    sqlite_schemas.ensure_market_data(db_path)
+    wanted = None if tickers is None else sorted(set(tickers))
+    series: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    with pooled_connection(db_path) as con:
+        archive = _load(db_path)
+        if archive is not None and _db_generation(con) != archive.generation:
+            archive = None
+        if archive is None:
+            series = _sqlite_series(con, wanted)
+        else:
+            dirty = {
+                r[0] for r in con.execute("SELECT ticker FROM price_archive_dirty")
+            }
+            names = (
+                wanted if wanted is not None else sorted(set(archive.offsets) | dirty)
+            )
+            stale = [t for t in names if t in dirty]
+            for t in names:
+                segment = None if t in dirty else archive.segment(t)
+                if segment is not None:
+                    series[t] = segment
+            series.update(_sqlite_series(con, stale))
+
+    lo = None if start is None else np.datetime64(start, "D").astype(np.int32)
+    hi = None if end is None else np.datetime64(end, "D").astype(np.int32)
+    names = wanted if wanted is not None else sorted(series)
+    clipped: list[tuple[np.ndarray, np.ndarray]] = []
+    for t in names:
+        days, closes = series.get(t, (np.empty(0, np.int32), np.empty(0, np.float64)))
+        mask = np.ones(len(days), dtype=bool)
+        if lo is not None:
+            mask &= days >= lo
+        if hi is not None:
+            mask &= days <= hi
+        clipped.append((days[mask], closes[mask]))
+    all_days = (
+        np.unique(np.concatenate([d for d, _ in clipped]))
+        if clipped
+        else np.empty(0, np.int32)
+    )
+    matrix = np.full((len(all_days), len(names)), np.nan, dtype=np.float64)
+    for j, (days, closes) in enumerate(clipped):
+        if len(days):
+            matrix[np.searchsorted(all_days, days), j] = closes
+    return PriceMatrix(
+        tickers=list(names),
+        dates=all_days.astype("datetime64[D]"),
+        close=matrix,
+    )
+
+
+def reset_cache_for_tests() -> None:
+    with _LOCK:
+        _CACHE.clear()
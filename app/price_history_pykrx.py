@@ -14,6 +14,13 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Optional, Union
 
+from app.source_circuit_breaker import (
+    CIRCUIT_OPEN_REASON,
+    SOURCE_PYKRX,
+    CircuitOpenError,
+    guarded_call,
+)
+
 DEFAULT_FETCH_WINDOW_DAYS = 45
 DEFAULT_LOOKBACK_DAYS = 30
 
@@ -32,7 +39,8 @@ class PriceHistoryBasis:
 class PriceHistoryFailure:
     """pykrx 조회/추출 실패 — candidate 단위 격리용."""
 
-    reason: str  # 'no_data' | 'fetch_error' | 'no_base_close' | 'asof_invalid'
+    # 'no_data' | 'fetch_error' | 'no_base_close' | 'asof_invalid' | 'circuit_open'
+    reason: str
     detail: Optional[str] = None
 
 
@@ -53,7 +61,8 @@ def _fetch_pykrx_ohlcv(ticker: str, fromdate: date, todate: date):
 
     from_str = fromdate.strftime("%Y%m%d")
     to_str = todate.strftime("%Y%m%d")
-    return stock.get_market_ohlcv(from_str, to_str, ticker)
+    # 2026-10 — pykrx 소스 circuit breaker. open 이면 호출 없이 CircuitOpenError.
+    return guarded_call(SOURCE_PYKRX, stock.get_market_ohlcv, from_str, to_str, ticker)
 
 
 def fetch_one_month_basis(
@@ -84,6 +93,8 @@ def fetch_one_month_basis(
 
     try:
         df = _fetch_pykrx_ohlcv(ticker, fromdate, todate)
+    except CircuitOpenError as e:
+        return PriceHistoryFailure(reason=CIRCUIT_OPEN_REASON, detail=str(e))
     except Exception as e:  # noqa: BLE001 — 외부 의존 광범위 예외 격리
         return PriceHistoryFailure(reason="fetch_error", detail=f"pykrx: {e}")
 
@@ -14,11 +14,41 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from app import runtime_state_db as _db
 from app.runtime_state_db import connection, utc_now_iso
 
+# _INSERT_SQL 의 컬럼 순서 (inserted_at 제외).
+_STATUS_COLUMNS = (
+    "push_kind",
+    "mode",
+    "status",
+    "reason",
+    "started_at",
+    "finished_at",
+    "runtime_kst",
+    "runtime_date_kst",
+    "param_id",
+    "param_source",
+    "message_text_length",
+    "availability_available",
+    "availability_unavailable_or_other",
+    "duplicate_key",
+    "telegram_attempted",
+    "telegram_sent",
+    "error",
+)
+
+_INSERT_SQL = (
+    "INSERT INTO runtime_execution_status ("
+    "push_kind, mode, status, reason, started_at, finished_at, "
+    "runtime_kst, runtime_date_kst, param_id, param_source, "
+    "message_text_length, availability_available, availability_unavailable_or_other, "
+    "duplicate_key, telegram_attempted, telegram_sent, error, inserted_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
 
 def _default_db_path() -> Path:
     return _db.DEFAULT_DB_PATH
@@ -46,14 +76,9 @@ def insert_execution_status(
     error: Optional[str],
     inserted_at: Optional[str] = None,
 ) -> int:
-    with connection(db_path) as con:
+    with connection(db_path, write=True) as con:
         cur = con.execute(
-            "INSERT INTO runtime_execution_status ("
-            "push_kind, mode, status, reason, started_at, finished_at, "
-            "runtime_kst, runtime_date_kst, param_id, param_source, "
-            "message_text_length, availability_available, availability_unavailable_or_other, "
-            "duplicate_key, telegram_attempted, telegram_sent, error, inserted_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _INSERT_SQL,
             (
                 push_kind,
                 mode,
@@ -89,30 +114,60 @@ def insert_status_from_record(
     fail-closed: DB 접근 실패 시 예외 상승. JSON fallback 없음.
     """
     p = Path(db_path or _default_db_path())
+    return insert_execution_status(p, **_record_fields(record), inserted_at=inserted_at)
+
+
+def _record_fields(record: dict[str, Any]) -> dict[str, Any]:
+    """runner record dict → insert_execution_status 키워드 인자."""
     availability = record.get("availability") or {}
-    return insert_execution_status(
-        p,
-        push_kind=str(record.get("push_kind", "")),
-        mode=str(record.get("mode", "")),
-        status=str(record.get("status", "")),
-        reason=record.get("reason"),
-        started_at=str(record.get("started_at", "")),
-        finished_at=str(record.get("finished_at", "")),
-        runtime_kst=str(record.get("runtime_kst", "")),
-        runtime_date_kst=str(record.get("runtime_date_kst", "")),
-        param_id=str(record.get("param_id", "")),
-        param_source=str(record.get("param_source", "")),
-        message_text_length=int(record.get("message_text_length", 0)),
-        availability_available=int(availability.get("available", 0)),
-        availability_unavailable_or_other=int(
+    return {
+        "push_kind": str(record.get("push_kind", "")),
+        "mode": str(record.get("mode", "")),
+        "status": str(record.get("status", "")),
+        "reason": record.get("reason"),
+        "started_at": str(record.get("started_at", "")),
+        "finished_at": str(record.get("finished_at", "")),
+        "runtime_kst": str(record.get("runtime_kst", "")),
+        "runtime_date_kst": str(record.get("runtime_date_kst", "")),
+        "param_id": str(record.get("param_id", "")),
+        "param_source": str(record.get("param_source", "")),
+        "message_text_length": int(record.get("message_text_length", 0)),
+        "availability_available": int(availability.get("available", 0)),
+        "availability_unavailable_or_other": int(
             availability.get("unavailable_or_other", 0)
         ),
-        duplicate_key=str(record.get("duplicate_key", "")),
-        telegram_attempted=bool(record.get("telegram_attempted", False)),
-        telegram_sent=bool(record.get("telegram_sent", False)),
-        error=record.get("error"),
-        inserted_at=inserted_at,
-    )
+        "duplicate_key": str(record.get("duplicate_key", "")),
+        "telegram_attempted": bool(record.get("telegram_attempted", False)),
+        "telegram_sent": bool(record.get("telegram_sent", False)),
+        "error": record.get("error"),
+    }
+
+
+def _status_row(fields: dict[str, Any], inserted_at: str) -> tuple:
+    """_record_fields 결과 → _INSERT_SQL 파라미터 (컬럼 순서, bool 은 0/1)."""
+    values = (fields[name] for name in _STATUS_COLUMNS)
+    return (*(int(v) if isinstance(v, bool) else v for v in values), inserted_at)
+
+
+def insert_status_many(
+    records: Iterable[dict[str, Any]],
+    *,
+    db_path: Optional[Path] = None,
+    inserted_at: Optional[str] = None,
+) -> list[int]:
+    """runner record 여러 개를 한 트랜잭션으로 insert (2026-10). run_id 목록 반환.
+
+    history 재적재 등 여러 건을 쓸 때 commit (= fsync) 을 1번으로 줄인다.
+    fail-closed: 한 건이라도 실패하면 전체 rollback 후 예외 상승.
+    """
+    p = Path(db_path or _default_db_path())
+    stamp = inserted_at or utc_now_iso()
+    run_ids: list[int] = []
+    with connection(p, write=True) as con:
+        for record in records:
+            cur = con.execute(_INSERT_SQL, _status_row(_record_fields(record), stamp))
+            run_ids.append(int(cur.lastrowid or 0))
+    return run_ids
 
 
 def latest_execution_status(db_path: Optional[Path] = None) -> Optional[dict[str, Any]]:
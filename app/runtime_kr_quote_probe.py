@@ -22,6 +22,12 @@ import urllib.request
 from datetime import datetime, timezone
 from typing import Any, Iterable, Optional
 
+from app.source_circuit_breaker import (
+    SOURCE_NAVER_POLLING,
+    CircuitOpenError,
+    guarded_call,
+)
+
 logger = logging.getLogger(__name__)
 
 NAVER_POLLING_URL = (
@@ -72,13 +78,18 @@ def _parse_float(value: Any) -> Optional[float]:
     return None
 
 
+def _read_text(req: urllib.request.Request) -> str:
+    with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as resp:
+        return resp.read().decode("utf-8")
+
+
 def _probe_single(ticker: str) -> dict[str, Any]:
     """단일 ticker quote 조회. 예외 흡수 후 status 명시 dict 반환."""
     url = NAVER_POLLING_URL.format(ticker=urllib.request.quote(ticker, safe=""))
     req = urllib.request.Request(url, headers=NAVER_HEADERS)
     try:
-        with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as resp:
-            raw = resp.read().decode("utf-8")
+        # 2026-10 — polling.finance.naver.com breaker. open 이면 호출 없이 failed.
+        raw = guarded_call(SOURCE_NAVER_POLLING, _read_text, req)
         data = json.loads(raw)
         items = data.get("datas")
         if not isinstance(items, list) or not items:
@@ -98,6 +109,16 @@ def _probe_single(ticker: str) -> dict[str, Any]:
             "volume": volume,
             "data_status": "ok",
         }
+    except CircuitOpenError as e:
+        return {
+            "ticker": ticker,
+            "name": None,
+            "price": None,
+            "change_pct": None,
+            "volume": None,
+            "data_status": "failed",
+            "error": str(e),
+        }
     except (urllib.error.URLError, TimeoutError) as e:
         logger.warning("kr quote probe 네트워크 실패: ticker=%s reason=%s", ticker, e)
         return {
@@ -180,7 +180,7 @@ def insert_param_version(
     source_note: Optional[str] = None,
     values: Optional[list[tuple[str, str, Any]]] = None,
 ) -> None:
-    with connection(db_path) as con:
+    with connection(db_path, write=True) as con:
         con.execute(
             "INSERT INTO runtime_param_version ("
             "param_version_id, schema_version, created_at, approved_at, approved_by, "
@@ -298,7 +298,7 @@ def set_active_pointer(
     activated_by: str,
     active_scope: str = DEFAULT_ACTIVE_SCOPE,
 ) -> None:
-    with connection(db_path) as con:
+    with connection(db_path, write=True) as con:
         con.execute(
             "INSERT INTO runtime_param_active "
             "(active_scope, active_param_version_id, activated_at, activated_by) "
@@ -14,11 +14,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from app import runtime_state_db as _db
 from app.runtime_state_db import connection, utc_now_iso
 
+# (push_kind, param_id, runtime_date_kst) — UNIQUE 키 1개.
+RegistryKey = tuple[str, str, str]
+
+# row value 3개 x 300 = 900 — 구버전 SQLite 변수 한도 (999) 이내.
+_KEYS_PER_QUERY = 300
+
 
 def _default_db_path() -> Path:
     return _db.DEFAULT_DB_PATH
@@ -59,7 +65,7 @@ def insert(
         "(push_kind, param_id, runtime_date_kst, sent_at_utc, inserted_at) "
         "VALUES (?, ?, ?, ?, ?)"
     )
-    with connection(db_path) as con:
+    with connection(db_path, write=True) as con:
         cur = con.execute(
             sql,
             (
@@ -73,6 +79,34 @@ def insert(
     return cur.rowcount > 0
 
 
+def contains_many(
+    keys: Iterable[RegistryKey],
+    *,
+    db_path: Optional[Path] = None,
+) -> set[RegistryKey]:
+    """keys 중 이미 registry 에 있는 키 집합 (2026-10 batch 조회).
+
+    spike fingerprint 처럼 키가 여러 개일 때 connection 1개 · 조회 1번으로 확인한다.
+    """
+    p = Path(db_path or _default_db_path())
+    wanted = list(dict.fromkeys(keys))
+    found: set[RegistryKey] = set()
+    if not wanted:
+        return found
+    with connection(p) as con:
+        for i in range(0, len(wanted), _KEYS_PER_QUERY):
+            chunk = wanted[i : i + _KEYS_PER_QUERY]  # noqa: E203
+            rows = con.execute(
+                "SELECT push_kind, param_id, runtime_date_kst FROM runtime_sent_registry "
+                "WHERE (push_kind, param_id, runtime_date_kst) IN (VALUES "
+                + ", ".join("(?, ?, ?)" for _ in chunk)
+                + ")",
+                [v for key in chunk for v in key],
+            ).fetchall()
+            found.update((r[0], r[1], r[2]) for r in rows)
+    return found
+
+
 def count(db_path: Optional[Path] = None) -> int:
     p = Path(db_path or _default_db_path())
     with connection(p) as con:
@@ -110,3 +144,29 @@ def mark_sent(
         runtime_date_kst=runtime_date_kst,
         sent_at_utc=sent_at_utc,
     )
+
+
+def mark_sent_many(
+    keys: Iterable[RegistryKey],
+    *,
+    sent_at_utc: str,
+    db_path: Optional[Path] = None,
+) -> int:
+    """keys 를 한 트랜잭션으로 sent 기록 (commit 1번). 새로 기록한 개수 반환.
+
+    중복 키는 mark_sent 와 같이 ignore. 중간 실패 시 전체 rollback.
+    """
+    p = Path(db_path or _default_db_path())
+    inserted_at = utc_now_iso()
+    rows = [(*key, sent_at_utc, inserted_at) for key in dict.fromkeys(keys)]
+    if not rows:
+        return 0
+    with connection(p, write=True) as con:
+        before = con.total_changes
+        con.executemany(
+            "INSERT OR IGNORE INTO runtime_sent_registry "
+            "(push_kind, param_id, runtime_date_kst, sent_at_utc, inserted_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        return con.total_changes - before
@@ -24,6 +24,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterator
 
+from app import sqlite_migrations
+from app.sqlite_pool import pooled_connection
+
 DEFAULT_DB_PATH = Path("state/runtime/runtime_state.sqlite")
 DEFAULT_ACTIVE_SCOPE = "three_push"
 
@@ -133,21 +136,13 @@ _INITIALIZED_DBS: set[str] = set()
 
 
 def init_db(db_path: Path) -> None:
-    """5 table + index 를 idempotent 하게 생성."""
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(str(db_path))
-    try:
-        con.execute("PRAGMA foreign_keys = ON;")
-        con.execute(RUNTIME_PARAM_VERSION_DDL)
-        con.execute(RUNTIME_PARAM_VERSION_HASH_INDEX_DDL)
-        con.execute(RUNTIME_PARAM_VALUE_DDL)
-        con.execute(RUNTIME_PARAM_ACTIVE_DDL)
-        con.execute(RUNTIME_EXECUTION_STATUS_DDL)
-        con.execute(RUNTIME_EXECUTION_STATUS_INDEX_DDL)
-        con.execute(RUNTIME_SENT_REGISTRY_DDL)
-        con.commit()
-    finally:
-        con.close()
+    """5 table + index 를 idempotent 하게 생성.
+
+    2026-10 — app.sqlite_schemas RUNTIME_STATE_SCHEMA (user_version 기준).
+    """
+    from app.sqlite_schemas import ensure_runtime_state
+
+    ensure_runtime_state(db_path)
 
 
 def _ensure_initialized(db_path: Path) -> None:
@@ -159,20 +154,20 @@ def _ensure_initialized(db_path: Path) -> None:
 
 
 @contextmanager
-def connection(db_path: Path) -> Iterator[sqlite3.Connection]:
-    """sqlite3 connection context manager. FK 활성화 + auto commit on success."""
+def connection(db_path: Path, *, write: bool = False) -> Iterator[sqlite3.Connection]:
+    """sqlite3 connection context manager. FK 활성화 + auto commit on success.
+
+    2026-10 — app.sqlite_pool 공유 connection 사용. write=True 면 경로별 writer.
+    """
     _ensure_initialized(db_path)
-    con = sqlite3.connect(str(db_path))
-    try:
+    with pooled_connection(db_path, write=write) as con:
         con.execute("PRAGMA foreign_keys = ON;")
         yield con
-        con.commit()
-    finally:
-        con.close()
 
 
 def reset_init_cache_for_testing() -> None:
     _INITIALIZED_DBS.clear()
+    sqlite_migrations.reset_cache_for_tests("runtime_state")
 
 
 # ── Introspection ────────────────────────────────────────────────────────────
@@ -23,6 +23,8 @@ import urllib.request
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from app.source_circuit_breaker import SOURCE_YAHOO, CircuitOpenError, guarded_call
+
 logger = logging.getLogger(__name__)
 
 YAHOO_HOME_URL = "https://finance.yahoo.com/"
@@ -79,9 +81,14 @@ def _probe_single(symbol_display: str, name: str, yahoo_symbol: str) -> dict[str
     url = YAHOO_CHART_URL.format(symbol=encoded)
     req = urllib.request.Request(url, headers=YAHOO_HEADERS)
     opener = _get_opener()
-    try:
+
+    def _read_text() -> str:
         with opener.open(req, timeout=HTTP_TIMEOUT_SECONDS) as resp:
-            raw = resp.read().decode("utf-8")
+            return resp.read().decode("utf-8")
+
+    try:
+        # 2026-10 — Yahoo 소스 circuit breaker. open 이면 호출 없이 failed.
+        raw = guarded_call(SOURCE_YAHOO, _read_text)
         data = json.loads(raw)
         meta = data["chart"]["result"][0]["meta"]
         close = meta.get("regularMarketPrice")
@@ -98,6 +105,15 @@ def _probe_single(symbol_display: str, name: str, yahoo_symbol: str) -> dict[str
             "change_pct": round(change_pct, 4),
             "status": "ok",
         }
+    except CircuitOpenError as e:
+        return {
+            "symbol": symbol_display,
+            "name": name,
+            "close": None,
+            "change_pct": None,
+            "status": "failed",
+            "error": str(e),
+        }
     except (urllib.error.URLError, TimeoutError) as e:
         logger.warning(
             "us_indices probe 네트워크 실패: symbol=%s reason=%s", symbol_display, e
@@ -0,0 +1,50 @@
+"""차트용 시계열 downsample — LTTB (Largest-Triangle-Three-Buckets) (2026-10).
+
+`GET /market/price-series?max_points=` 가 사용한다. 수백 px 폭 차트에 다년 일별
+종가 전체를 보낼 필요가 없어, 모양 (고점 / 저점 / 급변) 을 유지하며 점 수만 줄인다.
+
+- 첫 점과 마지막 점은 항상 포함 (available_from / available_to 그대로).
+- 가운데는 max_points - 2 개 구간에서 각 1점 — 앞에서 고른 점과 다음 구간 평균이
+  이루는 삼각형 면적이 가장 큰 점. 반환 값은 원본 (date, close) 그대로 (보간 X).
+- x 축은 거래일 순번 — 날짜 파싱 없이 O(n). numpy 없이 동작 (API 기동 비용).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, TypeVar
+
+Point = TypeVar("Point", bound=tuple)
+
+
+def lttb(points: Sequence[Point], max_points: int) -> list[Point]:
+    """points ((date, value) 날짜 오름차순) 를 max_points 개 이하로 줄인다."""
+    n = len(points)
+    if max_points >= n:
+        return list(points)
+    if max_points < 3:
+        return [points[0], points[-1]]
+
+    out = [points[0]]
+    bucket = (n - 2) / (max_points - 2)
+    a = 0
+    for i in range(max_points - 2):
+        lo = int(i * bucket) + 1
+        hi = int((i + 1) * bucket) + 1
+        # 다음 구간 평균 (마지막 구간이면 마지막 점).
+        next_lo = hi
+        next_hi = min(int((i + 2) * bucket) + 1, n)
+        if next_lo >= next_hi:
+            next_lo, next_hi = n - 1, n
+        avg_x = (next_lo + next_hi - 1) / 2.0
+        avg_y = sum(p[1] for p in points[next_lo:next_hi]) / (next_hi - next_lo)
+
+        ay = points[a][1]
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((a - avg_x) * (points[j][1] - ay) - (a - j) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        out.append(points[best])
+        a = best
+    out.append(points[-1])
+    return out
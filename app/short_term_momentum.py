@@ -14,10 +14,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from app.market_data_store import DEFAULT_DB_PATH, fetch_price_history
 
+if TYPE_CHECKING:
+    from app.evidence_context import EvidenceContext
+
 KODEX200_TICKER = "069500"
 
 # 일간 급등 / 급락 임계 (지시문 §6).
@@ -140,6 +143,7 @@ def compute_short_term_momentum_batch(
     tickers: list[str],
     *,
     db_path: Path = DEFAULT_DB_PATH,
+    context: Optional[EvidenceContext] = None,
 ) -> dict[str, ShortTermMomentum]:
     """여러 ticker 의 단기 흐름 계산 — KODEX200 시계열은 1회만 fetch (효율).
 
@@ -147,8 +151,18 @@ def compute_short_term_momentum_batch(
 
     2026-06-03 FIX (검증자 A-1 NOTE) — 단일 호출과 동일한 status 판정 규칙.
     20거래일 이력 또는 KODEX200 benchmark 이력 부족 시 status='unavailable'.
+
+    2026-10 — context 를 주면 시계열을 그 요청의 memo 에서 읽는다 (compute_topn 이
+    이미 읽은 KODEX200 / 보유 ETF 시계열 재사용).
     """
-    bench = fetch_price_history(KODEX200_TICKER, db_path=db_path)
+    if context is not None and context.db_path == db_path:
+        history_of = context.price_history
+    else:
+
+        def history_of(tk: str) -> list[tuple[str, float]]:
+            return fetch_price_history(tk, db_path=db_path)
+
+    bench = history_of(KODEX200_TICKER)
     bench_ok = len(bench) >= MIN_TRADING_DAYS_FOR_OK
     b5 = _window_return_pct(bench, 5) if bench_ok else None
     b10 = _window_return_pct(bench, 10) if bench_ok else None
@@ -156,7 +170,7 @@ def compute_short_term_momentum_batch(
 
     out: dict[str, ShortTermMomentum] = {}
     for ticker in tickers:
-        series = fetch_price_history(ticker, db_path=db_path)
+        series = history_of(ticker)
         if len(series) < MIN_TRADING_DAYS_FOR_OK:
             out[ticker] = ShortTermMomentum(
                 status="unavailable",
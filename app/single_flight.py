@@ -0,0 +1,67 @@
+"""같은 GET 의 동시 계산을 1번으로 합친다 — single-flight (2026-10).
+
+배경: 대시보드가 열리면 여러 컴포넌트가 `/market/topn/latest` ·
+`/holdings/market-evidence/latest` 를 거의 동시에 부르고, 요청마다 같은 계산을
+처음부터 따로 돌렸다 (페이지 로드당 3~5회).
+
+key = endpoint 경로 + 검증된 query 값 (이름 순) + 데이터 버전 (app.http_cache 가
+ETag 에 쓰는 값). 같은 key 의 계산이 진행 중이면 새 요청은 그 결과를 함께 기다린다:
+- 계산은 compute lane (app.compute_lanes) 에 1번만 들어간다 — 대기열도 1칸.
+- 데이터 버전이 같으니 ETag 도 같다 (같은 Accept-Encoding 기준).
+- 계산이 끝나면 key 를 지운다 — 결과를 보관하는 캐시가 아니다. 끝난 뒤 요청은
+  ETag 304 (app.http_cache) 나 새 계산으로 간다.
+- 예외도 기다리던 요청 모두에게 그대로 전달된다.
+- 한 요청의 연결이 끊겨도 (task 취소) 공유 계산은 취소하지 않는다.
+
+결과 객체는 요청끼리 공유한다 — 응답 직렬화만 하고 수정하지 않는 endpoint 에만 쓴다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Mapping, TypeVar
+
+from app import compute_lanes
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_inflight: dict[Hashable, Future] = {}
+_counters = {"leaders": 0, "joined": 0}
+
+
+def key(path: str, params: Mapping[str, Any], version: str) -> Hashable:
+    """endpoint + 정규화된 query (이름 순) + 데이터 버전."""
+    return (path, tuple(sorted(params.items())), version)
+
+
+def _forget(flight_key: Hashable, future: Future) -> None:
+    with _lock:
+        if _inflight.get(flight_key) is future:
+            del _inflight[flight_key]
+
+
+async def run(
+    flight_key: Hashable, lane: str, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """flight_key 의 계산이 진행 중이면 합류, 아니면 lane 에서 새로 시작."""
+    with _lock:
+        future = _inflight.get(flight_key)
+        if future is None:
+            # lane 대기열이 가득 차면 여기서 503 — 등록 전이라 key 가 남지 않는다.
+            future = compute_lanes.submit(lane, fn, *args, **kwargs)
+            _inflight[flight_key] = future
+            _counters["leaders"] += 1
+        else:
+            _counters["joined"] += 1
+    # lock 밖에서 — 이미 끝났으면 callback 이 즉시 (이 thread 에서) 실행된다.
+    future.add_done_callback(lambda f: _forget(flight_key, f))
+    return await asyncio.shield(asyncio.wrap_future(future))
+
+
+def stats() -> dict[str, int]:
+    """시작한 계산 수 (leaders) / 진행 중 계산에 합류한 요청 수 (joined) / 진행 중."""
+    with _lock:
+        return {**_counters, "in_flight": len(_inflight)}
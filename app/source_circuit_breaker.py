@@ -0,0 +1,286 @@
+"""외부 데이터 소스별 circuit breaker (2026-10).
+
+배경: FDR / pykrx / Naver / Yahoo 호출은 소스가 죽어 있어도 ticker 마다 timeout 까지
+기다린 뒤 실패를 쌓는다. refresh 한 번이 수백 번의 timeout 대기로 끝나고, 그 동안
+같은 소스를 계속 두드린다.
+
+본 모듈 정책:
+- endpoint family 1개당 breaker 1개 (프로세스 전역, thread-safe). 같은 회사라도
+  host / 호출 경로가 다르면 장애도 따로 난다 — Naver 는 host 별, FDR 경유
+  (NAVER:* / YAHOO:* DataReader) 는 직접 HTTP 와 별도 key.
+- 실패로 세는 것은 transport 오류 (연결 / timeout / 프로토콜) 와 HTTP 5xx / 429
+  뿐이다. 응답을 받은 뒤의 파싱 · 데이터 오류와 4xx 는 소스 장애가 아니므로
+  성공으로 기록한다 (half_open probe 도 그대로 닫힌다).
+- closed: 호출 허용. 연속 실패가 FAILURE_THRESHOLD 에 도달하면 open.
+- open: open_seconds 동안 호출하지 않고 즉시 CircuitOpenError (reason=circuit_open).
+  호출자는 이를 일반 네트워크 실패와 구분되는 사유로 기록한다.
+- open_seconds 경과 후 half_open: probe 1건만 통과시킨다. 성공 → closed (cooldown
+  초기화), 실패 → 다시 open 하되 cooldown 을 BACKOFF_MULTIPLIER 배로 늘린다
+  (MAX_OPEN_SECONDS 상한) — 오래 죽어 있는 소스일수록 덜 두드린다.
+- 상태는 snapshot_all() 로 노출 (`/oci/startup-status` 의 source_circuits).
+
+적용 위치는 각 모듈의 **기본(실제 네트워크) fetcher** 뿐이다. 테스트가 주입하는
+fetcher 는 breaker 를 거치지 않는다.
+"""
+
+from __future__ import annotations
+
+import http.client
+import threading
+import time
+import urllib.error
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+SOURCE_FDR = "fdr"  # FinanceDataReader KRX listing / DataReader (market_data_fdr)
+SOURCE_PYKRX = "pykrx"
+SOURCE_NAVER_FDR = "naver_fdr"  # FDR DataReader NAVER:* (timeseries adapter)
+SOURCE_NAVER_FINANCE = "naver_finance"  # finance.naver.com API (ETF universe)
+SOURCE_NAVER_MOBILE = "naver_mobile"  # m.stock.naver.com API (quote)
+SOURCE_NAVER_POLLING = "naver_polling"  # polling.finance.naver.com (realtime probe)
+SOURCE_NAVER_STOCK = "naver_stock"  # stock.naver.com API (ETF constituents)
+SOURCE_YAHOO = "yahoo"  # finance.yahoo.com chart API (US index probe)
+SOURCE_YAHOO_FDR = "yahoo_fdr"  # FDR DataReader YAHOO:* (timeseries adapter)
+KNOWN_SOURCES = (
+    SOURCE_FDR,
+    SOURCE_PYKRX,
+    SOURCE_NAVER_FDR,
+    SOURCE_NAVER_FINANCE,
+    SOURCE_NAVER_MOBILE,
+    SOURCE_NAVER_POLLING,
+    SOURCE_NAVER_STOCK,
+    SOURCE_YAHOO,
+    SOURCE_YAHOO_FDR,
+)
+
+# 소스 장애로 세는 예외 — urllib URLError / socket timeout / requests 예외는 모두
+# OSError 하위. 그 밖의 HTTP client (httpx 등) 는 호출자가 transport_errors 로 추가.
+TRANSPORT_ERRORS: tuple[type[BaseException], ...] = (
+    OSError,
+    http.client.HTTPException,
+)
+
+CIRCUIT_OPEN_REASON = "circuit_open"
+
+FAILURE_THRESHOLD = 5
+BASE_OPEN_SECONDS = 30.0
+MAX_OPEN_SECONDS = 600.0
+BACKOFF_MULTIPLIER = 2.0
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(RuntimeError):
+    """breaker 가 열려 호출을 건너뜀 — 네트워크 실패와 구분되는 사유."""
+
+    def __init__(self, source: str, retry_after_seconds: float) -> None:
+        self.source = source
+        self.reason = CIRCUIT_OPEN_REASON
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            f"{CIRCUIT_OPEN_REASON}: {source} "
+            f"(retry_after={retry_after_seconds:.0f}s)"
+        )
+
+
+@dataclass
+class CircuitSnapshot:
+    source: str
+    state: str
+    consecutive_failures: int
+    open_seconds: float
+    retry_after_seconds: Optional[float]
+    total_failures: int
+    total_short_circuits: int
+    last_error: Optional[str]
+
+
+class SourceCircuitBreaker:
+    """소스 1개의 breaker. clock 은 테스트 주입용 (기본 time.monotonic)."""
+
+    def __init__(
+        self,
+        source: str,
+        *,
+        failure_threshold: Optional[int] = None,
+        base_open_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.source = source
+        self._failure_threshold = failure_threshold
+        self._base_open_seconds = base_open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._open_seconds = self._base()
+        self._opened_until = 0.0
+        self._probe_in_flight = False
+        self._total_failures = 0
+        self._total_short_circuits = 0
+        self._last_error: Optional[str] = None
+
+    # 모듈 상수는 호출 시점에 읽는다 (테스트 monkeypatch 허용).
+    def _threshold(self) -> int:
+        if self._failure_threshold is not None:
+            return self._failure_threshold
+        return FAILURE_THRESHOLD
+
+    def _base(self) -> float:
+        if self._base_open_seconds is not None:
+            return float(self._base_open_seconds)
+        return float(BASE_OPEN_SECONDS)
+
+    def before_call(self) -> None:
+        """호출 전 확인. 허용되지 않으면 CircuitOpenError."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return
+            now = self._clock()
+            if self._state == STATE_OPEN and now >= self._opened_until:
+                self._state = STATE_HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self._total_short_circuits += 1
+            raise CircuitOpenError(self.source, max(0.0, self._opened_until - now))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._consecutive_failures = 0
+            self._open_seconds = self._base()
+            self._probe_in_flight = False
+
+    def record_failure(self, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._total_failures += 1
+            if error:
+                self._last_error = error[:200]
+            if self._state == STATE_HALF_OPEN:
+                # probe 실패 — cooldown 을 늘려 다시 연다.
+                self._open_seconds = min(
+                    float(MAX_OPEN_SECONDS), self._open_seconds * BACKOFF_MULTIPLIER
+                )
+                self._open(self._clock())
+            elif (
+                self._state == STATE_CLOSED
+                and self._consecutive_failures >= self._threshold()
+            ):
+                self._open(self._clock())
+
+    def _open(self, now: float) -> None:
+        self._state = STATE_OPEN
+        self._opened_until = now + self._open_seconds
+        self._probe_in_flight = False
+
+    def snapshot(self) -> CircuitSnapshot:
+        with self._lock:
+            retry_after: Optional[float] = None
+            if self._state == STATE_OPEN:
+                retry_after = round(max(0.0, self._opened_until - self._clock()), 1)
+            return CircuitSnapshot(
+                source=self.source,
+                state=self._state,
+                consecutive_failures=self._consecutive_failures,
+                open_seconds=self._open_seconds,
+                retry_after_seconds=retry_after,
+                total_failures=self._total_failures,
+                total_short_circuits=self._total_short_circuits,
+                last_error=self._last_error,
+            )
+
+
+_REGISTRY: dict[str, SourceCircuitBreaker] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_breaker(source: str) -> SourceCircuitBreaker:
+    with _REGISTRY_LOCK:
+        breaker = _REGISTRY.get(source)
+        if breaker is None:
+            breaker = SourceCircuitBreaker(source)
+            _REGISTRY[source] = breaker
+        return breaker
+
+
+def _error_http_status(exc: BaseException) -> Optional[int]:
+    """예외가 HTTP 응답을 담고 있으면 status (urllib HTTPError / requests · httpx)."""
+    if isinstance(exc, urllib.error.HTTPError):
+        return int(exc.code)
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_source_failure(
+    exc: BaseException,
+    transport_errors: tuple[type[BaseException], ...] = TRANSPORT_ERRORS,
+) -> bool:
+    """breaker 실패로 셀 예외인지 — transport 오류, 또는 5xx / 429 응답."""
+    status = _error_http_status(exc)
+    if status is not None:
+        return is_server_error_status(status)
+    return isinstance(exc, transport_errors)
+
+
+def guarded_call(
+    source: str,
+    fn: Callable[..., T],
+    *args: Any,
+    failure_if: Optional[Callable[[T], bool]] = None,
+    transport_errors: tuple[type[BaseException], ...] = TRANSPORT_ERRORS,
+    **kwargs: Any,
+) -> T:
+    """breaker 를 거쳐 fn 호출.
+
+    - 열려 있으면 fn 을 부르지 않고 CircuitOpenError.
+    - fn 예외는 그대로 재발생. transport 오류 / 5xx · 429 (is_source_failure) 만
+      실패로 기록하고, 파싱 · 데이터 오류는 응답을 받은 것이므로 성공으로 기록.
+    - failure_if(result) 가 True 면 (예: HTTP 5xx / 429) 결과는 그대로 돌려주되
+      실패로 기록한다.
+    """
+    breaker = get_breaker(source)
+    breaker.before_call()
+    try:
+        result = fn(*args, **kwargs)
+    except Exception as e:
+        if is_source_failure(e, transport_errors):
+            breaker.record_failure(f"{type(e).__name__}: {e}")
+        else:
+            breaker.record_success()
+        raise
+    if failure_if is not None and failure_if(result):
+        breaker.record_failure(f"result_failure: {result!r}"[:200])
+    else:
+        breaker.record_success()
+    return result
+
+
+def is_circuit_open_message(message: Optional[str]) -> bool:
+    """CircuitOpenError 를 흡수한 fetch 결과의 message 인지 (str(CircuitOpenError))."""
+    return bool(message) and message.startswith(CIRCUIT_OPEN_REASON)
+
+
+def is_server_error_status(status: Optional[int]) -> bool:
+    """breaker 실패로 셀 HTTP status — 5xx / 429."""
+    return status is not None and (status >= 500 or status == 429)
+
+
+def snapshot_all() -> list[CircuitSnapshot]:
+    """알려진 소스 + 생성된 breaker 전부의 현재 상태 (소스 이름 순)."""
+    for source in KNOWN_SOURCES:
+        get_breaker(source)
+    with _REGISTRY_LOCK:
+        breakers = sorted(_REGISTRY.values(), key=lambda b: b.source)
+    return [b.snapshot() for b in breakers]
+
+
+def reset_all_for_tests() -> None:
+    with _REGISTRY_LOCK:
+        _REGISTRY.clear()
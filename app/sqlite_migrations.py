@@ -0,0 +1,128 @@
+"""SQLite 스키마 마이그레이션 runner — `PRAGMA user_version` 기준 (2026-10).
+
+배경: store 마다 connection / 첫 사용 시점에 `CREATE TABLE IF NOT EXISTS` 묶음,
+`PRAGMA table_info` 확인 후 ALTER 를 반복했다 (decision_evidence_store 의
+`_migrate_*`, etf_constituents_store `_migrate_add_naver_columns` 등). 일부
+store 는 connection 마다 init 을 다시 돌렸다.
+
+본 모듈 정책:
+- DB 파일 1개 = `Schema` 1개 = 순서 있는 `Migration` 목록. version 은 1부터
+  연속 정수이며 추가만 한다 (적용된 step 의 내용은 바꾸지 않는다).
+- `PRAGMA user_version` 이 마지막 적용 version. 그보다 큰 step 만 실행하고,
+  최신이면 아무 probe 도 하지 않는다.
+- step 1개 = `BEGIN IMMEDIATE` 트랜잭션 1개 (step 본문 + user_version 갱신).
+  write lock 획득 후 user_version 을 다시 읽으므로 여러 thread / process 가
+  동시에 실행해도 각 step 은 정확히 1번만 적용된다.
+- user_version 0 인 기존 DB 는 step 1 부터 실행된다. 그래서 이미 운영 중인
+  스키마를 다루는 step 은 기존 `IF NOT EXISTS` / 컬럼 확인 로직을 유지한다
+  (그 확인은 step 적용 때 1번만 일어난다).
+- `ensure_migrated` 는 (schema, 경로) 단위 process 캐시 — 요청 경로 비용은
+  set 조회 + 파일 존재 확인뿐이다.
+
+스키마 정의는 app.sqlite_schemas, 기동 시 실행은 app.api `_lifespan`.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+BUSY_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+@dataclass(frozen=True)
+class Schema:
+    name: str
+    migrations: tuple[Migration, ...]
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+
+class MigrationError(RuntimeError):
+    """스키마 정의 오류 또는 DB 가 코드보다 새 버전인 경우."""
+
+
+_LOCK = threading.Lock()
+_MIGRATED: set[tuple[str, str]] = set()
+
+
+def _validate(schema: Schema) -> None:
+    versions = [m.version for m in schema.migrations]
+    if versions != list(range(1, len(versions) + 1)):
+        raise MigrationError(
+            f"{schema.name}: migration versions must be 1..N, got {versions}"
+        )
+
+
+def current_version(con: sqlite3.Connection) -> int:
+    return int(con.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(db_path: Path, schema: Schema) -> list[str]:
+    """미적용 step 을 순서대로 적용하고 적용한 step 이름 목록을 반환."""
+    _validate(schema)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(
+        str(db_path), timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+    )
+    applied: list[str] = []
+    try:
+        version = current_version(con)
+        if version > schema.latest_version:
+            raise MigrationError(
+                f"{schema.name}: db user_version {version} is newer than "
+                f"code ({schema.latest_version}) — {db_path}"
+            )
+        for step in schema.migrations:
+            if step.version <= version:
+                continue
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                # lock 획득 사이 다른 thread / process 가 적용했을 수 있다.
+                version = current_version(con)
+                if step.version <= version:
+                    con.execute("COMMIT")
+                    continue
+                step.apply(con)
+                con.execute(f"PRAGMA user_version = {int(step.version)}")
+                con.execute("COMMIT")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+            version = step.version
+            applied.append(step.name)
+    finally:
+        con.close()
+    return applied
+
+
+def ensure_migrated(db_path: Path, schema: Schema) -> None:
+    """process 안에서 (schema, 경로) 당 1번만 migrate. 파일이 사라지면 다시 실행."""
+    key = (schema.name, os.path.abspath(str(db_path)))
+    if key in _MIGRATED and os.path.exists(key[1]):
+        return
+    migrate(db_path, schema)
+    with _LOCK:
+        _MIGRATED.add(key)
+
+
+def reset_cache_for_tests(schema_name: Optional[str] = None) -> None:
+    with _LOCK:
+        if schema_name is None:
+            _MIGRATED.clear()
+            return
+        for key in [k for k in _MIGRATED if k[0] == schema_name]:
+            _MIGRATED.discard(key)
@@ -0,0 +1,377 @@
+"""SQLite 공유 connection 관리자 (2026-10).
+
+배경: market_data_store / etf_nav_store / etf_constituents_store /
+market_benchmark_store / ml_feature_store / decision_evidence_store /
+runtime_state_db 의 `_connection` 은 helper 호출마다 `sqlite3.connect` 를 열고
+닫았다. `/holdings/market-evidence` 요청 1건이 connection 을 수십 개 연다.
+
+본 모듈 정책:
+- 읽기 connection: (thread, DB 경로) 당 1개를 재사용한다. thread 별 entry 는
+  threading.local 에만 두고, thread 가 끝나면 weakref.finalize 로 닫는다 —
+  anyio worker 처럼 생겼다 사라지는 thread 가 connection / fd 를 남기지 않는다.
+- 쓰기 connection: DB 경로당 1개. 경로별 RLock 으로 직렬화한다 (write=True).
+- connection 을 처음 열 때 1회만 PRAGMA 설정: journal_mode=WAL, mmap_size,
+  cache_size, temp_store=MEMORY, busy_timeout.
+- `with pooled_connection(path) as con` 의미는 기존 `_connection` 과 같다 —
+  정상 종료 시 commit, 예외 시 rollback. 같은 thread 에서 중첩 사용하면 같은
+  connection 을 돌려주고 가장 바깥 블록만 commit / rollback 한다.
+- DB 파일이 교체 / 삭제되면 (inode 변경) 다음 acquire 때 다시 연다.
+- close_all(): 모든 connection 을 닫는다 (테스트 격리 / 측정 스크립트).
+- close_path(): 경로 1개를 retire 한다 (임시 DB / 지난 snapshot 삭제 전). writer 와
+  호출 thread 의 connection 만 바로 닫는다. 다른 thread 의 읽기 connection 은 조회
+  중일 수 있으므로 닫지 않고 generation 만 올린다 — 그 thread 가 다음 acquire 때
+  스스로 닫는다 (thread 가 먼저 끝나면 finalize). POSIX 에서는 삭제된 파일도 열린
+  connection 으로 끝까지 읽힌다.
+- checkpoint(): WAL 내용을 DB 파일에 반영 (파일 복사 전).
+- pool_stats(): 열린 connection 수, 누적 open / reuse, acquire 지연 (ms).
+  열린 읽기 connection 목록 (`_READ_CONNS`) 은 weakref 만 가진다 — 집계 /
+  close_all 용이고 connection 수명을 붙잡지 않는다.
+- register_immutable(): 이후 내용이 바뀌지 않는 파일 (app.market_data_snapshot
+  의 발행 snapshot) 은 `mode=ro&immutable=1` URI 로 연다 — lock / WAL / 변경
+  감지 없이 읽고, journal_mode 등 쓰기성 PRAGMA 는 건너뛴다 (2026-10).
+
+connection 은 check_same_thread=False 로 연다 — close_all 과 thread 종료
+finalize (GC 가 다른 thread 에서 돌 수 있음) 가 남의 connection 을 닫기 때문이다.
+close_path 는 남의 읽기 connection 을 닫지 않는다.
+실제 사용은 위 규칙대로 thread 당 1개 (읽기) 또는 lock 보유 중 1개 (쓰기) 로
+제한된다.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+CACHE_SIZE_KIB = 16 * 1024  # PRAGMA cache_size 음수 = KiB 단위.
+BUSY_TIMEOUT_MS = 5000
+
+PathLike = Union[str, Path]
+
+
+@dataclass(eq=False)
+class _Entry:
+    key: str
+    con: sqlite3.Connection
+    file_id: Optional[tuple[int, int]]
+    generation: tuple[int, int]
+    depth: int = 0
+
+
+@dataclass
+class PoolStats:
+    open_read_connections: int
+    open_write_connections: int
+    opened_total: int
+    reopened_total: int
+    reused_total: int
+    acquire_count: int
+    acquire_ms_avg: float
+    acquire_ms_max: float
+
+
+_LOCK = threading.Lock()
+_LOCAL = threading.local()
+_GENERATION = 0
+_PATH_GENERATION: dict[str, int] = {}
+_RETIRE_SEQ = 0  # close_path 횟수 — thread 가 자기 retire 된 entry 를 정리할 시점.
+_READ_CONNS: "weakref.WeakSet[_Entry]" = weakref.WeakSet()
+_WRITERS: dict[str, _Entry] = {}
+_WRITE_LOCKS: dict[str, threading.RLock] = {}
+_IMMUTABLE: set[str] = set()
+_COUNTERS = {
+    "opened": 0,
+    "reopened": 0,
+    "reused": 0,
+    "acquire_count": 0,
+    "acquire_seconds_total": 0.0,
+    "acquire_seconds_max": 0.0,
+}
+
+
+def _key(db_path: PathLike) -> str:
+    return os.path.abspath(str(db_path))
+
+
+def _file_id(key: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(key)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _open(key: str) -> sqlite3.Connection:
+    if key in _IMMUTABLE:
+        con = sqlite3.connect(
+            f"{Path(key).as_uri()}?mode=ro&immutable=1",
+            uri=True,
+            check_same_thread=False,
+        )
+        con.execute(f"PRAGMA mmap_size={int(MMAP_SIZE_BYTES)}")
+        con.execute(f"PRAGMA cache_size=-{int(CACHE_SIZE_KIB)}")
+        con.execute("PRAGMA temp_store=MEMORY")
+        return con
+    con = sqlite3.connect(key, check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute(f"PRAGMA mmap_size={int(MMAP_SIZE_BYTES)}")
+    con.execute(f"PRAGMA cache_size=-{int(CACHE_SIZE_KIB)}")
+    con.execute("PRAGMA temp_store=MEMORY")
+    con.execute(f"PRAGMA busy_timeout={int(BUSY_TIMEOUT_MS)}")
+    return con
+
+
+def _close_quietly(con: sqlite3.Connection) -> None:
+    try:
+        con.close()
+    except sqlite3.Error:
+        pass
+
+
+def _record_acquire(started: float) -> None:
+    elapsed = time.perf_counter() - started
+    with _LOCK:
+        _COUNTERS["acquire_count"] += 1
+        _COUNTERS["acquire_seconds_total"] += elapsed
+        if elapsed > _COUNTERS["acquire_seconds_max"]:
+            _COUNTERS["acquire_seconds_max"] = elapsed
+
+
+def _generation(key: str) -> tuple[int, int]:
+    return (_GENERATION, _PATH_GENERATION.get(key, 0))
+
+
+def _valid(entry: Optional[_Entry], key: str) -> bool:
+    """재사용 가능 여부 — close_all / close_path 이후 / 파일 교체 시 False."""
+    if entry is None:
+        return False
+    if entry.depth > 0:
+        # 사용 중인 중첩 블록 — retire / 교체되어도 바깥 블록이 끝날 때까지 유지.
+        return True
+    if entry.generation != _generation(key):
+        return False
+    return entry.file_id is not None and entry.file_id == _file_id(key)
+
+
+def _fresh_entry(key: str, previous: Optional[_Entry]) -> _Entry:
+    con = _open(key)
+    with _LOCK:
+        _COUNTERS["opened"] += 1
+        if previous is not None:
+            _COUNTERS["reopened"] += 1
+        generation = _generation(key)
+    return _Entry(key=key, con=con, file_id=_file_id(key), generation=generation)
+
+
+class _ThreadConns:
+    """thread 1개의 읽기 entry (경로 → _Entry). threading.local 에만 둔다."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, _Entry] = {}
+        self.retire_seen = _RETIRE_SEQ
+        # thread 가 끝나 local 이 이 객체를 버리면 그 thread 의 connection 을 닫는다.
+        weakref.finalize(self, _close_entries, self.entries)
+
+
+def _close_entries(entries: dict[str, _Entry]) -> None:
+    for entry in list(entries.values()):
+        _forget_read(entry)
+    entries.clear()
+
+
+def _thread_conns() -> _ThreadConns:
+    holder: Optional[_ThreadConns] = getattr(_LOCAL, "holder", None)
+    if holder is None:
+        holder = _ThreadConns()
+        _LOCAL.holder = holder
+    return holder
+
+
+def _drop_retired(holder: _ThreadConns) -> None:
+    """다른 thread 가 close_path 로 retire 한 경로의 이 thread connection 을 닫는다."""
+    holder.retire_seen = _RETIRE_SEQ
+    for key, entry in list(holder.entries.items()):
+        if entry.depth == 0 and entry.generation != _generation(key):
+            del holder.entries[key]
+            _forget_read(entry)
+
+
+def _read_entry(key: str) -> _Entry:
+    holder = _thread_conns()
+    if holder.retire_seen != _RETIRE_SEQ:
+        _drop_retired(holder)
+    conns = holder.entries
+    entry = conns.get(key)
+    if _valid(entry, key):
+        with _LOCK:
+            _COUNTERS["reused"] += 1
+        return entry
+    if entry is not None:
+        _forget_read(entry)
+    entry = _fresh_entry(key, entry)
+    with _LOCK:
+        _READ_CONNS.add(entry)
+    conns[key] = entry
+    return entry
+
+
+def _forget_read(entry: _Entry) -> None:
+    with _LOCK:
+        _READ_CONNS.discard(entry)
+    _close_quietly(entry.con)
+
+
+def _write_lock(key: str) -> threading.RLock:
+    with _LOCK:
+        lock = _WRITE_LOCKS.get(key)
+        if lock is None:
+            lock = threading.RLock()
+            _WRITE_LOCKS[key] = lock
+        return lock
+
+
+def _write_entry(key: str) -> _Entry:
+    """경로별 writer. 호출자가 write lock 을 보유한 상태에서만 호출."""
+    entry = _WRITERS.get(key)
+    if _valid(entry, key):
+        with _LOCK:
+            _COUNTERS["reused"] += 1
+        return entry
+    if entry is not None and entry.generation == _generation(key):
+        _close_quietly(entry.con)
+    entry = _fresh_entry(key, entry)
+    _WRITERS[key] = entry
+    return entry
+
+
+@contextmanager
+def _scoped(entry: _Entry) -> Iterator[sqlite3.Connection]:
+    entry.depth += 1
+    try:
+        yield entry.con
+    except BaseException:
+        entry.depth -= 1
+        if entry.depth == 0:
+            entry.con.rollback()
+        raise
+    entry.depth -= 1
+    if entry.depth == 0:
+        entry.con.commit()
+
+
+@contextmanager
+def pooled_connection(
+    db_path: PathLike, *, write: bool = False
+) -> Iterator[sqlite3.Connection]:
+    """공유 connection. 정상 종료 시 commit, 예외 시 rollback.
+
+    write=True 면 경로별 writer connection 을 lock 아래에서 사용한다.
+    """
+    key = _key(db_path)
+    started = time.perf_counter()
+    if not write:
+        entry = _read_entry(key)
+        _record_acquire(started)
+        with _scoped(entry) as con:
+            yield con
+        return
+    lock = _write_lock(key)
+    with lock:
+        entry = _write_entry(key)
+        _record_acquire(started)
+        with _scoped(entry) as con:
+            yield con
+
+
+def register_immutable(db_path: PathLike) -> None:
+    """db_path 를 읽기 전용 immutable 로 연다. 등록 후 파일 내용을 바꾸면 안 된다."""
+    with _LOCK:
+        _IMMUTABLE.add(_key(db_path))
+
+
+def forget_immutable(db_path: PathLike) -> None:
+    """immutable 등록 해제 + close_path (snapshot 파일 삭제 전)."""
+    close_path(db_path)
+    with _LOCK:
+        _IMMUTABLE.discard(_key(db_path))
+
+
+def checkpoint(db_path: PathLike) -> None:
+    """WAL 내용을 본 DB 파일에 반영 — 파일을 복사하기 전에 호출."""
+    with pooled_connection(db_path, write=True) as con:
+        con.commit()
+        con.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def close_all() -> None:
+    """열린 모든 connection 을 닫는다. 다른 thread 의 읽기 connection 은 다음
+    acquire 때 generation 불일치로 새로 열린다."""
+    global _GENERATION
+    with _LOCK:
+        _GENERATION += 1
+        read_entries = list(_READ_CONNS)
+        _READ_CONNS.clear()
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for entry in read_entries + writers:
+        _close_quietly(entry.con)
+    _thread_conns().entries.clear()
+
+
+def close_path(db_path: PathLike) -> None:
+    """경로 1개를 retire 한다 (임시 DB / 지난 snapshot 삭제 전).
+
+    writer (lock 아래에서) 와 호출 thread 의 읽기 connection 은 바로 닫는다. 다른
+    thread 의 읽기 connection 은 조회 / streaming 중일 수 있으므로 닫지 않는다 —
+    각 thread 가 다음 acquire 때 generation 불일치를 보고 스스로 닫는다.
+    """
+    global _RETIRE_SEQ
+    key = _key(db_path)
+    with _LOCK:
+        _PATH_GENERATION[key] = _PATH_GENERATION.get(key, 0) + 1
+        _RETIRE_SEQ += 1
+        lock = _WRITE_LOCKS.get(key)
+    if lock is not None:
+        with lock:
+            with _LOCK:
+                writer = _WRITERS.pop(key, None)
+            if writer is not None:
+                _close_quietly(writer.con)
+    conns = _thread_conns().entries
+    entry = conns.get(key)
+    if entry is not None and entry.depth == 0:
+        del conns[key]
+        _forget_read(entry)
+
+
+def pool_stats() -> PoolStats:
+    with _LOCK:
+        count = _COUNTERS["acquire_count"]
+        avg = _COUNTERS["acquire_seconds_total"] / count if count else 0.0
+        return PoolStats(
+            open_read_connections=len(_READ_CONNS),
+            open_write_connections=len(_WRITERS),
+            opened_total=_COUNTERS["opened"],
+            reopened_total=_COUNTERS["reopened"],
+            reused_total=_COUNTERS["reused"],
+            acquire_count=count,
+            acquire_ms_avg=round(avg * 1000, 4),
+            acquire_ms_max=round(_COUNTERS["acquire_seconds_max"] * 1000, 4),
+        )
+
+
+def reset_for_tests() -> None:
+    close_all()
+    with _LOCK:
+        _IMMUTABLE.clear()
+        for k in ("opened", "reopened", "reused", "acquire_count"):
+            _COUNTERS[k] = 0
+        _COUNTERS["acquire_seconds_total"] = 0.0
+        _COUNTERS["acquire_seconds_max"] = 0.0
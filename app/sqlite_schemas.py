@@ -0,0 +1,217 @@
+"""SQLite DB 파일별 마이그레이션 정의 (2026-10).
+
+DB 파일 4개, 각각 `app.sqlite_migrations.Schema` 1개:
+- market_data.sqlite — market_data_store / etf_nav_store / etf_constituents_store /
+  market_benchmark_store / ml_feature_store 가 공유. 어느 store 가 먼저 열어도
+  파일 전체 스키마가 함께 맞춰진다 (user_version 은 파일 단위).
+- decision_evidence.sqlite — decision_evidence_store.
+- runtime_state.sqlite — runtime_state_db.
+- runs.sqlite — app.store (POC1 run, 2026-10 JSON 파일에서 이전).
+
+step 1 은 2026-10 이전까지 각 store init 이 하던 일을 그대로 옮긴 것이다. 새
+스키마 변경은 목록 끝에 step 을 추가한다.
+
+store 모듈은 본 모듈을 함수 안에서 import 한다 (본 모듈이 store 의 DDL 을
+import 하므로 순환 회피).
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Callable
+
+from app import (
+    dashboard_snapshot,
+    decision_evidence_store,
+    etf_constituents_store,
+    etf_nav_store,
+    market_benchmark_store,
+    market_data_stats,
+    market_data_store,
+    ml_feature_store,
+    runtime_state_db,
+    store,
+)
+from app.market_data_indexes import drop_legacy_migration_table, ensure_all_indexes
+from app.sqlite_migrations import Migration, Schema, ensure_migrated, migrate
+
+logger = logging.getLogger(__name__)
+
+
+def _ddl(*statements: str) -> Callable[[sqlite3.Connection], None]:
+    def apply(con: sqlite3.Connection) -> None:
+        for sql in statements:
+            con.execute(sql)
+
+    return apply
+
+
+def _constituents(con: sqlite3.Connection) -> None:
+    con.execute(etf_constituents_store.ETF_CONSTITUENTS_DDL)
+    con.execute(etf_constituents_store.ETF_CONSTITUENT_REFRESH_LOG_DDL)
+    # 2026-05-31 이전 DB — Naver 4 컬럼 보강 (step 적용 때 1번만 확인).
+    etf_constituents_store._migrate_add_naver_columns(con)
+
+
+def _decision_base(con: sqlite3.Connection) -> None:
+    con.execute(decision_evidence_store.AI_SESSION_RECORDS_DDL)
+    decision_evidence_store._migrate_legacy_answer_text(con)
+
+
+def _price_archive_tracking(con: sqlite3.Connection) -> None:
+    # numpy 를 쓰는 모듈 — API 기동 경로에서 import 되지 않도록 step 실행 시점에.
+    from app import price_archive
+
+    price_archive.install_dirty_tracking(con)
+
+
+def _runtime_base(con: sqlite3.Connection) -> None:
+    con.execute("PRAGMA foreign_keys = ON;")
+    for sql in (
+        runtime_state_db.RUNTIME_PARAM_VERSION_DDL,
+        runtime_state_db.RUNTIME_PARAM_VERSION_HASH_INDEX_DDL,
+        runtime_state_db.RUNTIME_PARAM_VALUE_DDL,
+        runtime_state_db.RUNTIME_PARAM_ACTIVE_DDL,
+        runtime_state_db.RUNTIME_EXECUTION_STATUS_DDL,
+        runtime_state_db.RUNTIME_EXECUTION_STATUS_INDEX_DDL,
+        runtime_state_db.RUNTIME_SENT_REGISTRY_DDL,
+    ):
+        con.execute(sql)
+
+
+MARKET_DATA_SCHEMA = Schema(
+    name="market_data",
+    migrations=(
+        Migration(
+            1,
+            "market_data_base_tables",
+            _ddl(
+                market_data_store.ETF_MASTER_DDL,
+                market_data_store.ETF_DAILY_PRICE_DDL,
+                market_data_store.MARKET_REFRESH_LOG_DDL,
+                market_data_store.MARKET_REFRESH_STATE_DDL,
+                market_data_store.MARKET_TIMESERIES_INGESTION_STATE_DDL,
+                market_data_store.MARKET_TIMESERIES_REFRESH_STATE_DDL,
+            ),
+        ),
+        Migration(2, "etf_nav_daily", _ddl(etf_nav_store.ETF_NAV_DAILY_DDL)),
+        Migration(3, "etf_constituents", _constituents),
+        Migration(
+            4,
+            "market_benchmark_daily_price",
+            _ddl(market_benchmark_store.MARKET_BENCHMARK_DAILY_PRICE_DDL),
+        ),
+        Migration(
+            5,
+            "ml_feature_tables",
+            _ddl(
+                ml_feature_store.ETF_ML_FEATURE_DAILY_DDL,
+                ml_feature_store.MARKET_RISK_FEATURE_DAILY_DDL,
+            ),
+        ),
+        Migration(6, "secondary_indexes", ensure_all_indexes),
+        Migration(7, "price_archive_tracking", _price_archive_tracking),
+        Migration(8, "table_statistics", market_data_stats.install),
+        Migration(
+            9, "dashboard_snapshot", _ddl(dashboard_snapshot.DASHBOARD_SNAPSHOT_DDL)
+        ),
+        Migration(10, "drop_index_migration_ledger", drop_legacy_migration_table),
+    ),
+)
+
+DECISION_EVIDENCE_SCHEMA = Schema(
+    name="decision_evidence",
+    migrations=(
+        Migration(1, "ai_session_records", _decision_base),
+        Migration(
+            2,
+            "market_context_snapshot",
+            decision_evidence_store._migrate_add_market_context_snapshot,
+        ),
+        Migration(
+            3,
+            "constituent_overlap_snapshots",
+            decision_evidence_store._migrate_add_constituent_overlap_snapshots,
+        ),
+        Migration(
+            4,
+            "evidence_closeout_snapshots",
+            decision_evidence_store._migrate_add_evidence_closeout_snapshots,
+        ),
+        Migration(
+            5,
+            "ml_baseline_evidence_snapshot",
+            decision_evidence_store._migrate_add_ml_baseline_evidence_snapshot,
+        ),
+        Migration(
+            6,
+            "list_projection_columns",
+            decision_evidence_store._migrate_add_list_projection,
+        ),
+    ),
+)
+
+RUNTIME_STATE_SCHEMA = Schema(
+    name="runtime_state",
+    migrations=(Migration(1, "runtime_state_tables", _runtime_base),),
+)
+
+RUN_STORE_SCHEMA = Schema(
+    name="runs",
+    migrations=(
+        Migration(
+            1,
+            "runs_table",
+            _ddl(store.RUNS_DDL, store.RUNS_STATUS_INDEX_DDL, store.RUNS_REV_INDEX_DDL),
+        ),
+        Migration(2, "import_json_runs", store.import_json_runs),
+    ),
+)
+
+
+def ensure_market_data(db_path: Path) -> None:
+    ensure_migrated(db_path, MARKET_DATA_SCHEMA)
+
+
+def ensure_decision_evidence(db_path: Path) -> None:
+    ensure_migrated(db_path, DECISION_EVIDENCE_SCHEMA)
+
+
+def ensure_runtime_state(db_path: Path) -> None:
+    ensure_migrated(db_path, RUNTIME_STATE_SCHEMA)
+
+
+def ensure_run_store(db_path: Path) -> None:
+    ensure_migrated(db_path, RUN_STORE_SCHEMA)
+
+
+def _default_targets() -> list[tuple[Schema, Path]]:
+    # module 속성을 호출 시점에 읽는다 — 테스트의 DEFAULT_DB_PATH monkeypatch 호환.
+    return [
+        (MARKET_DATA_SCHEMA, market_data_store.DEFAULT_DB_PATH),
+        (DECISION_EVIDENCE_SCHEMA, decision_evidence_store.DEFAULT_DB_PATH),
+        (RUNTIME_STATE_SCHEMA, runtime_state_db.DEFAULT_DB_PATH),
+        (RUN_STORE_SCHEMA, store.db_path()),
+    ]
+
+
+def migrate_existing_databases() -> dict[str, list[str]]:
+    """기동 시 1회 — 이미 있는 기본 DB 파일만 최신 version 으로 올린다.
+
+    없는 파일은 만들지 않는다 (각 store 의 첫 사용 시점에 생성 + migrate).
+    schema 이름 → 적용한 step 이름 목록. 실패한 schema 는 로그만 남기고 건너뛴다.
+    """
+    result: dict[str, list[str]] = {}
+    for schema, path in _default_targets():
+        if not path.exists():
+            continue
+        try:
+            result[schema.name] = migrate(path, schema)
+            ensure_migrated(path, schema)
+        except (sqlite3.Error, RuntimeError) as e:
+            logger.warning(
+                "SQLite 마이그레이션 실패 (%s, %s): %s", schema.name, path, e
+            )
+    return result
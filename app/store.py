@@ -1,7 +1,23 @@
-"""JSON 파일 기반 run 저장소.
+"""run 저장소 — state/runs/runs.sqlite (2026-10 부터).
 
-state/runs/{run_id}.json 형태로 보관. POC 단계이므로 가벼운 파일 IO 만 사용.
-MongoDB/SQLite 도입은 금지 (KS-9, 이식금지 1번 준수).
+2026-10 변경: run 1건 = `state/runs/{run_id}.json` 1파일 구조에서 SQLite 테이블
+1개로 옮겼다. 기존 구조는 `list_runs()` 가 매 `GET /runs` 마다 디렉터리 전체를
+glob / 정렬 / 파싱했고, 목록 비용이 누적 run 수에 비례했다.
+초기 docstring 의 "MongoDB/SQLite 도입 금지 (KS-9)" 는 POC 초기 복잡도 통제였다.
+이후 store 대부분이 SQLite (app.sqlite_pool / app.sqlite_migrations) 로 정리되어
+같은 인프라를 재사용한다 — 별도 서버 / ORM 없음.
+
+- `save` / `load` / `list_runs` 시그니처와 의미는 그대로 (load 미존재 → KeyError,
+  list_runs 는 run_id 내림차순 전체).
+- `list_runs_page` — run_id 내림차순 keyset 페이지 + status 필터
+  (idx_runs_status_run_id). 비용은 limit 에만 비례.
+- `list_runs_changed_since` — save 마다 증가하는 rev 기준 증분 조회.
+- JSON 디렉터리 import: 스키마 step 2 (`import_json_runs`) 가 DB 생성 시 1번
+  STORE_DIR 의 *.json 을 가져온다. 원본 파일은 그대로 둔다 (백업). 이후
+  DB 에 없는 run_id 를 load 하면 같은 이름의 JSON 파일을 1건 import 한다.
+  다른 디렉터리는 `import_json_dir` / scripts/import_json_runs.py.
+
+DB 경로는 호출 시점의 STORE_DIR 기준 (테스트의 monkeypatch 호환).
 
 POC1 Step 3 추가:
 - HANDOFF_STAGING_DIR: SCP 전송 전 로컬에 임시로 만드는 handoff artifact
@@ -11,44 +27,203 @@ POC1 Step 3 추가:
 from __future__ import annotations
 
 import json
+import logging
+import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from app.models import Run
+from app.sqlite_pool import pooled_connection
+
+logger = logging.getLogger(__name__)
 
 STORE_DIR = Path("state/runs")
 HANDOFF_STAGING_DIR = Path("state/poc1_handoff")
 HANDOFF_PROCESSED_DIR = Path("state/poc1_handoff_processed")
 
+RUNS_DB_NAME = "runs.sqlite"
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
 
-def _ensure_dir() -> None:
-    STORE_DIR.mkdir(parents=True, exist_ok=True)
+RUNS_DDL = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    asof        TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    push_kind   TEXT,
+    rev         INTEGER NOT NULL,
+    run_json    TEXT NOT NULL
+)
+""".strip()
 
+RUNS_STATUS_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS idx_runs_status_run_id ON runs (status, run_id)"
+)
+RUNS_REV_INDEX_DDL = "CREATE INDEX IF NOT EXISTS idx_runs_rev ON runs (rev)"
 
-def save(run: Run) -> None:
-    _ensure_dir()
-    path = STORE_DIR / f"{run.run_id}.json"
-    path.write_text(
-        json.dumps(run.to_dict(), indent=2, ensure_ascii=False),
-        encoding="utf-8",
+_UPSERT_SQL = (
+    "INSERT INTO runs (run_id, asof, status, push_kind, rev, run_json) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(run_id) DO UPDATE SET asof = excluded.asof, "
+    "status = excluded.status, push_kind = excluded.push_kind, "
+    "rev = excluded.rev, run_json = excluded.run_json"
+)
+_INSERT_IGNORE_SQL = (
+    "INSERT OR IGNORE INTO runs (run_id, asof, status, push_kind, rev, run_json) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+def db_path() -> Path:
+    return STORE_DIR / RUNS_DB_NAME
+
+
+@contextmanager
+def _connection(*, write: bool = False) -> Iterator[sqlite3.Connection]:
+    from app import sqlite_schemas
+
+    path = db_path()
+    sqlite_schemas.ensure_run_store(path)
+    with pooled_connection(path, write=write) as con:
+        yield con
+
+
+def _next_rev(con: sqlite3.Connection) -> int:
+    """다음 rev. 같은 트랜잭션에서 이어지는 쓰기가 이 rev 를 써야 한다.
+
+    in-process writer lock 은 다른 process (run 을 쓰는 CLI) 를 막지 못한다 —
+    MAX(rev) 조회 전에 DB write lock (BEGIN IMMEDIATE) 을 잡아 rev 할당과 commit
+    순서를 process 간에도 맞춘다. 그래야 list_runs_changed_since 가 행을 건너뛰지
+    않는다.
+    """
+    if not con.in_transaction:
+        con.execute("BEGIN IMMEDIATE")
+    return int(con.execute("SELECT COALESCE(MAX(rev), 0) + 1 FROM runs").fetchone()[0])
+
+
+def _row(run: Run, rev: int) -> tuple[Any, ...]:
+    return (
+        run.run_id,
+        run.asof,
+        run.status,
+        run.push_kind,
+        rev,
+        json.dumps(run.to_dict(), ensure_ascii=False, separators=(",", ":")),
     )
 
 
+def _read_json_run(path: Path) -> Optional[Run]:
+    try:
+        return Run.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("run JSON import 건너뜀 (%s): %s", path, e)
+        return None
+
+
+def _import_json_files(con: sqlite3.Connection, paths: list[Path]) -> int:
+    """JSON run 파일 → runs. 이미 있는 run_id 는 덮어쓰지 않는다."""
+    imported = 0
+    rev = _next_rev(con)
+    # 파일명 오름차순 = 과거 run 부터 — rev 순서가 생성 순서와 대체로 맞는다.
+    for path in sorted(paths):
+        run = _read_json_run(path)
+        if run is None:
+            continue
+        cur = con.execute(_INSERT_IGNORE_SQL, _row(run, rev))
+        if cur.rowcount:
+            imported += 1
+            rev += 1
+    return imported
+
+
+def import_json_runs(con: sqlite3.Connection) -> None:
+    """스키마 step — DB 파일과 같은 디렉터리의 *.json 을 1번 가져온다."""
+    # migration step 은 connection 만 받으므로 DB 파일 위치는 connection 에서 읽는다.
+    main_file = con.execute("PRAGMA database_list").fetchone()[2]
+    if not main_file:
+        return
+    paths = list(Path(main_file).parent.glob("*.json"))
+    imported = _import_json_files(con, paths)
+    if imported:
+        logger.info("run JSON %d건 import (%s)", imported, Path(main_file).parent)
+
+
+def import_json_dir(json_dir: Path) -> int:
+    """다른 디렉터리의 JSON run 을 현재 STORE_DIR DB 로 import. import 건수 반환."""
+    with _connection(write=True) as con:
+        return _import_json_files(con, list(Path(json_dir).glob("*.json")))
+
+
+def save(run: Run) -> None:
+    with _connection(write=True) as con:
+        con.execute(_UPSERT_SQL, _row(run, _next_rev(con)))
+
+
 def load(run_id: str) -> Run:
+    with _connection() as con:
+        row = con.execute(
+            "SELECT run_json FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+    if row is not None:
+        return Run.from_dict(json.loads(row[0]))
+    # DB 생성 이후 디렉터리에 놓인 JSON (수동 복원 등) — 1건만 import.
     path = STORE_DIR / f"{run_id}.json"
-    if not path.exists():
-        raise KeyError(f"run_id not found: {run_id}")
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return Run.from_dict(data)
+    if path.exists():
+        with _connection(write=True) as con:
+            _import_json_files(con, [path])
+        run = _read_json_run(path)
+        if run is not None:
+            return run
+    raise KeyError(f"run_id not found: {run_id}")
+
+
+def _runs(rows: list[tuple[str]]) -> list[Run]:
+    return [Run.from_dict(json.loads(r[0])) for r in rows]
 
 
 def list_runs() -> list[Run]:
-    _ensure_dir()
-    runs: list[Run] = []
-    for p in sorted(STORE_DIR.glob("*.json"), reverse=True):
-        data = json.loads(p.read_text(encoding="utf-8"))
-        runs.append(Run.from_dict(data))
-    return runs
+    with _connection() as con:
+        rows = con.execute("SELECT run_json FROM runs ORDER BY run_id DESC").fetchall()
+    return _runs(rows)
+
+
+def list_runs_page(
+    *,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    before: Optional[str] = None,
+    status: Optional[str] = None,
+) -> list[Run]:
+    """run_id 내림차순 최대 limit 건. before = 직전 페이지 마지막 run_id."""
+    where: list[str] = []
+    params: list[Any] = []
+    if status is not None:
+        where.append("status = ?")
+        params.append(status)
+    if before is not None:
+        where.append("run_id < ?")
+        params.append(before)
+    sql = "SELECT run_json FROM runs"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY run_id DESC LIMIT ?"
+    params.append(int(limit))
+    with _connection() as con:
+        rows = con.execute(sql, params).fetchall()
+    return _runs(rows)
+
+
+def list_runs_changed_since(
+    rev: int, *, limit: int = MAX_PAGE_LIMIT
+) -> tuple[list[Run], int]:
+    """rev 이후 저장된 run (rev 오름차순) + 다음 호출에 넘길 rev."""
+    with _connection() as con:
+        rows = con.execute(
+            "SELECT run_json, rev FROM runs WHERE rev > ? ORDER BY rev LIMIT ?",
+            (int(rev), int(limit)),
+        ).fetchall()
+    next_rev = int(rows[-1][1]) if rows else int(rev)
+    return _runs(rows), next_rev
 
 
 def write_handoff_artifact(
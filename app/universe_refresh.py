@@ -2,12 +2,16 @@
 
 설계자 결정 (Step 6 §7):
 - 동기 수동 refresh. 백그라운드 워커 / 스케줄러 / 재시도 루프 절대 미도입.
-- MAX_UNIVERSE_ITEMS_PER_REFRESH = 20 — seed items 20개 초과 시 hard fail.
-- PYKRX_PER_TICKER_DELAY_SECONDS = 0.5 — ticker 별 호출 사이 delay.
+- MAX_UNIVERSE_ITEMS_PER_REFRESH — seed items cap. 초과 시 hard fail.
+  (2026-10 SQLite 우선 + 동시 scoring 도입으로 20 → 100 상향.)
+- PYKRX_PER_TICKER_DELAY_SECONDS = 0.5 — ticker 별 호출 사이 delay (순차 경로).
 - UNIVERSE_REFRESH_TIME_BUDGET_SECONDS = 30 — 전체 budget. 초과 시 남은 후보 미계산
   처리하고 partial 결과 저장.
 - candidate 단위 실패 격리 — 한 ticker 실패가 전체 refresh 를 중단하지 않는다.
 - pykrx 호출은 app.price_history_pykrx 의 fetch_one_month_basis 만 사용한다.
+- fetcher 미주입 (기본 pykrx 경로) 시 app.universe_refresh_concurrent 의 동시
+  scorer 를 쓴다 — SQLite 에 이미 있는 ticker 는 네트워크 없이 basis 를 얻고,
+  나머지만 rate limiter 아래 pykrx 동시 호출.
 
 역할 경계:
 - 본 모듈은 seed → candidate scoring → momentum_result 조립까지 담당.
@@ -33,10 +37,22 @@ from app.price_history_pykrx import (
 from app.universe_seed import UniverseSeed, UniverseSeedItem
 
 # Step 6 §7 고정값.
-MAX_UNIVERSE_ITEMS_PER_REFRESH = 20
+# 2026-10 — SQLite 우선 basis + pykrx 동시 호출로 같은 30s budget 이 훨씬 큰 seed 를
+# 소화하므로 cap 을 20 → 100 으로 상향.
+MAX_UNIVERSE_ITEMS_PER_REFRESH = 100
 PYKRX_PER_TICKER_DELAY_SECONDS = 0.5
 UNIVERSE_REFRESH_TIME_BUDGET_SECONDS = 30.0
 
+# 2026-10 동시 scorer (app.universe_refresh_concurrent) 설정.
+# - PYKRX_CONCURRENT_WORKERS: pykrx 동시 호출 worker 수.
+# - PYKRX_MIN_CALL_INTERVAL_SECONDS: worker 전체 공유 rate limiter — pykrx 호출
+#   시작 시각 사이 최소 간격 (초당 최대 4회).
+# - SQLITE_BASIS_MAX_STALE_DAYS: SQLite basis 의 latest_date 가 asof 보다 이 일수
+#   이상 오래되면 stale 로 보고 pykrx 로 넘긴다 (연휴 포함 여유).
+PYKRX_CONCURRENT_WORKERS = 4
+PYKRX_MIN_CALL_INTERVAL_SECONDS = 0.25
+SQLITE_BASIS_MAX_STALE_DAYS = 7
+
 # Step 7C §3.2 — 급락 ETF 주의 신호 (PUSH 3) 초기 기준값.
 # **확정값 아님 / 운영 검증 필요** — 너무 민감하면 알림 과다 (KS-5), 너무 둔하면 신호
 # 지연. BACKLOG "급락 임계값 검증" 항목과 연결.
@@ -44,7 +60,7 @@ FALLING_THRESHOLD_PCT = -10.0
 
 
 class UniverseRefreshError(ValueError):
-    """seed-level hard fail (>20 items 등). API layer 가 422 로 변환."""
+    """seed-level hard fail (items cap 초과 등). API layer 가 422 로 변환."""
 
 
 @dataclass
@@ -68,6 +84,8 @@ def _classify_failure(
         return "1개월 전 거래일 데이터 없음"
     if failure.reason == "asof_invalid":
         return "asof 형식 오류"
+    if failure.reason == "circuit_open":
+        return "pykrx 연속 실패로 호출 보류"
     return "pykrx 조회 실패"
 
 
@@ -81,6 +99,51 @@ def _budget_exceeded_score(item: UniverseSeedItem) -> CandidateScore:
     )
 
 
+def fetch_candidate_score(
+    item: UniverseSeedItem,
+    asof: str,
+    fetcher: Callable[[str, str], PriceHistoryResult],
+) -> CandidateScore:
+    """fetcher 1회 호출 → CandidateScore. 예외 / PriceHistoryFailure 는 unscored 로 격리.
+
+    순차 scorer (score_candidates) 와 동시 scorer
+    (app.universe_refresh_concurrent) 가 공유한다.
+    """
+    try:
+        result = fetcher(item.ticker, asof)
+    except Exception as e:  # noqa: BLE001 — 외부 의존 광범위 예외 격리
+        return CandidateScore(
+            item=item,
+            is_scored=False,
+            score_value=None,
+            basis=None,
+            exclusion_reason=f"pykrx 조회 실패: {e}",
+        )
+    return candidate_score_from_result(item, result)
+
+
+def candidate_score_from_result(
+    item: UniverseSeedItem,
+    result: PriceHistoryResult,
+) -> CandidateScore:
+    """PriceHistoryResult → CandidateScore (성공이면 1개월 수익률 계산)."""
+    if isinstance(result, PriceHistoryFailure):
+        return CandidateScore(
+            item=item,
+            is_scored=False,
+            score_value=None,
+            basis=None,
+            exclusion_reason=_classify_failure(result),
+        )
+    return CandidateScore(
+        item=item,
+        is_scored=True,
+        score_value=compute_one_month_return_pct(result),
+        basis=result,
+        exclusion_reason=None,
+    )
+
+
 def score_candidates(
     seed: UniverseSeed,
     fetcher: Optional[Callable[[str, str], PriceHistoryResult]] = None,
@@ -138,43 +201,7 @@ def score_candidates(
                 scores.append(_budget_exceeded_score(item))
                 continue
 
-        try:
-            result = fetcher(item.ticker, seed.asof)
-        except Exception as e:  # noqa: BLE001 — 외부 의존 광범위 예외 격리
-            scores.append(
-                CandidateScore(
-                    item=item,
-                    is_scored=False,
-                    score_value=None,
-                    basis=None,
-                    exclusion_reason=f"pykrx 조회 실패: {e}",
-                )
-            )
-            continue
-
-        if isinstance(result, PriceHistoryFailure):
-            scores.append(
-                CandidateScore(
-                    item=item,
-                    is_scored=False,
-                    score_value=None,
-                    basis=None,
-                    exclusion_reason=_classify_failure(result),
-                )
-            )
-            continue
-
-        # success
-        score_value = compute_one_month_return_pct(result)
-        scores.append(
-            CandidateScore(
-                item=item,
-                is_scored=True,
-                score_value=score_value,
-                basis=result,
-                exclusion_reason=None,
-            )
-        )
+        scores.append(fetch_candidate_score(item, seed.asof, fetcher))
 
     return scores
 
@@ -197,10 +224,11 @@ def determine_refresh_status(scores: list[CandidateScore]) -> str:
 
 
 def validate_seed_for_refresh(seed: UniverseSeed) -> None:
-    """seed-level hard fail 검증 — items 20개 초과 시 UniverseRefreshError.
+    """seed-level hard fail 검증 — items cap 초과 시 UniverseRefreshError.
 
     asof / source / items 형식 검증은 universe_seed.parse_universe_seed 이미 통과.
-    본 함수는 Step 6 §7 의 bounded refresh 정책 (20개 cap) 만 추가 검증한다.
+    본 함수는 Step 6 §7 의 bounded refresh 정책 (MAX_UNIVERSE_ITEMS_PER_REFRESH
+    cap) 만 추가 검증한다.
     """
     if len(seed.items) > MAX_UNIVERSE_ITEMS_PER_REFRESH:
         raise UniverseRefreshError(
@@ -223,7 +251,25 @@ def run_universe_refresh(
     """seed → scores + refresh_status. seed-level hard fail 은 호출 전 차단된 상태 가정.
 
     호출자는 validate_seed_for_refresh(seed) 를 본 함수 호출 전에 수행해야 한다.
+
+    fetcher 미주입 (기본 pykrx 경로) 이면 SQLite 우선 + pykrx 동시 scorer 를 쓴다.
+    fetcher 를 주입한 호출자 (OCI 배치의 SQLite fetcher · 테스트) 는 기존 순차
+    scorer 를 그대로 탄다 — 소스 선택은 호출자 책임.
     """
+    if fetcher is None:
+        # lazy import — 동시 scorer 모듈이 본 모듈의 CandidateScore / 상수를 import.
+        from app.universe_refresh_concurrent import score_candidates_concurrent
+
+        scores = score_candidates_concurrent(
+            seed=seed,
+            sleeper=sleeper,
+            clock=clock,
+            time_budget_seconds=time_budget_seconds,
+            fetch_window_days=fetch_window_days,
+            lookback_days=lookback_days,
+        )
+        return scores, determine_refresh_status(scores)
+
     scores = score_candidates(
         seed=seed,
         fetcher=fetcher,
@@ -0,0 +1,224 @@
+"""Universe momentum — SQLite 우선 + pykrx 동시 scoring (2026-10).
+
+배경: `universe_refresh.score_candidates` 는 ticker 마다 pykrx 를 순차 호출하고
+호출 사이 0.5s delay 를 둔다. 30s budget 안에 15개 안팎만 소화되어 seed cap 이
+20 에 묶여 있었고, 초과분은 time_budget_exceeded 로 남았다.
+
+본 모듈의 scorer:
+1. SQLite 단계 — `etf_daily_price` 에 이미 있는 ticker 는
+   `price_history_sqlite.fetch_one_month_basis_sqlite` 로 네트워크 없이 basis 를
+   얻는다. latest_date 가 asof 대비 SQLITE_BASIS_MAX_STALE_DAYS 이상 오래됐거나
+   basis 를 못 만들면 (no_data / no_base_close 등) pykrx 단계로 넘긴다.
+2. pykrx 단계 — 남은 ticker 만 ThreadPoolExecutor 로 동시 호출. 모든 worker 가
+   하나의 rate limiter 를 공유해 호출 시작 간격을 PYKRX_MIN_CALL_INTERVAL_SECONDS
+   이상으로 유지한다 (외부 호출 폭주 방지).
+
+불변 계약 (순차 scorer 와 동일):
+- 반환 리스트는 seed.items 순서 그대로.
+- budget 초과 ticker 는 time_budget_exceeded. 이미 시작된 pykrx 호출은 취소할 수
+  없으므로 deadline 까지 끝나지 않은 ticker 도 time_budget_exceeded 로 표시한다.
+- candidate 단위 실패 격리 — fetch 예외 / PriceHistoryFailure 는 unscored.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from app.market_data_store import DEFAULT_DB_PATH
+from app.price_history_pykrx import (
+    DEFAULT_FETCH_WINDOW_DAYS,
+    DEFAULT_LOOKBACK_DAYS,
+    PriceHistoryBasis,
+    PriceHistoryResult,
+)
+from app.universe_refresh import (
+    CandidateScore,
+    _budget_exceeded_score,
+    candidate_score_from_result,
+    fetch_candidate_score,
+)
+from app.universe_seed import UniverseSeed
+
+# SQLite 단계가 읽는 DB. 호출 시점 lookup — 테스트는 monkeypatch 로 격리한다.
+SQLITE_DB_PATH = DEFAULT_DB_PATH
+
+
+class PykrxRateLimiter:
+    """worker 공유 rate limiter — 호출 시작 시각 사이 최소 간격을 보장.
+
+    acquire() 는 다음 슬롯을 lock 안에서 예약하고, 대기는 lock 밖에서 한다.
+    예약 슬롯이 deadline 이후면 대기하지 않고 False (budget 초과) 를 반환한다.
+    """
+
+    def __init__(
+        self,
+        min_interval_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._interval = max(0.0, float(min_interval_seconds))
+        self._clock = clock
+        self._sleeper = sleeper
+        self._lock = threading.Lock()
+        self._next_slot: Optional[float] = None
+
+    def acquire(self, deadline: float) -> bool:
+        with self._lock:
+            now = self._clock()
+            slot = now if self._next_slot is None else max(now, self._next_slot)
+            if slot >= deadline:
+                return False
+            self._next_slot = slot + self._interval
+        wait_seconds = slot - now
+        if wait_seconds > 0:
+            self._sleeper(wait_seconds)
+        return True
+
+
+def _default_sqlite_fetcher(
+    fetch_window_days: int, lookback_days: int
+) -> Optional[Callable[[str, str], PriceHistoryResult]]:
+    """SQLITE_DB_PATH 가 실재할 때만 SQLite fetcher 반환 (빈 DB 생성 방지)."""
+    db_path = Path(SQLITE_DB_PATH)
+    if not db_path.exists():
+        return None
+
+    from app.price_history_sqlite import fetch_one_month_basis_sqlite
+
+    def _fetch(ticker: str, asof: str) -> PriceHistoryResult:
+        return fetch_one_month_basis_sqlite(
+            ticker=ticker,
+            asof=asof,
+            fetch_window_days=fetch_window_days,
+            lookback_days=lookback_days,
+            db_path=db_path,
+        )
+
+    return _fetch
+
+
+def _default_network_fetcher(
+    fetch_window_days: int, lookback_days: int
+) -> Callable[[str, str], PriceHistoryResult]:
+    """기본 pykrx fetcher — universe_refresh.fetch_one_month_basis 를 호출 시점 lookup.
+
+    (테스트 conftest 가 universe_refresh 모듈 attribute 를 stub 으로 교체한다.)
+    """
+    from app import universe_refresh as ur
+
+    def _fetch(ticker: str, asof: str) -> PriceHistoryResult:
+        return ur.fetch_one_month_basis(
+            ticker=ticker,
+            asof=asof,
+            fetch_window_days=fetch_window_days,
+            lookback_days=lookback_days,
+        )
+
+    return _fetch
+
+
+def _is_fresh_basis(result: PriceHistoryResult, asof: str, max_stale_days: int) -> bool:
+    if not isinstance(result, PriceHistoryBasis):
+        return False
+    try:
+        asof_date = date.fromisoformat(asof)
+        latest = date.fromisoformat(result.latest_date)
+    except (TypeError, ValueError):
+        return False
+    return latest >= asof_date - timedelta(days=max_stale_days)
+
+
+def score_candidates_concurrent(
+    seed: UniverseSeed,
+    fetcher: Optional[Callable[[str, str], PriceHistoryResult]] = None,
+    sqlite_fetcher: Optional[Callable[[str, str], PriceHistoryResult]] = None,
+    sleeper: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+    max_workers: Optional[int] = None,
+    min_interval_seconds: Optional[float] = None,
+    time_budget_seconds: Optional[float] = None,
+    max_stale_days: Optional[int] = None,
+    use_sqlite: bool = True,
+    fetch_window_days: int = DEFAULT_FETCH_WINDOW_DAYS,
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+) -> list[CandidateScore]:
+    """seed.items 를 SQLite 우선 → pykrx 동시 호출 순으로 scoring.
+
+    fetcher (pykrx) / sqlite_fetcher / sleeper / clock 는 테스트 주입용. 기본값은
+    실제 pykrx + SQLITE_DB_PATH (파일이 없으면 SQLite 단계 생략).
+    workers / interval / budget / stale 기본값은 호출 시점에 universe_refresh 모듈
+    상수에서 lookup 한다 (monkeypatch 가능).
+    """
+    from app import universe_refresh as ur
+
+    if max_workers is None:
+        max_workers = ur.PYKRX_CONCURRENT_WORKERS
+    if min_interval_seconds is None:
+        min_interval_seconds = ur.PYKRX_MIN_CALL_INTERVAL_SECONDS
+    if time_budget_seconds is None:
+        time_budget_seconds = ur.UNIVERSE_REFRESH_TIME_BUDGET_SECONDS
+    if max_stale_days is None:
+        max_stale_days = ur.SQLITE_BASIS_MAX_STALE_DAYS
+    if fetcher is None:
+        fetcher = _default_network_fetcher(fetch_window_days, lookback_days)
+    if sqlite_fetcher is None and use_sqlite:
+        sqlite_fetcher = _default_sqlite_fetcher(fetch_window_days, lookback_days)
+
+    deadline = clock() + time_budget_seconds
+    scores: list[Optional[CandidateScore]] = [None] * len(seed.items)
+
+    # 1) SQLite 단계 — 로컬 조회라 budget 체크만 하고 순차 처리.
+    remaining: list[int] = []
+    for idx, item in enumerate(seed.items):
+        if sqlite_fetcher is None:
+            remaining.append(idx)
+            continue
+        if clock() >= deadline:
+            scores[idx] = _budget_exceeded_score(item)
+            continue
+        try:
+            result = sqlite_fetcher(item.ticker, seed.asof)
+        except Exception:  # noqa: BLE001 — SQLite 실패는 pykrx 단계로 넘긴다
+            result = None
+        if result is not None and _is_fresh_basis(result, seed.asof, max_stale_days):
+            scores[idx] = candidate_score_from_result(item, result)
+        else:
+            remaining.append(idx)
+
+    # 2) pykrx 단계 — 남은 ticker 만 rate limiter 공유 동시 호출.
+    if remaining:
+        limiter = PykrxRateLimiter(min_interval_seconds, clock=clock, sleeper=sleeper)
+
+        def _work(idx: int) -> CandidateScore:
+            item = seed.items[idx]
+            if not limiter.acquire(deadline):
+                return _budget_exceeded_score(item)
+            return fetch_candidate_score(item, seed.asof, fetcher)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)),
+            thread_name_prefix="universe-pykrx",
+        )
+        try:
+            pending = {executor.submit(_work, idx): idx for idx in remaining}
+            while pending:
+                timeout = max(0.0, deadline - clock())
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for fut in done:
+                    scores[pending.pop(fut)] = fut.result()
+            # deadline 도달 — 미완료 ticker 는 budget 초과로 표시.
+            for fut, idx in pending.items():
+                fut.cancel()
+                scores[idx] = _budget_exceeded_score(seed.items[idx])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return [s for s in scores if s is not None]
@@ -41,7 +41,9 @@ export async function request<T>(
       method,
       headers: body ? { "Content-Type": "application/json" } : undefined,
       body: body ? JSON.stringify(body) : undefined,
-      cache: "no-store",
+      // GET 은 브라우저 cache 에 두되 매번 재검증 (If-None-Match → 304 면 본문
+      // 전송 없이 cache 본문 재사용). 변경 요청은 cache 미사용.
+      cache: method === "GET" ? "no-cache" : "no-store",
       signal: controller.signal,
     });
   } catch (e) {
@@ -91,6 +91,8 @@ export interface DecisionSessionSummary {
 export interface ListDecisionSessionsResponse {
   status: "ok";
   records: DecisionSessionSummary[];
+  // 2026-10 — keyset pagination. 다음 페이지가 없으면 null.
+  next_cursor?: string | null;
 }
 
 export interface DecisionSessionDetail {
@@ -139,8 +141,10 @@ export function createDecisionSession(
 
 export function fetchDecisionSessions(
   limit: number = 10,
+  cursor?: string | null,
 ): Promise<ListDecisionSessionsResponse> {
   const params = new URLSearchParams({ limit: String(limit) });
+  if (cursor) params.set("cursor", cursor);
   return request<ListDecisionSessionsResponse>(
     "GET",
     `/decision/sessions?${params.toString()}`,
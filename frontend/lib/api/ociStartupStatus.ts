@@ -14,6 +14,30 @@ export interface OciJobStatus {
   detail: string;
 }
 
+// 2026-10 — 외부 데이터 소스별 circuit breaker 상태(프로세스 메모리 값).
+export interface SourceCircuit {
+  source: string; // fdr / pykrx / naver / yahoo
+  state: string; // closed / open / half_open
+  consecutive_failures: number;
+  open_seconds: number;
+  retry_after_seconds: number | null;
+  total_failures: number;
+  total_short_circuits: number;
+  last_error: string | null;
+}
+
+// 2026-10 — 공유 SQLite connection 수 / acquire 지연(프로세스 메모리 값).
+export interface SqlitePoolStats {
+  open_read_connections: number;
+  open_write_connections: number;
+  opened_total: number;
+  reopened_total: number;
+  reused_total: number;
+  acquire_count: number;
+  acquire_ms_avg: number;
+  acquire_ms_max: number;
+}
+
 export interface OciStartupStatus {
   checked_at: string | null;
   reachable: boolean;
@@ -22,6 +46,8 @@ export interface OciStartupStatus {
   crontab_active: boolean | null;
   jobs: OciJobStatus[];
   note: string;
+  source_circuits: SourceCircuit[];
+  sqlite_connections: SqlitePoolStats | null;
 }
 
 export async function fetchOciStartupStatus(): Promise<OciStartupStatus> {
@@ -20,12 +20,35 @@ export interface PriceSeriesResponse {
   series: PricePoint[];
 }
 
-export function fetchPriceSeries(ticker: string): Promise<PriceSeriesResponse> {
-  const params = new URLSearchParams({ ticker });
-  return request<PriceSeriesResponse>(
+// 2026-10 — 차트 조회는 `format=columnar` (dates[] / closes[]) 로 받아 여기서
+// PricePoint[] 로 펼친다. 다년 시계열의 반복 key 가 빠져 전송량이 줄고,
+// 화면 컴포넌트는 기존 series 계약 그대로 쓴다.
+interface PriceSeriesColumnarResponse {
+  ticker: string;
+  availability: PriceSeriesAvailability;
+  reason?: string | null;
+  available_from?: string | null;
+  available_to?: string | null;
+  dates: string[];
+  closes: number[];
+}
+
+async function fetchColumnar(
+  params: URLSearchParams,
+): Promise<PriceSeriesResponse> {
+  params.set("format", "columnar");
+  const { dates, closes, ...rest } = await request<PriceSeriesColumnarResponse>(
     "GET",
     `/market/price-series?${params.toString()}`,
   );
+  return {
+    ...rest,
+    series: dates.map((date, i) => ({ date, price: closes[i] })),
+  };
+}
+
+export function fetchPriceSeries(ticker: string): Promise<PriceSeriesResponse> {
+  return fetchColumnar(new URLSearchParams({ ticker }));
 }
 
 // POC3-01 오늘의 투자 점검 — 시장지수 benchmark 시계열 (코스피 대표 차트).
@@ -33,9 +56,5 @@ export function fetchPriceSeries(ticker: string): Promise<PriceSeriesResponse> {
 export function fetchBenchmarkSeries(
   benchmark: string,
 ): Promise<PriceSeriesResponse> {
-  const params = new URLSearchParams({ benchmark });
-  return request<PriceSeriesResponse>(
-    "GET",
-    `/market/price-series?${params.toString()}`,
-  );
+  return fetchColumnar(new URLSearchParams({ benchmark }));
 }
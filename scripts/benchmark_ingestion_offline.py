@@ -0,0 +1,402 @@
+"""CLI: 오프라인 ingestion 벤치마크 (2026-10).
+
+`app.fetch_replay` 의 replay 세션 위에서 ingestion 경로를 네트워크 없이 끝까지
+실행하고 단계별 처리량을 출력한다.
+
+단계 (순서 고정):
+- universe     refresh_etf_universe        (fdr_universe fixture)
+- price        refresh_price_history       (fdr_price fixture, ticker 단위)
+- nav          refresh_nav                 (nav fixture, 10개 단위 batch)
+- constituents refresh_constituents        (constituents fixture, 10개 단위 batch)
+- timeseries   refresh_market_timeseries `benchmark` + `initial --all`
+               (timeseries_price fixture)
+
+fixture 준비:
+- 실제 응답 기록:  --record  (네트워크 사용 — 기록 후 바로 같은 단계 실행)
+- 합성 fixture:    --synthesize N  (N 개 ticker 의 결정적 합성 응답 생성)
+
+nav / constituents 서비스의 ticker 간 politeness delay 는 기본으로 끈다 — 측정
+대상은 ingestion 경로 자체이며, 소스 지연은 --latency-ms / --jitter-ms 로 흉내낸다.
+--keep-service-delay 를 주면 서비스 delay 를 그대로 둔다.
+
+DB 는 --db-path 를 주지 않으면 임시 디렉터리에 만든다 (운영 DB 미접촉).
+출력은 ASCII 만 사용 (Windows cp949 안전).
+
+사용 예:
+    python scripts/benchmark_ingestion_offline.py --synthesize 200
+    python scripts/benchmark_ingestion_offline.py --latency-ms 80 --error-rate 0.02
+    python scripts/benchmark_ingestion_offline.py --record --tickers 069500 102110
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from app import etf_constituents_fetcher as ecf  # noqa: E402
+from app import etf_nav_fetcher as enf  # noqa: E402
+from app.etf_constituents_service import DEFAULT_TOP_K  # noqa: E402
+from app.fetch_replay import (  # noqa: E402
+    FIXTURE_DIR,
+    MODE_RECORD,
+    MODE_REPLAY,
+    FetchStats,
+    FixtureStore,
+    RecordReplaySession,
+    SimulationProfile,
+)
+
+STAGES = ("universe", "price", "nav", "constituents", "timeseries")
+BATCH_SIZE = 10  # nav / constituents 서비스의 1회 hard cap.
+BENCHMARK_TICKER = "069500"
+
+
+@dataclass
+class StageReport:
+    stage: str
+    items: int
+    ok: int
+    fail: int
+    seconds: float
+    items_per_second: float
+    fetch_calls: int
+    simulated_errors: int
+    missing_fixtures: int
+
+
+def _noop_sleep(_seconds: float) -> None:
+    return None
+
+
+# ─── 합성 fixture ───────────────────────────────────────────────────
+
+
+def _synthetic_tickers(count: int) -> list[str]:
+    others = [f"{100000 + i:06d}" for i in range(max(0, count - 1))]
+    return [BENCHMARK_TICKER] + others
+
+
+def write_synthetic_fixtures(
+    store: FixtureStore, *, count: int, days: int, end: date
+) -> list[str]:
+    """count 개 ticker 의 결정적 합성 응답을 store 에 기록. ticker 목록 반환."""
+    import pandas as pd  # lazy import
+
+    tickers = _synthetic_tickers(count)
+    index = pd.bdate_range(end=pd.Timestamp(end), periods=days)
+    store.put(
+        "fdr_universe",
+        "ETF/KR",
+        value=pd.DataFrame(
+            {
+                "Symbol": tickers,
+                "Name": [f"SYN ETF {tk}" for tk in tickers],
+                "Category": ["1"] * len(tickers),
+                "Price": [10000.0] * len(tickers),
+                "Volume": [1000] * len(tickers),
+                "MarCap": [1.0e11] * len(tickers),
+            }
+        ),
+    )
+    for n, tk in enumerate(tickers):
+        closes = [10000.0 + ((i * 37 + n * 11) % 500) - 250 for i in range(days)]
+        store.put(
+            "fdr_price",
+            tk,
+            value=pd.DataFrame(
+                {
+                    "Open": closes,
+                    "High": [c + 50 for c in closes],
+                    "Low": [c - 50 for c in closes],
+                    "Close": closes,
+                    "Volume": [1000 + i for i in range(days)],
+                    "Change": [0.0] * days,
+                },
+                index=index,
+            ),
+        )
+        store.put(
+            "timeseries_price",
+            f"NAVER:{tk}",
+            value=pd.DataFrame({"Close": closes}, index=index),
+        )
+        store.put(
+            "nav",
+            tk,
+            value=enf.NavFetchResult(
+                status="ok",
+                asof=end.isoformat(),
+                nav=closes[-1],
+                market_price=closes[-1] * 1.001,
+                source="synthetic",
+            ),
+        )
+        store.put(
+            "constituents",
+            f"{tk}|{DEFAULT_TOP_K}",
+            value=ecf.FetchResult(
+                status="ok",
+                source=ecf.NAVER_STOCK_SOURCE,
+                constituents=[
+                    ecf.FetchedConstituent(
+                        rank=r + 1,
+                        constituent_ticker=f"{(n * 31 + r) % 900000 + 1:06d}",
+                        constituent_name=f"SYN STOCK {r}",
+                        weight_pct=round(100.0 / DEFAULT_TOP_K, 4),
+                    )
+                    for r in range(DEFAULT_TOP_K)
+                ],
+                etf_name=f"SYN ETF {tk}",
+                effective_asof=end.isoformat(),
+            ),
+        )
+    return tickers
+
+
+# ─── 단계 실행 ──────────────────────────────────────────────────────
+
+
+def _batches(tickers: list[str]) -> list[list[str]]:
+    out = []
+    for start in range(0, len(tickers), BATCH_SIZE):
+        out.append(tickers[start : start + BATCH_SIZE])  # noqa: E203
+    return out
+
+
+def _run_universe(db_path: Path, tickers: list[str], asof: date, sleep_fn) -> tuple:
+    from app.market_data_fdr import refresh_etf_universe
+
+    result = refresh_etf_universe(db_path=db_path)
+    ok = result.universe_count
+    return ok, ok, 0 if result.success else 1
+
+
+def _run_price(db_path: Path, tickers: list[str], asof: date, sleep_fn) -> tuple:
+    from app.market_data_fdr import refresh_price_history
+
+    result = refresh_price_history(tickers, end_date=asof, db_path=db_path)
+    return result.attempted, result.success, result.fail
+
+
+def _run_nav(db_path: Path, tickers: list[str], asof: date, sleep_fn) -> tuple:
+    from app.etf_nav_service import refresh_nav
+
+    ok = fail = 0
+    for batch in _batches(tickers):
+        result = refresh_nav(
+            asof=asof.isoformat(),
+            tickers=batch,
+            fetcher=enf.default_nav_fetcher(),
+            sleep_fn=sleep_fn,
+            db_path=db_path,
+        )
+        ok += result.success_count
+        fail += result.requested_count - result.success_count
+    return len(tickers), ok, fail
+
+
+def _run_constituents(db_path: Path, tickers: list[str], asof: date, sleep_fn) -> tuple:
+    from app.etf_constituents_service import refresh_constituents
+
+    ok = fail = 0
+    for batch in _batches(tickers):
+        result = refresh_constituents(
+            asof=asof.isoformat(),
+            tickers=batch,
+            sleep_fn=sleep_fn,
+            db_path=db_path,
+        )
+        ok += result.success_count
+        fail += result.requested_count - result.success_count
+    return len(tickers), ok, fail
+
+
+def _run_timeseries(db_path: Path, tickers: list[str], asof: date, sleep_fn) -> tuple:
+    from app.market_timeseries_ingestion_store import STATUS_NORMAL, count_by_status
+    from scripts.refresh_market_timeseries import main as timeseries_main
+
+    common = ["--db-path", str(db_path)]
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
+        io.StringIO()
+    ):
+        rc = timeseries_main(["benchmark", *common])
+        if rc == 0:
+            timeseries_main(["initial", "--all", *common])
+    counts = count_by_status(db_path=db_path)
+    ok = counts.get(STATUS_NORMAL, 0)
+    total = sum(counts.values())
+    return max(total, len(tickers)), ok, max(total, len(tickers)) - ok
+
+
+_STAGE_RUNNERS: dict[str, Callable[..., tuple]] = {
+    "universe": _run_universe,
+    "price": _run_price,
+    "nav": _run_nav,
+    "constituents": _run_constituents,
+    "timeseries": _run_timeseries,
+}
+_STAGE_FETCHERS = {
+    "universe": ("fdr_universe",),
+    "price": ("fdr_price",),
+    "nav": ("nav",),
+    "constituents": ("constituents",),
+    "timeseries": ("timeseries_price",),
+}
+
+
+def _stat_totals(session: RecordReplaySession, names: tuple[str, ...]) -> FetchStats:
+    total = FetchStats()
+    for name in names:
+        s = session.stats.get(name)
+        if s is None:
+            continue
+        total.calls += s.calls
+        total.simulated_errors += s.simulated_errors
+        total.missing += s.missing
+    return total
+
+
+def run_benchmark(
+    *,
+    store: FixtureStore,
+    tickers: list[str],
+    asof: date,
+    db_path: Path,
+    mode: str = MODE_REPLAY,
+    profile: Optional[SimulationProfile] = None,
+    stages: tuple[str, ...] = STAGES,
+    keep_service_delay: bool = False,
+    sleeper: Callable[[float], None] = time.sleep,
+) -> list[StageReport]:
+    session = RecordReplaySession(store, mode=mode, profile=profile, sleeper=sleeper)
+    sleep_fn = time.sleep if keep_service_delay else _noop_sleep
+    reports: list[StageReport] = []
+    with session.install():
+        for stage in stages:
+            before = _stat_totals(session, _STAGE_FETCHERS[stage])
+            t0 = time.perf_counter()
+            items, ok, fail = _STAGE_RUNNERS[stage](db_path, tickers, asof, sleep_fn)
+            elapsed = time.perf_counter() - t0
+            after = _stat_totals(session, _STAGE_FETCHERS[stage])
+            reports.append(
+                StageReport(
+                    stage=stage,
+                    items=items,
+                    ok=ok,
+                    fail=fail,
+                    seconds=round(elapsed, 4),
+                    items_per_second=round(items / elapsed, 2) if elapsed > 0 else 0.0,
+                    fetch_calls=after.calls - before.calls,
+                    simulated_errors=after.simulated_errors - before.simulated_errors,
+                    missing_fixtures=after.missing - before.missing,
+                )
+            )
+    return reports
+
+
+# ─── CLI ────────────────────────────────────────────────────────────
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="benchmark_ingestion_offline",
+        description="Run ingestion stages offline on recorded fixtures.",
+    )
+    p.add_argument("--fixtures", type=Path, default=FIXTURE_DIR)
+    p.add_argument("--db-path", type=Path, default=None)
+    p.add_argument("--asof", default=date.today().isoformat())
+    p.add_argument("--tickers", nargs="*", default=None)
+    p.add_argument("--stages", nargs="*", choices=STAGES, default=list(STAGES))
+    p.add_argument("--record", action="store_true", help="Call real sources.")
+    p.add_argument("--synthesize", type=int, default=0, metavar="N")
+    p.add_argument("--days", type=int, default=260, help="Synthetic trading days.")
+    p.add_argument("--latency-ms", type=float, default=0.0)
+    p.add_argument("--jitter-ms", type=float, default=0.0)
+    p.add_argument("--error-rate", type=float, default=0.0)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--keep-service-delay", action="store_true")
+    p.add_argument("--json", dest="as_json", action="store_true")
+    return p.parse_args(argv)
+
+
+def _print_table(reports: list[StageReport]) -> None:
+    header = (
+        f"{'stage':<13}{'items':>7}{'ok':>7}{'fail':>6}{'seconds':>10}"
+        f"{'items/s':>10}{'calls':>7}{'sim_err':>8}{'missing':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in reports:
+        print(
+            f"{r.stage:<13}{r.items:>7}{r.ok:>7}{r.fail:>6}{r.seconds:>10.3f}"
+            f"{r.items_per_second:>10.1f}{r.fetch_calls:>7}"
+            f"{r.simulated_errors:>8}{r.missing_fixtures:>8}"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _parse_args(argv)
+    asof = date.fromisoformat(args.asof)
+    store = FixtureStore(args.fixtures)
+
+    tickers = args.tickers
+    if args.synthesize > 0:
+        synthesized = write_synthetic_fixtures(
+            store, count=args.synthesize, days=args.days, end=asof
+        )
+        tickers = tickers or synthesized
+    if not tickers:
+        tickers = store.keys("fdr_price")
+    if not tickers:
+        print(
+            "[bench] no tickers: pass --tickers, --synthesize N, or record first.",
+            file=sys.stderr,
+        )
+        return 2
+
+    profile = SimulationProfile(
+        latency_seconds=args.latency_ms / 1000.0,
+        jitter_seconds=args.jitter_ms / 1000.0,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    mode = MODE_RECORD if args.record else MODE_REPLAY
+    with tempfile.TemporaryDirectory(prefix="ingest-bench-") as tmp:
+        db_path = args.db_path or Path(tmp) / "market_data.sqlite"
+        reports = run_benchmark(
+            store=store,
+            tickers=list(tickers),
+            asof=asof,
+            db_path=db_path,
+            mode=mode,
+            profile=profile,
+            stages=tuple(args.stages),
+            keep_service_delay=args.keep_service_delay,
+        )
+
+    if args.as_json:
+        print(json.dumps([asdict(r) for r in reports], indent=2))
+    else:
+        print(
+            f"[bench] mode={mode} tickers={len(tickers)} asof={asof.isoformat()} "
+            f"latency_ms={args.latency_ms} error_rate={args.error_rate}"
+        )
+        _print_table(reports)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
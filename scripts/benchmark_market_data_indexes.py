@@ -0,0 +1,291 @@
+"""CLI: market_data.sqlite 인덱스 전/후 조회 계획 + 시간 비교 (2026-10).
+
+합성 DB (기본 1000 ticker x 3년 영업일) 를 만들고 hot 조회마다
+`EXPLAIN QUERY PLAN` 과 실행 시간을 인덱스 적용 전 / 후로 기록한다.
+인덱스는 `app.market_data_indexes.ensure_all_indexes` 로 적용한다 — 운영 init
+경로와 같은 정의.
+
+DB 는 --db-path 를 주지 않으면 임시 디렉터리에 만든다 (운영 DB 미접촉).
+출력은 ASCII 만 사용 (Windows cp949 안전).
+
+사용 예:
+    python scripts/benchmark_market_data_indexes.py
+    python scripts/benchmark_market_data_indexes.py --tickers 200 --years 1 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from app.etf_constituents_store import ETF_CONSTITUENTS_DDL  # noqa: E402
+from app.etf_nav_store import ETF_NAV_DAILY_DDL  # noqa: E402
+from app.market_data_indexes import ensure_all_indexes  # noqa: E402
+from app.market_data_store import (  # noqa: E402
+    ETF_DAILY_PRICE_DDL,
+    MARKET_REFRESH_LOG_DDL,
+)
+
+NAV_DAYS = 60
+CONSTITUENT_ASOF_COUNT = 5
+CONSTITUENT_TOP_K = 10
+REFRESH_LOG_ROWS = 2000
+SOURCES = ("fdr", "pykrx", "naver")
+
+
+@dataclass
+class QueryReport:
+    query: str
+    before_ms: float
+    after_ms: float
+    speedup: Optional[float]
+    before_plan: list[str]
+    after_plan: list[str]
+
+
+def _business_days(end: date, years: int) -> list[str]:
+    start = end - timedelta(days=365 * years)
+    out: list[str] = []
+    d = start
+    while d <= end:
+        if d.weekday() < 5:
+            out.append(d.isoformat())
+        d += timedelta(days=1)
+    return out
+
+
+def build_synthetic_db(
+    db_path: Path, *, tickers: int, years: int, end: date, seed: int = 0
+) -> list[str]:
+    """인덱스 없는 합성 DB 생성. 거래일 목록 (ASC) 반환."""
+    rng = random.Random(seed)
+    days = _business_days(end, years)
+    codes = [f"{100000 + i:06d}" for i in range(tickers)]
+    con = sqlite3.connect(str(db_path))
+    try:
+        for ddl in (
+            ETF_DAILY_PRICE_DDL,
+            MARKET_REFRESH_LOG_DDL,
+            ETF_NAV_DAILY_DDL,
+            ETF_CONSTITUENTS_DDL,
+        ):
+            con.execute(ddl)
+        fetched = f"{end.isoformat()}T00:00:00Z"
+        for code in codes:
+            price = 10000.0
+            rows = []
+            for d in days:
+                price *= 1 + rng.uniform(-0.02, 0.02)
+                # 일부 행은 종가 결측 — 유효 종가 필터 경로 확인용.
+                close = None if rng.random() < 0.01 else round(price, 2)
+                rows.append((code, d, close, None, "synthetic", fetched))
+            con.executemany(
+                "INSERT INTO etf_daily_price "
+                "(ticker, date, close, volume, source, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        nav_days = days[-NAV_DAYS:]
+        con.executemany(
+            "INSERT INTO etf_nav_daily (etf_ticker, asof, nav, source, status, "
+            "created_at) VALUES (?, ?, ?, 'naver', 'ok', ?)",
+            (
+                (code, d, 10000.0, f"{d}T09:00:00.000000Z")
+                for code in codes
+                for d in nav_days
+            ),
+        )
+        asofs = days[-CONSTITUENT_ASOF_COUNT:]
+        con.executemany(
+            "INSERT INTO etf_constituents (etf_ticker, asof, source, rank, "
+            "constituent_ticker, weight_pct, created_at) "
+            "VALUES (?, ?, 'naver', ?, ?, ?, ?)",
+            (
+                (code, a, rank, f"{rank:06d}", 10.0, fetched)
+                for code in codes
+                for a in asofs
+                for rank in range(1, CONSTITUENT_TOP_K + 1)
+            ),
+        )
+        con.executemany(
+            "INSERT INTO market_refresh_log (run_id, source, asof, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                (
+                    f"run-{i:05d}",
+                    SOURCES[i % len(SOURCES)],
+                    days[i % len(days)],
+                    f"{days[i % len(days)]}T{i % 24:02d}:00:00Z",
+                )
+                for i in range(REFRESH_LOG_ROWS)
+            ),
+        )
+        con.commit()
+    finally:
+        con.close()
+    return days
+
+
+def hot_queries(days: list[str]) -> list[tuple[str, str, tuple]]:
+    """(이름, SQL, 파라미터). 운영 코드의 조회 형태를 그대로 옮긴 것."""
+    latest = days[-1]
+    return [
+        ("price_max_date", "SELECT MAX(date) FROM etf_daily_price", ()),
+        (
+            "price_max_valid_date",
+            "SELECT MAX(date) FROM etf_daily_price "
+            "WHERE close IS NOT NULL AND close > 0",
+            (),
+        ),
+        (
+            "price_date_slice",
+            "SELECT ticker, close FROM etf_daily_price WHERE date = ?",
+            (latest,),
+        ),
+        (
+            "price_date_range",
+            "SELECT ticker, date, close FROM etf_daily_price "
+            "WHERE date >= ? AND date <= ?",
+            (days[-5], latest),
+        ),
+        (
+            "nav_latest_all",
+            "SELECT t.etf_ticker, t.asof, t.nav FROM etf_nav_daily t "
+            "INNER JOIN (SELECT etf_ticker, MAX(asof) AS max_asof, "
+            "MAX(created_at) AS max_created_at FROM etf_nav_daily "
+            "GROUP BY etf_ticker) latest ON t.etf_ticker = latest.etf_ticker "
+            "AND t.asof = latest.max_asof AND t.created_at = latest.max_created_at "
+            "ORDER BY t.etf_ticker",
+            (),
+        ),
+        (
+            "refresh_log_latest",
+            "SELECT run_id FROM market_refresh_log "
+            "ORDER BY created_at DESC, rowid DESC LIMIT 1",
+            (),
+        ),
+        (
+            "refresh_log_latest_source",
+            "SELECT run_id FROM market_refresh_log WHERE source = ? "
+            "ORDER BY created_at DESC, rowid DESC LIMIT 1",
+            ("naver",),
+        ),
+        (
+            "constituents_by_asof",
+            "SELECT etf_ticker, rank, weight_pct FROM etf_constituents "
+            "WHERE asof = ?",
+            (latest,),
+        ),
+    ]
+
+
+def explain(con: sqlite3.Connection, sql: str, params: tuple) -> list[str]:
+    return [str(r[3]) for r in con.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+def time_query(
+    con: sqlite3.Connection, sql: str, params: tuple, *, repeat: int
+) -> float:
+    """best-of-repeat 실행 시간 (ms)."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        con.execute(sql, params).fetchall()
+        best = min(best, time.perf_counter() - started)
+    return round(best * 1000, 3)
+
+
+def run_benchmark(
+    db_path: Path, days: list[str], *, repeat: int = 5
+) -> list[QueryReport]:
+    queries = hot_queries(days)
+    con = sqlite3.connect(str(db_path))
+    try:
+        before = {
+            name: (explain(con, sql, p), time_query(con, sql, p, repeat=repeat))
+            for name, sql, p in queries
+        }
+        ensure_all_indexes(con)
+        con.commit()
+        reports: list[QueryReport] = []
+        for name, sql, p in queries:
+            after_plan = explain(con, sql, p)
+            after_ms = time_query(con, sql, p, repeat=repeat)
+            before_plan, before_ms = before[name]
+            reports.append(
+                QueryReport(
+                    query=name,
+                    before_ms=before_ms,
+                    after_ms=after_ms,
+                    speedup=round(before_ms / after_ms, 1) if after_ms > 0 else None,
+                    before_plan=before_plan,
+                    after_plan=after_plan,
+                )
+            )
+        return reports
+    finally:
+        con.close()
+
+
+def _print_table(reports: list[QueryReport]) -> None:
+    print(f"{'query':<28}{'before_ms':>12}{'after_ms':>12}{'speedup':>10}")
+    for r in reports:
+        speed = f"{r.speedup}x" if r.speedup is not None else "-"
+        print(f"{r.query:<28}{r.before_ms:>12.3f}{r.after_ms:>12.3f}{speed:>10}")
+    print()
+    for r in reports:
+        print(f"[{r.query}]")
+        print("  before: " + " | ".join(r.before_plan))
+        print("  after:  " + " | ".join(r.after_plan))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--end", default=None, help="마지막 거래일 (YYYY-MM-DD)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db-path", default=None)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    end = date.fromisoformat(args.end) if args.end else date.today()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(args.db_path) if args.db_path else Path(tmp) / "bench.sqlite"
+        if db_path.exists():
+            print(f"db already exists: {db_path}", file=sys.stderr)
+            return 2
+        started = time.perf_counter()
+        days = build_synthetic_db(
+            db_path, tickers=args.tickers, years=args.years, end=end, seed=args.seed
+        )
+        build_seconds = time.perf_counter() - started
+        reports = run_benchmark(db_path, days, repeat=args.repeat)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in reports], ensure_ascii=True, indent=2))
+    else:
+        print(
+            f"synthetic db: {args.tickers} tickers x {len(days)} days "
+            f"(built in {build_seconds:.1f}s)"
+        )
+        _print_table(reports)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,193 @@
+"""CLI: etf_daily_price SQLite vs 종가 columnar archive 비교 (2026-10).
+
+합성 DB (기본 1000 ticker x 3년 영업일) 를 만들고 다음을 기록한다:
+- 디스크: etf_daily_price 만 담은 SQLite 파일 (VACUUM 후) vs price_archive/ 합계.
+- 전 universe 종가 로드: ticker 마다 fetch_price_history (SQLite 경로) /
+  같은 호출의 archive 경로 / `fetch_close_matrix` 1회.
+
+archive 는 운영 경로와 같은 `app.price_archive.sync` 로 만든다. DB 는
+--db-path 를 주지 않으면 임시 디렉터리에 만든다 (운영 DB 미접촉).
+출력은 ASCII 만 사용 (Windows cp949 안전).
+
+사용 예:
+    python scripts/benchmark_price_archive.py
+    python scripts/benchmark_price_archive.py --tickers 200 --years 1 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from app import sqlite_pool, sqlite_schemas  # noqa: E402
+from app.market_data_store import fetch_close_matrix, fetch_price_history  # noqa: E402
+from app.price_archive import archive_dir, sync  # noqa: E402
+
+
+@dataclass
+class ArchiveReport:
+    tickers: int
+    days: int
+    sqlite_bytes: int
+    archive_bytes: int
+    size_ratio: Optional[float]
+    sqlite_loop_ms: float
+    archive_loop_ms: float
+    matrix_ms: float
+    loop_speedup: Optional[float]
+
+
+def _business_days(end: date, years: int) -> list[str]:
+    start = end - timedelta(days=365 * years)
+    out: list[str] = []
+    d = start
+    while d <= end:
+        if d.weekday() < 5:
+            out.append(d.isoformat())
+        d += timedelta(days=1)
+    return out
+
+
+def build_synthetic_db(
+    db_path: Path, *, tickers: int, years: int, end: date, seed: int = 0
+) -> list[str]:
+    """운영 스키마 (migration 포함) 로 합성 가격 DB 생성. 거래일 목록 반환."""
+    rng = random.Random(seed)
+    days = _business_days(end, years)
+    sqlite_schemas.ensure_market_data(db_path)
+    fetched = f"{end.isoformat()}T00:00:00Z"
+    con = sqlite3.connect(str(db_path))
+    try:
+        for i in range(tickers):
+            code = f"{100000 + i:06d}"
+            price = 10000.0
+            rows = []
+            for d in days:
+                price *= 1 + rng.uniform(-0.02, 0.02)
+                close = round(price, 2)
+                rows.append(
+                    (
+                        code,
+                        d,
+                        close,
+                        close,
+                        close,
+                        close,
+                        1000,
+                        0.0,
+                        "synthetic",
+                        fetched,
+                    )
+                )
+            con.executemany(
+                "INSERT INTO etf_daily_price (ticker, date, open, high, low, close, "
+                "volume, change, source, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        con.commit()
+        con.execute("VACUUM")
+    finally:
+        con.close()
+    return days
+
+
+def _best_ms(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return round(best * 1000, 3)
+
+
+def _dir_bytes(directory: Path) -> int:
+    return sum(p.stat().st_size for p in directory.glob("*") if p.is_file())
+
+
+def run_benchmark(db_path: Path, days: list[str], *, repeat: int = 3) -> ArchiveReport:
+    sqlite_pool.close_all()  # VACUUM 이후 크기 + WAL 없는 상태로 측정.
+    sqlite_bytes = db_path.stat().st_size
+    with sqlite3.connect(str(db_path)) as con:
+        codes = [
+            r[0] for r in con.execute("SELECT DISTINCT ticker FROM etf_daily_price")
+        ]
+
+    def load_loop() -> None:
+        for code in codes:
+            fetch_price_history(code, db_path=db_path)
+
+    sqlite_loop_ms = _best_ms(load_loop, repeat)
+    sync(db_path)
+    archive_bytes = _dir_bytes(archive_dir(db_path))
+    archive_loop_ms = _best_ms(load_loop, repeat)
+    matrix_ms = _best_ms(lambda: fetch_close_matrix(db_path=db_path), repeat)
+    return ArchiveReport(
+        tickers=len(codes),
+        days=len(days),
+        sqlite_bytes=sqlite_bytes,
+        archive_bytes=archive_bytes,
+        size_ratio=round(sqlite_bytes / archive_bytes, 1) if archive_bytes else None,
+        sqlite_loop_ms=sqlite_loop_ms,
+        archive_loop_ms=archive_loop_ms,
+        matrix_ms=matrix_ms,
+        loop_speedup=(
+            round(sqlite_loop_ms / archive_loop_ms, 1) if archive_loop_ms > 0 else None
+        ),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--end", default=None, help="마지막 거래일 (YYYY-MM-DD)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db-path", default=None)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    end = date.fromisoformat(args.end) if args.end else date.today()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(args.db_path) if args.db_path else Path(tmp) / "bench.sqlite"
+        if db_path.exists():
+            print(f"db already exists: {db_path}", file=sys.stderr)
+            return 2
+        days = build_synthetic_db(
+            db_path, tickers=args.tickers, years=args.years, end=end, seed=args.seed
+        )
+        report = run_benchmark(db_path, days, repeat=args.repeat)
+        sqlite_pool.close_all()
+
+    if args.json:
+        print(json.dumps(asdict(report), ensure_ascii=True, indent=2))
+        return 0
+    print(f"synthetic db: {report.tickers} tickers x {report.days} days")
+    print(
+        f"disk: sqlite {report.sqlite_bytes / 1e6:.1f} MB, "
+        f"archive {report.archive_bytes / 1e6:.1f} MB ({report.size_ratio}x smaller)"
+    )
+    print(
+        f"full-universe load: sqlite {report.sqlite_loop_ms:.1f} ms, "
+        f"archive {report.archive_loop_ms:.1f} ms ({report.loop_speedup}x), "
+        f"matrix {report.matrix_ms:.1f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
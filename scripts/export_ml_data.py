@@ -0,0 +1,83 @@
+"""CLI: ML feature / walk-forward 예측 streaming export — NDJSON · CSV (2026-10).
+
+`GET /ml/export/{dataset}` 과 같은 경로 (app.ml_export) — SQLite 를 조각 단위로
+읽어 바로 쓰므로 다년치 feature 표도 메모리가 일정하다. --output 을 주지 않으면
+stdout 으로 쓴다 (파이프 / 리다이렉트용).
+
+데이터셋: etf_features / market_risk_features / walk_forward_predictions.
+상태 메시지는 ASCII 만 사용 (Windows cp949 안전).
+
+사용 예:
+    python scripts/export_ml_data.py etf_features --start 2024-01-01 --ticker 069500 > f.ndjson
+    python scripts/export_ml_data.py market_risk_features --format csv --output risk.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from app import ml_export  # noqa: E402
+from app.market_data_store import DEFAULT_DB_PATH  # noqa: E402
+
+
+def _write(chunks, out: BinaryIO) -> int:
+    written = 0
+    for chunk in chunks:
+        out.write(chunk)
+        written += len(chunk)
+    out.flush()
+    return written
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dataset", choices=ml_export.DATASETS)
+    parser.add_argument(
+        "--format",
+        choices=(ml_export.FORMAT_NDJSON, ml_export.FORMAT_CSV),
+        default=ml_export.FORMAT_NDJSON,
+    )
+    parser.add_argument("--start", help="asof 시작 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--end", help="asof 끝 (YYYY-MM-DD, 포함)")
+    parser.add_argument(
+        "--ticker", action="append", default=[], help="ETF ticker (반복 지정)"
+    )
+    parser.add_argument("--db-path", type=Path, default=DEFAULT_DB_PATH)
+    parser.add_argument("--chunk-size", type=int, default=ml_export.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", type=Path, help="출력 파일 (기본 stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        source = ml_export.open_export(
+            args.dataset,
+            start=args.start,
+            end=args.end,
+            tickers=args.ticker,
+            db_path=args.db_path,
+            chunk_size=max(1, args.chunk_size),
+        )
+    except ml_export.ExportError as e:
+        print(f"invalid export request: {e}", file=sys.stderr)
+        return 2
+    chunks = ml_export.encode(source, args.format)
+    if args.output is None:
+        _write(chunks, sys.stdout.buffer)
+        return 0
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = args.output.with_name(args.output.name + ".tmp")
+    with tmp.open("wb") as f:
+        written = _write(chunks, f)
+    tmp.replace(args.output)
+    print(f"exported {args.dataset}: bytes={written} -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
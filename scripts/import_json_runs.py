@@ -0,0 +1,50 @@
+"""CLI: JSON run 파일 디렉터리 → runs.sqlite import (2026-10).
+
+STORE_DIR (기본 state/runs) 의 *.json 은 runs.sqlite 가 처음 만들어질 때
+스키마 step 으로 자동 import 된다. 본 CLI 는 그 외 경우용:
+- 다른 디렉터리 (백업 / 다른 PC 에서 복사한 run) 를 가져올 때 (--from).
+- 자동 import 이후 디렉터리에 추가된 JSON 을 한 번에 가져올 때.
+
+이미 DB 에 있는 run_id 는 덮어쓰지 않는다. 원본 JSON 파일은 지우지 않는다.
+출력은 ASCII 만 사용 (Windows cp949 안전).
+
+사용 예:
+    python scripts/import_json_runs.py
+    python scripts/import_json_runs.py --from D:/backup/runs
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from app import store  # noqa: E402
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--from", dest="source", default=None, help="JSON 디렉터리 (기본 STORE_DIR)"
+    )
+    parser.add_argument("--store-dir", default=None, help="runs.sqlite 디렉터리")
+    args = parser.parse_args(argv)
+
+    if args.store_dir:
+        store.STORE_DIR = Path(args.store_dir)
+    source = Path(args.source) if args.source else store.STORE_DIR
+    if not source.is_dir():
+        print(f"not a directory: {source}", file=sys.stderr)
+        return 2
+    imported = store.import_json_dir(source)
+    print(f"imported {imported} run(s) from {source} into {store.db_path()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -73,6 +73,7 @@ from app.market_data_store import (  # noqa: E402
     fetch_price_history,
     list_etf_tickers,
 )
+from app.market_post_refresh import run_post_refresh  # noqa: E402
 from app.market_timeseries_ingestion_service import (  # noqa: E402
     BENCHMARK_KODEX200_TICKER,
     IngestionInput,
@@ -342,13 +343,18 @@ def _cmd_status(args: _Args) -> int:
 
 def main(argv: Optional[list[str]] = None) -> int:
     args = _parse_args(argv)
-    if args.command == "benchmark":
-        return _cmd_benchmark(args)
-    if args.command == "etf":
-        return _cmd_etf(args)
     if args.command == "status":
         return _cmd_status(args)
-    return 1
+    if args.command == "benchmark":
+        rc = _cmd_benchmark(args)
+    elif args.command == "etf":
+        rc = _cmd_etf(args)
+    else:
+        return 1
+    # 2026-10 — 적재 뒤 archive sync + 대시보드 계산 + (snapshot 모드면) 발행.
+    # refresh job / refresh_market_timeseries 와 같은 후처리 (app.market_post_refresh).
+    run_post_refresh(args.db_path)
+    return rc
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,45 @@
+"""CLI: market_data.sqlite 읽기 전용 snapshot 수동 발행 (2026-10).
+
+refresh 작업은 snapshot 모드 (MARKET_DATA_SNAPSHOT_MODE=on) 에서 끝날 때 자동
+발행한다. 본 CLI 는 그 외 쓰기 (NAV / 구성종목 단독 수집 스크립트 등) 직후
+API 읽기에 바로 반영하고 싶을 때 쓴다. 모드와 무관하게 발행한다 — 읽기 전환은
+모드가 on 일 때만 일어난다.
+
+출력은 ASCII 만 사용 (Windows cp949 안전).
+
+사용 예:
+    python scripts/publish_market_data_snapshot.py
+    python scripts/publish_market_data_snapshot.py --db-path state/market/market_data.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from app.market_data_snapshot import publish_snapshot  # noqa: E402
+from app.market_data_store import DEFAULT_DB_PATH  # noqa: E402
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-path", type=Path, default=DEFAULT_DB_PATH)
+    args = parser.parse_args(argv)
+
+    if not args.db_path.exists():
+        print(f"db not found: {args.db_path}", file=sys.stderr)
+        return 2
+    path = publish_snapshot(args.db_path)
+    size_mb = path.stat().st_size / (1024 * 1024)
+    print(f"published snapshot: {path} ({size_mb:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+"""CLI: market_data.sqlite 테이블 통계 재계산 (2026-10).
+
+통계 (app.market_data_stats) 는 trigger 로 유지된다. `run_oci_database_preflight.py
+--deep` 가 stats_drift 를 보고하면 (trigger 밖의 수동 SQL 수정 — 예: 추적 테이블에
+INSERT OR REPLACE, trigger 를 끈 채 쓴 경우) 본 CLI 로 전체 scan 해서 다시 채운다.
+추적 테이블 전체를 1번 읽는다. app 의 writer 는 모두 ON CONFLICT ... DO UPDATE 로
+써서 drift 를 만들지 않는다.
+
+출력은 ASCII 만 사용 (Windows cp949 안전).
+
+사용 예:
+    python scripts/rebuild_market_data_stats.py
+    python scripts/rebuild_market_data_stats.py --db-path state/market/market_data.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from app import market_data_stats, sqlite_schemas  # noqa: E402
+from app.market_data_store import DEFAULT_DB_PATH  # noqa: E402
+from app.sqlite_pool import pooled_connection  # noqa: E402
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-path", type=Path, default=DEFAULT_DB_PATH)
+    args = parser.parse_args(argv)
+
+    if not args.db_path.exists():
+        print(f"db not found: {args.db_path}", file=sys.stderr)
+        return 2
+    sqlite_schemas.ensure_market_data(args.db_path)
+    with pooled_connection(args.db_path, write=True) as con:
+        market_data_stats.rebuild(con)
+        stats = market_data_stats.read_stats(con) or {}
+    for table, s in stats.items():
+        print(f"{table}: rows={s.row_count} min={s.min_date} max={s.max_date}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
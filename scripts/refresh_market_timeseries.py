@@ -48,6 +48,7 @@ from app.market_data_store import (  # noqa: E402
     fetch_price_history,
     list_etf_tickers,
 )
+from app.market_post_refresh import run_post_refresh  # noqa: E402
 from app.market_timeseries_ingestion_service import (  # noqa: E402
     BENCHMARK_KODEX200_TICKER,
     IngestionInput,
@@ -566,6 +567,15 @@ def _cmd_kospi(args: _Args) -> int:
 
 def main(argv: Optional[list[str]] = None) -> int:
     args = _parse_args(argv)
+    rc = _dispatch(args)
+    # 2026-10 — 쓰기 서브커맨드 뒤 종가 archive sync + 대시보드 응답 미리 계산 +
+    # (snapshot 모드면) 발행 — 모든 writer 공통 후처리 (app.market_post_refresh).
+    if args.command != "status":
+        run_post_refresh(args.db_path)
+    return rc
+
+
+def _dispatch(args: _Args) -> int:
     if args.command == "benchmark":
         return _cmd_benchmark(args)
     if args.command == "initial":
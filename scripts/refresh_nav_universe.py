@@ -30,6 +30,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from app.etf_nav_service import refresh_nav_universe  # noqa: E402
+from app.market_post_refresh import run_post_refresh  # noqa: E402
 from app.market_refresh_service import (  # noqa: E402
     NAV_REFRESH_SUMMARY_PATH,
     _write_nav_refresh_summary,
@@ -105,6 +106,14 @@ def main() -> int:
         _write_nav_refresh_summary(summary)
         print(f"[WROTE] {NAV_REFRESH_SUMMARY_PATH}")
 
+    # 2026-10 — NAV 가 바뀌었으니 대시보드 응답 다시 계산 후 snapshot 모드면 발행
+    # (API 는 read_db_path() 의 발행본을 읽는다). 모든 writer 공통 후처리.
+    post = run_post_refresh(db_path)
+    if post.materialized is not None:
+        print(f"[DASH]  materialized={post.materialized.entries}")
+    if post.published is not None:
+        print(f"[SNAP]  published={post.published.name}")
+
     # 종료 코드: status 가 unavailable 이면 1, 그 외 0.
     return 0 if summary.status != "unavailable" else 1
 
@@ -48,6 +48,9 @@ from app.decision_evidence_store import (  # noqa: E402
     DEFAULT_DB_PATH as DECISION_DEFAULT_DB_PATH,
 )
 
+# 2026-10 — 통계 테이블 읽기 (sqlite3 만 사용, write 없음).
+from app import market_data_stats  # noqa: E402
+
 # staging env 변수명만 참조 (audit §8 명시). .env 로드 금지.
 STAGING_ENV_NAME = "THREE_PUSH_REMOTE_PACKAGE_DIR"
 
@@ -64,6 +67,14 @@ def _parse_args() -> argparse.Namespace:
         choices=list(VALID_ENVIRONMENTS),
         help="pc | oci (라벨만 — 원격 접속·전송·환경 변경 금지)",
     )
+    p.add_argument(
+        "--deep",
+        action="store_true",
+        help=(
+            "PRAGMA integrity_check + 추적 테이블 전체 COUNT(*) 대조 "
+            "(기본은 통계 테이블만 읽는 빠른 점검)"
+        ),
+    )
     return p.parse_args()
 
 
@@ -131,10 +142,14 @@ def _resolve_market_data_path() -> tuple[str, str, str]:
 # ---------- SQLite read-only observation (§6.5 · §6.6) ----------
 
 
-def _observe_sqlite(rel_path: str) -> dict:
+def _observe_sqlite(rel_path: str, *, deep: bool = True) -> dict:
     """지시문 §6.5 관찰 항목. write 유발 명령 금지.
 
     반환 dict 는 stdout 조립용. 절대 경로 · secret · raw traceback 미포함.
+
+    2026-10 — deep=False (CLI 기본) 는 전체 scan 을 하지 않는다: 스키마 목록 +
+    writer 가 유지하는 통계 테이블 (app.market_data_stats) 만 읽고
+    integrity_check="skipped". deep=True 는 integrity_check 와 통계 ↔ 실측 대조.
     """
     obs: dict = {
         "path": rel_path,
@@ -148,6 +163,9 @@ def _observe_sqlite(rel_path: str) -> dict:
         "application_id": None,
         "file_size_bytes": None,
         "read_access": False,
+        "check_mode": "deep" if deep else "fast",
+        "table_stats": None,
+        "stats_drift": None,
     }
     p = Path(rel_path)
     obs["parent_dir_exists"] = p.parent.exists() and p.parent.is_dir()
@@ -167,13 +185,29 @@ def _observe_sqlite(rel_path: str) -> dict:
         con = sqlite3.connect(f"file:{p}?mode=ro", uri=True)
         obs["read_open_success"] = True
         try:
-            row = con.execute("PRAGMA integrity_check").fetchone()
-            if row:
-                obs["integrity_check"] = str(row[0])
+            if deep:
+                row = con.execute("PRAGMA integrity_check").fetchone()
+                if row:
+                    obs["integrity_check"] = str(row[0])
             tbl_rows = con.execute(
                 "SELECT name FROM sqlite_master WHERE type='table'"
             ).fetchall()
             obs["table_count"] = len(tbl_rows)
+            if not deep:
+                obs["integrity_check"] = "skipped"
+            stats = market_data_stats.read_stats(con)
+            if stats is not None:
+                obs["table_stats"] = {
+                    t: {
+                        "row_count": s.row_count,
+                        "max_date": s.max_date,
+                        "last_run_id": s.last_run_id,
+                    }
+                    for t, s in stats.items()
+                }
+                if deep:
+                    actual = market_data_stats.deep_scan(con)
+                    obs["stats_drift"] = market_data_stats.drift(stats, actual)
             sv = con.execute("PRAGMA schema_version").fetchone()
             if sv:
                 obs["schema_version"] = int(sv[0])
@@ -187,6 +221,10 @@ def _observe_sqlite(rel_path: str) -> dict:
     return obs
 
 
+# fast 점검은 integrity_check 를 건너뛴다 — 스키마 읽기 성공이 최소 확인.
+_INTEGRITY_PASS = ("ok", "skipped")
+
+
 def _market_readiness(obs: dict, path_status: str) -> str:
     """§7.1 market_data.sqlite 개별 READY / NOT_READY / UNAVAILABLE / FAILED."""
     if path_status == "database_path_resolution_conflict":
@@ -199,10 +237,14 @@ def _market_readiness(obs: dict, path_status: str) -> str:
         return "NOT_READY"
     if not obs["read_open_success"]:
         return "NOT_READY"
-    if obs["integrity_check"] != "ok":
+    if obs["integrity_check"] not in _INTEGRITY_PASS:
         return "NOT_READY"
     if obs["table_count"] is None:
         return "NOT_READY"
+    # 2026-10 — --deep 에서 통계 ↔ 실측이 다르면 이후 fast 점검 / API 가 믿는
+    # 통계 자체가 틀린 것 → rebuild_market_data_stats.py 로 재구성 전까지 NOT_READY.
+    if obs.get("stats_drift"):
+        return "NOT_READY"
     return "READY"
 
 
@@ -214,7 +256,7 @@ def _decision_readiness(obs: dict) -> str:
         return "NOT_READY"
     if not obs["read_open_success"]:
         return "NOT_READY"
-    if obs["integrity_check"] != "ok":
+    if obs["integrity_check"] not in _INTEGRITY_PASS:
         return "NOT_READY"
     return "READY"
 
@@ -328,7 +370,7 @@ def _main_impl() -> int:
     canonical_path_str, path_status, path_note = _resolve_market_data_path()
 
     if path_status == "resolved":
-        market_obs = _observe_sqlite(canonical_path_str)
+        market_obs = _observe_sqlite(canonical_path_str, deep=args.deep)
     else:
         market_obs = {
             "path": canonical_path_str or "unresolved",
@@ -342,11 +384,14 @@ def _main_impl() -> int:
             "application_id": None,
             "file_size_bytes": None,
             "read_access": False,
+            "check_mode": "deep" if args.deep else "fast",
+            "table_stats": None,
+            "stats_drift": None,
         }
     market_readiness = _market_readiness(market_obs, path_status)
 
     decision_rel = _relative(Path(DECISION_DEFAULT_DB_PATH))
-    decision_obs = _observe_sqlite(decision_rel)
+    decision_obs = _observe_sqlite(decision_rel, deep=args.deep)
     decision_readiness = _decision_readiness(decision_obs)
 
     runtime_obs = _observe_runtime_paths()
@@ -376,6 +421,19 @@ def _main_impl() -> int:
         f"application_id={market_obs['application_id']} "
         f"file_size_bytes={market_obs['file_size_bytes']}"
     )
+    print(f"[market_data] check_mode={market_obs['check_mode']}")
+    for table, st in (market_obs["table_stats"] or {}).items():
+        print(
+            f"  - table={table} row_count={st['row_count']} "
+            f"max_date={st['max_date']} last_run_id={st['last_run_id']}"
+        )
+    if market_obs["stats_drift"] is not None:
+        print(f"[market_data] stats_drift={market_obs['stats_drift']}")
+    if market_obs["stats_drift"]:
+        print(
+            "[market_data] action=python scripts/rebuild_market_data_stats.py "
+            "(stats table rebuild)"
+        )
     print(f"[market_data] readiness={market_readiness}")
     print(f"[decision_evidence] path={decision_obs['path']}")
     print(
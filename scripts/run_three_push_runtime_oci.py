@@ -60,8 +60,10 @@ from app.runtime_execution_status_store import (  # noqa: E402
 )
 from app.runtime_param_store import read_active_param_dict  # noqa: E402
 from app.runtime_sent_registry_store import (  # noqa: E402
+    contains_many,
     is_already_sent,
     mark_sent,
+    mark_sent_many,
 )
 from app.runtime_evidence_composer import (  # noqa: E402
     compose_runtime_evidence,
@@ -457,20 +459,22 @@ def run(
     #        각각 registry 에 기록.
     if push_kind == "spike_or_falling_alert":
         fps_all = record.get("spike_signal_fingerprints") or []
-        new_fps: list[str] = []
-        already_fps: list[str] = []
-        for fp in fps_all:
-            date_field = _resolve_registry_date_field(
-                runtime_date_kst, signal_fingerprint=fp
+        # 2026-10 — fingerprint 별 조회 대신 connection 1개 batch 조회.
+        fp_keys = {
+            fp: (
+                push_kind,
+                param.param_id,
+                _resolve_registry_date_field(runtime_date_kst, signal_fingerprint=fp),
             )
-            try:
-                if is_already_sent(push_kind, param.param_id, date_field):
-                    already_fps.append(fp)
-                else:
-                    new_fps.append(fp)
-            except Exception as e:
-                logger.error("registry DB 접근 실패 (fp=%s): %s", fp, e)
-                return _finish("failed", "registry_corrupted", str(e)[:400])
+            for fp in fps_all
+        }
+        try:
+            sent_keys = contains_many(fp_keys.values())
+        except Exception as e:
+            logger.error("registry DB 접근 실패 (fps=%d): %s", len(fp_keys), e)
+            return _finish("failed", "registry_corrupted", str(e)[:400])
+        new_fps = [fp for fp in fps_all if fp_keys[fp] not in sent_keys]
+        already_fps = [fp for fp in fps_all if fp_keys[fp] in sent_keys]
         record["spike_new_fingerprints"] = new_fps
         record["spike_already_sent_fingerprints"] = already_fps
         record["duplicate_key"] = (
@@ -550,17 +554,11 @@ def run(
     if sent:
         sent_at = datetime.now(timezone.utc).isoformat()
         if push_kind == "spike_or_falling_alert":
-            # 발송 성공 시 신규 fingerprint 각각 registry entry 기록.
-            for fp in record.get("spike_new_fingerprints", []):
-                date_field = _resolve_registry_date_field(
-                    runtime_date_kst, signal_fingerprint=fp
-                )
-                mark_sent(
-                    push_kind=push_kind,
-                    param_id=param.param_id,
-                    runtime_date_kst=date_field,
-                    sent_at_utc=sent_at,
-                )
+            # 발송 성공 시 신규 fingerprint 각각 registry entry 기록 (트랜잭션 1개).
+            mark_sent_many(
+                [fp_keys[fp] for fp in record.get("spike_new_fingerprints", [])],
+                sent_at_utc=sent_at,
+            )
         else:
             mark_sent(
                 push_kind=push_kind,
@@ -0,0 +1,53 @@
+"""CLI: etf_daily_price 종가 columnar archive 수동 sync (2026-10).
+
+refresh_market_timeseries.py / ingest_krx_timeseries.py / UI refresh 작업은 끝날 때
+자동으로 sync 한다. 본 CLI 는 그 외 경로로 가격을 고친 뒤 (수동 SQL 등) 바로
+archive 에 반영하거나, `--rebuild` 로 archive 를 처음부터 다시 만들 때 쓴다.
+
+출력은 ASCII 만 사용 (Windows cp949 안전).
+
+사용 예:
+    python scripts/sync_price_archive.py
+    python scripts/sync_price_archive.py --rebuild --db-path state/market/market_data.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+from typing import Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from app.market_data_store import DEFAULT_DB_PATH  # noqa: E402
+from app.price_archive import archive_dir, sync  # noqa: E402
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-path", type=Path, default=DEFAULT_DB_PATH)
+    parser.add_argument(
+        "--rebuild", action="store_true", help="기존 archive 를 지우고 전체 재구성"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.db_path.exists():
+        print(f"db not found: {args.db_path}", file=sys.stderr)
+        return 2
+    if args.rebuild:
+        shutil.rmtree(archive_dir(args.db_path), ignore_errors=True)
+    result = sync(args.db_path)
+    print(
+        f"price archive: generation={result.generation} "
+        f"full_rebuild={result.full_rebuild} synced={result.synced_tickers} "
+        f"tickers={result.archived_tickers} rows={result.archived_rows}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
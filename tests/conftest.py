@@ -6,7 +6,9 @@
 - pytest 가 같은 디렉터리(또는 상위) 의 conftest.py 를 자동 인식 — import 불필요.
 
 내용:
-- _isolated_store (autouse): runs / handoff / holdings / market_cache 경로 격리
+- _isolated_store (autouse): runs / handoff / holdings / market_cache /
+  naver_http_cache 경로 격리 + source circuit breaker 초기화 + 공유 SQLite
+  connection / 마이그레이션 캐시 정리
 - _stub_oci_calls (autouse): deliver / fetch_outbox_result 를 무동작 stub
 - client: FastAPI TestClient
 - _isolated_universe: Step5C universe seed / artifact 경로 격리
@@ -47,8 +49,25 @@ def _isolated_store(tmp_path, monkeypatch):
         Path(tmp_path) / "market_cache" / "market_latest.json",
     )
     market_cache.reset_for_test()
+    # 2026-10: Naver 디스크 HTTP 캐시도 격리 (운영 state/market/http_cache 미기록).
+    from app import naver_http_cache
+
+    monkeypatch.setattr(
+        naver_http_cache, "CACHE_DIR", Path(tmp_path) / "naver_http_cache"
+    )
+    # 2026-10: 소스별 circuit breaker 는 프로세스 전역 — 테스트 간 상태 누수 차단.
+    from app import source_circuit_breaker
+
+    source_circuit_breaker.reset_all_for_tests()
     yield
     market_cache.reset_for_test()
+    source_circuit_breaker.reset_all_for_tests()
+    # 2026-10: 공유 SQLite connection 을 닫아 tmp DB 핸들이 다음 테스트로 새지 않게.
+    from app import sqlite_migrations, sqlite_pool
+
+    sqlite_pool.close_all()
+    # 2026-10: 마이그레이션 완료 캐시 (경로 단위) 도 테스트마다 비운다.
+    sqlite_migrations.reset_cache_for_tests()
 
 
 @pytest.fixture(autouse=True)
@@ -187,5 +206,11 @@ def _isolated_universe(tmp_path, monkeypatch):
     monkeypatch.setattr(ur, "fetch_one_month_basis", _stub_fetcher)
     # delay 도 0 으로 (테스트 속도)
     monkeypatch.setattr(ur, "PYKRX_PER_TICKER_DELAY_SECONDS", 0.0)
+    # 2026-10 동시 scorer: rate limiter 간격 0 + SQLite 단계는 존재하지 않는 tmp
+    # 경로로 격리 (운영 market_data.sqlite 를 읽거나 생성하지 않는다).
+    from app import universe_refresh_concurrent as urc
+
+    monkeypatch.setattr(ur, "PYKRX_MIN_CALL_INTERVAL_SECONDS", 0.0)
+    monkeypatch.setattr(urc, "SQLITE_DB_PATH", seed_dir / "market_data.sqlite")
 
     return {"seed_file": seed_file, "artifact_file": artifact_file}
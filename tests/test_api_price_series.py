@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import sqlite3
+from datetime import date, timedelta
 from pathlib import Path
 
 import pytest
@@ -227,3 +228,100 @@ def test_close_le_zero_excluded(tmp_db: Path):
     dates = [p["date"] for p in body["series"]]
     assert "2026-07-03" not in dates  # close 0 제외
     assert body["available_to"] == "2026-07-02"
+
+
+def test_columnar_format_same_values_as_rows(tmp_db: Path):
+    # 2026-10 — format=columnar: dates[] / closes[] 가 rows series 와 같은 값·순서.
+    _seed(
+        tmp_db,
+        "069500",
+        [("2026-07-02", 33500.0), ("2026-07-01", 33000.0), ("2026-07-03", 34000.0)],
+    )
+    client = TestClient(app)
+    rows = client.get("/market/price-series", params={"ticker": "069500"}).json()
+    resp = client.get(
+        "/market/price-series", params={"ticker": "069500", "format": "columnar"}
+    )
+    body = resp.json()
+    assert "series" not in body
+    assert body["dates"] == [p["date"] for p in rows["series"]]
+    assert body["closes"] == [p["price"] for p in rows["series"]]
+    assert body["available_from"] == "2026-07-01"
+    assert body["available_to"] == "2026-07-03"
+
+    bad = client.get(
+        "/market/price-series", params={"ticker": "bad!", "format": "columnar"}
+    ).json()
+    assert bad["availability"] == "UNAVAILABLE"
+    assert bad["dates"] == [] and bad["closes"] == []
+
+
+def test_large_series_gzip_small_response_plain(tmp_db: Path):
+    # 2026-10 — GZipMiddleware: 임계값 이상만 압축.
+    start = date(2020, 1, 1)
+    _seed(
+        tmp_db,
+        "069500",
+        [((start + timedelta(days=i)).isoformat(), 30000.0 + i) for i in range(400)],
+    )
+    client = TestClient(app)
+    big = client.get(
+        "/market/price-series",
+        params={"ticker": "069500"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert big.headers.get("content-encoding") == "gzip"
+    assert len(big.json()["series"]) == 400
+
+    small = client.get(
+        "/market/price-series",
+        params={"ticker": "102110"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert small.json()["availability"] == "NO_DATA"
+    assert "content-encoding" not in small.headers
+
+
+def test_range_and_max_points(tmp_db: Path):
+    # 2026-10 — start / end 는 SQL 구간 (양끝 포함), max_points 는 LTTB.
+    start = date(2020, 1, 1)
+    _seed(
+        tmp_db,
+        "069500",
+        [((start + timedelta(days=i)).isoformat(), 30000.0 + i) for i in range(1000)],
+    )
+    client = TestClient(app)
+    body = client.get(
+        "/market/price-series",
+        params={"ticker": "069500", "start": "2020-02-01", "end": "2020-02-10"},
+    ).json()
+    assert [p["date"] for p in body["series"]][0] == "2020-02-01"
+    assert body["available_to"] == "2020-02-10"
+    assert len(body["series"]) == 10
+
+    full = client.get("/market/price-series", params={"ticker": "069500"}).json()
+    thin = client.get(
+        "/market/price-series", params={"ticker": "069500", "max_points": 100}
+    ).json()
+    assert len(thin["series"]) == 100
+    assert thin["series"][0] == full["series"][0]
+    assert thin["series"][-1] == full["series"][-1]
+    assert thin["available_from"] == full["available_from"]
+    assert thin["available_to"] == full["available_to"]
+
+    kospi = client.get(
+        "/market/price-series",
+        params={"benchmark": "KOSPI", "start": "2020-03-01", "end": "2020-02-01"},
+    ).json()
+    assert kospi["availability"] == "UNAVAILABLE"
+    assert kospi["reason"] == "invalid_range"
+    bad = client.get(
+        "/market/price-series", params={"ticker": "069500", "start": "2020/01/01"}
+    ).json()
+    assert bad["reason"] == "invalid_range"
+    assert (
+        client.get(
+            "/market/price-series", params={"ticker": "069500", "max_points": 1}
+        ).status_code
+        == 422
+    )
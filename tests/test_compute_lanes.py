@@ -0,0 +1,100 @@
+"""무거운 read endpoint 전용 bounded executor (2026-10, app.compute_lanes).
+
+- 느린 TOP N 계산이 `topn` lane 을 다 잡아도 상태 polling 은 응답한다.
+- lane 대기열이 가득 차면 503 + Retry-After.
+- lane 별 실행 / 대기 통계가 `/oci/startup-status` 에 노출된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app import api_market_topn, compute_lanes
+from app.api import app
+from app.market_refresh_service import RefreshState
+
+
+def test_slow_topn_does_not_block_status_polling(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def slow_topn(**_kwargs):
+        started.release()
+        release.wait(timeout=10)
+        raise AssertionError("unreachable in this test")
+
+    monkeypatch.setattr(api_market_topn, "DEFAULT_DB_PATH", tmp_path / "m.sqlite")
+    monkeypatch.setattr(api_market_topn, "_build_topn_response", slow_topn)
+    monkeypatch.setattr(
+        api_market_topn,
+        "get_state_snapshot",
+        lambda **_kw: RefreshState(status="idle"),
+    )
+    workers = compute_lanes.lane_stats()
+    topn_workers = next(s.max_workers for s in workers if s.lane == "topn")
+
+    client = TestClient(app, raise_server_exceptions=False)
+    # query 가 달라야 계산이 따로 돈다 (같은 query 는 app.single_flight 가 합친다).
+    threads = [
+        threading.Thread(target=client.get, args=(f"/market/topn/latest?n={i + 1}",))
+        for i in range(topn_workers)
+    ]
+    for t in threads:
+        t.start()
+    try:
+        for _ in range(topn_workers):
+            assert started.acquire(timeout=10)
+        res = client.get("/market/refresh/status")
+        assert res.status_code == 200
+        assert res.json()["status"] == "idle"
+        running = {s.lane: s.running for s in compute_lanes.lane_stats()}
+        assert running["topn"] == topn_workers
+    finally:
+        release.set()
+        for t in threads:
+            t.join(timeout=10)
+
+
+def test_full_queue_rejects_with_503():
+    lane = compute_lanes._Lane("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.wrap_future(lane.submit(lambda: release.wait(timeout=10)))
+        await asyncio.sleep(0.05)  # 첫 작업이 worker 를 잡는다 (대기열 0).
+        second = asyncio.wrap_future(lane.submit(lambda: "queued"))
+        with pytest.raises(HTTPException) as exc:
+            lane.submit(lambda: "rejected")
+        release.set()
+        return exc.value, await first, await second
+
+    try:
+        err, first, second = asyncio.run(scenario())
+    finally:
+        lane.shutdown()
+    assert err.status_code == 503
+    assert err.headers["Retry-After"] == str(compute_lanes.RETRY_AFTER_SECONDS)
+    assert (first, second) == (True, "queued")
+    stats = lane.stats()
+    assert stats.rejected_total == 1
+    assert stats.completed_total == 2
+    assert stats.queued == 0 and stats.running == 0
+    assert stats.wait_ms_max > 0
+
+
+def test_lane_stats_exposed_in_startup_status():
+    res = TestClient(app).get("/oci/startup-status")
+    assert res.status_code == 200
+    lanes = {row["lane"]: row for row in res.json()["compute_lanes"]}
+    assert set(lanes) == {"evidence", "status", "topn"}
+    # 이 요청의 market table 통계 조회가 `status` lane 에서 실행됐다.
+    assert lanes["status"]["completed_total"] >= 1
+    assert lanes["topn"]["max_queue"] > 0
@@ -0,0 +1,210 @@
+"""refresh 직후 미리 계산한 대시보드 응답 (2026-10, app.dashboard_snapshot).
+
+- materialize 뒤 자주 쓰는 TOP N 조합 / NAV 괴리율은 계산 없이 저장본을 보낸다.
+- 저장본은 live 응답과 같은 내용이고, ETag / Cache-Control 도 그대로 붙는다.
+- 드문 조합, 또는 materialize 이후 데이터 / 점수 snapshot 이 바뀌면 live 계산.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import (
+    api_market_topn,
+    api_nav_discount,
+    dashboard_snapshot,
+    market_data_store,
+    ml_relative_upside_score,
+)
+from app.api import app
+from app.etf_nav_store import NavDailyRow, upsert_nav_rows
+from app.market_data_store import (
+    EtfDailyPriceRow,
+    EtfMasterRow,
+    init_db,
+    upsert_daily_prices,
+    upsert_etf_master,
+)
+
+
+def _boom(*_args, **_kwargs):
+    raise AssertionError("저장본이 있으면 live 계산을 하면 안 된다")
+
+
+def _seed_prices(db: Path, rows: list[tuple[str, float]]) -> None:
+    upsert_daily_prices(
+        [EtfDailyPriceRow("069500", d, c, c, c, c, 0, 0) for (d, c) in rows],
+        source="test",
+        db_path=db,
+    )
+
+
+@pytest.fixture
+def market_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    for module in (api_market_topn, market_data_store):
+        monkeypatch.setattr(module, "DEFAULT_DB_PATH", db)
+    monkeypatch.setattr(api_nav_discount, "NAV_DB_PATH", db)
+    monkeypatch.setattr(api_nav_discount, "MARKET_DB_PATH", db)
+    monkeypatch.setattr(
+        ml_relative_upside_score, "SCORE_SNAPSHOT_PATH", tmp_path / "score.json"
+    )
+    upsert_etf_master(
+        [EtfMasterRow("069500", "KODEX 200", "1", 100.0, 1000, 5000.0)],
+        source="test",
+        db_path=db,
+    )
+    _seed_prices(db, [("2026-07-01", 100.0), ("2026-09-30", 110.0)])
+    upsert_nav_rows(
+        [
+            NavDailyRow(
+                etf_ticker="069500",
+                asof="2026-09-30",
+                nav=110.5,
+                market_price=110.0,
+                discount_rate_pct=-0.45,
+                source="test",
+                status="ok",
+                message=None,
+            )
+        ],
+        db_path=db,
+    )
+    return db
+
+
+def test_materialized_topn_served_without_compute(
+    market_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    client = TestClient(app)
+    live = client.get("/market/topn/latest", params={"n": 30, "order": "asc"})
+    summary = dashboard_snapshot.materialize(market_db)
+    assert summary.entries == 1 + len(dashboard_snapshot.topn_variants())
+    assert summary.stored_bytes < summary.raw_bytes
+
+    monkeypatch.setattr(api_market_topn, "compute_topn", _boom)
+    for params in ({}, {"n": 30, "order": "asc"}, {"basis": "daily", "n": 10}):
+        res = client.get("/market/topn/latest", params=params)
+        assert res.status_code == 200
+        assert res.headers["content-type"] == "application/json"
+        assert res.headers["Cache-Control"] == "no-cache"
+        assert res.headers["ETag"]
+    body = res.json()
+    assert body["basis"] == "daily" and body["n"] == 10
+    stored = client.get("/market/topn/latest", params={"n": 30, "order": "asc"})
+    assert stored.headers["ETag"] == live.headers["ETag"]
+    strip = {"runtime_seconds"}
+    assert {k: v for k, v in stored.json().items() if k not in strip} == {
+        k: v for k, v in live.json().items() if k not in strip
+    }
+
+    # 저장하지 않은 조합은 live 계산.
+    with pytest.raises(AssertionError):
+        client.get("/market/topn/latest", params={"n": 5})
+
+
+def test_stale_after_data_or_score_change(
+    market_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    dashboard_snapshot.materialize(market_db)
+    key = dashboard_snapshot.KEY_NAV_DISCOUNT
+    assert dashboard_snapshot.load(market_db, key) is not None
+
+    # 상대상승 점수 snapshot 이 생기면 TOP N 저장본만 무효.
+    score_files = (ml_relative_upside_score.SCORE_SNAPSHOT_PATH,)
+    topn_key = dashboard_snapshot.topn_key(dashboard_snapshot.topn_variants()[0])
+    assert dashboard_snapshot.load(market_db, topn_key, score_files) is not None
+    ml_relative_upside_score.SCORE_SNAPSHOT_PATH.write_text(
+        json.dumps({"status": "ok"}), encoding="utf-8"
+    )
+    assert dashboard_snapshot.load(market_db, topn_key, score_files) is None
+    assert dashboard_snapshot.load(market_db, key) is not None
+
+    # 어느 writer 든 추적 테이블을 바꾸면 전부 무효 → live 계산.
+    _seed_prices(market_db, [("2026-10-01", 111.0)])
+    assert dashboard_snapshot.load(market_db, key) is None
+    monkeypatch.setattr(api_market_topn, "compute_topn", _boom)
+    with pytest.raises(AssertionError):
+        TestClient(app).get("/market/topn/latest")
+
+
+def test_nav_discount_served_from_snapshot(
+    market_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    client = TestClient(app)
+    live = client.get("/market/nav-discount/latest").json()
+    dashboard_snapshot.materialize(market_db)
+    monkeypatch.setattr(api_nav_discount, "fetch_all_latest_nav", _boom)
+    res = client.get("/market/nav-discount/latest")
+    assert res.status_code == 200
+    assert res.json() == live
+    assert res.json()["items"][0]["name"] == "KODEX 200"
+
+
+def test_load_without_table_falls_back(tmp_path: Path):
+    assert dashboard_snapshot.load(tmp_path / "missing.sqlite", "nav_discount") is None
+    assert dashboard_snapshot.topn_key(
+        {"n": 10, "exclude_futures": True}
+    ) == dashboard_snapshot.topn_key({"exclude_futures": True, "n": 10})
+
+
+def test_nav_universe_cli_materializes_and_publishes(
+    market_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    import sys
+    from types import SimpleNamespace
+
+    from app import market_data_snapshot
+    from scripts import refresh_nav_universe as cli
+
+    def _refresh(*, asof, force, db_path):
+        upsert_nav_rows(
+            [
+                NavDailyRow(
+                    etf_ticker="069500",
+                    asof=asof,
+                    nav=112.0,
+                    market_price=110.0,
+                    discount_rate_pct=-1.79,
+                    source="test",
+                    status="ok",
+                    message=None,
+                )
+            ],
+            db_path=db_path,
+        )
+        return SimpleNamespace(
+            status="ok",
+            total_count=1,
+            success_count=1,
+            unavailable_count=0,
+            cache_hit=False,
+            stale_cache_used=False,
+            elapsed_seconds=0.0,
+            upserted_count=1,
+            sample_tickers=[],
+        )
+
+    monkeypatch.setenv(market_data_snapshot.MODE_ENV, "on")
+    market_data_snapshot.reset_cache_for_tests()
+    monkeypatch.setattr(cli, "refresh_nav_universe", _refresh)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["refresh_nav_universe.py", "--asof", "2026-10-01", "--db", str(market_db)],
+    )
+    monkeypatch.setattr(cli, "_write_nav_refresh_summary", lambda _s: None)
+    assert cli.main() == 0
+
+    # snapshot 모드 API 는 발행본을 읽는다 — CLI 가 발행했어야 새 NAV 가 보인다.
+    snap = market_data_snapshot.current_snapshot(market_db)
+    assert snap is not None
+    assert dashboard_snapshot.load(snap, dashboard_snapshot.KEY_NAV_DISCOUNT)
+    body = TestClient(app).get("/market/nav-discount/latest").json()
+    assert body["items"][0]["nav"] == 112.0
+    market_data_snapshot.reset_cache_for_tests()
@@ -145,7 +145,7 @@ def test_build_preview_text_empty_ticker() -> None:
 def stub_evidence(monkeypatch: pytest.MonkeyPatch):
     """endpoint 내부 evidence loader 를 stub — SQLite 초기화 불필요."""
 
-    def stub_holding(ticker: str):
+    def stub_holding(ticker: str, context=None):
         if ticker == "069500":
             return {
                 "ticker": "069500",
@@ -158,7 +158,7 @@ def stub_evidence(monkeypatch: pytest.MonkeyPatch):
             }
         return None
 
-    def stub_candidate(ticker: str):
+    def stub_candidate(ticker: str, context=None):
         if ticker == "379800":
             return {
                 "ticker": "379800",
@@ -334,7 +334,7 @@ def test_endpoint_maintains_user_friendly_response_on_programmer_error(
     """
     from app import api_decision_draft_preview as api_mod
 
-    def raise_import_error(ticker: str):
+    def raise_import_error(ticker: str, context=None):
         raise ImportError("simulated regression: bad symbol import")
 
     monkeypatch.setattr(api_mod, "_load_holdings_evidence", raise_import_error)
@@ -13,6 +13,7 @@ from pathlib import Path
 
 import pytest
 
+from app import sqlite_migrations
 from app.decision_evidence_store import (
     ALLOWED_USER_VERDICTS,
     DEFAULT_USER_VERDICT,
@@ -350,8 +351,11 @@ def test_init_db_cleans_up_stale_ai_session_records_new(tmp_path: Path):
     db = tmp_path / "decision_evidence.sqlite"
     # 1) 정상 신규 DB 만들기 (3 분리 스키마).
     init_db(db)
-    # 2) 의도적으로 잔재 _new 테이블 주입.
+    # 2) 의도적으로 잔재 _new 테이블 주입. 2026-10 — 마이그레이션은 user_version
+    #    기준 1번만 실행되므로, 잔재가 남을 수 있었던 framework 이전 DB
+    #    (user_version 0) 를 재현한다.
     with sqlite3.connect(str(db)) as con:
+        con.execute("PRAGMA user_version = 0")
         con.execute(
             "CREATE TABLE ai_session_records_new ("
             "id TEXT PRIMARY KEY, created_at TEXT NOT NULL, updated_at TEXT NOT NULL, "
@@ -368,7 +372,8 @@ def test_init_db_cleans_up_stale_ai_session_records_new(tmp_path: Path):
         )
         con.commit()
 
-    # 3) init_db 재호출 → 잔재 cleanup.
+    # 3) init_db 재호출 (새 프로세스 기동 상당) → 잔재 cleanup.
+    sqlite_migrations.reset_cache_for_tests()
     init_db(db)
     with sqlite3.connect(str(db)) as con:
         tables = {
@@ -665,3 +670,47 @@ def test_legacy_db_migrates_ml_baseline_evidence_column(tmp_path: Path):
         cur = con.execute("PRAGMA table_info(ai_session_records)")
         cols = {row[1] for row in cur.fetchall()}
     assert "ml_baseline_evidence_snapshot_json" in cols
+
+
+def test_list_projection_is_backfilled_for_existing_rows(tmp_path: Path):
+    """2026-10 — 파생 컬럼 이전 DB (user_version 5) 의 row 도 목록에 정상 표시."""
+    db = tmp_path / "decision_evidence.sqlite"
+    insert_record(
+        db_path=db,
+        **_minimal_kwargs(user_memo="", claude_answer_text="Claude 답변"),
+    )
+    with sqlite3.connect(str(db)) as con:
+        con.execute(
+            "UPDATE ai_session_records SET summary_text = '', candidate_count = 0, "
+            "has_gpt_answer = 0, has_claude_answer = 0"
+        )
+        con.execute("PRAGMA user_version = 5")
+    sqlite_migrations.reset_cache_for_tests()
+
+    [row] = list_recent_records(limit=10, db_path=db)
+    assert row["summary"] == "GPT 답변 전문"
+    assert row["candidate_count"] == 1
+    assert row["has_gpt_answer"] is True
+    assert row["has_gemini_answer"] is False
+    assert row["has_claude_answer"] is True
+
+
+def test_list_recent_records_keyset_before(tmp_path: Path):
+    db = tmp_path / "decision_evidence.sqlite"
+    for i in range(4):
+        insert_record(db_path=db, **_minimal_kwargs(user_memo=f"m{i}"))
+    first = list_recent_records(limit=2, db_path=db)
+    rest = list_recent_records(
+        limit=10, before=(first[-1]["created_at"], first[-1]["id"]), db_path=db
+    )
+    assert [r["summary"] for r in first + rest] == ["m3", "m2", "m1", "m0"]
+    with sqlite3.connect(str(db)) as con:
+        plan = " ".join(
+            str(r[3])
+            for r in con.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM ai_session_records "
+                "WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC",
+                ("x", "y"),
+            )
+        )
+    assert "idx_ai_session_records_created_id" in plan
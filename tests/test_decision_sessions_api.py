@@ -333,3 +333,24 @@ def test_post_decision_sessions_without_constituent_overlap_defaults_to_empty(
     detail = api_client.get(f"/decision/sessions/{rid}").json()
     assert detail["record"]["constituent_snapshot"] == {}
     assert detail["record"]["overlap_snapshot"] == {}
+
+
+def test_get_decision_sessions_keyset_pagination(api_client):
+    """2026-10 — cursor / next_cursor 로 전체 기록을 중복 없이 순회."""
+    for i in range(5):
+        api_client.post("/decision/sessions", json=_payload(user_memo=f"m{i}"))
+    seen: list[str] = []
+    cursor = None
+    for _ in range(5):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        body = api_client.get("/decision/sessions", params=params).json()
+        seen.extend(r["summary"] for r in body["records"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == ["m4", "m3", "m2", "m1", "m0"]
+
+    res = api_client.get("/decision/sessions", params={"cursor": "broken"})
+    assert res.status_code == 422
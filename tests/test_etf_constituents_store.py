@@ -8,6 +8,7 @@ from pathlib import Path
 from app.etf_constituents_store import (
     ConstituentRow,
     fetch_constituents,
+    fetch_constituents_many,
     init_constituents_db,
     latest_constituent_asof,
     log_constituent_refresh,
@@ -134,3 +135,33 @@ def test_latest_constituent_asof_returns_max(tmp_path: Path):
         )
     assert latest_constituent_asof("139260", db_path=db) == "2026-05-26"
     assert latest_constituent_asof("UNKNOWN", db_path=db) is None
+
+
+def test_fetch_constituents_many_latest_asof_per_ticker(tmp_path: Path):
+    """2026-10 — asof 미지정이면 ticker 별 최신 asof, 1 쿼리로 단건 조회와 같은 결과."""
+    db = tmp_path / "market_data.sqlite"
+
+    def row(ticker: str, asof: str, rank: int, name: str) -> ConstituentRow:
+        return ConstituentRow(ticker, asof, "src", rank, None, name, 1.0)
+
+    upsert_constituents(
+        [
+            row("139260", "2026-05-25", 1, "old"),
+            row("139260", "2026-05-26", 2, "B"),
+            row("139260", "2026-05-26", 1, "A"),
+            row("229200", "2026-05-20", 1, "C"),
+        ],
+        db_path=db,
+    )
+    many = fetch_constituents_many(["139260", "229200", "000000"], db_path=db)
+    assert set(many) == {"139260", "229200"}
+    assert [r.constituent_name for r in many["139260"]] == ["A", "B"]
+    for ticker in ("139260", "229200"):
+        asof = latest_constituent_asof(ticker, db_path=db)
+        assert many[ticker] == fetch_constituents(
+            etf_ticker=ticker, asof=asof, db_path=db
+        )
+
+    fixed = fetch_constituents_many(["139260", "229200"], "2026-05-25", db_path=db)
+    assert [r.constituent_name for r in fixed["139260"]] == ["old"]
+    assert "229200" not in fixed
@@ -24,6 +24,7 @@ from app.etf_nav_service import refresh_nav
 from app.etf_nav_store import (
     NavDailyRow,
     fetch_latest_nav,
+    fetch_latest_nav_many,
     fetch_nav_rows,
     init_nav_db,
     upsert_nav_rows,
@@ -108,6 +109,32 @@ def test_store_returns_none_when_no_row(tmp_path: Path):
     assert fetch_latest_nav(etf_ticker="069500", db_path=db) is None
 
 
+def test_store_fetch_latest_nav_many_matches_single_lookup(tmp_path: Path):
+    """2026-10 — bulk 조회는 ticker 별 fetch_latest_nav 와 같은 row 를 고른다."""
+    db = tmp_path / "n.sqlite"
+
+    def row(ticker: str, asof: str, source: str, nav: float) -> NavDailyRow:
+        return NavDailyRow(ticker, asof, nav, nav, 0.0, source, "ok", None)
+
+    upsert_nav_rows(
+        [
+            row("069500", "2026-05-30", "a", 1.0),
+            row("069500", "2026-05-31", "a", 2.0),
+            row("229200", "2026-05-29", "a", 3.0),
+        ],
+        db_path=db,
+    )
+    # 같은 asof 의 다른 source 를 나중에 기록 — created_at 이 더 최근인 row 가 이긴다.
+    upsert_nav_rows([row("229200", "2026-05-29", "b", 4.0)], db_path=db)
+
+    many = fetch_latest_nav_many(["069500", "229200", "999999", "069500"], db_path=db)
+    assert set(many) == {"069500", "229200"}
+    for ticker in ("069500", "229200"):
+        assert many[ticker] == fetch_latest_nav(etf_ticker=ticker, db_path=db)
+    assert many["229200"].nav == 4.0
+    assert fetch_latest_nav_many([], db_path=db) == {}
+
+
 def test_store_fetch_nav_rows_by_asof(tmp_path: Path):
     db = tmp_path / "n.sqlite"
     upsert_nav_rows(
@@ -0,0 +1,180 @@
+"""요청 단위 EvidenceContext — 같은 요청 안 dataset 1회 로드 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import (
+    api as api_module,
+    api_holdings_market_evidence,
+    api_market_topn,
+    etf_constituents_store,
+    etf_nav_store,
+    evidence_context,
+    market_data_store,
+    market_refresh_service,
+)
+from app.etf_constituents_store import ConstituentRow, upsert_constituents
+from app.etf_nav_store import NavDailyRow, upsert_nav_rows
+from app.evidence_context import EvidenceContext
+from app.holdings import Holding
+from app.holdings_market_evidence import build_holdings_market_evidence
+from app.market_data_store import (
+    EtfDailyPriceRow,
+    EtfMasterRow,
+    upsert_daily_prices,
+    upsert_etf_master,
+)
+from app.market_topn import compute_topn
+
+END = date(2026, 5, 30)
+
+
+@pytest.fixture
+def market_db(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    fake_db = tmp_path / "market_data.sqlite"
+    for mod in (market_data_store, etf_constituents_store, etf_nav_store):
+        monkeypatch.setattr(mod, "DEFAULT_DB_PATH", fake_db)
+    monkeypatch.setattr(api_market_topn, "DEFAULT_DB_PATH", fake_db)
+    monkeypatch.setattr(api_holdings_market_evidence, "MARKET_DB_PATH", fake_db)
+    _seed(fake_db)
+    return fake_db
+
+
+def _seed(db: Path) -> None:
+    series = {
+        "069500": ("KODEX 200", [100.0 + i * 0.5 for i in range(25)]),
+        "100001": ("Strong ETF", [100.0 + i for i in range(25)]),
+        "100002": ("Flat ETF", [100.0] * 25),
+    }
+    for ticker, (name, closes) in series.items():
+        upsert_etf_master(
+            [EtfMasterRow(ticker, name, "1", 100.0, 1000, 5000.0)],
+            source="TestSource",
+            db_path=db,
+        )
+        rows = [
+            EtfDailyPriceRow(
+                ticker, (END - timedelta(days=24 - i)).isoformat(), c, c, c, c, 0, 0
+            )
+            for i, c in enumerate(closes)
+        ]
+        upsert_daily_prices(rows, source="TestSource", db_path=db)
+    upsert_constituents(
+        [
+            ConstituentRow(tk, "2026-05-29", "test", 1, "005930", "삼성전자", 20.0)
+            for tk in ("100001", "100002")
+        ],
+        db_path=db,
+    )
+    upsert_nav_rows(
+        [NavDailyRow("100001", "2026-05-29", 100.0, 100.5, 0.5, "test", "ok", None)],
+        db_path=db,
+    )
+
+
+@pytest.fixture
+def reads(monkeypatch: pytest.MonkeyPatch) -> Counter:
+    """evidence_context 가 부르는 store 함수 호출 수 (dataset, key)."""
+    counter: Counter = Counter()
+
+    def counting(name: str, key_of):
+        real = getattr(evidence_context, name)
+
+        def wrapper(*args, **kwargs):
+            counter[(name, key_of(args, kwargs))] += 1
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(evidence_context, name, wrapper)
+
+    counting("fetch_price_history", lambda a, k: a[0])
+    counting("fetch_benchmark_history", lambda a, k: a[0])
+    counting("latest_constituent_asof", lambda a, k: a[0])
+    counting("fetch_latest_nav", lambda a, k: k["etf_ticker"])
+    counting("fetch_latest_nav_many", lambda a, k: tuple(sorted(a[0])))
+    counting("fetch_constituents_many", lambda a, k: tuple(sorted(a[0])))
+    counting("get_etf_name_map", lambda a, k: None)
+    return counter
+
+
+def _holding(ticker: str) -> Holding:
+    return Holding(
+        ticker=ticker, quantity=10.0, avg_buy_price=100.0, account_group="일반"
+    )
+
+
+def test_builder_with_context_reads_each_dataset_once(market_db, reads) -> None:
+    holdings = [_holding("100001"), _holding("100002")]
+    ctx = EvidenceContext(db_path=market_db)
+    ctx.focus(h.ticker for h in holdings)
+    topn = ctx.topn(n=5)
+    out = build_holdings_market_evidence(
+        holdings=holdings, topn_payload=topn, db_path=market_db, context=ctx
+    )
+
+    assert all(n == 1 for n in reads.values()), reads
+    assert reads[("fetch_price_history", "069500")] == 1
+    # 구성종목 (후보 + 보유) / NAV 는 bulk 1 쿼리씩 — ticker 별 조회 없음.
+    assert reads[("fetch_constituents_many", ("069500", "100001", "100002"))] == 1
+    assert reads[("fetch_latest_nav_many", ("100001", "100002"))] == 1
+    assert not any(name == "latest_constituent_asof" for name, _ in reads)
+    assert ctx.loads["topn"] == 1
+
+    # 결과는 context 없이 만든 것과 같다.
+    baseline = build_holdings_market_evidence(
+        holdings=holdings,
+        topn_payload=compute_topn(n=5, db_path=market_db),
+        db_path=market_db,
+    )
+    assert out["holdings"] == baseline["holdings"]
+    assert out["judgment_summary"] == baseline["judgment_summary"]
+
+
+def test_non_focus_series_are_not_retained(market_db, reads) -> None:
+    ctx = EvidenceContext(db_path=market_db)
+    ctx.price_history("100002")
+    ctx.price_history("100002")
+    assert reads[("fetch_price_history", "100002")] == 2
+    ctx.focus(["100002"])
+    ctx.price_history("100002")
+    ctx.price_history("100002")
+    assert reads[("fetch_price_history", "100002")] == 3
+
+
+def test_market_evidence_endpoint_reads_each_dataset_once(
+    market_db, reads, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    market_refresh_service.reset_state_for_testing()
+    client = TestClient(api_module.app)
+    res = client.put(
+        "/holdings",
+        json={
+            "holdings": [
+                {"ticker": t, "name": t, "quantity": 1, "avg_buy_price": 100}
+                for t in ("100001", "100002")
+            ]
+        },
+    )
+    assert res.status_code == 200, res.text
+    from app import holdings as holdings_module
+
+    loads = Counter()
+    real_load = holdings_module.load
+
+    def counting_load():
+        loads["holdings"] += 1
+        return real_load()
+
+    monkeypatch.setattr(holdings_module, "load", counting_load)
+
+    res = client.get("/holdings/market-evidence/latest")
+    assert res.status_code == 200
+    assert res.json()["summary"]["total_holdings_count"] == 2
+    assert loads["holdings"] == 1
+    assert all(n == 1 for n in reads.values()), reads
+    assert reads[("fetch_latest_nav_many", ("100001", "100002"))] == 1
@@ -0,0 +1,150 @@
+"""fetcher record / replay 레이어 + 오프라인 벤치마크 CLI 테스트 (2026-10).
+
+실제 네트워크 호출 없음 — record 대상 fetcher 도 테스트 stub.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from app import market_timeseries_naver_yahoo_adapter as adapter
+from app.etf_constituents_fetcher import FetchedConstituent, FetchResult
+from app.fetch_replay import (
+    MODE_RECORD,
+    MODE_REPLAY,
+    FixtureMissingError,
+    FixtureStore,
+    RecordReplaySession,
+    ReplayedFetchError,
+    SimulatedFetchError,
+    SimulationProfile,
+    decode_value,
+    encode_value,
+)
+
+
+def _df() -> pd.DataFrame:
+    idx = pd.to_datetime(["2026-10-01", "2026-10-02"])
+    return pd.DataFrame({"Close": [100.0, float("nan")], "Volume": [1, 2]}, index=idx)
+
+
+def _key(*args, **_kwargs) -> str:
+    return str(args[0])
+
+
+def test_codec_roundtrip_dataframe_dataclass_tuple():
+    df = _df()
+    back = decode_value(encode_value(df))
+    pd.testing.assert_frame_equal(back, df, check_freq=False)
+
+    fr = FetchResult(
+        status="ok",
+        source="naver",
+        constituents=[FetchedConstituent(1, "005930", "삼성전자", 25.5)],
+        effective_asof="2026-10-01",
+    )
+    assert decode_value(encode_value(fr)) == fr
+    assert decode_value(encode_value((200, "body"))) == (200, "body")
+    assert decode_value(encode_value(date(2026, 10, 1))) == date(2026, 10, 1)
+
+
+def test_record_then_replay_without_calling_real_fetcher(tmp_path):
+    store = FixtureStore(tmp_path)
+    calls: list[str] = []
+
+    def real(ticker):
+        calls.append(ticker)
+        if ticker == "bad":
+            raise ConnectionError("boom")
+        return {"ticker": ticker}
+
+    rec = RecordReplaySession(store, mode=MODE_RECORD).wrap("f", real, _key)
+    assert rec("069500") == {"ticker": "069500"}
+    with pytest.raises(ConnectionError):
+        rec("bad")
+
+    rep = RecordReplaySession(store, mode=MODE_REPLAY).wrap("f", None, _key)
+    assert rep("069500") == {"ticker": "069500"}
+    with pytest.raises(ReplayedFetchError, match="ConnectionError: boom"):
+        rep("bad")
+    with pytest.raises(FixtureMissingError):
+        rep("unknown")
+    assert calls == ["069500", "bad"]
+    assert store.keys("f") == ["069500", "bad"]
+
+
+def test_replay_simulates_latency_and_errors_deterministically(tmp_path):
+    store = FixtureStore(tmp_path)
+    store.put("f", "a", value=1)
+    slept: list[float] = []
+
+    def run(seed):
+        session = RecordReplaySession(
+            store,
+            mode=MODE_REPLAY,
+            profile=SimulationProfile(
+                latency_seconds=0.05, jitter_seconds=0.01, error_rate=0.3, seed=seed
+            ),
+            sleeper=slept.append,
+        )
+        fn = session.wrap("f", None, _key)
+        outcome = []
+        for _ in range(20):
+            try:
+                outcome.append(fn("a"))
+            except SimulatedFetchError:
+                outcome.append("err")
+        return outcome, session.stats["f"]
+
+    first, stats = run(7)
+    second, _ = run(7)
+    assert first == second
+    assert 0 < stats.simulated_errors < 20
+    assert stats.calls == 20
+    assert all(0.04 <= s <= 0.06 for s in slept)
+
+
+def test_install_patches_and_restores_module_fetchers(tmp_path):
+    store = FixtureStore(tmp_path)
+    store.put("timeseries_price", "NAVER:069500", value=_df())
+    original = adapter._default_price_fetcher
+    session = RecordReplaySession(store, mode=MODE_REPLAY)
+    with session.install():
+        result = adapter.fetch_ticker_prices(
+            "069500", start=date(2026, 1, 1), end=date(2026, 10, 2)
+        )
+    assert adapter._default_price_fetcher is original
+    assert result.source == adapter.SOURCE_NAVER
+    assert result.rows[0] == ("2026-10-01", 100.0)
+
+
+def test_benchmark_cli_runs_all_stages_offline(tmp_path, capsys):
+    from scripts.benchmark_ingestion_offline import main
+
+    rc = main(
+        [
+            "--fixtures",
+            str(tmp_path / "fx"),
+            "--synthesize",
+            "12",
+            "--days",
+            "30",
+            "--asof",
+            "2026-10-16",
+            "--db-path",
+            str(tmp_path / "bench.sqlite"),
+            "--json",
+        ]
+    )
+    assert rc == 0
+    reports = {r["stage"]: r for r in json.loads(capsys.readouterr().out)}
+    assert list(reports) == ["universe", "price", "nav", "constituents", "timeseries"]
+    for stage in ("price", "nav", "constituents", "timeseries"):
+        assert reports[stage]["items"] == 12
+        assert reports[stage]["ok"] == 12, stage
+        assert reports[stage]["missing_fixtures"] == 0
+        assert reports[stage]["items_per_second"] > 0
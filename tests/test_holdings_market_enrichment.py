@@ -475,11 +475,12 @@ def test_market_cache_rolls_back_on_disk_write_failure(monkeypatch):
     market_cache.upsert_many([q1])
     assert market_cache.get("069500") is not None
 
-    # 2) 쓰기 실패 주입 — _atomic_write 가 raise
-    def _boom(path, text):
+    # 2) 쓰기 실패 주입 — journal append 가 raise
+    # (2026-10: 디스크 쓰기 경로가 전체 재작성 _atomic_write → _append_journal).
+    def _boom(path, quotes):
         raise OSError("disk write failure injected")
 
-    monkeypatch.setattr(market_cache, "_atomic_write", _boom)
+    monkeypatch.setattr(market_cache, "_append_journal", _boom)
 
     q2 = market_cache.MarketQuote(
         ticker="091160",
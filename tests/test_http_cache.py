@@ -0,0 +1,157 @@
+"""read-only GET 조건부 요청 — ETag / If-None-Match → 304 (2026-10, app.http_cache).
+
+- 데이터가 그대로면 304 + 본문 없음, endpoint 계산은 실행되지 않는다.
+- 데이터 (SQLite / snapshot 파일 / holdings 파일) 가 바뀌면 ETag 도 바뀐다.
+- query 가 다르면 ETag 가 다르다. Cache-Control 은 항상 재검증 (no-cache).
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import (
+    api_holdings_market_evidence,
+    api_market_topn,
+    api_ml_sanity,
+    api_price_series,
+    holdings as holdings_module,
+    market_data_store,
+)
+from app.api import app
+from app.market_data_store import EtfDailyPriceRow, init_db, upsert_daily_prices
+
+
+def _boom(*_args, **_kwargs):
+    raise AssertionError("304 경로에서 계산이 실행되면 안 된다")
+
+
+def _seed(db: Path, rows: list[tuple[str, float]]) -> None:
+    upsert_daily_prices(
+        [EtfDailyPriceRow("069500", d, c, c, c, c, 0, 0) for (d, c) in rows],
+        source="test",
+        db_path=db,
+    )
+
+
+@pytest.fixture
+def market_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    monkeypatch.setattr(api_price_series, "MARKET_DB_PATH", db)
+    monkeypatch.setattr(api_market_topn, "DEFAULT_DB_PATH", db)
+    monkeypatch.setattr(market_data_store, "DEFAULT_DB_PATH", db)
+    monkeypatch.setattr(api_holdings_market_evidence, "MARKET_DB_PATH", db)
+    return db
+
+
+def test_price_series_not_modified_skips_read(
+    market_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    _seed(market_db, [("2026-10-01", 100.0), ("2026-10-02", 101.0)])
+    client = TestClient(app)
+    first = client.get("/market/price-series", params={"ticker": "069500"})
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    monkeypatch.setattr(api_price_series, "fetch_price_history", _boom)
+    again = client.get(
+        "/market/price-series",
+        params={"ticker": "069500"},
+        headers={"If-None-Match": etag},
+    )
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+    # 목록 / weak 표기 / "*" 도 일치로 본다.
+    for value in (f'"other", W/{etag}', "*"):
+        res = client.get(
+            "/market/price-series",
+            params={"ticker": "069500"},
+            headers={"If-None-Match": value},
+        )
+        assert res.status_code == 304
+
+
+def test_price_series_etag_changes_with_data_and_query(market_db: Path):
+    _seed(market_db, [("2026-10-01", 100.0)])
+    client = TestClient(app)
+    etag = client.get("/market/price-series", params={"ticker": "069500"}).headers[
+        "ETag"
+    ]
+    other = client.get("/market/price-series", params={"ticker": "102110"})
+    assert other.headers["ETag"] != etag
+
+    _seed(market_db, [("2026-10-02", 101.0)])
+    res = client.get(
+        "/market/price-series",
+        params={"ticker": "069500"},
+        headers={"If-None-Match": etag},
+    )
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+    assert res.json()["available_to"] == "2026-10-02"
+
+
+def test_topn_not_modified_skips_compute(
+    market_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    client = TestClient(app)
+    etag = client.get("/market/topn/latest").headers["ETag"]
+    monkeypatch.setattr(api_market_topn, "compute_topn", _boom)
+    res = client.get("/market/topn/latest", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    # 다른 query (n) 는 다른 ETag — 계산 경로로 간다.
+    with pytest.raises(AssertionError):
+        client.get("/market/topn/latest?n=5", headers={"If-None-Match": etag})
+
+
+def test_ml_sanity_etag_follows_snapshot_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    snap = tmp_path / "ml_feature_sanity_latest.json"
+    monkeypatch.setattr(api_ml_sanity, "SANITY_SNAPSHOT_PATH", snap)
+    client = TestClient(app)
+    missing = client.get("/ml/feature-sanity/latest")
+    assert missing.json()["status"] == "empty"
+
+    snap.write_text(json.dumps({"status": "ok"}), encoding="utf-8")
+    res = client.get(
+        "/ml/feature-sanity/latest",
+        headers={"If-None-Match": missing.headers["ETag"]},
+    )
+    assert res.status_code == 200
+    assert res.json()["status"] == "ok"
+    res2 = client.get(
+        "/ml/feature-sanity/latest", headers={"If-None-Match": res.headers["ETag"]}
+    )
+    assert res2.status_code == 304
+
+
+def test_holdings_evidence_private_and_tracks_holdings_file(
+    market_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    client = TestClient(app)
+    first = client.get("/holdings/market-evidence/latest")
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    etag = first.headers["ETag"]
+
+    monkeypatch.setattr(api_holdings_market_evidence, "EvidenceContext", _boom)
+    res = client.get(
+        "/holdings/market-evidence/latest", headers={"If-None-Match": etag}
+    )
+    assert res.status_code == 304
+
+    before = api_holdings_market_evidence._data_version()
+    holdings_module.HOLDINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    holdings_module.HOLDINGS_FILE.write_text('{"holdings": []}', encoding="utf-8")
+    assert api_holdings_market_evidence._data_version() != before
+    with pytest.raises(AssertionError):
+        client.get("/holdings/market-evidence/latest", headers={"If-None-Match": etag})
@@ -0,0 +1,81 @@
+"""API cold start 예산 — `python -X importtime -c "import app.api"` (2026-10).
+
+새 프로세스에서 app.api 를 import 하고:
+- 무거운 외부 의존성 (pandas / numpy / torch / sklearn / FDR / pykrx / httpx) 이
+  로드되지 않는다 — 호출 지점 (수집 job / ML 실행 / 명시 갱신) 에서만 import.
+- app.* 모듈 자체 import 시간 합이 예산 안.
+- (Linux) import 직후 최대 RSS (VmHWM) 가 예산 안.
+
+예산은 현재 값의 수 배 여유 — 무거운 import 가 top-level 로 새로 들어오는 회귀를
+잡는 용도이지 미세 측정이 아니다.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "torch",
+    "sklearn",
+    "scipy",
+    "FinanceDataReader",
+    "pykrx",
+    "httpx",
+)
+APP_SELF_IMPORT_BUDGET_US = 1_000_000
+MAX_RSS_BUDGET_MB = 150
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+
+
+def _importtime_rows() -> list[tuple[int, str]]:
+    """(self_us, module) 목록 — `import time: self | cumulative | name` 행."""
+    proc = _run("-X", "importtime", "-c", "import app.api")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line.split(":", 1)[1].split("|")
+        rows.append((int(self_us), name.strip()))
+    return rows
+
+
+def test_api_import_skips_heavy_dependencies_and_fits_budget():
+    rows = _importtime_rows()
+    loaded = {name for _us, name in rows}
+    assert "app.api" in loaded
+    heavy = sorted(name for name in loaded if name.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+    app_self_us = sum(us for us, name in rows if name.split(".")[0] == "app")
+    assert app_self_us < APP_SELF_IMPORT_BUDGET_US
+
+
+def test_api_import_peak_rss_within_budget():
+    # VmHWM (새 프로세스 최대 RSS) — ru_maxrss 는 fork 한 pytest 부모 값을 물려받는다.
+    if not Path("/proc/self/status").exists():
+        pytest.skip("/proc 없는 플랫폼")
+    proc = _run(
+        "-c",
+        "import app.api; "
+        "print(next(l.split()[1] for l in open('/proc/self/status') "
+        "if l.startswith('VmHWM:')))",
+    )
+    peak_mb = int(proc.stdout.strip().splitlines()[-1]) // 1024
+    assert peak_mb < MAX_RSS_BUDGET_MB
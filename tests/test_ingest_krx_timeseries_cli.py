@@ -326,3 +326,36 @@ def test_cli_output_is_ascii_safe(fake_db: Path, tmp_path: Path, capsys) -> None
     # stdout / stderr 모두 ASCII 만 사용 — Windows cp949 등으로 인코딩 가능.
     captured.out.encode("ascii")
     captured.err.encode("ascii")
+
+
+def test_cli_etf_publishes_snapshot_in_snapshot_mode(
+    fake_db: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """2026-10 — 적재 뒤 공통 후처리 (archive sync → 대시보드 계산 → 발행)."""
+    from app import dashboard_snapshot, market_data_snapshot
+
+    monkeypatch.setenv(market_data_snapshot.MODE_ENV, "on")
+    market_data_snapshot.reset_cache_for_tests()
+    _seed_universe(fake_db, ["069500"])
+    csv_path = tmp_path / "etf.csv"
+    _write_csv(
+        csv_path,
+        [
+            {"종목코드": "069500", "일자": "2024-10-29", "종가": "100.5"},
+            {"종목코드": "069500", "일자": "2024-10-30", "종가": "101.5"},
+        ],
+    )
+    for command, extra in (
+        ("benchmark", ["--benchmark-id", "069500", "--benchmark-name", "KODEX 200"]),
+        ("etf", []),
+    ):
+        rc = cli_main(
+            [command, "--csv", str(csv_path), *extra]
+            + ["--price-basis", "raw_close", "--db-path", str(fake_db)]
+        )
+        assert rc == 0
+    snap = market_data_snapshot.current_snapshot(fake_db)
+    assert snap is not None
+    assert len(fetch_price_history("069500", db_path=snap)) == 2
+    assert dashboard_snapshot.load(snap, dashboard_snapshot.KEY_NAV_DISCOUNT)
+    market_data_snapshot.reset_cache_for_tests()
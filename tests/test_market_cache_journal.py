@@ -0,0 +1,104 @@
+"""market_cache journal + compaction 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app import market_cache
+from app.market_cache import MarketQuote
+
+
+def _quote(ticker: str, price: float) -> MarketQuote:
+    return MarketQuote(
+        ticker=ticker,
+        name=f"ETF {ticker}",
+        current_price=price,
+        price_asof="2026-10-17T15:30:00+09:00",
+    )
+
+
+def _journal_lines() -> list[dict]:
+    path = market_cache.journal_path()
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_writes_append_only_changed_quotes():
+    market_cache.upsert_many([_quote("069500", 100.0), _quote("229200", 50.0)])
+    # snapshot 이 없던 첫 쓰기는 base snapshot 을 만들고 journal 을 비운다.
+    assert market_cache.CACHE_FILE.exists()
+    assert _journal_lines() == []
+    snapshot_before = market_cache.CACHE_FILE.read_text(encoding="utf-8")
+
+    market_cache.upsert_many([_quote("069500", 101.0), _quote("229200", 50.0)])
+    assert [r["ticker"] for r in _journal_lines()] == ["069500"]
+    assert market_cache.CACHE_FILE.read_text(encoding="utf-8") == snapshot_before
+
+    market_cache.upsert_many([_quote("069500", 101.0)])  # 변경 없음 → 기록 0
+    assert len(_journal_lines()) == 1
+
+
+def test_startup_replays_journal_and_skips_torn_line():
+    market_cache.upsert_many([_quote("069500", 100.0), _quote("229200", 50.0)])
+    market_cache.upsert_many([_quote("069500", 102.0)])
+    market_cache.upsert_many([_quote("0013P0", 11.0)])
+    with market_cache.journal_path().open("a", encoding="utf-8") as f:
+        f.write('{"ticker": "069500", "current_pr')  # 쓰는 중 종료된 마지막 줄
+
+    market_cache.reset_for_test()
+    cache = market_cache.get_all()
+    assert cache["069500"].current_price == 102.0
+    assert cache["229200"].current_price == 50.0
+    assert cache["0013P0"].current_price == 11.0
+
+
+def test_compaction_folds_journal_into_snapshot(monkeypatch):
+    monkeypatch.setattr(market_cache, "COMPACT_JOURNAL_LINES", 3)
+    market_cache.upsert_many([_quote("069500", 100.0)])
+    for i in range(3):
+        market_cache.upsert_many([_quote(f"10000{i}", 10.0 + i)])
+    assert _journal_lines() == []
+
+    snapshot = json.loads(market_cache.CACHE_FILE.read_text(encoding="utf-8"))
+    assert set(snapshot["items"]) == {"069500", "100000", "100001", "100002"}
+    market_cache.reset_for_test()
+    assert market_cache.get("100002").current_price == 12.0
+
+
+def test_failed_append_rolls_back_memory_and_journal(monkeypatch):
+    market_cache.upsert_many([_quote("069500", 100.0), _quote("0013P0", 11.0)])
+    market_cache.upsert_many([_quote("069500", 101.0)])
+    size = market_cache.journal_path().stat().st_size
+
+    def _boom(fd):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(market_cache.os, "fsync", _boom)
+        with pytest.raises(OSError, match="disk full"):
+            market_cache.upsert_many([_quote("069500", 999.0), _quote("229200", 1.0)])
+
+    assert market_cache.get("069500").current_price == 101.0
+    assert market_cache.get("229200") is None
+    # 이번 쓰기와 무관한 종목은 롤백 대상이 아니므로 그대로 남는다.
+    assert market_cache.get("0013P0").current_price == 11.0
+    assert market_cache.journal_path().stat().st_size == size
+    market_cache.reset_for_test()
+    assert market_cache.get("069500").current_price == 101.0
+
+
+def test_first_write_after_restart_merges_with_disk():
+    market_cache.upsert_many([_quote("069500", 100.0), _quote("229200", 50.0)])
+    market_cache.upsert_many([_quote("229200", 51.0)])
+    market_cache.reset_for_test()
+
+    market_cache.upsert_many([_quote("0013P0", 11.0)])
+    market_cache.reset_for_test()
+    assert {t: q.current_price for t, q in market_cache.get_all().items()} == {
+        "069500": 100.0,
+        "229200": 51.0,
+        "0013P0": 11.0,
+    }
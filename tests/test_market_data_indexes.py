@@ -0,0 +1,108 @@
+"""market_data.sqlite 보조 인덱스 마이그레이션 + 벤치마크 CLI 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from app.etf_constituents_store import init_constituents_db
+from app.etf_nav_store import init_nav_db
+from app import sqlite_schemas
+from app.market_data_indexes import (
+    LEGACY_MIGRATION_TABLE,
+    SECONDARY_INDEXES,
+    ensure_indexes,
+)
+from app.market_data_store import MARKET_REFRESH_LOG_DDL, init_db
+from app.sqlite_migrations import migrate
+
+
+def _indexes(db) -> set[str]:
+    with sqlite3.connect(str(db)) as con:
+        cur = con.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        return {r[0] for r in cur.fetchall()}
+
+
+def test_store_init_applies_all_indexes_once(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    init_nav_db(db)
+    init_constituents_db(db)
+    assert {ix.name for ix in SECONDARY_INDEXES} <= _indexes(db)
+    with sqlite3.connect(str(db)) as con:
+        # 적용 기록은 user_version 하나 — 별도 per-index 기록 테이블 없음.
+        assert (
+            con.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = ?", (LEGACY_MIGRATION_TABLE,)
+            ).fetchone()
+            is None
+        )
+        # 재실행은 아무것도 적용하지 않는다.
+        assert ensure_indexes(con, "etf_daily_price") == []
+
+
+def test_legacy_index_ledger_is_dropped_on_upgrade(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    with sqlite3.connect(str(db)) as con:
+        con.execute(
+            f"CREATE TABLE {LEGACY_MIGRATION_TABLE} (version INTEGER PRIMARY KEY, "
+            "name TEXT NOT NULL, applied_at TEXT NOT NULL)"
+        )
+        con.execute("PRAGMA user_version = 9")
+    assert migrate(db, sqlite_schemas.MARKET_DATA_SCHEMA) == [
+        "drop_index_migration_ledger"
+    ]
+    with sqlite3.connect(str(db)) as con:
+        assert (
+            con.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = ?", (LEGACY_MIGRATION_TABLE,)
+            ).fetchone()
+            is None
+        )
+
+
+def test_missing_table_is_skipped_until_created(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    with sqlite3.connect(str(db)) as con:
+        assert ensure_indexes(con, "market_refresh_log") == []
+        con.execute(MARKET_REFRESH_LOG_DDL)
+        assert ensure_indexes(con, "market_refresh_log") == [
+            "idx_market_refresh_log_created_at",
+            "idx_market_refresh_log_source_created_at",
+        ]
+
+
+def test_hot_queries_use_indexes(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    with sqlite3.connect(str(db)) as con:
+        plan = " ".join(
+            str(r[3])
+            for r in con.execute(
+                "EXPLAIN QUERY PLAN SELECT ticker, close FROM etf_daily_price "
+                "WHERE date = ?",
+                ("2026-10-16",),
+            )
+        )
+    assert "COVERING INDEX idx_etf_daily_price_date_ticker_close" in plan
+
+
+def test_benchmark_cli_reports_plans_before_and_after(capsys):
+    from scripts.benchmark_market_data_indexes import main
+
+    rc = main(
+        ["--tickers", "5", "--years", "1", "--end", "2026-10-16", "--repeat", "1"]
+        + ["--json"]
+    )
+    assert rc == 0
+    reports = {r["query"]: r for r in json.loads(capsys.readouterr().out)}
+    slice_report = reports["price_date_slice"]
+    assert any("SCAN etf_daily_price" in p for p in slice_report["before_plan"])
+    assert any(
+        "idx_etf_daily_price_date_ticker_close" in p for p in slice_report["after_plan"]
+    )
+    assert any(
+        "idx_market_refresh_log_created_at" in p
+        for p in reports["refresh_log_latest"]["after_plan"]
+    )
@@ -0,0 +1,220 @@
+"""market_data.sqlite 읽기 전용 snapshot 발행 / API 읽기 전환 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import (
+    api_market_topn,
+    api_price_series,
+    market_data_snapshot,
+    market_data_store,
+    market_refresh_service,
+    ml_export,
+    sqlite_pool,
+    sqlite_schemas,
+)
+from app.api import app
+from app.market_data_store import EtfDailyPriceRow, init_db, upsert_daily_prices
+from app.ml_feature_store import (
+    MarketRiskFeatureRow,
+    init_ml_feature_db,
+    upsert_market_risk_features,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_pointer_cache():
+    market_data_snapshot.reset_cache_for_tests()
+    yield
+    market_data_snapshot.reset_cache_for_tests()
+
+
+@pytest.fixture
+def live_db(tmp_path: Path) -> Path:
+    db = tmp_path / "market" / "market_data.sqlite"
+    init_db(db)
+    return db
+
+
+def _seed(db: Path, ticker: str, day: str, close: float) -> None:
+    upsert_daily_prices(
+        [EtfDailyPriceRow(ticker, day, close, close, close, close, 0, 0)],
+        source="test",
+        db_path=db,
+    )
+
+
+def _snapshot_files(db: Path) -> list[str]:
+    return sorted(
+        p.name for p in market_data_snapshot.snapshot_dir(db).glob("market_data.*")
+    )
+
+
+def test_publish_copies_consistent_readonly_file(live_db):
+    _seed(live_db, "069500", "2026-10-16", 100.0)
+    snap = market_data_snapshot.publish_snapshot(live_db)
+    _seed(live_db, "069500", "2026-10-17", 101.0)  # 발행 이후 쓰기는 미반영
+
+    assert market_data_snapshot.current_snapshot(live_db) == snap
+    assert market_data_store.fetch_price_history("069500", db_path=snap) == [
+        ("2026-10-16", 100.0)
+    ]
+    with sqlite_pool.pooled_connection(snap) as con:
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert (
+            con.execute("PRAGMA user_version").fetchone()[0]
+            == sqlite_schemas.MARKET_DATA_SCHEMA.latest_version
+        )
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            con.execute("DELETE FROM etf_daily_price")
+    # immutable 로 열었으므로 WAL / shm 파일이 생기지 않는다.
+    assert _snapshot_files(live_db) == [snap.name]
+
+
+def test_republish_switches_pointer_and_keeps_one_previous(live_db):
+    published = []
+    for i in range(3):
+        _seed(live_db, "069500", f"2026-10-1{i}", 100.0 + i)
+        published.append(market_data_snapshot.publish_snapshot(live_db))
+
+    assert market_data_snapshot.current_snapshot(live_db) == published[-1]
+    assert _snapshot_files(live_db) == sorted(p.name for p in published[1:])
+    assert (
+        len(market_data_store.fetch_price_history("069500", db_path=published[-1])) == 3
+    )
+
+
+def test_read_db_path_follows_mode(live_db, monkeypatch):
+    monkeypatch.delenv(market_data_snapshot.MODE_ENV, raising=False)
+    assert market_data_snapshot.read_db_path(live_db) == live_db
+
+    monkeypatch.setenv(market_data_snapshot.MODE_ENV, "on")
+    assert market_data_snapshot.read_db_path(live_db) == live_db  # 아직 발행 전
+    snap = market_data_snapshot.publish_if_enabled(live_db)
+    assert snap is not None
+    assert market_data_snapshot.read_db_path(live_db) == snap
+
+
+def test_api_reads_snapshot_while_live_db_is_write_locked(live_db, monkeypatch):
+    monkeypatch.setenv(market_data_snapshot.MODE_ENV, "on")
+    monkeypatch.setattr(api_price_series, "MARKET_DB_PATH", live_db)
+    monkeypatch.setattr(api_market_topn, "DEFAULT_DB_PATH", live_db)
+    _seed(live_db, "069500", "2026-10-16", 100.0)
+    market_data_snapshot.publish_snapshot(live_db)
+
+    writer = sqlite3.connect(str(live_db), isolation_level=None)
+    try:
+        writer.execute("BEGIN EXCLUSIVE")
+        writer.execute("DELETE FROM etf_daily_price")
+        client = TestClient(app)
+        body = client.get("/market/price-series", params={"ticker": "069500"}).json()
+        assert body["availability"] == "AVAILABLE"
+        assert [p["price"] for p in body["series"]] == [100.0]
+        assert client.get("/market/topn/latest").status_code == 200
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+
+def test_refresh_job_publishes_snapshot_when_enabled(live_db, monkeypatch):
+    monkeypatch.setenv(market_data_snapshot.MODE_ENV, "on")
+    market_refresh_service.reset_state_for_testing(db_path=live_db)
+
+    def _fail(*args, **kwargs):
+        raise RuntimeError("offline")
+
+    monkeypatch.setattr(market_refresh_service, "refresh_kospi_benchmark", _fail)
+    monkeypatch.setattr(market_refresh_service, "refresh_nav_universe", _fail)
+    market_refresh_service._execute_refresh_job(
+        refresh_id="snap-test",
+        db_path=live_db,
+        universe_fetcher=_fail,
+        price_fetcher=_fail,
+        end_date_for_prices=date(2026, 10, 16),
+    )
+    snap = market_data_snapshot.current_snapshot(live_db)
+    assert snap is not None
+    # 발행은 최종 상태 영속화 이후 — snapshot 에도 종료 상태가 들어 있다.
+    with sqlite3.connect(str(snap)) as con:
+        row = con.execute(
+            "SELECT refresh_id, last_attempt_status FROM market_refresh_state"
+        ).fetchone()
+    assert row == ("snap-test", "failed")
+
+
+def test_prune_does_not_close_other_threads_mid_query(live_db):
+    for i in range(1, 10):
+        _seed(live_db, "069500", f"2026-10-0{i}", 100.0 + i)
+    old = market_data_snapshot.publish_snapshot(live_db)
+    started, pruned = threading.Event(), threading.Event()
+    result: dict = {}
+
+    def reader():
+        with sqlite_pool.pooled_connection(old) as con:
+            cur = con.execute("SELECT date FROM etf_daily_price ORDER BY date")
+            result["head"] = cur.fetchmany(3)
+            started.set()
+            pruned.wait(5)
+            result["tail"] = cur.fetchall()
+        # 다음 acquire 때 retire 된 snapshot connection 을 스스로 닫는다.
+        with sqlite_pool.pooled_connection(live_db):
+            pass
+        result["con"] = con
+
+    t = threading.Thread(target=reader)
+    t.start()
+    assert started.wait(5)
+    for _ in range(2):
+        market_data_snapshot.publish_snapshot(live_db)
+    assert not old.exists()  # pin 이 없으면 바로 삭제
+    pruned.set()
+    t.join()
+    assert len(result["head"]) + len(result["tail"]) == 9
+    with pytest.raises(sqlite3.ProgrammingError):
+        result["con"].execute("SELECT 1")
+
+
+def test_prune_defers_pinned_snapshot_until_stream_ends(live_db, monkeypatch):
+    monkeypatch.setenv(market_data_snapshot.MODE_ENV, "on")
+    init_ml_feature_db(live_db)
+    days = [f"2026-09-2{i}" for i in range(5)]
+    upsert_market_risk_features(
+        [
+            MarketRiskFeatureRow(
+                **{
+                    f.name: (d if f.name == "asof" else None)
+                    for f in fields(MarketRiskFeatureRow)
+                }
+            )
+            for d in days
+        ],
+        db_path=live_db,
+    )
+    old = market_data_snapshot.publish_snapshot(live_db)
+    source = ml_export.open_export(
+        "market_risk_features", db_path=live_db, chunk_size=2
+    )
+    asof = source.columns.index("asof")
+    chunks = iter(source.chunks)
+    seen: list[str] = []
+    # 조각마다 다른 thread — streaming 응답이 worker 를 옮겨 다니는 상황.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        seen += [r[asof] for r in pool.submit(next, chunks).result()]
+        for _ in range(2):
+            market_data_snapshot.publish_snapshot(live_db)
+        assert old.exists()  # 읽는 중인 발행본은 삭제 보류
+        assert market_data_snapshot.current_snapshot(live_db) != old
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        rest = pool.submit(lambda: [r[asof] for c in chunks for r in c]).result()
+    assert seen + rest == days
+    assert not old.exists()  # 마지막 pin 이 풀리면서 삭제
+    assert len(_snapshot_files(live_db)) == 2
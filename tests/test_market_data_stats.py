@@ -0,0 +1,213 @@
+"""market_data.sqlite 테이블 통계 (trigger 유지 / fast · deep 점검) 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app import market_data_stats, market_data_store, sqlite_schemas
+from app.api import app
+from app.market_data_store import (
+    EtfDailyPriceRow,
+    init_db,
+    log_refresh,
+    upsert_daily_prices,
+)
+from app.market_topn_helpers import _latest_date_in_db
+
+
+def _row(ticker: str, d: str, close: float) -> EtfDailyPriceRow:
+    return EtfDailyPriceRow(ticker, d, None, None, None, close, 100, None)
+
+
+def _log(db: Path, run_id: str) -> None:
+    log_refresh(
+        run_id=run_id,
+        source="test",
+        asof="2026-10-16",
+        attempted=1,
+        success=1,
+        fail=0,
+        runtime_seconds=0.0,
+        db_path=db,
+    )
+
+
+def _stats(db: Path) -> dict[str, market_data_stats.TableStats]:
+    with sqlite3.connect(str(db)) as con:
+        return market_data_stats.read_stats(con)
+
+
+def _drift(db: Path) -> list[str]:
+    with sqlite3.connect(str(db)) as con:
+        stats = market_data_stats.read_stats(con)
+        return market_data_stats.drift(stats, market_data_stats.deep_scan(con))
+
+
+def test_triggers_track_counts_and_date_range(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    upsert_daily_prices(
+        [
+            _row("A", "2026-10-14", 1.0),
+            _row("A", "2026-10-15", 2.0),
+            _row("B", "2026-10-13", 3.0),
+        ],
+        source="test",
+        db_path=db,
+    )
+    # upsert 충돌 (UPDATE 경로) 은 행 수를 바꾸지 않는다.
+    upsert_daily_prices([_row("A", "2026-10-15", 2.5)], source="test", db_path=db)
+    s = _stats(db)["etf_daily_price"]
+    assert (s.row_count, s.min_date, s.max_date) == (3, "2026-10-13", "2026-10-15")
+
+    with sqlite3.connect(str(db)) as con:
+        con.execute("DELETE FROM etf_daily_price WHERE date = '2026-10-13'")
+        con.execute(
+            "UPDATE etf_daily_price SET date = '2026-10-16' WHERE date = '2026-10-15'"
+        )
+    s = _stats(db)["etf_daily_price"]
+    assert (s.row_count, s.min_date, s.max_date) == (2, "2026-10-14", "2026-10-16")
+    assert _drift(db) == []
+
+
+def test_record_run_stamps_only_changed_tables(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    upsert_daily_prices([_row("A", "2026-10-16", 1.0)], source="test", db_path=db)
+    _log(db, "run-1")
+    stats = _stats(db)
+    assert stats["etf_daily_price"].last_run_id == "run-1"
+    assert stats["market_refresh_log"].last_run_id == "run-1"
+    assert stats["etf_nav_daily"].last_run_id is None
+
+    _log(db, "run-2")  # 가격은 그대로 — refresh_log 만 바뀜.
+    stats = _stats(db)
+    assert stats["etf_daily_price"].last_run_id == "run-1"
+    assert stats["market_refresh_log"].last_run_id == "run-2"
+
+
+def test_repeated_run_id_log_keeps_stats_exact(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    for _ in range(3):
+        _log(db, "run-1")
+    _log(db, "run-2")
+    assert _stats(db)["market_refresh_log"].row_count == 2
+    assert _drift(db) == []
+
+
+def test_migration_seeds_existing_rows_and_rebuild_fixes_drift(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    with sqlite3.connect(str(db)) as con:
+        con.execute(market_data_store.ETF_DAILY_PRICE_DDL)
+        con.executemany(
+            "INSERT INTO etf_daily_price (ticker, date, close, source, fetched_at) "
+            "VALUES (?, ?, 1.0, 'legacy', 'x')",
+            [("A", "2025-01-02"), ("A", "2025-01-03"), ("B", "2025-01-03")],
+        )
+    sqlite_schemas.ensure_market_data(db)
+    s = _stats(db)["etf_daily_price"]
+    assert (s.row_count, s.min_date, s.max_date) == (3, "2025-01-02", "2025-01-03")
+
+    with sqlite3.connect(str(db)) as con:
+        con.execute("UPDATE market_data_table_stats SET row_count = 99")
+    assert "etf_daily_price" in _drift(db)
+    with sqlite3.connect(str(db)) as con:
+        market_data_stats.rebuild(con)
+    assert _drift(db) == []
+
+
+def test_topn_latest_date_reads_stats_with_fallback(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    upsert_daily_prices([_row("A", "2026-10-16", 1.0)], source="test", db_path=db)
+    assert _latest_date_in_db(db) == "2026-10-16"
+    with sqlite3.connect(str(db)) as con:
+        con.execute("UPDATE market_data_table_stats SET max_date = '2099-01-01'")
+    assert _latest_date_in_db(db) == "2099-01-01"  # 통계 행을 읽었다 (scan 없음).
+
+    legacy = tmp_path / "legacy.sqlite"
+    with sqlite3.connect(str(legacy)) as con:
+        con.execute(market_data_store.ETF_DAILY_PRICE_DDL)
+        con.execute(
+            "INSERT INTO etf_daily_price (ticker, date, close, source, fetched_at) "
+            "VALUES ('A', '2026-01-05', 1.0, 'legacy', 'x')"
+        )
+    assert _latest_date_in_db(legacy) == "2026-01-05"
+
+
+def test_preflight_fast_mode_skips_full_scans(tmp_path, monkeypatch):
+    from scripts import run_oci_database_preflight as m
+
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    upsert_daily_prices([_row("A", "2026-10-16", 1.0)], source="test", db_path=db)
+    statements: list[str] = []
+    real_connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        con = real_connect(*args, **kwargs)
+        con.set_trace_callback(statements.append)
+        return con
+
+    monkeypatch.setattr(m.sqlite3, "connect", tracing_connect)
+    obs = m._observe_sqlite(str(db), deep=False)
+    assert obs["check_mode"] == "fast"
+    assert obs["integrity_check"] == "skipped"
+    assert obs["table_stats"]["etf_daily_price"]["row_count"] == 1
+    assert obs["stats_drift"] is None
+    assert m._market_readiness(obs, "resolved") == "READY"
+    assert not any("integrity_check" in s or "COUNT(" in s for s in statements)
+
+    deep = m._observe_sqlite(str(db), deep=True)
+    assert deep["integrity_check"] == "ok"
+    assert deep["stats_drift"] == []
+    assert m._market_readiness(deep, "resolved") == "READY"
+
+
+def test_preflight_deep_drift_is_not_ready(tmp_path, monkeypatch, capsys):
+    from scripts import run_oci_database_preflight as m
+
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    upsert_daily_prices([_row("A", "2026-10-16", 1.0)], source="test", db_path=db)
+    with sqlite3.connect(str(db)) as con:
+        con.execute("UPDATE market_data_table_stats SET row_count = 99")
+
+    deep = m._observe_sqlite(str(db), deep=True)
+    assert "etf_daily_price" in deep["stats_drift"]
+    assert m._market_readiness(deep, "resolved") == "NOT_READY"
+
+    monkeypatch.setattr(
+        m, "_resolve_market_data_path", lambda: (str(db), "resolved", "same")
+    )
+    monkeypatch.setattr(
+        "sys.argv", ["run_oci_database_preflight", "--environment", "pc", "--deep"]
+    )
+    assert m.main() == 0
+    out = capsys.readouterr().out
+    assert "[market_data] readiness=NOT_READY" in out
+    assert "scripts/rebuild_market_data_stats.py" in out
+
+
+def test_startup_status_reports_market_table_stats(tmp_path, monkeypatch):
+    db = tmp_path / "market_data.sqlite"
+    init_db(db)
+    upsert_daily_prices([_row("A", "2026-10-16", 1.0)], source="test", db_path=db)
+    _log(db, "run-9")
+    monkeypatch.setattr(market_data_store, "DEFAULT_DB_PATH", db)
+
+    body = TestClient(app).get("/oci/startup-status").json()
+    tables = {t["table"]: t for t in body["market_data_tables"]}
+    assert tables["etf_daily_price"]["row_count"] == 1
+    assert tables["etf_daily_price"]["max_date"] == "2026-10-16"
+    assert tables["etf_daily_price"]["last_run_id"] == "run-9"
+
+    monkeypatch.setattr(
+        market_data_store, "DEFAULT_DB_PATH", tmp_path / "missing.sqlite"
+    )
+    assert TestClient(app).get("/oci/startup-status").json()["market_data_tables"] == []
+    assert not (tmp_path / "missing.sqlite").exists()
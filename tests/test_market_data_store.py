@@ -50,13 +50,28 @@ def test_init_db_creates_expected_tables_only(db_path: Path) -> None:
             "AND name NOT LIKE 'sqlite_%' ORDER BY name"
         )
         names = sorted(row[0] for row in cur.fetchall())
+    # 2026-10 — market_data.sqlite 는 파일 단위 user_version 마이그레이션
+    # (app.sqlite_schemas) 으로 같은 파일을 쓰는 store 테이블까지 함께 만든다.
     assert names == [
+        # 2026-10 — refresh 직후 계산해 둔 대시보드 응답 (app.dashboard_snapshot).
+        "dashboard_snapshot",
+        "etf_constituent_refresh_log",
+        "etf_constituents",
         "etf_daily_price",
         "etf_master",
+        "etf_ml_feature_daily",
+        "etf_nav_daily",
+        "market_benchmark_daily_price",
+        # 2026-10 — 테이블 행 수 / 날짜 범위 통계 (app.market_data_stats).
+        "market_data_table_stats",
         "market_refresh_log",
         "market_refresh_state",
+        "market_risk_feature_daily",
         "market_timeseries_ingestion_state",
         "market_timeseries_refresh_state",
+        # 2026-10 — 종가 columnar archive 동기화 추적 (app.price_archive).
+        "price_archive_dirty",
+        "price_archive_meta",
     ]
 
 
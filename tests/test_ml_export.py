@@ -0,0 +1,204 @@
+"""ML feature / 예측 streaming export (2026-10, app.ml_export).
+
+- keyset 조각 경계 (chunk_size) 와 무관하게 PK 순서 전체 행, 중복 / 누락 없음.
+- asof 구간 · ticker 필터, CSV header, 빈 결과.
+- API: NDJSON / CSV streaming 응답, 잘못된 필터는 422.
+- CLI: 파일 출력, 잘못된 필터는 exit 2.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import api_ml_export, market_flow_walk_forward, ml_export
+from app.api import app
+from app.ml_feature_store import (
+    EtfMlFeatureRow,
+    MarketRiskFeatureRow,
+    init_ml_feature_db,
+    upsert_etf_features,
+    upsert_market_risk_features,
+)
+
+DATES = ["2026-09-28", "2026-09-29", "2026-09-30"]
+TICKERS = ["069500", "102110", "379800"]
+
+
+def _row(cls, **values):
+    return cls(**{f.name: values.get(f.name) for f in fields(cls)})
+
+
+@pytest.fixture
+def feature_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    db = tmp_path / "market_data.sqlite"
+    init_ml_feature_db(db)
+    upsert_etf_features(
+        [
+            _row(
+                EtfMlFeatureRow,
+                asof=d,
+                ticker=t,
+                name=f"ETF {t}",
+                return_5d=i * 0.1,
+            )
+            for i, (d, t) in enumerate((d, t) for d in DATES for t in TICKERS)
+        ],
+        db_path=db,
+    )
+    upsert_market_risk_features(
+        [_row(MarketRiskFeatureRow, asof=d, kodex200_return_1d=0.5) for d in DATES],
+        db_path=db,
+    )
+    monkeypatch.setattr(api_ml_export, "DEFAULT_DB_PATH", db)
+    return db
+
+
+def _ndjson(chunks) -> list[dict]:
+    return [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4, 9, 1000])
+def test_chunks_cover_all_rows_in_key_order(feature_db: Path, chunk_size: int):
+    source = ml_export.open_export(
+        "etf_features", db_path=feature_db, chunk_size=chunk_size
+    )
+    chunks = list(source.chunks)
+    assert all(len(c) <= chunk_size for c in chunks)
+    keys = [
+        (r[source.columns.index("asof")], r[source.columns.index("ticker")])
+        for c in chunks
+        for r in c
+    ]
+    assert keys == [(d, t) for d in DATES for t in TICKERS]
+
+
+def test_filters_and_formats(feature_db: Path):
+    rows = _ndjson(
+        ml_export.encode(
+            ml_export.open_export(
+                "etf_features",
+                start="2026-09-29",
+                end="2026-09-30",
+                tickers=["379800", "069500", " "],
+                db_path=feature_db,
+                chunk_size=1,
+            ),
+            "ndjson",
+        )
+    )
+    assert [(r["asof"], r["ticker"]) for r in rows] == [
+        ("2026-09-29", "069500"),
+        ("2026-09-29", "379800"),
+        ("2026-09-30", "069500"),
+        ("2026-09-30", "379800"),
+    ]
+    assert rows[0]["name"] == "ETF 069500" and rows[0]["nav"] is None
+
+    text = b"".join(
+        ml_export.encode(
+            ml_export.open_export("market_risk_features", db_path=feature_db), "csv"
+        )
+    ).decode()
+    table = list(csv.reader(io.StringIO(text)))
+    assert table[0][0] == "asof" and "kodex200_return_1d" in table[0]
+    assert [r[0] for r in table[1:]] == DATES
+
+    empty = ml_export.open_export(
+        "market_risk_features", start="2027-01-01", db_path=feature_db
+    )
+    assert (
+        b"".join(ml_export.encode(empty, "csv")).decode() == ",".join(table[0]) + "\n"
+    )
+
+    with pytest.raises(ml_export.ExportError):
+        ml_export.open_export(
+            "market_risk_features", tickers=["069500"], db_path=feature_db
+        )
+    with pytest.raises(ml_export.ExportError):
+        ml_export.open_export("etf_features", start="2026-10-01", end="2026-09-01")
+
+
+def test_walk_forward_predictions_csv_stream(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    path = tmp_path / "predictions.csv"
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["as_of_date", "ridge_prediction_pct", "vix_source_date"])
+        for d in DATES:
+            writer.writerow([d, "1.5", ""])
+    monkeypatch.setattr(
+        market_flow_walk_forward, "WALK_FORWARD_PREDICTIONS_CSV_PATH", path
+    )
+    rows = _ndjson(
+        ml_export.encode(
+            ml_export.open_export(
+                "walk_forward_predictions", start="2026-09-29", chunk_size=1
+            ),
+            "ndjson",
+        )
+    )
+    assert rows == [
+        {"as_of_date": d, "ridge_prediction_pct": "1.5", "vix_source_date": None}
+        for d in DATES[1:]
+    ]
+    path.unlink()
+    missing = ml_export.open_export("walk_forward_predictions")
+    assert list(ml_export.encode(missing, "ndjson")) == []
+
+
+def test_api_streams_ndjson_and_csv(feature_db: Path):
+    client = TestClient(app)
+    res = client.get(
+        "/ml/export/etf_features",
+        params=[("ticker", "102110"), ("start", "2026-09-30")],
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    assert "etf_features.ndjson" in res.headers["content-disposition"]
+    assert [json.loads(line)["ticker"] for line in res.text.splitlines()] == ["102110"]
+
+    res = client.get("/ml/export/market_risk_features", params={"format": "csv"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+    assert len(res.text.splitlines()) == 1 + len(DATES)
+
+    bad = client.get("/ml/export/market_risk_features", params={"ticker": "069500"})
+    assert bad.status_code == 422
+    assert client.get("/ml/export/etf_features?start=20260930").status_code == 422
+    assert client.get("/ml/export/unknown").status_code == 422
+
+
+def test_cli_writes_file(feature_db: Path, tmp_path: Path):
+    from scripts.export_ml_data import main
+
+    out = tmp_path / "out" / "features.csv"
+    rc = main(
+        [
+            "etf_features",
+            "--format",
+            "csv",
+            "--ticker",
+            "069500",
+            "--db-path",
+            str(feature_db),
+            "--chunk-size",
+            "2",
+            "--output",
+            str(out),
+        ]
+    )
+    assert rc == 0
+    table = list(csv.reader(out.open(encoding="utf-8")))
+    assert [r[1] for r in table[1:]] == ["069500"] * len(DATES)
+    assert (
+        main(["market_risk_features", "--ticker", "x", "--db-path", str(feature_db)])
+        == 2
+    )
@@ -0,0 +1,191 @@
+"""Naver 디스크 HTTP 캐시 + conditional request 테스트 (2026-10).
+
+외부 네트워크 없이 urlopen 을 주입해 검증한다.
+"""
+
+from __future__ import annotations
+
+import json
+import urllib.error
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import naver_etf_universe_fetcher as nuf
+from app import naver_http_cache as nhc
+
+_URL = "https://example.invalid/etfItemList.nhn"
+_T0 = datetime(2026, 10, 1, 0, 0, tzinfo=timezone.utc)
+
+
+class _FakeResp:
+    def __init__(self, body: bytes, headers: dict, status: int = 200):
+        self._body = body
+        self.headers = headers
+        self.status = status
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+class _FakeServer:
+    """ETag 기반 304 를 흉내내는 urlopen 대체."""
+
+    def __init__(self, body: bytes, etag: str = '"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests: list[dict] = []
+        self.down = False
+
+    def __call__(self, req, timeout=None):  # noqa: ARG002
+        headers = dict(req.header_items())
+        self.requests.append(headers)
+        if self.down:
+            raise urllib.error.URLError("network down")
+        if headers.get("If-none-match") == self.etag:
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+        return _FakeResp(
+            self.body,
+            {"ETag": self.etag, "Content-Type": "application/json; charset=utf-8"},
+        )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(nhc, "CACHE_DIR", tmp_path / "http_cache")
+    nuf.reset_cache_for_tests()
+    yield
+    nuf.reset_cache_for_tests()
+
+
+def _get(server, *, max_age=30, now=_T0):
+    return nhc.cached_get(
+        _URL,
+        headers={"Accept": "application/json"},
+        max_age_seconds=max_age,
+        timeout=1,
+        urlopen=server,
+        now=now,
+    )
+
+
+def test_first_call_downloads_and_persists():
+    server = _FakeServer(b'{"a": 1}')
+    r = _get(server)
+    assert r.cache_status == "downloaded"
+    assert r.body == b'{"a": 1}'
+    assert len(list(nhc.CACHE_DIR.glob("*.body"))) == 1
+
+
+def test_within_max_age_serves_disk_without_network():
+    server = _FakeServer(b'{"a": 1}')
+    _get(server)
+    r = _get(server, now=_T0 + timedelta(seconds=10))
+    assert r.cache_status == "fresh"
+    assert len(server.requests) == 1
+
+
+def test_expired_entry_sends_conditional_request_and_reuses_body_on_304():
+    server = _FakeServer(b'{"a": 1}')
+    first = _get(server)
+    r = _get(server, now=_T0 + timedelta(seconds=60))
+    assert r.cache_status == "not_modified"
+    assert r.body == b'{"a": 1}'
+    assert r.body_sha256 == first.body_sha256
+    assert server.requests[-1].get("If-none-match") == '"v1"'
+    meta = json.loads(next(nhc.CACHE_DIR.glob("*.json")).read_text())
+    assert meta["fetched_at"] == "2026-10-01T00:01:00Z"
+
+
+def test_network_error_returns_stale_disk_body():
+    server = _FakeServer(b'{"a": 1}')
+    _get(server)
+    server.down = True
+    r = _get(server, max_age=0)
+    assert r.cache_status == "stale_on_error"
+    assert r.body == b'{"a": 1}'
+    assert "network down" in r.error
+
+
+def test_network_error_without_entry_is_error():
+    server = _FakeServer(b"{}")
+    server.down = True
+    r = _get(server)
+    assert r.cache_status == "error"
+    assert r.body is None
+
+
+def test_corrupted_body_is_ignored():
+    server = _FakeServer(b'{"a": 1}')
+    _get(server)
+    next(nhc.CACHE_DIR.glob("*.body")).write_bytes(b"tampered")
+    r = _get(server, now=_T0 + timedelta(seconds=1))
+    # hash 불일치 → entry 무시 → 무조건 재다운로드 (conditional header 없음).
+    assert r.cache_status == "downloaded"
+    assert "If-none-match" not in server.requests[-1]
+
+
+# ─── fetch_universe_snapshot 통합 ─────────────────────────────────────
+
+
+def _universe_body() -> bytes:
+    payload = {
+        "result": {
+            "etfItemList": [
+                {
+                    "itemcode": "069500",
+                    "itemname": "KODEX 200",
+                    "nav": "33,520",
+                    "nowVal": "33,535",
+                }
+            ]
+        }
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def test_universe_snapshot_skips_reparse_on_unchanged_body(monkeypatch):
+    server = _FakeServer(_universe_body())
+    real_cached_get = nhc.cached_get
+
+    def _cached_get(url, **kwargs):
+        kwargs["urlopen"] = server
+        return real_cached_get(url, **kwargs)
+
+    monkeypatch.setattr(nuf, "cached_get", _cached_get)
+
+    first = nuf.fetch_universe_snapshot()
+    assert first.status == "ok"
+    assert first.parse_skipped is False
+    assert first.http_cache_status == "downloaded"
+
+    # force — TTL / 디스크 max_age 무시 → 304 → 같은 body hash → 재파싱 생략.
+    second = nuf.fetch_universe_snapshot(force=True)
+    assert second.http_cache_status == "not_modified"
+    assert second.parse_skipped is True
+    assert second.items.keys() == first.items.keys()
+
+
+def test_universe_snapshot_stale_disk_body_marks_partial(monkeypatch):
+    server = _FakeServer(_universe_body())
+    real_cached_get = nhc.cached_get
+
+    def _cached_get(url, **kwargs):
+        kwargs["urlopen"] = server
+        return real_cached_get(url, **kwargs)
+
+    monkeypatch.setattr(nuf, "cached_get", _cached_get)
+    nuf.fetch_universe_snapshot()
+    # 프로세스 재시작 시뮬레이션 — 메모리 캐시 비움, 디스크만 남음.
+    nuf.reset_cache_for_tests()
+    server.down = True
+    snap = nuf.fetch_universe_snapshot(force=True)
+    assert snap.status == "partial"
+    assert snap.stale_cache_used is True
+    assert "069500" in snap.items
@@ -0,0 +1,118 @@
+"""Naver JSON 스트리밍 디코드 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import codecs
+import json
+
+import pytest
+
+from app.naver_json_stream import (
+    JsonStreamError,
+    detect_charset,
+    iter_array_items,
+    iter_byte_chunks,
+)
+
+
+def _payload(n: int = 50) -> dict:
+    return {
+        "resultCode": "success",
+        "result": {
+            "etfItemList": [
+                {
+                    "itemcode": f"{i:06d}",
+                    "itemname": f"한글 ETF {i}",
+                    "nav": f"{10000 + i:,}",
+                    "quant": i * 1000,
+                }
+                for i in range(n)
+            ]
+        },
+    }
+
+
+def _stream(body: bytes, size: int, charset: str):
+    return list(
+        iter_array_items(
+            iter_byte_chunks(body, size), key="etfItemList", charset=charset
+        )
+    )
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 65536])
+@pytest.mark.parametrize("encoding", ["utf-8", "cp949"])
+def test_stream_matches_full_parse_across_chunk_boundaries(size, encoding):
+    payload = _payload()
+    body = json.dumps(payload, ensure_ascii=False).encode(encoding)
+    items = _stream(body, size, detect_charset(body, None))
+    assert items == payload["result"]["etfItemList"]
+
+
+def test_trailing_number_items_not_truncated():
+    body = b'{"etfItemList": [1, 23, 456]}'
+    assert _stream(body, 1, "utf-8") == [1, 23, 456]
+
+
+def test_empty_array():
+    assert _stream(b'{"result": {"etfItemList": []}}', 4, "utf-8") == []
+
+
+def test_detect_charset_header_bom_and_sniff():
+    utf8 = "한글".encode("utf-8")
+    cp949 = "한글".encode("cp949")
+    assert detect_charset(utf8, "application/json; charset=UTF-8") == "utf-8"
+    assert detect_charset(codecs.BOM_UTF8 + utf8, None) == "utf-8-sig"
+    assert detect_charset(cp949, None) == "cp949"
+    # 헤더가 utf-8 이라고 해도 본문이 cp949 면 sniff 결과를 따른다.
+    assert detect_charset(cp949, "text/plain; charset=utf-8") == "cp949"
+    assert detect_charset(cp949, "text/plain; charset=EUC-KR") == "euc_kr"
+
+
+def test_missing_key_and_malformed_raise():
+    with pytest.raises(JsonStreamError):
+        _stream(b'{"other": []}', 4, "utf-8")
+    with pytest.raises(JsonStreamError):
+        _stream(b'{"etfItemList": {"a": 1}}', 4, "utf-8")
+    with pytest.raises(JsonStreamError):
+        _stream(b'{"etfItemList": [{"a": 1} {"b": 2}]}', 4, "utf-8")
+    with pytest.raises(JsonStreamError):
+        _stream(b'{"etfItemList": [{"a": 1}', 4, "utf-8")
+
+
+def test_fetcher_streaming_path_matches_payload_builder():
+    from datetime import datetime, timezone
+
+    from app.naver_etf_universe_fetcher import (
+        _build_items_streaming,
+        _build_snapshot_from_payload,
+    )
+
+    payload = _payload(20)
+    body = json.dumps(payload, ensure_ascii=False).encode("cp949")
+    streamed = _build_items_streaming(body, "application/json; charset=EUC-KR")
+    full = _build_snapshot_from_payload(
+        payload, datetime(2026, 10, 1, tzinfo=timezone.utc)
+    ).items
+    assert streamed == full
+
+
+def test_fetcher_malformed_body_is_call_failure():
+    from datetime import datetime, timezone
+
+    from app.naver_etf_universe_fetcher import _snapshot_from_cached_response
+    from app.naver_http_cache import CachedHttpResponse
+
+    resp = CachedHttpResponse(
+        cache_status="downloaded",
+        status=200,
+        body=b'{"result": {"etfItemList": [{"itemcode": "069500"',
+        content_type="application/json; charset=UTF-8",
+        body_sha256="deadbeef",
+        fetched_at=None,
+    )
+    snapshot, failure = _snapshot_from_cached_response(
+        resp, datetime(2026, 10, 1, tzinfo=timezone.utc)
+    )
+    assert snapshot is None
+    assert failure.startswith("call_failed: json_stream_failed")
@@ -0,0 +1,164 @@
+"""etf_daily_price 종가 columnar archive 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app import price_archive
+from app.market_data_store import (
+    EtfDailyPriceRow,
+    fetch_close_matrix,
+    fetch_price_history,
+    init_db,
+    upsert_daily_prices,
+)
+from app.market_timeseries_ingestion_service import sync_price_archive
+
+
+@pytest.fixture(autouse=True)
+def _reset_archive_cache():
+    price_archive.reset_cache_for_tests()
+    yield
+    price_archive.reset_cache_for_tests()
+
+
+def _row(ticker: str, d: str, close) -> EtfDailyPriceRow:
+    return EtfDailyPriceRow(ticker, d, None, None, None, close, 100, None)
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Path:
+    db_path = tmp_path / "market_data.sqlite"
+    init_db(db_path)
+    upsert_daily_prices(
+        [
+            _row("069500", "2026-10-12", 100.0),
+            _row("069500", "2026-10-13", 101.5),
+            _row("069500", "2026-10-14", None),
+            _row("069500", "2026-10-15", 0.0),
+            _row("069500", "2026-10-16", 103.0),
+            _row("229200", "2026-10-13", 50.0),
+            _row("229200", "2026-10-16", 52.25),
+        ],
+        source="test",
+        db_path=db_path,
+    )
+    return db_path
+
+
+def _dirty(db_path: Path) -> list[str]:
+    with sqlite3.connect(str(db_path)) as con:
+        return sorted(
+            r[0] for r in con.execute("SELECT ticker FROM price_archive_dirty")
+        )
+
+
+def test_archive_reads_match_sqlite(db):
+    expected = {
+        t: fetch_price_history(t, db_path=db) for t in ("069500", "229200", "999999")
+    }
+    assert expected["069500"] == [
+        ("2026-10-12", 100.0),
+        ("2026-10-13", 101.5),
+        ("2026-10-16", 103.0),
+    ]
+
+    result = price_archive.sync(db)
+    assert result.full_rebuild and result.archived_rows == 5
+    assert _dirty(db) == []
+    with sqlite3.connect(str(db)) as con:
+        assert price_archive.read_history(con, db, "069500") == expected["069500"]
+    for ticker, series in expected.items():
+        assert fetch_price_history(ticker, db_path=db) == series
+    # 2026-10 — 구간 조회도 archive / SQLite 결과가 같다 (양끝 포함).
+    with sqlite3.connect(str(db)) as con:
+        assert price_archive.read_history(
+            con, db, "069500", start="2026-10-13", end="2026-10-16"
+        ) == [("2026-10-13", 101.5), ("2026-10-16", 103.0)]
+        assert price_archive.read_history(con, db, "069500", end="2026-10-12") == [
+            ("2026-10-12", 100.0)
+        ]
+
+
+def test_write_after_sync_falls_back_until_next_sync(db):
+    first = price_archive.sync(db)
+    upsert_daily_prices([_row("229200", "2026-10-17", 53.0)], source="test", db_path=db)
+    assert _dirty(db) == ["229200"]
+    with sqlite3.connect(str(db)) as con:
+        assert price_archive.read_history(con, db, "229200") is None
+        assert price_archive.read_history(con, db, "069500") is not None
+    assert fetch_price_history("229200", db_path=db)[-1] == ("2026-10-17", 53.0)
+
+    second = price_archive.sync(db)
+    assert not second.full_rebuild
+    assert second.synced_tickers == 1 and second.archived_rows == 6
+    assert second.generation != first.generation
+    assert _dirty(db) == []
+    with sqlite3.connect(str(db)) as con:
+        assert price_archive.read_history(con, db, "229200")[-1] == ("2026-10-17", 53.0)
+    # 재-sync 할 것이 없으면 generation 유지.
+    assert price_archive.sync(db).generation == second.generation
+
+
+def test_delete_marks_dirty_and_missing_archive_rebuilds(db):
+    price_archive.sync(db)
+    with sqlite3.connect(str(db)) as con:
+        con.execute("DELETE FROM etf_daily_price WHERE ticker = '229200'")
+    assert _dirty(db) == ["229200"]
+    assert fetch_price_history("229200", db_path=db) == []
+
+    for path in price_archive.archive_dir(db).iterdir():
+        path.unlink()
+    assert price_archive.sync(db).full_rebuild
+    assert fetch_price_history("229200", db_path=db) == []
+    assert len(fetch_price_history("069500", db_path=db)) == 3
+
+
+def test_generation_mismatch_uses_sqlite(db):
+    price_archive.sync(db)
+    with sqlite3.connect(str(db)) as con:
+        con.execute(
+            "UPDATE price_archive_meta SET value = 'other' WHERE key = 'generation'"
+        )
+        assert price_archive.read_history(con, db, "069500") is None
+    assert len(fetch_price_history("069500", db_path=db)) == 3
+
+
+def test_close_matrix_aligns_dates_and_includes_dirty_tickers(db):
+    price_archive.sync(db)
+    upsert_daily_prices([_row("229200", "2026-10-16", 60.0)], source="test", db_path=db)
+
+    m = fetch_close_matrix(db_path=db)
+    assert m.tickers == ["069500", "229200"]
+    assert m.date_strings() == ["2026-10-12", "2026-10-13", "2026-10-16"]
+    np.testing.assert_array_equal(
+        m.close, np.array([[100.0, np.nan], [101.5, 50.0], [103.0, 60.0]])
+    )
+
+    sub = fetch_close_matrix(["229200", "000000"], start="2026-10-14", db_path=db)
+    assert sub.tickers == ["000000", "229200"]
+    assert sub.date_strings() == ["2026-10-16"]
+    np.testing.assert_array_equal(sub.close, np.array([[np.nan, 60.0]]))
+
+
+def test_sync_price_archive_logs_failures(db, monkeypatch):
+    def boom(db_path):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(price_archive, "sync", boom)
+    assert sync_price_archive(db) is False
+
+
+def test_benchmark_archive_is_smaller_than_sqlite(tmp_path):
+    from scripts.benchmark_price_archive import build_synthetic_db, run_benchmark
+
+    db_path = tmp_path / "bench.sqlite"
+    days = build_synthetic_db(db_path, tickers=20, years=1, end=date(2026, 10, 16))
+    report = run_benchmark(db_path, days, repeat=1)
+    assert report.tickers == 20
+    assert report.size_ratio is not None and report.size_ratio > 5
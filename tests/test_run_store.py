@@ -0,0 +1,160 @@
+"""SQLite run 저장소 + GET /runs 페이지 조회 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from app import sqlite_migrations, sqlite_pool, store
+from app.models import Run
+
+
+def _run(i: int, status: str = "PENDING_APPROVAL") -> Run:
+    return Run(
+        run_id=f"run_20261018T0000{i:02d}_abcd{i:04d}",
+        asof="2026-10-18T00:00:00+00:00",
+        status=status,
+        draft_payload={"title": f"t{i}", "recommendations": []},
+        message_text=f"msg {i}",
+        push_kind="market_briefing",
+    )
+
+
+def _write_json(directory, run: Run) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{run.run_id}.json").write_text(
+        json.dumps(run.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+
+
+def test_save_load_list_roundtrip_and_upsert():
+    for i in range(3):
+        store.save(_run(i))
+    updated = _run(1, status="REJECTED")
+    store.save(updated)
+
+    assert store.load(updated.run_id) == updated
+    assert [r.run_id for r in store.list_runs()] == [_run(i).run_id for i in (2, 1, 0)]
+    with pytest.raises(KeyError):
+        store.load("run_missing")
+    # run 당 JSON 파일을 더 이상 만들지 않는다.
+    assert list(store.STORE_DIR.glob("*.json")) == []
+
+
+def test_page_status_filter_and_cursor_use_index():
+    for i in range(10):
+        store.save(_run(i, status="FAILED" if i % 2 else "COMPLETED"))
+
+    page = store.list_runs_page(limit=3, status="FAILED")
+    assert [r.run_id for r in page] == [_run(i).run_id for i in (9, 7, 5)]
+    rest = store.list_runs_page(limit=3, status="FAILED", before=page[-1].run_id)
+    assert [r.run_id for r in rest] == [_run(i).run_id for i in (3, 1)]
+
+    with sqlite3.connect(str(store.db_path())) as con:
+        plan = " ".join(
+            str(r[3])
+            for r in con.execute(
+                "EXPLAIN QUERY PLAN SELECT run_json FROM runs WHERE status = ? "
+                "AND run_id < ? ORDER BY run_id DESC LIMIT 3",
+                ("FAILED", "run_z"),
+            )
+        )
+    assert "idx_runs_status_run_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_changed_since_returns_saves_in_order():
+    for i in range(3):
+        store.save(_run(i))
+    runs, rev = store.list_runs_changed_since(0)
+    assert [r.run_id for r in runs] == [_run(i).run_id for i in range(3)]
+
+    store.save(_run(0, status="DELIVERING"))
+    changed, next_rev = store.list_runs_changed_since(rev)
+    assert [(r.run_id, r.status) for r in changed] == [(_run(0).run_id, "DELIVERING")]
+    assert store.list_runs_changed_since(next_rev) == ([], next_rev)
+
+
+def test_rev_is_allocated_under_db_write_lock():
+    store.save(_run(0))
+    # 다른 process 의 writer (CLI) 가 rev 를 할당하고 아직 commit 전인 상태.
+    other = sqlite3.connect(str(store.db_path()), isolation_level=None, timeout=10)
+    other.execute("BEGIN IMMEDIATE")
+    other_rev = other.execute("SELECT MAX(rev) + 1 FROM runs").fetchone()[0]
+    other.execute(
+        "INSERT INTO runs (run_id, asof, status, push_kind, rev, run_json) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        ("run_other", "2026-10-18", "PENDING_APPROVAL", None, other_rev, "{}"),
+    )
+    saver = threading.Thread(target=store.save, args=(_run(1),))
+    saver.start()
+    saver.join(timeout=0.3)
+    assert saver.is_alive()  # write lock 대기 — commit 전 MAX(rev) 를 읽지 않는다.
+    other.execute("COMMIT")
+    other.close()
+    saver.join(timeout=10)
+
+    with sqlite3.connect(str(store.db_path())) as con:
+        revs = [r[0] for r in con.execute("SELECT rev FROM runs ORDER BY rev")]
+    assert revs == [1, 2, 3]
+
+
+def test_existing_json_directory_is_imported_once():
+    legacy = [_run(i) for i in range(4)]
+    for run in legacy:
+        _write_json(store.STORE_DIR, run)
+    (store.STORE_DIR / "broken.json").write_text("{", encoding="utf-8")
+
+    assert [r.run_id for r in store.list_runs()] == [r.run_id for r in reversed(legacy)]
+    store.save(_run(0, status="COMPLETED"))
+
+    # 재기동 (캐시 초기화) 후에도 import step 은 다시 돌지 않는다 — 갱신 유지.
+    sqlite_pool.close_all()
+    sqlite_migrations.reset_cache_for_tests()
+    assert store.load(_run(0).run_id).status == "COMPLETED"
+    with sqlite3.connect(str(store.db_path())) as con:
+        assert con.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 4
+
+
+def test_json_dropped_after_db_creation_is_loaded():
+    store.save(_run(0))
+    late = _run(5)
+    _write_json(store.STORE_DIR, late)
+    assert store.load(late.run_id) == late
+    assert store.list_runs_page(limit=1)[0].run_id == late.run_id
+
+
+def test_import_cli_reads_other_directory(tmp_path, capsys):
+    from scripts.import_json_runs import main
+
+    backup = tmp_path / "backup"
+    for i in range(2):
+        _write_json(backup, _run(i))
+    store.save(_run(0, status="COMPLETED"))
+
+    assert main(["--from", str(backup)]) == 0
+    assert "imported 1 run(s)" in capsys.readouterr().out
+    # 이미 있던 run 은 덮어쓰지 않는다.
+    assert store.load(_run(0).run_id).status == "COMPLETED"
+    assert store.load(_run(1).run_id).message_text == "msg 1"
+
+
+def test_get_runs_paginates_with_cursor_header(client):
+    for i in range(5):
+        store.save(_run(i, status="REJECTED" if i == 4 else "PENDING_APPROVAL"))
+
+    first = client.get("/runs", params={"limit": 2})
+    assert first.status_code == 200
+    assert [r["run_id"] for r in first.json()] == [_run(4).run_id, _run(3).run_id]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/runs", params={"limit": 5, "before": cursor})
+    assert [r["run_id"] for r in second.json()] == [_run(i).run_id for i in (2, 1, 0)]
+    assert "X-Next-Cursor" not in second.headers
+
+    rejected = client.get("/runs", params={"status": "REJECTED"}).json()
+    assert [r["run_id"] for r in rejected] == [_run(4).run_id]
+    assert client.get("/runs", params={"status": "BOGUS"}).status_code == 422
@@ -2,8 +2,8 @@
 
 - runtime_state_db: schema · integrity · canonical hash.
 - runtime_param_store: flatten · reconstruct · idempotent version · active pointer · fail-closed.
-- runtime_sent_registry_store: insert or ignore · duplicate guard.
-- runtime_execution_status_store: insert · latest 조회.
+- runtime_sent_registry_store: insert or ignore · duplicate guard · batch (2026-10).
+- runtime_execution_status_store: insert · latest 조회 · batch (2026-10).
 """
 
 from __future__ import annotations
@@ -18,6 +18,7 @@ from app import runtime_state_db as db_helper
 from app.runtime_execution_status_store import (
     insert_execution_status,
     insert_status_from_record,
+    insert_status_many,
     latest_execution_status,
 )
 from app.runtime_param_store import (
@@ -27,8 +28,10 @@ from app.runtime_param_store import (
 )
 from app.runtime_sent_registry_store import (
     contains as registry_contains,
+    contains_many as registry_contains_many,
     count as registry_count,
     insert as registry_insert,
+    mark_sent_many,
 )
 from app.three_push_runtime_param import build_manual_seed_param, from_dict
 
@@ -124,6 +127,64 @@ def test_registry_insert_or_ignore(tmp_path: Path) -> None:
     assert registry_contains(p, "market_briefing", "param-xyz", "2026-07-09")
 
 
+def test_registry_batch_contains_and_mark_sent(tmp_path: Path) -> None:
+    p = _fresh_db(tmp_path)
+    now = datetime.now(timezone.utc).isoformat()
+    kind = "spike_or_falling_alert"
+    a = (kind, "param-xyz", "2026-07-09#A")
+    b = (kind, "param-xyz", "2026-07-09#B")
+    assert registry_contains_many([], db_path=p) == set()
+    assert mark_sent_many([a], sent_at_utc=now, db_path=p) == 1
+    assert registry_contains_many([a, b, a], db_path=p) == {a}
+    # 이미 있는 키는 ignore — 새로 기록한 개수만.
+    assert mark_sent_many([a, b, b], sent_at_utc=now, db_path=p) == 1
+    assert registry_contains_many([a, b], db_path=p) == {a, b}
+    assert registry_count(p) == 2
+
+
+def test_registry_contains_many_chunks_large_key_sets(tmp_path: Path) -> None:
+    p = _fresh_db(tmp_path)
+    now = datetime.now(timezone.utc).isoformat()
+    keys = [
+        ("spike_or_falling_alert", "param-xyz", f"2026-07-09#{i}") for i in range(700)
+    ]
+    assert mark_sent_many(keys[::2], sent_at_utc=now, db_path=p) == 350
+    assert registry_contains_many(keys, db_path=p) == set(keys[::2])
+
+
+def test_insert_status_many_single_transaction(tmp_path: Path) -> None:
+    p = _fresh_db(tmp_path)
+    base = {
+        "mode": "send",
+        "status": "sent",
+        "runtime_date_kst": "2026-07-09",
+        "availability": {"available": 3},
+        "telegram_attempted": True,
+        "telegram_sent": True,
+    }
+    run_ids = insert_status_many(
+        [
+            {**base, "push_kind": "market_briefing"},
+            {**base, "push_kind": "holdings_briefing"},
+        ],
+        db_path=p,
+    )
+    assert len(run_ids) == 2 and run_ids[1] > run_ids[0]
+    latest = latest_execution_status(p)
+    assert latest["run_id"] == run_ids[1]
+    assert latest["push_kind"] == "holdings_briefing"
+    assert latest["availability_available"] == 3
+    assert latest["telegram_sent"] is True
+
+    # 한 건이라도 실패하면 전체 rollback.
+    with pytest.raises(ValueError):
+        insert_status_many(
+            [{**base, "push_kind": "market_briefing"}, {"message_text_length": "x"}],
+            db_path=p,
+        )
+    assert latest_execution_status(p)["run_id"] == run_ids[1]
+
+
 def test_execution_status_insert_and_latest(tmp_path: Path) -> None:
     p = _fresh_db(tmp_path)
     now = datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,40 @@
+"""LTTB 시계열 downsample (2026-10, app.series_downsample)."""
+
+from __future__ import annotations
+
+import math
+
+from app.series_downsample import lttb
+
+
+def _series(n: int) -> list[tuple[str, float]]:
+    return [(f"d{i:05d}", 100.0 + 10.0 * math.sin(i / 25.0)) for i in range(n)]
+
+
+def test_short_series_returned_unchanged():
+    points = _series(10)
+    assert lttb(points, 10) == points
+    assert lttb(points, 500) == points
+
+
+def test_keeps_endpoints_count_and_order():
+    points = _series(3000)
+    out = lttb(points, 300)
+    assert len(out) == 300
+    assert out[0] == points[0] and out[-1] == points[-1]
+    assert [p[0] for p in out] == sorted(p[0] for p in out)
+    assert set(out) <= set(points)  # 보간 없이 원본 점만
+
+
+def test_preserves_spike_and_trough():
+    points = [(f"d{i:04d}", 100.0) for i in range(1000)]
+    points[400] = ("d0400", 180.0)
+    points[700] = ("d0700", 20.0)
+    out = lttb(points, 50)
+    assert ("d0400", 180.0) in out
+    assert ("d0700", 20.0) in out
+
+
+def test_two_points_keeps_first_and_last():
+    points = _series(100)
+    assert lttb(points, 2) == [points[0], points[-1]]
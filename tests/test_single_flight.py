@@ -0,0 +1,97 @@
+"""동시 동일 GET 계산 합치기 — single-flight (2026-10, app.single_flight).
+
+- 같은 query · 데이터 버전의 동시 요청은 계산 1번, 같은 본문 · 같은 ETag.
+- query 가 다르면 따로 계산한다.
+- 예외는 기다리던 요청 모두에게 가고, 끝나면 key 가 지워진다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import api_market_topn, compute_lanes, single_flight
+from app.api import app
+from app.api_market_topn import MarketTopNResponse
+
+
+def _wait_for(predicate, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timeout"
+        time.sleep(0.01)
+
+
+def test_concurrent_identical_topn_requests_share_one_compute(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(api_market_topn, "DEFAULT_DB_PATH", tmp_path / "m.sqlite")
+    release = threading.Event()
+    calls: list[int] = []
+
+    def slow_topn(**kwargs):
+        calls.append(kwargs["n"])
+        release.wait(timeout=10)
+        return MarketTopNResponse(status="empty", n=kwargs["n"])
+
+    monkeypatch.setattr(api_market_topn, "_build_topn_response", slow_topn)
+    client = TestClient(app)
+    results: list = []
+    urls = ["/market/topn/latest?n=7"] * 4 + ["/market/topn/latest?n=8"]
+    threads = [
+        threading.Thread(target=lambda u=u: results.append(client.get(u))) for u in urls
+    ]
+    joined_before = single_flight.stats()["joined"]
+    for t in threads:
+        t.start()
+    _wait_for(lambda: single_flight.stats()["joined"] - joined_before >= 3)
+    _wait_for(lambda: len(calls) == 2)
+    release.set()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert sorted(calls) == [7, 8]
+    same = [r for r in results if r.json()["n"] == 7]
+    assert len(same) == 4
+    assert all(r.status_code == 200 for r in results)
+    assert len({r.headers["ETag"] for r in same}) == 1
+    assert single_flight.stats()["in_flight"] == 0
+
+
+def test_error_reaches_every_waiter_and_key_is_cleared():
+    release = threading.Event()
+    calls: list[int] = []
+
+    def boom():
+        calls.append(1)
+        release.wait(timeout=10)
+        raise ValueError("compute failed")
+
+    async def scenario():
+        key = single_flight.key("/test", {"a": 1}, "v1")
+        waiters = [
+            asyncio.ensure_future(
+                single_flight.run(key, compute_lanes.LANE_STATUS, boom)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*waiters, return_exceptions=True)
+
+    outcomes = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(isinstance(o, ValueError) for o in outcomes)
+    assert single_flight.stats()["in_flight"] == 0
+
+
+def test_key_normalizes_param_order():
+    a = single_flight.key("/p", {"n": 1, "basis": "x"}, "v")
+    b = single_flight.key("/p", {"basis": "x", "n": 1}, "v")
+    assert a == b
+    assert single_flight.key("/p", {"n": 1, "basis": "x"}, "v2") != a
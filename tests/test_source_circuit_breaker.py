@@ -0,0 +1,315 @@
+"""외부 데이터 소스 circuit breaker 테스트 (2026-10).
+
+clock 을 주입해 시간 경과를 통제한다. 실제 네트워크 호출 없음.
+"""
+
+from __future__ import annotations
+
+import urllib.error
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app import naver_http_cache as nhc
+from app import source_circuit_breaker as scb
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _boom():
+    raise ConnectionError("down")
+
+
+def _breaker(clock, threshold=3, base=10.0):
+    return scb.SourceCircuitBreaker(
+        "test", failure_threshold=threshold, base_open_seconds=base, clock=clock
+    )
+
+
+def test_opens_after_consecutive_failures_and_short_circuits():
+    clock = _Clock()
+    b = _breaker(clock)
+    for _ in range(3):
+        b.before_call()
+        b.record_failure("down")
+    assert b.snapshot().state == scb.STATE_OPEN
+    with pytest.raises(scb.CircuitOpenError) as exc:
+        b.before_call()
+    assert exc.value.reason == "circuit_open"
+    assert b.snapshot().total_short_circuits == 1
+
+
+def test_success_resets_consecutive_count():
+    b = _breaker(_Clock())
+    b.record_failure()
+    b.record_failure()
+    b.record_success()
+    b.record_failure()
+    assert b.snapshot().state == scb.STATE_CLOSED
+    assert b.snapshot().consecutive_failures == 1
+
+
+def test_half_open_allows_single_probe_then_closes_on_success():
+    clock = _Clock()
+    b = _breaker(clock)
+    for _ in range(3):
+        b.record_failure()
+    clock.now += 10.0
+    b.before_call()  # probe 통과
+    assert b.snapshot().state == scb.STATE_HALF_OPEN
+    with pytest.raises(scb.CircuitOpenError):
+        b.before_call()  # probe 진행 중 — 두 번째 호출은 차단
+    b.record_success()
+    snap = b.snapshot()
+    assert snap.state == scb.STATE_CLOSED
+    assert snap.open_seconds == 10.0
+
+
+def test_failed_probe_reopens_with_backoff(monkeypatch):
+    monkeypatch.setattr(scb, "MAX_OPEN_SECONDS", 25.0)
+    clock = _Clock()
+    b = _breaker(clock)
+    for _ in range(3):
+        b.record_failure()
+    clock.now += 10.0
+    b.before_call()
+    b.record_failure()
+    assert b.snapshot().state == scb.STATE_OPEN
+    assert b.snapshot().open_seconds == 20.0
+    clock.now += 19.0
+    with pytest.raises(scb.CircuitOpenError):
+        b.before_call()
+    clock.now += 1.0
+    b.before_call()
+    b.record_failure()
+    # 상한 적용.
+    assert b.snapshot().open_seconds == 25.0
+
+
+def test_guarded_call_counts_result_failures(monkeypatch):
+    monkeypatch.setattr(scb, "FAILURE_THRESHOLD", 2)
+    for _ in range(2):
+        assert scb.guarded_call(
+            scb.SOURCE_NAVER_MOBILE, lambda: 503, failure_if=lambda s: s >= 500
+        )
+    with pytest.raises(scb.CircuitOpenError):
+        scb.guarded_call(scb.SOURCE_NAVER_MOBILE, lambda: 200)
+
+
+def test_guarded_call_reraises_and_snapshot_lists_known_sources(monkeypatch):
+    monkeypatch.setattr(scb, "FAILURE_THRESHOLD", 1)
+    with pytest.raises(ConnectionError):
+        scb.guarded_call("fdr", _boom)
+    by_source = {s.source: s for s in scb.snapshot_all()}
+    assert set(scb.KNOWN_SOURCES) <= set(by_source)
+    assert by_source["fdr"].state == scb.STATE_OPEN
+    assert "ConnectionError" in by_source["fdr"].last_error
+    assert by_source["pykrx"].state == scb.STATE_CLOSED
+
+
+def _raise(exc):
+    def fn():
+        raise exc
+
+    return fn
+
+
+def test_guarded_call_counts_only_transport_and_server_errors(monkeypatch):
+    monkeypatch.setattr(scb, "FAILURE_THRESHOLD", 2)
+    source = scb.SOURCE_NAVER_POLLING
+    not_found = urllib.error.HTTPError("u", 404, "nf", {}, None)
+    # 응답은 받은 경우 — 파싱 / 데이터 오류와 4xx 는 소스 장애가 아니다.
+    for exc in (ValueError("bad json"), KeyError("datas"), not_found) * 2:
+        with pytest.raises(type(exc)):
+            scb.guarded_call(source, _raise(exc))
+    assert scb.get_breaker(source).snapshot().state == scb.STATE_CLOSED
+
+    unavailable = urllib.error.HTTPError("u", 503, "down", {}, None)
+    with pytest.raises(urllib.error.HTTPError):
+        scb.guarded_call(source, _raise(unavailable))
+    with pytest.raises(TimeoutError):
+        scb.guarded_call(source, _raise(TimeoutError("timed out")))
+    assert scb.get_breaker(source).snapshot().state == scb.STATE_OPEN
+
+
+def test_breakers_are_keyed_per_endpoint_family(monkeypatch):
+    from app import market_timeseries_naver_yahoo_adapter as adapter
+
+    monkeypatch.setattr(scb, "FAILURE_THRESHOLD", 1)
+    # FDR 경유 Naver 시세가 죽어도 Naver 직접 HTTP endpoint 는 그대로 호출된다.
+    naver_fdr = adapter._source_for_symbol("NAVER:069500")
+    assert naver_fdr == scb.SOURCE_NAVER_FDR
+    with pytest.raises(ConnectionError):
+        scb.guarded_call(naver_fdr, _boom)
+    with pytest.raises(scb.CircuitOpenError):
+        scb.guarded_call(naver_fdr, lambda: "rows")
+    for source in (
+        scb.SOURCE_NAVER_FINANCE,
+        scb.SOURCE_NAVER_MOBILE,
+        scb.SOURCE_NAVER_POLLING,
+        scb.SOURCE_NAVER_STOCK,
+    ):
+        assert scb.guarded_call(source, lambda: "ok") == "ok"
+    assert adapter._source_for_symbol("YAHOO:^GSPC") == scb.SOURCE_YAHOO_FDR
+
+
+# ─── 모듈 통합 ────────────────────────────────────────────────────────
+
+
+def test_pykrx_basis_reports_distinct_circuit_open_reason(monkeypatch):
+    from app import price_history_pykrx as ph
+
+    def _raise_open(*_a, **_k):
+        raise scb.CircuitOpenError("pykrx", 30.0)
+
+    monkeypatch.setattr(ph, "_fetch_pykrx_ohlcv", _raise_open)
+    result = ph.fetch_one_month_basis("069500", "2026-10-01")
+    assert result.reason == "circuit_open"
+
+
+def test_fdr_price_refresh_short_circuits_after_threshold(monkeypatch, tmp_path):
+    import sys
+    import types
+
+    from app import market_data_fdr as fdr_mod
+
+    calls: list[str] = []
+
+    def _data_reader(ticker, start, end):
+        calls.append(ticker)
+        raise ConnectionError("fdr down")
+
+    fake = types.ModuleType("FinanceDataReader")
+    fake.DataReader = _data_reader
+    monkeypatch.setitem(sys.modules, "FinanceDataReader", fake)
+    monkeypatch.setattr(scb, "FAILURE_THRESHOLD", 2)
+
+    result = fdr_mod.refresh_price_history(
+        ["069500", "102110", "229200", "360750"],
+        end_date=date(2026, 10, 1),
+        db_path=tmp_path / "m.sqlite",
+    )
+    assert result.success == 0
+    assert len(calls) == 2
+    errors = [f["error"] for f in result.failure_examples]
+    assert errors[2].startswith("circuit_open: fdr")
+    assert [f.get("reason") for f in result.failure_examples] == [
+        None,
+        None,
+        "circuit_open",
+        "circuit_open",
+    ]
+    assert (result.fail, result.circuit_open) == (4, 2)
+
+
+def test_constituents_refresh_skips_delay_once_circuit_is_open(tmp_path):
+    from app.etf_constituents_fetcher import FetchResult
+    from app.etf_constituents_service import refresh_constituents
+
+    calls: list[str] = []
+    sleeps: list[float] = []
+
+    def _open(ticker, asof, top_k):  # noqa: ARG001
+        calls.append(ticker)
+        return FetchResult(
+            status="unavailable",
+            source="naver_stock_etf_component",
+            constituents=[],
+            message=str(scb.CircuitOpenError(scb.SOURCE_NAVER_STOCK, 30.0)),
+        )
+
+    out = refresh_constituents(
+        asof="2026-10-01",
+        tickers=["A", "B", "C", "D"],
+        fetcher=_open,
+        sleep_fn=sleeps.append,
+        db_path=tmp_path / "m.sqlite",
+    )
+    assert calls == ["A"]
+    assert sleeps == []
+    assert [i.status for i in out.items] == ["unavailable"] + [
+        "skipped_circuit_open"
+    ] * 3
+    assert all(i.message.startswith("circuit_open: naver") for i in out.items)
+    assert (out.status, out.fail_count, out.skipped_count) == ("partial", 1, 3)
+
+
+def test_nav_refresh_skips_delay_once_circuit_is_open(tmp_path):
+    from app.etf_nav_service import refresh_nav
+
+    calls: list[str] = []
+    sleeps: list[float] = []
+
+    def _raise_open(ticker):
+        calls.append(ticker)
+        raise scb.CircuitOpenError(scb.SOURCE_NAVER_FINANCE, 30.0)
+
+    out = refresh_nav(
+        asof="2026-10-01",
+        tickers=["069500", "102110", "229200"],
+        fetcher=_raise_open,
+        sleep_fn=sleeps.append,
+        db_path=tmp_path / "m.sqlite",
+    )
+    assert calls == ["069500"]
+    assert sleeps == []
+    assert [i.status for i in out.items] == [
+        "unavailable",
+        "skipped_circuit_open",
+        "skipped_circuit_open",
+    ]
+    assert all(i.message.startswith("circuit_open: naver") for i in out.items)
+    assert (out.fail_count, out.skipped_count) == (1, 2)
+
+
+def test_naver_http_cache_serves_stale_without_network_when_open(monkeypatch):
+    monkeypatch.setattr(scb, "FAILURE_THRESHOLD", 1)
+    requests: list[str] = []
+
+    class _Resp:
+        status = 200
+        headers = {"Content-Type": "application/json"}
+
+        def read(self):
+            return b'{"a": 1}'
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            return False
+
+    def _ok(req, timeout=None):  # noqa: ARG001
+        requests.append(req.full_url)
+        return _Resp()
+
+    def _down(req, timeout=None):  # noqa: ARG001
+        requests.append(req.full_url)
+        raise urllib.error.URLError("down")
+
+    now = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    url = "https://example.invalid/x"
+    kwargs = dict(headers={}, max_age_seconds=0, timeout=1, now=now)
+    nhc.cached_get(url, urlopen=_ok, **kwargs)
+    nhc.cached_get(url, urlopen=_down, **kwargs)
+    r = nhc.cached_get(url, urlopen=_ok, **kwargs)
+    assert len(requests) == 2
+    assert r.cache_status == "stale_on_error"
+    assert r.error.startswith("circuit_open: naver_finance")
+
+
+def test_startup_status_exposes_source_circuits(client, monkeypatch):
+    monkeypatch.setattr(scb, "FAILURE_THRESHOLD", 1)
+    with pytest.raises(ConnectionError):
+        scb.guarded_call("yahoo", _boom)
+    body = client.get("/oci/startup-status").json()
+    by_source = {c["source"]: c for c in body["source_circuits"]}
+    assert by_source["yahoo"]["state"] == "open"
+    assert by_source["yahoo"]["retry_after_seconds"] is not None
+    assert by_source[scb.SOURCE_NAVER_FINANCE]["state"] == "closed"
@@ -0,0 +1,146 @@
+"""PRAGMA user_version 마이그레이션 runner 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from app import (
+    decision_evidence_store,
+    etf_constituents_store,
+    market_data_store,
+    runtime_state_db,
+    sqlite_migrations,
+    sqlite_schemas,
+)
+from app.sqlite_migrations import Migration, MigrationError, Schema, migrate
+
+
+def _user_version(db) -> int:
+    with sqlite3.connect(str(db)) as con:
+        return int(con.execute("PRAGMA user_version").fetchone()[0])
+
+
+def _columns(db, table) -> set[str]:
+    with sqlite3.connect(str(db)) as con:
+        return {r[1] for r in con.execute(f"PRAGMA table_info({table})")}
+
+
+def _counter_schema(fail_at: int | None = None) -> Schema:
+    def step(n):
+        def apply(con):
+            if n == fail_at:
+                con.execute("INSERT INTO applied VALUES (?)", (-n,))
+                raise RuntimeError(f"step {n} failed")
+            con.execute("INSERT INTO applied VALUES (?)", (n,))
+
+        return apply
+
+    return Schema(
+        name="counter",
+        migrations=(
+            Migration(1, "create", lambda con: con.execute("CREATE TABLE applied (n)")),
+            Migration(2, "two", step(2)),
+            Migration(3, "three", step(3)),
+        ),
+    )
+
+
+def test_fresh_db_applies_all_steps_once(tmp_path):
+    db = tmp_path / "a.sqlite"
+    assert migrate(db, _counter_schema()) == ["create", "two", "three"]
+    assert migrate(db, _counter_schema()) == []
+    assert _user_version(db) == 3
+    with sqlite3.connect(str(db)) as con:
+        assert [r[0] for r in con.execute("SELECT n FROM applied")] == [2, 3]
+
+
+def test_failed_step_rolls_back_and_keeps_previous_version(tmp_path):
+    db = tmp_path / "a.sqlite"
+    with pytest.raises(RuntimeError, match="step 3 failed"):
+        migrate(db, _counter_schema(fail_at=3))
+    assert _user_version(db) == 2
+    with sqlite3.connect(str(db)) as con:
+        assert [r[0] for r in con.execute("SELECT n FROM applied")] == [2]
+    assert migrate(db, _counter_schema()) == ["three"]
+
+
+def test_db_newer_than_code_is_rejected(tmp_path):
+    db = tmp_path / "a.sqlite"
+    with sqlite3.connect(str(db)) as con:
+        con.execute("PRAGMA user_version = 9")
+    with pytest.raises(MigrationError, match="newer than code"):
+        migrate(db, _counter_schema())
+
+
+def test_concurrent_migrate_applies_each_step_once(tmp_path):
+    db = tmp_path / "a.sqlite"
+    errors: list[BaseException] = []
+
+    def run():
+        try:
+            migrate(db, _counter_schema())
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    with sqlite3.connect(str(db)) as con:
+        assert sorted(r[0] for r in con.execute("SELECT n FROM applied")) == [2, 3]
+
+
+def test_legacy_constituents_db_gets_naver_columns(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    with sqlite3.connect(str(db)) as con:
+        con.execute(
+            "CREATE TABLE etf_constituents (etf_ticker TEXT NOT NULL, "
+            "asof TEXT NOT NULL, source TEXT NOT NULL, rank INTEGER NOT NULL, "
+            "constituent_ticker TEXT, constituent_name TEXT, weight_pct REAL, "
+            "etf_name TEXT, created_at TEXT NOT NULL, "
+            "PRIMARY KEY (etf_ticker, asof, source, rank))"
+        )
+    etf_constituents_store.init_constituents_db(db)
+    assert {"constituent_key", "market_type"} <= _columns(db, "etf_constituents")
+    assert _user_version(db) == sqlite_schemas.MARKET_DATA_SCHEMA.latest_version
+
+
+def test_store_connections_do_not_reprobe_schema(tmp_path, monkeypatch):
+    db = tmp_path / "market_data.sqlite"
+    calls: list[str] = []
+    real = sqlite_migrations.migrate
+
+    def counting(path, schema):
+        calls.append(schema.name)
+        return real(path, schema)
+
+    monkeypatch.setattr(sqlite_migrations, "migrate", counting)
+    for _ in range(5):
+        etf_constituents_store.has_constituents(
+            etf_ticker="069500", asof="2026-10-16", source="naver", db_path=db
+        )
+        market_data_store.list_etf_tickers(db_path=db)
+    assert calls == ["market_data"]
+
+
+def test_migrate_existing_databases_skips_missing_files(tmp_path, monkeypatch):
+    market_db = tmp_path / "market" / "market_data.sqlite"
+    market_db.parent.mkdir()
+    sqlite3.connect(str(market_db)).close()
+    decision_db = tmp_path / "decision" / "decision_evidence.sqlite"
+    monkeypatch.setattr(market_data_store, "DEFAULT_DB_PATH", market_db)
+    monkeypatch.setattr(decision_evidence_store, "DEFAULT_DB_PATH", decision_db)
+    monkeypatch.setattr(
+        runtime_state_db, "DEFAULT_DB_PATH", tmp_path / "runtime" / "missing.sqlite"
+    )
+
+    applied = sqlite_schemas.migrate_existing_databases()
+    assert list(applied) == ["market_data"]
+    assert applied["market_data"][0] == "market_data_base_tables"
+    assert not decision_db.exists()
+    assert sqlite_schemas.migrate_existing_databases() == {"market_data": []}
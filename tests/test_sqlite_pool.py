@@ -0,0 +1,201 @@
+"""공유 SQLite connection 관리자 테스트 (2026-10)."""
+
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app import sqlite_pool
+from app.market_data_store import (
+    EtfDailyPriceRow,
+    fetch_price_history,
+    get_last_price_date,
+    upsert_daily_prices,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    sqlite_pool.reset_for_tests()
+    yield
+    sqlite_pool.reset_for_tests()
+
+
+def _make_table(db):
+    with sqlite_pool.pooled_connection(db, write=True) as con:
+        con.execute("CREATE TABLE IF NOT EXISTS t (v INTEGER)")
+
+
+def test_same_thread_reuses_connection_with_pragmas(tmp_path):
+    db = tmp_path / "a.sqlite"
+    with sqlite_pool.pooled_connection(db) as first:
+        pass
+    with sqlite_pool.pooled_connection(db) as second:
+        assert second is first
+        assert second.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert second.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert second.execute("PRAGMA cache_size").fetchone()[0] < 0
+    stats = sqlite_pool.pool_stats()
+    assert stats.opened_total == 1
+    assert stats.reused_total == 1
+    assert stats.acquire_count == 2
+    assert stats.open_read_connections == 1
+
+
+def test_threads_get_their_own_read_connection(tmp_path):
+    db = tmp_path / "a.sqlite"
+    seen: list = []
+    release = threading.Event()
+
+    def worker():
+        with sqlite_pool.pooled_connection(db) as con:
+            seen.append(con)
+        release.wait(5)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    while len(seen) < 3:
+        time.sleep(0.01)
+    assert len({id(con) for con in seen}) == 3
+    assert sqlite_pool.pool_stats().open_read_connections == 3
+    release.set()
+    for t in threads:
+        t.join()
+
+
+def _wait_open_reads(expected: int) -> int:
+    deadline = time.monotonic() + 5
+    while True:
+        gc.collect()
+        n = sqlite_pool.pool_stats().open_read_connections
+        if n == expected or time.monotonic() > deadline:
+            return n
+        time.sleep(0.01)
+
+
+def test_exited_threads_close_their_read_connections(tmp_path):
+    db = tmp_path / "a.sqlite"
+    _make_table(db)
+    with sqlite_pool.pooled_connection(db):
+        pass
+    baseline = sqlite_pool.pool_stats().open_read_connections
+    fd_dir = Path("/proc/self/fd")
+    fds_before = len(list(fd_dir.iterdir())) if fd_dir.exists() else None
+
+    def worker():
+        with sqlite_pool.pooled_connection(db) as con:
+            con.execute("SELECT COUNT(*) FROM t").fetchone()
+
+    threads = [threading.Thread(target=worker) for _ in range(50)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert _wait_open_reads(baseline) == baseline
+    assert sqlite_pool.pool_stats().opened_total >= 50
+    if fds_before is not None:
+        # 누수라면 thread 당 fd 1개 이상 (50+) 남는다.
+        assert len(list(fd_dir.iterdir())) < fds_before + 10
+    # 남은 thread 의 connection 은 그대로 쓸 수 있다.
+    with sqlite_pool.pooled_connection(db) as con:
+        assert con.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_exception_rolls_back_and_nested_block_commits_once(tmp_path):
+    db = tmp_path / "a.sqlite"
+    _make_table(db)
+    with pytest.raises(RuntimeError):
+        with sqlite_pool.pooled_connection(db) as con:
+            con.execute("INSERT INTO t VALUES (1)")
+            raise RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        with sqlite_pool.pooled_connection(db) as outer:
+            outer.execute("INSERT INTO t VALUES (2)")
+            with sqlite_pool.pooled_connection(db) as inner:
+                assert inner is outer
+            # 안쪽 블록 종료는 commit 하지 않는다 — 바깥 예외로 함께 rollback.
+            raise RuntimeError("outer")
+    with sqlite_pool.pooled_connection(db) as con:
+        assert con.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_writer_is_serialized_across_threads(tmp_path):
+    db = tmp_path / "a.sqlite"
+    _make_table(db)
+    errors: list[BaseException] = []
+
+    def writer(n):
+        try:
+            for i in range(50):
+                with sqlite_pool.pooled_connection(db, write=True) as con:
+                    con.execute("INSERT INTO t VALUES (?)", (n * 100 + i,))
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    with sqlite_pool.pooled_connection(db) as con:
+        assert con.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 200
+    assert sqlite_pool.pool_stats().open_write_connections == 1
+
+
+def test_replaced_file_is_reopened(tmp_path):
+    db = tmp_path / "a.sqlite"
+    _make_table(db)
+    with sqlite_pool.pooled_connection(db) as first:
+        pass
+    sqlite_pool.close_path(db)
+    for suffix in ("", "-wal", "-shm"):
+        p = tmp_path / f"a.sqlite{suffix}"
+        if p.exists():
+            p.unlink()
+    with sqlite_pool.pooled_connection(db) as second:
+        assert second is not first
+        tables = second.execute("SELECT name FROM sqlite_master").fetchall()
+        assert tables == []
+
+
+def test_store_helpers_share_one_connection_per_thread(tmp_path):
+    db = tmp_path / "market_data.sqlite"
+    upsert_daily_prices(
+        [
+            EtfDailyPriceRow(
+                ticker="069500",
+                date="2026-10-01",
+                open=None,
+                high=None,
+                low=None,
+                close=100.0,
+                volume=None,
+                change=None,
+            )
+        ],
+        source="test",
+        db_path=db,
+    )
+    before = sqlite_pool.pool_stats().opened_total
+    for _ in range(10):
+        assert fetch_price_history("069500", db_path=db) == [("2026-10-01", 100.0)]
+        assert get_last_price_date("069500", db_path=db) == "2026-10-01"
+    after = sqlite_pool.pool_stats()
+    # writer 1개 이후 읽기 20회는 read connection 1개만 추가로 연다.
+    assert after.opened_total - before == 1
+    assert after.acquire_ms_max >= after.acquire_ms_avg >= 0
+
+
+def test_startup_status_exposes_pool_stats(client, tmp_path):
+    with sqlite_pool.pooled_connection(tmp_path / "a.sqlite"):
+        pass
+    body = client.get("/oci/startup-status").json()
+    stats = body["sqlite_connections"]
+    assert stats["opened_total"] >= 1
+    assert stats["acquire_count"] >= 1
@@ -6,7 +6,7 @@
 3. 일부 성공 시 refresh_status="partial"
 4. 전체 실패 시 refresh_status="failed"
 5. 성공 시 refresh_status="ok"
-6. seed items 20개 초과 hard fail
+6. seed items cap (MAX_UNIVERSE_ITEMS_PER_REFRESH) 초과 hard fail
 7. rank 는 scored 후보에만 부여
 8. top_candidate 저장
 9. GenerateDraft 가 pykrx 를 호출하지 않고 latest artifact 만 읽는지
@@ -156,14 +156,22 @@ def test_refresh_status_ok(_isolated_universe):
 
 
 def test_seed_items_over_20_hard_fail(client, _isolated_universe):
-    """20개 초과 seed → POST /universe/momentum/refresh 422 (조용히 자르지 않음)."""
-    items = [{"ticker": f"{i:06d}", "name": f"ETF{i}"} for i in range(21)]
+    """cap 초과 seed → POST /universe/momentum/refresh 422 (조용히 자르지 않음).
+
+    2026-10: cap 20 → MAX_UNIVERSE_ITEMS_PER_REFRESH (SQLite 우선 + 동시 scoring).
+    """
+    from app.universe_refresh import MAX_UNIVERSE_ITEMS_PER_REFRESH
+
+    items = [
+        {"ticker": f"{i:06d}", "name": f"ETF{i}"}
+        for i in range(MAX_UNIVERSE_ITEMS_PER_REFRESH + 1)
+    ]
     payload = _seed_payload(date.today().isoformat(), items=items)
     _write_seed(_isolated_universe["seed_file"], payload)
     r = client.post("/universe/momentum/refresh")
     assert r.status_code == 422
     body = r.json()
-    assert "20" in body["detail"]
+    assert str(MAX_UNIVERSE_ITEMS_PER_REFRESH) in body["detail"]
 
 
 # ─── 7. rank 는 scored 후보에만 + 8. top_candidate 저장 ────────────────
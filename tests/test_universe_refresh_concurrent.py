@@ -0,0 +1,213 @@
+"""Universe momentum 동시 scorer (SQLite 우선 + pykrx rate-limited) 테스트.
+
+1. SQLite 에 fresh basis 가 있는 ticker 는 pykrx 미호출
+2. SQLite 미보유 / stale ticker 만 pykrx 로 조회
+3. 결과 순서 = seed.items 순서 (동시 완료 순서와 무관)
+4. rate limiter 가 호출 시작 간격을 보장하고 deadline 이후 슬롯은 거절
+5. budget 초과 ticker 는 time_budget_exceeded
+6. fetch 예외 / PriceHistoryFailure 격리
+7. run_universe_refresh(fetcher=None) 가 동시 scorer 를 탄다
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, timedelta
+
+from app.market_data_store import EtfDailyPriceRow, upsert_daily_prices
+from app.price_history_pykrx import PriceHistoryBasis, PriceHistoryFailure
+from app.universe_refresh_concurrent import (
+    PykrxRateLimiter,
+    score_candidates_concurrent,
+)
+from app.universe_seed import UniverseSeed, UniverseSeedItem
+
+_ASOF = "2026-07-24"
+
+
+def _seed(tickers, asof=_ASOF):
+    return UniverseSeed(
+        asof=asof,
+        source="manual_seed",
+        source_freshness="fresh",
+        staleness_days=0,
+        items=[
+            UniverseSeedItem(
+                ticker=t, name=t, universe_group=None, sector_or_theme=None
+            )
+            for t in tickers
+        ],
+    )
+
+
+def _basis(asof=_ASOF, latest_close=10500.0):
+    return PriceHistoryBasis(
+        base_date="2026-06-24",
+        base_close=10000.0,
+        latest_date=asof,
+        latest_close=latest_close,
+    )
+
+
+def _seed_sqlite(db_path, ticker, end: date, days: int = 45, close=10000.0):
+    rows = [
+        EtfDailyPriceRow(
+            ticker=ticker,
+            date=(end - timedelta(days=days - 1 - i)).isoformat(),
+            open=None,
+            high=None,
+            low=None,
+            close=close + i,
+            volume=None,
+            change=None,
+        )
+        for i in range(days)
+    ]
+    upsert_daily_prices(rows, source="test", db_path=db_path)
+
+
+def test_sqlite_hit_skips_pykrx(tmp_path, monkeypatch):
+    from app import universe_refresh_concurrent as urc
+
+    db = tmp_path / "market_data.sqlite"
+    _seed_sqlite(db, "AAA", date.fromisoformat(_ASOF))
+    # stale: 최신일이 asof - 30일 → SQLITE_BASIS_MAX_STALE_DAYS 초과.
+    _seed_sqlite(db, "BBB", date.fromisoformat(_ASOF) - timedelta(days=30))
+    monkeypatch.setattr(urc, "SQLITE_DB_PATH", db)
+
+    called: list[str] = []
+    lock = threading.Lock()
+
+    def _net(ticker, asof):
+        with lock:
+            called.append(ticker)
+        return _basis(asof)
+
+    scores = score_candidates_concurrent(
+        _seed(["AAA", "BBB", "CCC"]),
+        fetcher=_net,
+        sleeper=lambda _x: None,
+        min_interval_seconds=0.0,
+    )
+    assert sorted(called) == ["BBB", "CCC"]
+    assert [s.item.ticker for s in scores] == ["AAA", "BBB", "CCC"]
+    assert all(s.is_scored for s in scores)
+    assert scores[0].basis.latest_date == _ASOF
+
+
+def test_missing_sqlite_file_is_not_created(tmp_path, monkeypatch):
+    from app import universe_refresh_concurrent as urc
+
+    db = tmp_path / "absent" / "market_data.sqlite"
+    monkeypatch.setattr(urc, "SQLITE_DB_PATH", db)
+    scores = score_candidates_concurrent(
+        _seed(["AAA"]),
+        fetcher=lambda t, a: _basis(a),
+        sleeper=lambda _x: None,
+        min_interval_seconds=0.0,
+    )
+    assert scores[0].is_scored
+    assert not db.exists()
+
+
+def test_result_order_preserved_under_concurrency():
+    tickers = [f"{i:06d}" for i in range(30)]
+    release = threading.Event()
+
+    def _net(ticker, asof):
+        # 앞 ticker 가 늦게 끝나도 결과 순서는 seed 순서.
+        if ticker == tickers[0]:
+            release.wait(timeout=2)
+        else:
+            release.set()
+        return _basis(asof, latest_close=10000.0 + int(ticker))
+
+    scores = score_candidates_concurrent(
+        _seed(tickers),
+        fetcher=_net,
+        use_sqlite=False,
+        sleeper=lambda _x: None,
+        min_interval_seconds=0.0,
+        max_workers=4,
+    )
+    assert [s.item.ticker for s in scores] == tickers
+    assert all(s.is_scored for s in scores)
+
+
+def test_rate_limiter_spacing_and_deadline():
+    now = [100.0]
+    slept: list[float] = []
+    limiter = PykrxRateLimiter(
+        0.5, clock=lambda: now[0], sleeper=lambda s: slept.append(s)
+    )
+    assert limiter.acquire(deadline=101.2) is True  # slot 100.0
+    assert limiter.acquire(deadline=101.2) is True  # slot 100.5
+    assert limiter.acquire(deadline=101.2) is True  # slot 101.0
+    assert limiter.acquire(deadline=101.2) is False  # slot 101.5 > deadline
+    assert slept == [0.5, 1.0]
+
+
+def test_budget_exceeded_marks_remaining():
+    now = [0.0]
+
+    def _clock():
+        return now[0]
+
+    def _sleep(s):
+        now[0] += s
+
+    # interval 10s · budget 25s → 슬롯 0 / 10 / 20 만 허용, 4·5 번째는 초과.
+    scores = score_candidates_concurrent(
+        _seed(["A1", "A2", "A3", "A4", "A5"]),
+        fetcher=lambda t, a: _basis(a),
+        use_sqlite=False,
+        clock=_clock,
+        sleeper=_sleep,
+        min_interval_seconds=10.0,
+        time_budget_seconds=25.0,
+        max_workers=1,
+    )
+    reasons = [s.exclusion_reason for s in scores]
+    assert reasons[:3] == [None, None, None]
+    assert reasons[3:] == ["time_budget_exceeded", "time_budget_exceeded"]
+
+
+def test_failure_and_exception_isolated():
+    def _net(ticker, asof):
+        if ticker == "ERR":
+            raise RuntimeError("boom")
+        if ticker == "NOD":
+            return PriceHistoryFailure(reason="no_data")
+        return _basis(asof)
+
+    scores = score_candidates_concurrent(
+        _seed(["OK1", "ERR", "NOD"]),
+        fetcher=_net,
+        use_sqlite=False,
+        sleeper=lambda _x: None,
+        min_interval_seconds=0.0,
+    )
+    assert scores[0].is_scored is True
+    assert scores[1].is_scored is False
+    assert "boom" in scores[1].exclusion_reason
+    assert scores[2].exclusion_reason == "pykrx 데이터 없음"
+
+
+def test_run_universe_refresh_default_uses_concurrent(monkeypatch, _isolated_universe):
+    from app import universe_refresh as ur
+    from app import universe_refresh_concurrent as urc
+
+    seen: dict = {}
+    real = urc.score_candidates_concurrent
+
+    def _spy(**kwargs):
+        seen["called"] = True
+        return real(**kwargs)
+
+    monkeypatch.setattr(urc, "score_candidates_concurrent", _spy)
+    scores, status = ur.run_universe_refresh(
+        _seed(["069500", "229200"]), sleeper=lambda _x: None
+    )
+    assert seen.get("called") is True
+    assert status == "ok"
+    assert [s.item.ticker for s in scores] == ["069500", "229200"]